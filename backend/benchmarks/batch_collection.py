@@ -0,0 +1,154 @@
+"""
+Publish-worker batch collection: asyncio.Queue + wait_for versus BatchQueue.
+
+The wait_for path is how BatchPublishQueue workers used to collect a
+batch: one `wait_for(queue.get(), remaining)` per item, which allocates a
+task and a timeout handle per message. BatchQueue drains everything that
+is already queued and arms one deadline per batch.
+
+Both sides run one producer putting messages in small bursts and one or
+more workers collecting batches; publishing is a no-op, so the numbers
+are pure event-loop overhead on a single core.
+
+Usage:
+    python -m benchmarks.batch_collection --messages 200000
+"""
+
+import argparse
+import asyncio
+import time
+
+from shortener_app.infrastructures.broker.batch_queue import BatchQueue
+
+_STOP = object()
+
+
+async def run_wait_for(
+    *,
+    messages: int,
+    burst: int,
+    workers: int,
+    batch_size: int,
+    window_sec: float,
+) -> float:
+    queue: asyncio.Queue[object] = asyncio.Queue(maxsize=10_000)
+    collected = 0
+
+    async def worker() -> None:
+        nonlocal collected
+        loop = asyncio.get_running_loop()
+        while True:
+            first = await queue.get()
+            if first is _STOP:
+                return
+            items = [first]
+            deadline = loop.time() + window_sec
+            while len(items) < batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    nxt = await asyncio.wait_for(queue.get(), remaining)
+                except TimeoutError:
+                    break
+                if nxt is _STOP:
+                    collected += len(items)
+                    return
+                items.append(nxt)
+            collected += len(items)
+
+    tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+    t0 = time.perf_counter()
+    for i in range(messages):
+        await queue.put(i)
+        if i % burst == 0:
+            await asyncio.sleep(0)
+    for _ in range(workers):
+        await queue.put(_STOP)
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - t0
+
+    assert collected == messages
+    return elapsed
+
+
+async def run_batch_queue(
+    *,
+    messages: int,
+    burst: int,
+    workers: int,
+    batch_size: int,
+    window_sec: float,
+) -> float:
+    queue: BatchQueue[int] = BatchQueue(maxsize=10_000)
+    collected = 0
+
+    async def worker() -> None:
+        nonlocal collected
+        while items := await queue.get_batch(batch_size, window_sec):
+            collected += len(items)
+            queue.task_done(len(items))
+
+    tasks = [asyncio.create_task(worker()) for _ in range(workers)]
+    t0 = time.perf_counter()
+    for i in range(messages):
+        await queue.put(i)
+        if i % burst == 0:
+            await asyncio.sleep(0)
+    queue.close()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - t0
+
+    assert collected == messages
+    return elapsed
+
+
+async def run(
+    *,
+    messages: int,
+    burst: int,
+    workers: int,
+    batch_size: int,
+    window_ms: float,
+) -> None:
+    params = {
+        "messages": messages,
+        "burst": burst,
+        "workers": workers,
+        "batch_size": batch_size,
+        "window_sec": window_ms / 1000,
+    }
+    print(
+        f"messages       {messages} (burst {burst}, workers {workers}, "
+        f"batch {batch_size}, window {window_ms} ms)",
+    )
+
+    slow = await run_wait_for(**params)
+    print(f"{'wait_for':<14} {messages / slow:12,.0f} msg/s")
+    fast = await run_batch_queue(**params)
+    print(f"{'BatchQueue':<14} {messages / fast:12,.0f} msg/s")
+    print(f"speedup        {slow / fast:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--burst", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--batch-size", type=int, default=200)
+    parser.add_argument("--window-ms", type=float, default=200.0)
+    args = parser.parse_args()
+
+    asyncio.run(
+        run(
+            messages=args.messages,
+            burst=args.burst,
+            workers=args.workers,
+            batch_size=args.batch_size,
+            window_ms=args.window_ms,
+        ),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Key generation cost: one key per call versus RandomKeyGenerator.generate_many.
+
+The per-key path is what CreateShortUrl and key-pool refills used to do:
+`SystemRandom.choices` for every key. The bulk path draws one os.urandom
+buffer and maps it to the alphabet with a single bytes.translate.
+
+Usage:
+    python -m benchmarks.key_generation --keys 100000
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+
+from shortener_app.domain.services.key_generator import RandomKeyGenerator
+
+
+def measure(name: str, generate: Callable[[], list[str]], keys: int) -> float:
+    # Warm up allocator free lists and code paths.
+    generate()
+
+    t0 = time.perf_counter()
+    result = generate()
+    elapsed = time.perf_counter() - t0
+    assert len(result) == keys
+
+    per_key_ns = elapsed / keys * 1e9
+    print(f"{name:<14} {per_key_ns:10.1f} ns/key")
+    return per_key_ns
+
+
+def run(*, keys: int, batch: int, length: int) -> None:
+    gen = RandomKeyGenerator(length=length)
+
+    def per_key() -> list[str]:
+        return [gen() for _ in range(keys)]
+
+    def bulk() -> list[str]:
+        result: list[str] = []
+        for start in range(0, keys, batch):
+            result.extend(gen.generate_many(min(batch, keys - start)))
+        return result
+
+    print(f"keys           {keys} (length {length}, batch {batch})")
+    slow = measure("per-key", per_key, keys)
+    fast = measure("generate_many", bulk, keys)
+    print(f"speedup        {slow / fast:.1f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--keys", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=200)
+    parser.add_argument("--length", type=int, default=5)
+    args = parser.parse_args()
+
+    run(keys=args.keys, batch=args.batch, length=args.length)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""
+Redirect resolve cost: full entity path versus the UrlResolveDTO fast path.
+
+Both paths read the same JSON records from an in-memory stand-in for
+RedisCacheClient (json.loads included) with the local cache disabled, so
+every request decodes a record. The entity path is what redirects used to
+do: codec decode with UUID parsing, UrlEntity construction and a click
+event. The fast path decodes only key, target_url and is_active.
+
+Reports CPU time per request and the memory held per resolved request,
+measured with tracemalloc while the results of a whole run are kept alive.
+
+Usage:
+    python -m benchmarks.resolve_fast_path --requests 50000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from typing import Any
+from uuid import uuid4
+
+import structlog
+
+from shortener_app.application.dtos.urls.urls_cache import UrlCacheRecordDTO
+from shortener_app.application.mappers import UrlDtoFacade
+from shortener_app.application.mappers.components import (
+    UrlCacheToEntityMapper,
+    UrlCreatedMapper,
+    UrlPublishMapper,
+    UrlRedirectedMapper,
+    UrlToCacheRecordMapper,
+    UrlToResolveMapper,
+    UrlToUserUrlItemMapper,
+)
+from shortener_app.application.services.urls.url_cache import UrlCacheService
+from shortener_app.infrastructures.codecs import (
+    UrlCacheRedisHashCodec,
+    UrlResolveRedisHashCodec,
+)
+
+
+class JsonBytesCache:
+    """In-memory stand-in for RedisCacheClient.get, JSON decoding included."""
+
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        raw = self.store.get(key)
+        return json.loads(raw) if raw is not None else None
+
+    def is_available(self) -> bool:
+        return True
+
+
+def build_mapper() -> UrlDtoFacade:
+    return UrlDtoFacade(
+        publish_new_url=UrlPublishMapper(),
+        created=UrlCreatedMapper(),
+        publish_redirected_url=UrlRedirectedMapper(),
+        user_item=UrlToUserUrlItemMapper(),
+        url_cache_to_entity=UrlCacheToEntityMapper(),
+        url_to_cache_record=UrlToCacheRecordMapper(),
+        url_to_resolve=UrlToResolveMapper(),
+    )
+
+
+async def measure(
+    name: str,
+    resolve: Callable[[str], Awaitable[Any]],
+    keys: list[str],
+    requests: int,
+) -> float:
+    # Warm up allocator free lists and code paths.
+    for key in keys:
+        await resolve(key)
+
+    t0 = time.process_time()
+    for i in range(requests):
+        await resolve(keys[i % len(keys)])
+    cpu = time.process_time() - t0
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    held = [await resolve(keys[i % len(keys)]) for i in range(requests)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del held
+
+    per_request_us = cpu / requests * 1e6
+    print(
+        f"{name:<12} {per_request_us:8.2f} us/req  "
+        f"{(after - before) / requests:8.0f} B held/req",
+    )
+    return per_request_us
+
+
+async def run(*, requests: int, keys: int) -> None:
+    cache = JsonBytesCache()
+    codec = UrlCacheRedisHashCodec()
+    mapper = build_mapper()
+    service = UrlCacheService(
+        cache=cache,  # type: ignore[arg-type]
+        codec=codec,
+        mapper=mapper,
+        resolve_codec=UrlResolveRedisHashCodec(),
+    )
+
+    key_list = [f"{i:05d}" for i in range(keys)]
+    for key in key_list:
+        dto = UrlCacheRecordDTO(
+            key=key,
+            target_url=f"https://example.com/{key}",
+            user_id=uuid4(),
+        )
+        cache.store[f"short:{key}"] = json.dumps(codec.encode(dto)).encode()
+
+    async def entity_path(key: str) -> tuple[Any, Any]:
+        entity = await service.lookup(key=key)
+        return entity, mapper.to_publish_redirected_dto(entity=entity)
+
+    async def fast_path(key: str) -> tuple[Any, Any]:
+        resolved = await service.lookup_resolve(key=key)
+        return resolved, mapper.to_publish_redirected_dto_from_resolve(
+            dto=resolved,
+        )
+
+    print(f"requests     {requests}")
+    slow = await measure("entity", entity_path, key_list, requests)
+    fast = await measure("projection", fast_path, key_list, requests)
+    print(f"speedup      {slow / fast:.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--keys", type=int, default=1_000)
+    args = parser.parse_args()
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING),
+    )
+    asyncio.run(run(requests=args.requests, keys=args.keys))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 __all__ = (
     "UrlCacheSeedDTO",
     "UrlCacheRecordDTO",
+    "UrlResolveDTO",
 )
 
 from dataclasses import dataclass
@@ -37,3 +38,18 @@ class UrlCacheRecordDTO:
     user_id: UUID
     name: str | None = None
     is_active: bool = True
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UrlResolveDTO:
+    """
+    Read projection of a cached URL holding only what a redirect needs.
+
+    Decoded straight from a cache record, without parsing the owner UUID or
+    building a UrlEntity.
+    """
+
+    key: str
+    target_url: str
+    is_active: bool = True
@@ -20,7 +20,9 @@ class UrlClickedEventDTO:
     Integration event payload published when a short URL is resolved (clicked).
 
     Used by downstream consumers to update click counters idempotently.
+    `count` is greater than one when clicks were pre-aggregated per key.
     """
 
     key: str
     event_id: UUID = field(default_factory=uuid4)
+    count: int = 1
@@ -1,4 +1,9 @@
-__all__ = ("CreatedUrlDTO",)
+__all__ = (
+    "CreateUrlResultDTO",
+    "CreatedUrlDTO",
+    "HotKeyDTO",
+    "ResolvedKeyDTO",
+)
 
 from dataclasses import dataclass
 from uuid import UUID
@@ -9,3 +14,44 @@ class CreatedUrlDTO:
     key: str
     target_url: str
     user_id: UUID
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CreateUrlResultDTO:
+    """
+    Outcome of creating one URL in a batch.
+
+    Exactly one of `created` and `error` is set.
+    """
+
+    target_url: str
+    created: CreatedUrlDTO | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ResolvedKeyDTO:
+    """
+    Outcome of resolving one key in a batch.
+
+    `target_url` is None when the key does not exist; `is_active` is only
+    meaningful when it does.
+    """
+
+    key: str
+    target_url: str | None = None
+    is_active: bool = False
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class HotKeyDTO:
+    """
+    Estimated traffic for one key in the current window.
+
+    `count` may overestimate the true number of requests by up to `error`.
+    """
+
+    key: str
+    count: int
+    error: int
+    rate_per_sec: float
@@ -1,3 +1,15 @@
-__all__ = ("BaseApplicationError",)
+__all__ = (
+    "BaseApplicationError",
+    "PublishOverloadedError",
+    "TooManyKeysError",
+    "TooManyUrlsError",
+)
 
 from shortener_app.application.exceptions.base import BaseApplicationError
+from shortener_app.application.exceptions.publish import (
+    PublishOverloadedError,
+)
+from shortener_app.application.exceptions.urls import (
+    TooManyKeysError,
+    TooManyUrlsError,
+)
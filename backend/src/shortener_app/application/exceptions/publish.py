@@ -0,0 +1,11 @@
+__all__ = ("PublishOverloadedError",)
+
+from shortener_app.application.exceptions.base import BaseApplicationError
+
+
+class PublishOverloadedError(BaseApplicationError):
+    def __init__(self, *, retry_after_sec: float) -> None:
+        self.retry_after_sec = retry_after_sec
+        super().__init__(
+            f"Publish pipeline is saturated; retry after {retry_after_sec:g}s",
+        )
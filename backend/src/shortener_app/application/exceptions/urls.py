@@ -0,0 +1,24 @@
+__all__ = (
+    "TooManyKeysError",
+    "TooManyUrlsError",
+)
+
+from shortener_app.application.exceptions.base import BaseApplicationError
+
+
+class TooManyKeysError(BaseApplicationError):
+    def __init__(self, *, requested: int, limit: int) -> None:
+        self.requested = requested
+        self.limit = limit
+        super().__init__(
+            f"Too many keys requested: {requested} (limit {limit})",
+        )
+
+
+class TooManyUrlsError(BaseApplicationError):
+    def __init__(self, *, requested: int, limit: int) -> None:
+        self.requested = requested
+        self.limit = limit
+        super().__init__(
+            f"Too many URLs requested: {requested} (limit {limit})",
+        )
@@ -1,6 +1,10 @@
 __all__ = (
     "MessageBrokerPublisherProtocol",
     "CacheProtocol",
+    "ClickCounterStoreProtocol",
+    "KeyFilterProtocol",
+    "KeySequenceProtocol",
+    "LocalCacheProtocol",
     "EntityToDtoMapperProtocol",
     "DtoCodecProtocol",
     "EntityDtoMapperProtocol",
@@ -11,12 +15,22 @@ __all__ = (
 from shortener_app.application.interfaces.broker import (
     MessageBrokerPublisherProtocol,
 )
-from shortener_app.application.interfaces.cache import CacheProtocol
+from shortener_app.application.interfaces.cache import (
+    CacheProtocol,
+    KeyFilterProtocol,
+    LocalCacheProtocol,
+)
+from shortener_app.application.interfaces.click_counter import (
+    ClickCounterStoreProtocol,
+)
 from shortener_app.application.interfaces.dto_codec import DtoCodecProtocol
 from shortener_app.application.interfaces.entity_dto_mapper import (
     DtoToEntityMapperProtocol,
     EntityDtoMapperProtocol,
     EntityToDtoMapperProtocol,
 )
+from shortener_app.application.interfaces.key_sequence import (
+    KeySequenceProtocol,
+)
 from shortener_app.application.interfaces.repository import RepositoryProtocol
 from shortener_app.application.interfaces.uow import UnitOfWorkProtocol
@@ -16,6 +16,12 @@ class MessageBrokerPublisherProtocol(Protocol):
         dtos: list[PublishUrlDTO],
     ) -> None: ...
 
+    @abstractmethod
+    async def publish_update_urls_batch(
+        self,
+        dtos: list[UrlClickedEventDTO],
+    ) -> None: ...
+
     @abstractmethod
     async def publish_update_url(
         self,
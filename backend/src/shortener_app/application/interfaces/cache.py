@@ -1,7 +1,14 @@
-__all__ = ("CacheProtocol",)
+__all__ = (
+    "CacheProtocol",
+    "KeyFilterProtocol",
+    "LocalCacheProtocol",
+)
 
 from abc import abstractmethod
-from typing import Any, Protocol
+from collections.abc import Mapping, Sequence
+from typing import Any, Protocol, TypeVar
+
+V = TypeVar("V")  # Cached value
 
 
 class CacheProtocol(Protocol):
@@ -16,9 +23,75 @@ class CacheProtocol(Protocol):
         ttl: int | None = None,
     ) -> bool: ...
 
+    @abstractmethod
+    async def get_many(
+        self,
+        keys: Sequence[str],
+    ) -> list[dict[str, Any] | None]:
+        """Get several values in one round trip, aligned with `keys`."""
+        ...
+
+    @abstractmethod
+    async def set_many(
+        self,
+        items: Mapping[str, dict[str, Any]],
+        ttl: int | None = None,
+    ) -> bool:
+        """Set several values in one round trip."""
+        ...
+
+    @abstractmethod
+    async def set_many_guarded(
+        self,
+        items: Mapping[str, dict[str, Any]],
+        guards: Sequence[str],
+        ttl: int | None = None,
+    ) -> list[bool]:
+        """
+        Set each key of `items` unless its guard key exists, atomically.
+
+        `guards` is aligned with `items`; the result tells which keys were
+        set.
+        """
+        ...
+
+    @abstractmethod
+    async def set_many_if_equals(
+        self,
+        items: Mapping[str, dict[str, Any]],
+        expected: dict[str, Any],
+        ttl: int | None = None,
+    ) -> list[bool]:
+        """
+        Set each key of `items` only while it still holds `expected`.
+
+        Every key is compared and set atomically; the result, aligned with
+        `items`, tells which keys were set.
+        """
+        ...
+
     @abstractmethod
     async def delete(self, key: str) -> bool: ...
 
+    @abstractmethod
+    async def delete_many(self, keys: Sequence[str]) -> int:
+        """Delete several keys in one round trip; returns how many existed."""
+        ...
+
+    @abstractmethod
+    async def delete_if_equals(self, key: str, value: str) -> bool:
+        """Atomically delete `key` only while it still holds `value`."""
+        ...
+
+    @abstractmethod
+    async def delete_many_if_equals(
+        self,
+        keys: Sequence[str],
+        value: dict[str, Any] | str,
+    ) -> int:
+        """Atomically delete the keys holding `value`; returns how many."""
+        ...
+
     @abstractmethod
     async def exists(self, key: str) -> bool: ...
 
@@ -32,3 +105,96 @@ class CacheProtocol(Protocol):
         value: dict[str, Any] | str,
         ttl_seconds: int | None = None,
     ) -> bool: ...
+
+    @abstractmethod
+    async def set_nx_many(
+        self,
+        items: Mapping[str, dict[str, Any] | str],
+        ttl_seconds: int | None = None,
+    ) -> list[bool]:
+        """SETNX several keys in one round trip, aligned with `items`."""
+        ...
+
+    @abstractmethod
+    async def reserve_first_free(
+        self,
+        items: Mapping[str, dict[str, Any] | str],
+        ttl_seconds: int | None = None,
+    ) -> str | None:
+        """
+        Atomically SETNX the first free key of `items`, in iteration order.
+
+        Returns the key that was set, or None if every key was taken.
+        """
+        ...
+
+    @abstractmethod
+    async def publish(self, channel: str, message: str) -> int: ...
+
+    @abstractmethod
+    def is_available(self) -> bool:
+        """False while the backend is known to be failing."""
+        ...
+
+
+class LocalCacheProtocol(Protocol[V]):
+    """
+    Per-process cache tier consulted before the shared cache.
+
+    Implementations are bounded and expire entries on their own; they must be
+    safe to call from the event loop without awaiting.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> V | None: ...
+
+    @abstractmethod
+    def get_stale(
+        self,
+        key: str,
+        max_stale_sec: float | None = None,
+    ) -> V | None:
+        """
+        Return an entry even if its TTL has passed, while it is retained.
+
+        `max_stale_sec` narrows how far past its TTL an entry may be.
+        """
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: V) -> None: ...
+
+    @abstractmethod
+    def delete(self, key: str) -> bool: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> dict[str, int]: ...
+
+
+class KeyFilterProtocol(Protocol):
+    """
+    Probabilistic membership filter over every allocated short key.
+
+    `might_contain` may return false positives but never false negatives for
+    keys that were added, so a negative answer proves the key does not exist.
+    """
+
+    @abstractmethod
+    def might_contain(self, key: str) -> bool: ...
+
+    @abstractmethod
+    def add(self, key: str) -> None: ...
+
+    @abstractmethod
+    def discard(self, key: str) -> None:
+        """Note a deleted key; its bits stay set until the next rebuild."""
+        ...
+
+    @abstractmethod
+    def record_false_positive(self, key: str) -> None: ...
+
+    @abstractmethod
+    def stats(self) -> dict[str, int | float]: ...
@@ -0,0 +1,27 @@
+__all__ = ("ClickCounterStoreProtocol",)
+
+from typing import Protocol
+
+
+class ClickCounterStoreProtocol(Protocol):
+    """
+    Application port for draining click counters accumulated outside the DB.
+
+    Counters are grouped into buckets. A bucket is claimed once it can no
+    longer receive writes, read, applied to the database and then released.
+    A bucket that was claimed but not released (e.g. after a crash) is
+    returned again by the next `claim_closed` call, so deltas are applied
+    at least once.
+    """
+
+    async def claim_closed(self) -> list[str]:
+        """Claim every closed bucket and return the claimed bucket ids."""
+        ...
+
+    async def read(self, *, bucket: str) -> dict[str, int]:
+        """Return the key -> clicks deltas of a claimed bucket."""
+        ...
+
+    async def release(self, *, bucket: str) -> None:
+        """Forget a claimed bucket once its deltas have been applied."""
+        ...
@@ -0,0 +1,17 @@
+__all__ = ("KeySequenceProtocol",)
+
+from typing import Protocol
+
+
+class KeySequenceProtocol(Protocol):
+    """
+    Application port for a shared, monotonically increasing counter.
+
+    Each lease hands out `count` numbers no other caller will ever get,
+    which lets every process allocate keys from its own block without
+    coordinating per key.
+    """
+
+    async def lease(self, *, count: int) -> range:
+        """Reserve the next `count` numbers and return them."""
+        ...
@@ -1,8 +1,15 @@
-__all__ = ("NewUrlPublishQueueProtocol",)
+__all__ = (
+    "ClickPublishQueueProtocol",
+    "NewUrlPublishQueueProtocol",
+)
 
+from collections.abc import Sequence
 from typing import Protocol
 
-from shortener_app.application.dtos.urls.urls_events import PublishUrlDTO
+from shortener_app.application.dtos.urls.urls_events import (
+    PublishUrlDTO,
+    UrlClickedEventDTO,
+)
 
 
 class NewUrlPublishQueueProtocol(Protocol):
@@ -13,6 +20,27 @@ class NewUrlPublishQueueProtocol(Protocol):
     provides an implementation (e.g., an asyncio batching queue).
     """
 
+    def admit(self, *, count: int = 1) -> None:
+        """Raise PublishOverloadedError if `count` new events would be shed."""
+        ...
+
     async def enqueue(self, *, dto: PublishUrlDTO) -> None:
         """Enqueue a DTO for background publishing."""
         ...
+
+    async def enqueue_many(self, *, dtos: Sequence[PublishUrlDTO]) -> None:
+        """Enqueue several DTOs, in order, for background publishing."""
+        ...
+
+
+class ClickPublishQueueProtocol(Protocol):
+    """
+    Application port for publishing click events asynchronously.
+
+    Implementations batch events and may drop them under overload, since
+    click counting must not slow redirects down.
+    """
+
+    async def enqueue(self, *, dto: UrlClickedEventDTO) -> bool:
+        """Enqueue a click event; returns False if it was dropped."""
+        ...
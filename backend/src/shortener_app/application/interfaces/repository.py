@@ -1,6 +1,7 @@
 __all__ = ("RepositoryProtocol",)
 
 from abc import abstractmethod
+from collections.abc import Mapping, Sequence
 from typing import Protocol
 from uuid import UUID
 
@@ -15,6 +16,15 @@ class RepositoryProtocol(Protocol):
         reference: dict[str, str | int | UUID],
     ) -> UrlEntity | None: ...
 
+    @abstractmethod
+    async def get_by_keys(
+        self,
+        *,
+        keys: Sequence[str],
+    ) -> list[UrlEntity]:
+        """Fetch the URLs for `keys` in one query; missing keys are omitted."""
+        ...
+
     @abstractmethod
     async def get_all(
         self,
@@ -56,5 +66,20 @@ class RepositoryProtocol(Protocol):
     async def apply_click_events(
         self,
         *,
-        events: list[tuple[UUID, str]],
-    ) -> int: ...
+        events: list[tuple[UUID, str, int]],
+    ) -> int:
+        """
+        Apply (event_id, key, clicks) events at most once per event id.
+
+        Returns the number of newly applied events.
+        """
+        ...
+
+    @abstractmethod
+    async def increment_clicks(
+        self,
+        *,
+        increments: Mapping[str, int],
+    ) -> None:
+        """Add pre-aggregated key -> clicks deltas without deduplication."""
+        ...
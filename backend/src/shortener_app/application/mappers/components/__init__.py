@@ -4,10 +4,14 @@ __all__ = (
     "UrlToUserUrlItemMapper",
     "UrlRedirectedMapper",
     "UrlCacheToEntityMapper",
+    "UrlToCacheRecordMapper",
+    "UrlToResolveMapper",
 )
 
 from shortener_app.application.mappers.components.url_cache_mapper import (
     UrlCacheToEntityMapper,
+    UrlToCacheRecordMapper,
+    UrlToResolveMapper,
 )
 from shortener_app.application.mappers.components.url_created_mapper import (
     UrlCreatedMapper,
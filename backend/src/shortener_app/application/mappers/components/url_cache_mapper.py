@@ -1,11 +1,19 @@
-__all__ = ("UrlCacheToEntityMapper",)
+__all__ = (
+    "UrlCacheToEntityMapper",
+    "UrlToCacheRecordMapper",
+    "UrlToResolveMapper",
+)
 
 from dataclasses import dataclass
 from typing import final
 
-from shortener_app.application.dtos.urls.urls_cache import UrlCacheRecordDTO
+from shortener_app.application.dtos.urls.urls_cache import (
+    UrlCacheRecordDTO,
+    UrlResolveDTO,
+)
 from shortener_app.application.interfaces.entity_dto_mapper import (
     DtoToEntityMapperProtocol,
+    EntityToDtoMapperProtocol,
 )
 from shortener_app.domain.entities.url import UrlEntity
 
@@ -25,4 +33,45 @@ class UrlCacheToEntityMapper(
             user_id=dto.user_id,
             target_url=dto.target_url,
             name=dto.name,
+            is_active=dto.is_active,
+        )
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class UrlToCacheRecordMapper(
+    EntityToDtoMapperProtocol[UrlEntity, UrlCacheRecordDTO],
+):
+    """
+    Application policy mapper: UrlEntity -> UrlCacheRecordDTO
+
+    Used when a persisted URL is written back into the cache.
+    """
+
+    def to_dto(self, entity: UrlEntity) -> UrlCacheRecordDTO:
+        return UrlCacheRecordDTO(
+            key=entity.key,
+            target_url=entity.target_url,
+            user_id=entity.user_id,
+            name=entity.name,
+            is_active=entity.is_active,
+        )
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class UrlToResolveMapper(
+    EntityToDtoMapperProtocol[UrlEntity, UrlResolveDTO],
+):
+    """
+    Application policy mapper: UrlEntity -> UrlResolveDTO
+
+    Used when a redirect is answered from a full entity.
+    """
+
+    def to_dto(self, entity: UrlEntity) -> UrlResolveDTO:
+        return UrlResolveDTO(
+            key=entity.key,
+            target_url=entity.target_url,
+            is_active=entity.is_active,
         )
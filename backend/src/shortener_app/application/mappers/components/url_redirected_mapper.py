@@ -3,6 +3,7 @@ __all__ = ("UrlRedirectedMapper",)
 from dataclasses import dataclass
 from typing import final
 
+from shortener_app.application.dtos.urls.urls_cache import UrlResolveDTO
 from shortener_app.application.dtos.urls.urls_events import UrlClickedEventDTO
 from shortener_app.application.interfaces.entity_dto_mapper import (
     EntityToDtoMapperProtocol,
@@ -21,3 +22,6 @@ class UrlRedirectedMapper(
 
     def to_dto(self, entity: UrlEntity) -> UrlClickedEventDTO:
         return UrlClickedEventDTO(key=entity.key)
+
+    def to_dto_from_resolve(self, dto: UrlResolveDTO) -> UrlClickedEventDTO:
+        return UrlClickedEventDTO(key=dto.key)
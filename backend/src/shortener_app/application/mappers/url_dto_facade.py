@@ -3,7 +3,10 @@ __all__ = ("UrlDtoFacade",)
 from dataclasses import dataclass
 from typing import final
 
-from shortener_app.application.dtos.urls.urls_cache import UrlCacheRecordDTO
+from shortener_app.application.dtos.urls.urls_cache import (
+    UrlCacheRecordDTO,
+    UrlResolveDTO,
+)
 from shortener_app.application.dtos.urls.urls_events import (
     PublishUrlDTO,
     UrlClickedEventDTO,
@@ -15,6 +18,8 @@ from shortener_app.application.mappers.components import (
     UrlCreatedMapper,
     UrlPublishMapper,
     UrlRedirectedMapper,
+    UrlToCacheRecordMapper,
+    UrlToResolveMapper,
     UrlToUserUrlItemMapper,
 )
 from shortener_app.domain.entities.url import UrlEntity
@@ -35,7 +40,9 @@ class UrlDtoFacade:
     created: UrlCreatedMapper
     publish_redirected_url: UrlRedirectedMapper
     url_cache_to_entity: UrlCacheToEntityMapper
+    url_to_cache_record: UrlToCacheRecordMapper
     user_item: UrlToUserUrlItemMapper
+    url_to_resolve: UrlToResolveMapper
 
     def to_publish_dto(self, entity: UrlEntity) -> PublishUrlDTO:
         return self.publish_new_url.to_dto(entity)
@@ -52,5 +59,17 @@ class UrlDtoFacade:
     ) -> UrlClickedEventDTO:
         return self.publish_redirected_url.to_dto(entity)
 
+    def to_publish_redirected_dto_from_resolve(
+        self,
+        dto: UrlResolveDTO,
+    ) -> UrlClickedEventDTO:
+        return self.publish_redirected_url.to_dto_from_resolve(dto)
+
     def to_entity_from_cache_dto(self, dto: UrlCacheRecordDTO) -> UrlEntity:
         return self.url_cache_to_entity.to_entity(dto)
+
+    def to_cache_record_dto(self, entity: UrlEntity) -> UrlCacheRecordDTO:
+        return self.url_to_cache_record.to_dto(entity)
+
+    def to_resolve_dto(self, entity: UrlEntity) -> UrlResolveDTO:
+        return self.url_to_resolve.to_dto(entity)
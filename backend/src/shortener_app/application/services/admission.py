@@ -0,0 +1,101 @@
+__all__ = ("AdmissionController",)
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class AdmissionController:
+    """
+    Sheds new work while a pipeline is saturated, with hysteresis.
+
+    Shedding starts once the pipeline depth reaches `high_depth` or the
+    smoothed publish latency reaches `high_latency_ms`, and stops only when
+    depth is back to `low_depth` and latency to `low_latency_ms`, so the
+    state does not flap around a single threshold. Shed callers are told to
+    retry after `retry_after_sec`.
+
+    Latency is only observed when the pipeline publishes something. Once
+    it has drained while latency keeps it shedding, a single probe is
+    admitted at depth 0, and no other until a publish is observed, so that
+    latency gets a fresh sample. A check with `claim_probe=False` passes
+    while the probe is free without taking it.
+    """
+
+    def __init__(
+        self,
+        *,
+        high_depth: int,
+        low_depth: int,
+        high_latency_ms: float = 500.0,
+        low_latency_ms: float = 100.0,
+        retry_after_sec: float = 1.0,
+        smoothing: float = 0.2,
+    ) -> None:
+        if not 0 <= low_depth < high_depth:
+            raise ValueError("0 <= low_depth < high_depth required")
+        if not 0 <= low_latency_ms < high_latency_ms:
+            raise ValueError("0 <= low_latency_ms < high_latency_ms required")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+
+        self._high_depth = high_depth
+        self._low_depth = low_depth
+        self._high_latency_ms = high_latency_ms
+        self._low_latency_ms = low_latency_ms
+        self._retry_after_sec = retry_after_sec
+        self._smoothing = smoothing
+
+        self._latency_ms = 0.0
+        self._shedding = False
+        self._probe_inflight = False
+
+    @property
+    def retry_after_sec(self) -> float:
+        return self._retry_after_sec
+
+    @property
+    def shedding(self) -> bool:
+        return self._shedding
+
+    def admit(self, *, depth: int, claim_probe: bool = True) -> bool:
+        """Whether new work may enter a pipeline `depth` items deep."""
+        if self._shedding:
+            if (
+                depth <= self._low_depth
+                and self._latency_ms <= self._low_latency_ms
+            ):
+                self._shedding = False
+                self._probe_inflight = False
+                logger.info("Admission resumed", depth=depth)
+        elif (
+            depth >= self._high_depth
+            or self._latency_ms >= self._high_latency_ms
+        ):
+            self._shedding = True
+            logger.warning(
+                "Admission shedding load",
+                depth=depth,
+                publish_latency_ms=round(self._latency_ms, 2),
+            )
+
+        if not self._shedding:
+            return True
+
+        # Drained, but still shedding on stale latency: let one probe in.
+        if depth > 0 or self._probe_inflight:
+            return False
+        if claim_probe:
+            self._probe_inflight = True
+        return True
+
+    def observe(self, *, latency_ms: float) -> None:
+        """Account the latency of one publish by the pipeline."""
+        self._latency_ms += self._smoothing * (latency_ms - self._latency_ms)
+        self._probe_inflight = False
+
+    def stats(self) -> dict[str, float | bool]:
+        return {
+            "shedding": self._shedding,
+            "publish_latency_ms": round(self._latency_ms, 3),
+        }
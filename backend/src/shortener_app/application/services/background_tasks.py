@@ -0,0 +1,149 @@
+__all__ = (
+    "BackgroundTaskSupervisor",
+    "OverflowPolicy",
+)
+
+import asyncio
+import random
+from collections.abc import Awaitable, Callable
+from enum import StrEnum
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class OverflowPolicy(StrEnum):
+    DROP = "drop"
+    SAMPLE = "sample"
+    BLOCK = "block"
+
+
+class BackgroundTaskSupervisor:
+    """
+    Runs fire-and-forget side effects with a bounded number of live tasks.
+
+    Every task is referenced until it finishes, so it cannot be garbage
+    collected mid-flight, and failures are logged instead of surfacing as
+    "exception was never retrieved". Once `max_concurrency` tasks are in
+    flight, new submissions are handled by `policy`:
+
+    - DROP: the side effect is skipped;
+    - SAMPLE: admission probability falls linearly from 1 at half the limit
+      to 0 at the limit, shedding load before the cap is reached;
+    - BLOCK: the caller waits for a free slot.
+
+    `drain` stops accepting work and waits for in-flight tasks on shutdown.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = 1000,
+        policy: OverflowPolicy = OverflowPolicy.DROP,
+        rng: random.Random | None = None,
+    ) -> None:
+        if max_concurrency <= 0:
+            raise ValueError("max_concurrency must be > 0")
+
+        self._max_concurrency = max_concurrency
+        self._policy = policy
+        self._rng = rng or random.Random()
+
+        self._slots = asyncio.Semaphore(max_concurrency)
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._closed = False
+
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._dropped = 0
+
+    async def submit(
+        self,
+        fn: Callable[[], Awaitable[object]],
+        *,
+        name: str,
+    ) -> bool:
+        """Schedule `fn`; returns False if it was dropped."""
+        if self._closed or not self._admit():
+            self._dropped += 1
+            return False
+
+        await self._slots.acquire()
+
+        task = asyncio.create_task(self._run(fn, name=name), name=name)
+        self._tasks.add(task)
+        # Not in `_run`: a task cancelled before it starts never runs it.
+        task.add_done_callback(self._done)
+
+        self._submitted += 1
+        return True
+
+    async def drain(self, *, timeout_sec: float = 5.0) -> None:
+        """Reject new work, wait for in-flight tasks and cancel stragglers."""
+        self._closed = True
+
+        if self._tasks:
+            _, pending = await asyncio.wait(
+                set(self._tasks),
+                timeout=timeout_sec,
+            )
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+                logger.warning(
+                    "Background tasks cancelled on shutdown",
+                    cancelled=len(pending),
+                    timeout_sec=timeout_sec,
+                )
+
+        logger.info("Background tasks drained", **self.stats())
+
+    def stats(self) -> dict[str, int | str]:
+        return {
+            "inflight": len(self._tasks),
+            "max_concurrency": self._max_concurrency,
+            "policy": self._policy.value,
+            "submitted": self._submitted,
+            "completed": self._completed,
+            "failed": self._failed,
+            "dropped": self._dropped,
+        }
+
+    def _done(self, task: asyncio.Task[None]) -> None:
+        self._tasks.discard(task)
+        self._slots.release()
+
+    def _admit(self) -> bool:
+        if self._policy is OverflowPolicy.BLOCK:
+            return True
+
+        inflight = len(self._tasks)
+        if inflight >= self._max_concurrency:
+            return False
+
+        if self._policy is OverflowPolicy.SAMPLE:
+            soft_limit = self._max_concurrency // 2
+            if inflight > soft_limit:
+                headroom = self._max_concurrency - inflight
+                span = self._max_concurrency - soft_limit
+                return self._rng.random() < headroom / span
+
+        return True
+
+    async def _run(
+        self,
+        fn: Callable[[], Awaitable[object]],
+        *,
+        name: str,
+    ) -> None:
+        try:
+            await fn()
+            self._completed += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._failed += 1
+            logger.exception("Background task failed", task=name)
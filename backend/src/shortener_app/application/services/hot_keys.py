@@ -0,0 +1,241 @@
+__all__ = (
+    "HotKeyTracker",
+    "SpaceSaving",
+)
+
+import asyncio
+import time
+from collections.abc import Callable
+
+import structlog
+
+from shortener_app.application.dtos.urls.urls_responses import HotKeyDTO
+
+logger = structlog.get_logger(__name__)
+
+
+class SpaceSaving:
+    """
+    Space-Saving heavy-hitters sketch over a stream of keys.
+
+    At most `capacity` keys are monitored. An unmonitored key replaces the
+    one with the smallest count and inherits that count as its error, so a
+    count overestimates the true frequency by at most `error`. Any key whose
+    true frequency exceeds total / capacity is guaranteed to be monitored.
+
+    Keys are grouped into buckets by count (Stream-Summary), which makes
+    `add` O(1): an increment moves a key to the next bucket and eviction
+    takes any key from the minimum bucket.
+    """
+
+    def __init__(self, *, capacity: int) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+
+        self._capacity = capacity
+        self._counts: dict[str, int] = {}
+        self._errors: dict[str, int] = {}
+        self._buckets: dict[int, dict[str, None]] = {}
+        self._min = 0
+        self._total = 0
+
+    @property
+    def total(self) -> int:
+        return self._total
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def add(self, key: str) -> None:
+        self._total += 1
+
+        count = self._counts.get(key)
+        if count is not None:
+            self._move(key, count)
+            return
+
+        if len(self._counts) < self._capacity:
+            self._counts[key] = 1
+            self._errors[key] = 0
+            self._buckets.setdefault(1, {})[key] = None
+            self._min = 1
+            return
+
+        floor = self._min
+        victim = next(iter(self._buckets[floor]))
+        del self._counts[victim]
+        del self._errors[victim]
+
+        self._counts[key] = floor
+        self._errors[key] = floor
+        self._buckets[floor][key] = None
+        del self._buckets[floor][victim]
+        self._move(key, floor)
+
+    def count(self, key: str) -> int:
+        return self._counts.get(key, 0)
+
+    def error(self, key: str) -> int:
+        return self._errors.get(key, 0)
+
+    def top(self, k: int) -> list[tuple[str, int, int]]:
+        """Up to `k` (key, count, error) triples, highest count first."""
+        result: list[tuple[str, int, int]] = []
+        for count in sorted(self._buckets, reverse=True):
+            for key in self._buckets[count]:
+                result.append((key, count, self._errors[key]))
+                if len(result) >= k:
+                    return result
+        return result
+
+    def _move(self, key: str, count: int) -> None:
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if count == self._min:
+                self._min = count + 1
+
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, {})[key] = None
+
+
+class HotKeyTracker:
+    """
+    Tracks the most requested short keys over a sliding time window.
+
+    Each window of `window_sec` feeds a fresh Space-Saving sketch; the
+    previous window is kept to estimate per-second rates as a weighted sum
+    of both, so rates do not drop to zero at every window boundary.
+
+    `record` is O(1) and is called on the redirect path. `is_hot` is O(1)
+    and answers from the top-K of the last completed window, so other
+    components can cheaply give hot keys special treatment.
+    """
+
+    def __init__(
+        self,
+        *,
+        capacity: int = 1_000,
+        top_k: int = 20,
+        window_sec: float = 60.0,
+        report_interval_sec: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if window_sec <= 0:
+            raise ValueError("window_sec must be > 0")
+        if not 0 < top_k <= capacity:
+            raise ValueError("top_k must be in (0, capacity]")
+
+        self._capacity = capacity
+        self._top_k = top_k
+        self._window_sec = window_sec
+        self._report_interval_sec = report_interval_sec
+        self._clock = clock
+
+        self._current = SpaceSaving(capacity=capacity)
+        self._previous = SpaceSaving(capacity=capacity)
+        self._window_started = clock()
+        self._hot: frozenset[str] = frozenset()
+
+        self._rotations = 0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def top_k(self) -> int:
+        return self._top_k
+
+    def record(self, key: str) -> None:
+        self._maybe_rotate()
+        self._current.add(key)
+
+    def is_hot(self, key: str) -> bool:
+        self._maybe_rotate()
+        return key in self._hot
+
+    def top(self, k: int | None = None) -> list[HotKeyDTO]:
+        """Estimated top keys, highest rate first."""
+        self._maybe_rotate()
+        limit = min(k or self._top_k, self._capacity)
+
+        elapsed = self._clock() - self._window_started
+        previous_weight = 1.0 - elapsed / self._window_sec
+
+        candidates = {key for key, _, _ in self._current.top(limit)}
+        candidates.update(key for key, _, _ in self._previous.top(limit))
+
+        hot_keys = []
+        for key in candidates:
+            count = self._current.count(key)
+            weighted = count + previous_weight * self._previous.count(key)
+            hot_keys.append(
+                HotKeyDTO(
+                    key=key,
+                    count=count,
+                    error=self._current.error(key),
+                    rate_per_sec=weighted / self._window_sec,
+                ),
+            )
+
+        hot_keys.sort(key=lambda item: (-item.rate_per_sec, item.key))
+        return hot_keys[:limit]
+
+    async def start(self) -> None:
+        if self._task is not None or self._report_interval_sec <= 0:
+            return
+
+        self._task = asyncio.create_task(
+            self._report_loop(),
+            name="hot-key-report",
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            "tracked": len(self._current),
+            "window_requests": self._current.total,
+            "window_sec": self._window_sec,
+            "rotations": self._rotations,
+        }
+
+    def _maybe_rotate(self) -> None:
+        now = self._clock()
+        elapsed = now - self._window_started
+        if elapsed < self._window_sec:
+            return
+
+        if elapsed >= 2 * self._window_sec:
+            # Idle for a whole window: the last window saw no traffic.
+            self._previous = SpaceSaving(capacity=self._capacity)
+            self._window_started = now
+        else:
+            self._previous = self._current
+            self._window_started += self._window_sec
+
+        self._current = SpaceSaving(capacity=self._capacity)
+        self._hot = frozenset(
+            key for key, _, _ in self._previous.top(self._top_k)
+        )
+        self._rotations += 1
+
+    async def _report_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._report_interval_sec)
+            logger.info(
+                "Hot keys",
+                top=[
+                    (item.key, round(item.rate_per_sec, 2))
+                    for item in self.top()
+                ],
+                **self.stats(),
+            )
@@ -0,0 +1,48 @@
+__all__ = ("SingleFlight",)
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+
+
+class SingleFlight[K: Hashable, V]:
+    """
+    Coalesces concurrent calls for the same key into one execution.
+
+    The first caller for a key starts the call; callers arriving while it is
+    in flight await the same result (or exception). The call runs as its own
+    task, so a cancelled caller does not cancel the shared work for others.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[K, asyncio.Task[V]] = {}
+
+        self._calls = 0
+        self._shared = 0
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        task = self._inflight.get(key)
+
+        if task is None:
+            self._calls += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._forget(key, t))
+        else:
+            self._shared += 1
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "inflight": len(self._inflight),
+            "calls": self._calls,
+            "shared": self._shared,
+        }
+
+    def _forget(self, key: K, task: asyncio.Task[V]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+        # Mark the outcome as retrieved even if every caller was cancelled.
+        if not task.cancelled():
+            task.exception()
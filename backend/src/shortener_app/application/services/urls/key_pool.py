@@ -0,0 +1,224 @@
+__all__ = ("ReservedKeyPool",)
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+import structlog
+
+if TYPE_CHECKING:
+    from shortener_app.application.services.urls.url_cache import (
+        UrlCacheService,
+    )
+    from shortener_app.domain.services.key_generator import RandomKeyGenerator
+
+logger = structlog.get_logger(__name__)
+
+
+class ReservedKeyPool:
+    """
+    Per-process pool of short keys already reserved in the cache.
+
+    Keys are reserved in batches of `batch_size` with one pipelined SETNX
+    of placeholder records, so `pop` hands out a key without any network
+    round trip. A background task tops the pool back up to `size` whenever
+    it drops below `low_water`.
+
+    Placeholders expire after `reservation_ttl_sec`. A pooled key is only
+    handed out during the first half of that window, so the placeholder is
+    still ours when the real record replaces it; older keys are discarded.
+    `stop` deletes the placeholders of keys that were never handed out,
+    and only while they still hold this pool's token.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_service: "UrlCacheService",
+        key_generator: "RandomKeyGenerator",
+        size: int = 1_000,
+        low_water: int = 250,
+        batch_size: int = 200,
+        reservation_ttl_sec: int = 3600,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if size <= 0 or batch_size <= 0:
+            raise ValueError("size and batch_size must be > 0")
+        if not 0 <= low_water < size:
+            raise ValueError("low_water must be in [0, size)")
+
+        self._cache_service = cache_service
+        self._key_generator = key_generator
+        self._size = size
+        self._low_water = low_water
+        self._batch_size = batch_size
+        self._reservation_ttl_sec = reservation_ttl_sec
+        self._max_age_sec = reservation_ttl_sec / 2
+        self._clock = clock
+
+        self._token = uuid4().hex
+        self._keys: deque[tuple[float, str]] = deque()
+        self._refill_needed = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+        self._popped = 0
+        self._empty = 0
+        self._expired = 0
+        self._refills = 0
+        self._attempted = 0
+        self._reserved = 0
+        self._refill_sec_total = 0.0
+        self._refill_sec_last = 0.0
+        self._reclaimed = 0
+
+    @property
+    def depth(self) -> int:
+        return len(self._keys)
+
+    @property
+    def token(self) -> str:
+        """Owner token stored in this pool's placeholders."""
+        return self._token
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+
+        await self.refill()
+        self._task = asyncio.create_task(
+            self._refill_loop(),
+            name="key-pool-refill",
+        )
+        logger.info("Key pool started", **self.stats())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        # Aged keys are dropped as `pop` would: their placeholders may have
+        # expired and been claimed elsewhere, so Redis is not touched.
+        oldest_allowed = self._clock() - self._max_age_sec
+        unused = [key for at, key in self._keys if at >= oldest_allowed]
+        self._expired += len(self._keys) - len(unused)
+        self._keys.clear()
+        if unused:
+            self._reclaimed += await self._cache_service.release_reservations(
+                keys=unused,
+                token=self._token,
+            )
+        logger.info("Key pool stopped", **self.stats())
+
+    def pop(self) -> str | None:
+        """Take a reserved key, or None if the pool has none left."""
+        oldest_allowed = self._clock() - self._max_age_sec
+
+        while self._keys:
+            reserved_at, key = self._keys.popleft()
+            if reserved_at >= oldest_allowed:
+                self._popped += 1
+                self._maybe_request_refill()
+                return key
+            self._expired += 1
+
+        self._empty += 1
+        self._maybe_request_refill()
+        return None
+
+    def give_back(self, keys: Sequence[str]) -> None:
+        """
+        Return popped keys that were not assigned; they are handed out next.
+
+        A placeholder that expired in the meantime is caught by the
+        token check on assignment, so the keys are re-stamped as fresh.
+        """
+        now = self._clock()
+        self._keys.extendleft((now, key) for key in reversed(keys))
+        self._popped -= len(keys)
+
+    async def refill(self) -> int:
+        """Reserve keys until the pool is full; returns how many were added."""
+        added = 0
+
+        while (missing := self._size - len(self._keys)) > 0:
+            candidates = list(
+                dict.fromkeys(
+                    self._key_generator.generate_many(
+                        min(missing, self._batch_size),
+                    ),
+                ),
+            )
+
+            started = time.monotonic()
+            reserved = await self._cache_service.reserve_keys(
+                keys=candidates,
+                token=self._token,
+                ttl_seconds=self._reservation_ttl_sec,
+            )
+            elapsed = time.monotonic() - started
+
+            self._refills += 1
+            self._attempted += len(candidates)
+            self._reserved += len(reserved)
+            self._refill_sec_last = elapsed
+            self._refill_sec_total += elapsed
+
+            now = self._clock()
+            self._keys.extend((now, key) for key in reserved)
+            added += len(reserved)
+
+            if not reserved:
+                # Every candidate collided or the cache is failing; the
+                # next pop below the low-water mark retries.
+                logger.warning("Key pool refill reserved nothing")
+                break
+
+        return added
+
+    def stats(self) -> dict[str, int | float]:
+        collisions = self._attempted - self._reserved
+        return {
+            "depth": len(self._keys),
+            "size": self._size,
+            "popped": self._popped,
+            "empty": self._empty,
+            "expired": self._expired,
+            "refills": self._refills,
+            "refill_ms_last": round(self._refill_sec_last * 1000, 2),
+            "refill_ms_avg": round(
+                self._refill_sec_total / self._refills * 1000
+                if self._refills
+                else 0.0,
+                2,
+            ),
+            "collisions": collisions,
+            "collision_rate": round(
+                collisions / self._attempted if self._attempted else 0.0,
+                4,
+            ),
+            "reclaimed": self._reclaimed,
+        }
+
+    def _maybe_request_refill(self) -> None:
+        if len(self._keys) < self._low_water:
+            self._refill_needed.set()
+
+    async def _refill_loop(self) -> None:
+        while True:
+            await self._refill_needed.wait()
+            self._refill_needed.clear()
+            try:
+                added = await self.refill()
+            except Exception:
+                logger.exception("Key pool refill failed")
+                continue
+            logger.debug("Key pool refilled", added=added, **self.stats())
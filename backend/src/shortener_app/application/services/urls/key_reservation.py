@@ -1,5 +1,6 @@
 __all__ = ("UrlKeyReservationService",)
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, final
 
@@ -9,6 +10,12 @@ from shortener_app.application.dtos.urls.urls_cache import (
 )
 
 if TYPE_CHECKING:
+    from shortener_app.application.services.urls.key_pool import (
+        ReservedKeyPool,
+    )
+    from shortener_app.application.services.urls.sequence_keys import (
+        SequenceKeyAllocator,
+    )
     from shortener_app.application.services.urls.url_cache import (
         UrlCacheService,
     )
@@ -23,29 +30,162 @@ class UrlKeyReservationService:
 
     max_attempts: int = 50
     ttl_seconds: int | None = None
+    pool: "ReservedKeyPool | None" = None
+    sequence_keys: "SequenceKeyAllocator | None" = None
+    candidates_per_call: int = 1
 
     async def reserve(
         self,
         *,
         seed: UrlCacheSeedDTO,
     ) -> str:
-        for _ in range(self.max_attempts):
-            key = self.key_generator()
+        if self.pool is not None and (key := self.pool.pop()) is not None:
+            # One compare-and-set replaces the placeholder while it is
+            # still ours; otherwise fall back to a fresh key.
+            try:
+                assigned = await self.cache_service.assign_reserved(
+                    dto=self._record(key=key, seed=seed),
+                    token=self.pool.token,
+                )
+            except BaseException:
+                self.pool.give_back([key])
+                raise
+            if assigned:
+                return key
 
-            record = UrlCacheRecordDTO(
-                key=key,
-                target_url=seed.target_url,
-                user_id=seed.user_id,
-                name=seed.name,
-                is_active=seed.is_active,
+        attempts = 0
+        while attempts < self.max_attempts:
+            count = min(
+                self._candidates_per_call(),
+                self.max_attempts - attempts,
             )
+            attempts += count
+
+            if count > 1:
+                # One EVALSHA claims the first free of `count` random keys.
+                if (
+                    key := await self.cache_service.claim_first_free(
+                        dtos=[
+                            self._record(key=key, seed=seed)
+                            for key in self.key_generator.generate_many(count)
+                        ],
+                    )
+                ) is not None:
+                    return key
+                continue
 
+            key = await self._next_key()
             if await self.cache_service.set_new_url(
                 key=key,
-                dto=record,
+                dto=self._record(key=key, seed=seed),
             ):
                 return key
 
         raise RuntimeError(
             "Failed to allocate unique key (too many collisions)",
         )
+
+    async def reserve_many(
+        self,
+        *,
+        seeds: Sequence[UrlCacheSeedDTO],
+    ) -> list[str | None]:
+        """
+        Reserve one key per seed; None marks a seed that got no key.
+
+        Pooled keys are assigned with one compare-and-set. The other seeds
+        get fresh candidates, written with one pipelined SETNX per round, and
+        only the seeds whose candidate collided go into the next round.
+        """
+        keys: list[str | None] = [None] * len(seeds)
+        pending = list(range(len(seeds)))
+
+        if self.pool is not None:
+            pooled: list[tuple[int, str]] = []
+            for index in pending:
+                if (key := self.pool.pop()) is None:
+                    break
+                pooled.append((index, key))
+
+            if pooled:
+                try:
+                    stored = await self.cache_service.assign_reserved_many(
+                        dtos=[
+                            self._record(key=key, seed=seeds[index])
+                            for index, key in pooled
+                        ],
+                        token=self.pool.token,
+                    )
+                except BaseException:
+                    # Still reserved for us: keep them for the next request.
+                    self.pool.give_back([key for _, key in pooled])
+                    raise
+                for (index, key), ok in zip(pooled, stored, strict=True):
+                    if ok:
+                        keys[index] = key
+                pending = [index for index in pending if keys[index] is None]
+
+        for _ in range(self.max_attempts):
+            if not pending:
+                break
+
+            # A candidate drawn twice in one round is written only once;
+            # the other seed retries in the next round.
+            candidates: dict[str, int] = {}
+            for key, index in zip(
+                await self._next_keys(len(pending)),
+                pending,
+                strict=True,
+            ):
+                candidates.setdefault(key, index)
+
+            stored = await self.cache_service.set_new_urls(
+                dtos=[
+                    self._record(key=key, seed=seeds[index])
+                    for key, index in candidates.items()
+                ],
+            )
+            for (key, index), ok in zip(
+                candidates.items(),
+                stored,
+                strict=True,
+            ):
+                if ok:
+                    keys[index] = key
+
+            pending = [index for index in pending if keys[index] is None]
+
+        return keys
+
+    async def release(self, *, keys: Sequence[str]) -> None:
+        """Give back reserved keys whose URLs were never published."""
+        if keys:
+            await self.cache_service.release_reserved(keys=keys)
+
+    async def _next_keys(self, count: int) -> list[str]:
+        if self.sequence_keys is not None:
+            return [await self.sequence_keys.next_key() for _ in range(count)]
+        return self.key_generator.generate_many(count)
+
+    def _candidates_per_call(self) -> int:
+        # Sequence keys do not collide; drawing spares would waste them.
+        if self.sequence_keys is not None:
+            return 1
+        return max(self.candidates_per_call, 1)
+
+    async def _next_key(self) -> str:
+        # Sequence keys never repeat; SETNX still guards against keys that
+        # were issued randomly before the strategy was switched.
+        if self.sequence_keys is not None:
+            return await self.sequence_keys.next_key()
+        return self.key_generator()
+
+    @staticmethod
+    def _record(*, key: str, seed: UrlCacheSeedDTO) -> UrlCacheRecordDTO:
+        return UrlCacheRecordDTO(
+            key=key,
+            target_url=seed.target_url,
+            user_id=seed.user_id,
+            name=seed.name,
+            is_active=seed.is_active,
+        )
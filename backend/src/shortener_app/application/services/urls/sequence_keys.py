@@ -0,0 +1,87 @@
+__all__ = ("SequenceKeyAllocator",)
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import structlog
+
+if TYPE_CHECKING:
+    from shortener_app.application.interfaces.key_sequence import (
+        KeySequenceProtocol,
+    )
+    from shortener_app.domain.services.key_permutation import (
+        FeistelKeyPermutation,
+    )
+
+logger = structlog.get_logger(__name__)
+
+
+class SequenceKeyAllocator:
+    """
+    Allocates short keys from leased blocks of a shared sequence.
+
+    Every process leases `block_size` numbers at a time and maps each one
+    through a keyed permutation, so keys are unique by construction and
+    creating one costs the same at any fill level. Only one lease per
+    block touches the network; concurrent callers wait on a single lease.
+
+    Numbers of a block that is dropped (e.g. on restart) are never reused:
+    the keyspace loses them, which is cheap next to a uniqueness check.
+    """
+
+    def __init__(
+        self,
+        *,
+        sequence: "KeySequenceProtocol",
+        permutation: "FeistelKeyPermutation",
+        block_size: int = 1_000,
+    ) -> None:
+        if block_size <= 0:
+            raise ValueError("block_size must be > 0")
+
+        self._sequence = sequence
+        self._permutation = permutation
+        self._block_size = block_size
+
+        self._block: range = range(0)
+        self._next = 0
+        self._lock = asyncio.Lock()
+
+        self._allocated = 0
+        self._leases = 0
+
+    async def next_key(self) -> str:
+        if self._next >= len(self._block):
+            async with self._lock:
+                if self._next >= len(self._block):
+                    await self._lease()
+
+        index = self._block[self._next]
+        self._next += 1
+        self._allocated += 1
+        return self._permutation(index)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "allocated": self._allocated,
+            "leases": self._leases,
+            "block_remaining": len(self._block) - self._next,
+        }
+
+    async def _lease(self) -> None:
+        block = await self._sequence.lease(count=self._block_size)
+
+        capacity = self._permutation.capacity
+        if block.start >= capacity:
+            raise RuntimeError("Key sequence exhausted the keyspace")
+        if block.stop > capacity:
+            block = range(block.start, capacity)
+
+        self._block = block
+        self._next = 0
+        self._leases += 1
+        logger.debug(
+            "Key sequence block leased",
+            start=block.start,
+            size=len(block),
+        )
@@ -1,17 +1,45 @@
-__all__ = ("UrlCacheService",)
+__all__ = (
+    "UrlCacheMiss",
+    "UrlCacheService",
+)
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, final
+import asyncio
+import random
+import time
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Final, final
 
 from shortener_app.application.dtos.urls.urls_cache import (
     UrlCacheRecordDTO,
+    UrlResolveDTO,
 )
 from shortener_app.domain.entities.url import UrlEntity
 
 if TYPE_CHECKING:
-    from shortener_app.application.interfaces.cache import CacheProtocol
+    from shortener_app.application.interfaces.cache import (
+        CacheProtocol,
+        KeyFilterProtocol,
+        LocalCacheProtocol,
+    )
     from shortener_app.application.interfaces.dto_codec import DtoCodecProtocol
     from shortener_app.application.mappers.url_dto_facade import UrlDtoFacade
+    from shortener_app.application.services.background_tasks import (
+        BackgroundTaskSupervisor,
+    )
+
+_TOMBSTONE: Final[dict[str, str]] = {"tombstone": "1"}
+# Placeholder for a key reserved by a key pool but not yet assigned a URL.
+_RESERVED_FIELD: Final[str] = "reserved"
+
+
+class UrlCacheMiss(Enum):
+    """Why a cache lookup did not produce an entity."""
+
+    UNKNOWN = "unknown"
+    KNOWN_MISSING = "known_missing"
 
 
 @final
@@ -20,10 +48,32 @@ class UrlCacheService:
     cache: "CacheProtocol"
     codec: "DtoCodecProtocol"
     mapper: "UrlDtoFacade"
+    resolve_codec: "DtoCodecProtocol[UrlResolveDTO, Any] | None" = None
+
+    local_cache: "LocalCacheProtocol[UrlEntity | UrlResolveDTO] | None" = None
+    invalidation_channel: str | None = None
 
     max_attempts: int = 50
     ttl_seconds: int | None = None
 
+    read_through_ttl_seconds: int | None = None
+    read_through_ttl_jitter_seconds: int = 0
+    invalidation_guard_seconds: int = 5
+
+    negative_ttl_seconds: int | None = None
+    key_filter: "KeyFilterProtocol | None" = None
+
+    fill_lock_ttl_seconds: int = 2
+    fill_poll_interval_seconds: float = 0.025
+
+    serve_stale_seconds: float = 0.0
+    background: "BackgroundTaskSupervisor | None" = None
+    _revalidating: set[str] = field(
+        default_factory=set,
+        init=False,
+        repr=False,
+    )
+
     async def set_new_url(
         self,
         *,
@@ -35,18 +85,373 @@ class UrlCacheService:
             value=self.codec.encode(dto=dto),
             ttl_seconds=self.ttl_seconds,
         ):
+            if self.key_filter is not None:
+                self.key_filter.add(key)
             return key
         return False
 
+    async def set_new_urls(
+        self,
+        *,
+        dtos: Sequence[UrlCacheRecordDTO],
+    ) -> list[bool]:
+        """SETNX the records of many new keys in one pipelined round trip."""
+        stored = await self.cache.set_nx_many(
+            items={
+                self._key(key=dto.key): self.codec.encode(dto=dto)
+                for dto in dtos
+            },
+            ttl_seconds=self.ttl_seconds,
+        )
+        if self.key_filter is not None:
+            for dto, ok in zip(dtos, stored, strict=True):
+                if ok:
+                    self.key_filter.add(dto.key)
+        return stored
+
+    async def claim_first_free(
+        self,
+        *,
+        dtos: Sequence[UrlCacheRecordDTO],
+    ) -> str | None:
+        """
+        Store the first record whose key is free, in one round trip.
+
+        Returns its key, or None if every candidate key was taken.
+        """
+        records = {self._key(key=dto.key): dto for dto in dtos}
+        claimed = await self.cache.reserve_first_free(
+            items={
+                cache_key: self.codec.encode(dto=dto)
+                for cache_key, dto in records.items()
+            },
+            ttl_seconds=self.ttl_seconds,
+        )
+        if claimed is None:
+            return None
+
+        key = records[claimed].key
+        if self.key_filter is not None:
+            self.key_filter.add(key)
+        return key
+
     async def get_by_key_cached(
         self,
         *,
         key: str,
     ) -> UrlEntity | None:
-        if value := await self.cache.get(key=self._key(key=key)):
-            dto = self.codec.decode(value)
-            return self.mapper.to_entity_from_cache_dto(dto=dto)
-        return None
+        result = await self.lookup(key=key)
+        return result if isinstance(result, UrlEntity) else None
+
+    async def lookup(
+        self,
+        *,
+        key: str,
+    ) -> UrlEntity | UrlCacheMiss:
+        """
+        Resolve a key from the cache tiers without touching the database.
+
+        Order: local cache, Redis record or tombstone, then the key filter.
+        The filter is consulted only after Redis because freshly reserved
+        keys may not have reached this instance's filter copy yet, while
+        their Redis record is written synchronously.
+
+        A local entry up to `serve_stale_seconds` past its TTL is returned
+        as is while it is refreshed from Redis in the background. While
+        Redis is unavailable, any retained local entry is returned instead
+        of falling through to the database.
+        """
+        if self.local_cache is not None:
+            if isinstance(entity := self.local_cache.get(key), UrlEntity):
+                return entity
+            if isinstance(
+                stale := await self._serve_stale(key=key),
+                UrlEntity,
+            ):
+                return stale
+
+        value = await self.cache.get(key=self._key(key=key))
+        return self._from_cached(key=key, value=value)
+
+    async def lookup_resolve(
+        self,
+        *,
+        key: str,
+    ) -> UrlResolveDTO | UrlCacheMiss:
+        """
+        Redirect-only variant of `lookup` returning a UrlResolveDTO.
+
+        Redis records are decoded with `resolve_codec` straight into the
+        projection, which is what the local cache then keeps: no owner UUID
+        is parsed and no UrlEntity is built. Local entries of either kind
+        answer the lookup.
+        """
+        if self.resolve_codec is None:
+            result = await self.lookup(key=key)
+            if isinstance(result, UrlEntity):
+                return self.mapper.to_resolve_dto(entity=result)
+            return result
+
+        if self.local_cache is not None:
+            local = self.local_cache.get(key) or await self._serve_stale(
+                key=key,
+            )
+            if isinstance(local, UrlResolveDTO):
+                return local
+            if local is not None:
+                return self.mapper.to_resolve_dto(entity=local)
+
+        value = await self.cache.get(key=self._key(key=key))
+        if not value:
+            return self._miss(key=key)
+        if _is_placeholder(value):
+            return UrlCacheMiss.KNOWN_MISSING
+
+        dto = self.resolve_codec.decode(value)
+        if self.local_cache is not None:
+            self.local_cache.set(key, dto)
+        return dto
+
+    async def lookup_many(
+        self,
+        *,
+        keys: Sequence[str],
+    ) -> dict[str, UrlEntity | UrlCacheMiss]:
+        """
+        Batch variant of `lookup`.
+
+        Keys missing from the local cache are fetched from Redis with a
+        single MGET instead of one GET per key.
+        """
+        result: dict[str, UrlEntity | UrlCacheMiss] = {}
+        remote: list[str] = []
+
+        for key in keys:
+            if self.local_cache is not None and isinstance(
+                entity := self.local_cache.get(key),
+                UrlEntity,
+            ):
+                result[key] = entity
+            else:
+                remote.append(key)
+
+        if remote:
+            values = await self.cache.get_many(
+                keys=[self._key(key=key) for key in remote],
+            )
+            for key, value in zip(remote, values, strict=True):
+                result[key] = self._from_cached(key=key, value=value)
+
+        return result
+
+    def available(self) -> bool:
+        return self.cache.is_available()
+
+    def fallback(
+        self,
+        *,
+        key: str,
+    ) -> UrlEntity | None:
+        """Last-resort stale local entry for when the database is failing."""
+        if self.local_cache is None:
+            return None
+        entity = self.local_cache.get_stale(key)
+        return entity if isinstance(entity, UrlEntity) else None
+
+    async def remember_missing(
+        self,
+        *,
+        key: str,
+    ) -> None:
+        """
+        Record a database miss so repeated lookups skip the database.
+
+        The tombstone is written with SETNX so it never replaces a record
+        reserved in the meantime.
+        """
+        if self.key_filter is not None:
+            self.key_filter.record_false_positive(key)
+
+        if self.negative_ttl_seconds is None:
+            return
+
+        await self.cache.set_nx(
+            key=self._key(key=key),
+            value=_TOMBSTONE,
+            ttl_seconds=self.negative_ttl_seconds,
+        )
+
+    async def remember_missing_many(
+        self,
+        *,
+        keys: Sequence[str],
+    ) -> None:
+        """Batch variant of `remember_missing` using one pipelined SETNX."""
+        if self.key_filter is not None:
+            for key in keys:
+                self.key_filter.record_false_positive(key)
+
+        if self.negative_ttl_seconds is None or not keys:
+            return
+
+        await self.cache.set_nx_many(
+            items={self._key(key=key): _TOMBSTONE for key in keys},
+            ttl_seconds=self.negative_ttl_seconds,
+        )
+
+    async def populate(
+        self,
+        *,
+        entity: UrlEntity,
+    ) -> bool:
+        """
+        Write a persisted URL back into the cache after a database hit.
+
+        The TTL is spread by a random jitter so records populated together
+        (e.g. after a Redis restart) do not expire together. The write is
+        skipped while the key's invalidation guard is set: the entity may
+        have been read before an update or delete that invalidated it.
+        """
+        return await self.populate_many(entities=[entity])
+
+    async def populate_many(
+        self,
+        *,
+        entities: Sequence[UrlEntity],
+    ) -> bool:
+        """
+        Batch variant of `populate` using one guarded write.
+
+        The whole batch shares one jittered TTL; batches are small and
+        independent, so their expiries still spread out. Returns whether
+        every record was written.
+        """
+        if not entities:
+            return True
+
+        stored = await self.cache.set_many_guarded(
+            items={
+                self._key(key=entity.key): self.codec.encode(
+                    dto=self.mapper.to_cache_record_dto(entity=entity),
+                )
+                for entity in entities
+            },
+            guards=[self._guard_key(key=entity.key) for entity in entities],
+            ttl=self._read_through_ttl(),
+        )
+
+        if self.local_cache is not None:
+            for entity, ok in zip(entities, stored, strict=True):
+                if ok:
+                    self.local_cache.set(entity.key, entity)
+        return all(stored)
+
+    async def warm_many(
+        self,
+        *,
+        entities: Sequence[UrlEntity],
+    ) -> int:
+        """
+        Load `entities` into the local cache and fill Redis where missing.
+
+        Records already in Redis are kept as they are; returns how many were
+        written to Redis.
+        """
+        cached = await self.lookup_many(
+            keys=[entity.key for entity in entities],
+        )
+        missing = [
+            entity
+            for entity in entities
+            if not isinstance(cached[entity.key], UrlEntity)
+        ]
+        await self.populate_many(entities=missing)
+        return len(missing)
+
+    async def reserve_keys(
+        self,
+        *,
+        keys: Sequence[str],
+        token: str,
+        ttl_seconds: int,
+    ) -> list[str]:
+        """
+        Reserve `keys` with placeholder records in one pipelined SETNX.
+
+        Returns the keys that were free. Placeholders read as known-missing
+        until `assign_reserved` replaces them with the real record.
+        """
+        reserved = await self.cache.set_nx_many(
+            items={
+                self._key(key=key): {_RESERVED_FIELD: token} for key in keys
+            },
+            ttl_seconds=ttl_seconds,
+        )
+        return [key for key, ok in zip(keys, reserved, strict=True) if ok]
+
+    async def assign_reserved(
+        self,
+        *,
+        dto: UrlCacheRecordDTO,
+        token: str,
+    ) -> bool:
+        """Replace the placeholder of `dto.key` reserved with `token`."""
+        [stored] = await self.assign_reserved_many(dtos=[dto], token=token)
+        return stored
+
+    async def assign_reserved_many(
+        self,
+        *,
+        dtos: Sequence[UrlCacheRecordDTO],
+        token: str,
+    ) -> list[bool]:
+        """
+        Replace the placeholders of many reserved keys in one round trip.
+
+        A key is written only while it still holds the placeholder reserved
+        with `token`: one that expired and was taken by another writer is
+        left alone and reported as not stored.
+        """
+        stored = await self.cache.set_many_if_equals(
+            items={
+                self._key(key=dto.key): self.codec.encode(dto=dto)
+                for dto in dtos
+            },
+            expected={_RESERVED_FIELD: token},
+            ttl=self.ttl_seconds,
+        )
+        if self.key_filter is not None:
+            for dto, ok in zip(dtos, stored, strict=True):
+                if ok:
+                    self.key_filter.add(dto.key)
+        return stored
+
+    async def release_reserved(
+        self,
+        *,
+        keys: Sequence[str],
+    ) -> int:
+        """Drop reserved keys that were never assigned or never published."""
+        return await self.cache.delete_many(
+            keys=[self._key(key=key) for key in keys],
+        )
+
+    async def release_reservations(
+        self,
+        *,
+        keys: Sequence[str],
+        token: str,
+    ) -> int:
+        """
+        Drop placeholders of pooled keys that were never handed out.
+
+        Only placeholders still holding `token` are deleted: one that
+        expired may since belong to another writer's real record.
+        """
+        return await self.cache.delete_many_if_equals(
+            keys=[self._key(key=key) for key in keys],
+            value={_RESERVED_FIELD: token},
+        )
 
     async def delete_by_key(
         self,
@@ -55,6 +460,187 @@ class UrlCacheService:
     ) -> None:
         await self.cache.delete(key=self._key(key=key))
 
+    async def invalidate(
+        self,
+        *,
+        key: str,
+        deleted: bool = False,
+    ) -> None:
+        """
+        Drop a key from every cache tier.
+
+        Sets a short-lived guard that keeps in-flight database reads from
+        writing the old record back, removes the Redis record and the local
+        entry, then broadcasts the key so other instances evict it from
+        their local caches as well.
+        """
+        await self.cache.set(
+            key=self._guard_key(key=key),
+            value=_TOMBSTONE,
+            ttl=self.invalidation_guard_seconds,
+        )
+        await self.delete_by_key(key=key)
+
+        if deleted and self.key_filter is not None:
+            self.key_filter.discard(key)
+
+        if self.local_cache is not None:
+            self.local_cache.delete(key)
+
+        if self.invalidation_channel is not None:
+            await self.cache.publish(
+                channel=self.invalidation_channel,
+                message=key,
+            )
+
+    async def acquire_fill_lock(
+        self,
+        *,
+        key: str,
+    ) -> str | None:
+        """
+        Try to become the only instance loading `key` from the database.
+
+        Returns the owner token to release the lock with, or None if it is
+        held elsewhere. The lock expires on its own, so a crashed holder
+        only delays others by `fill_lock_ttl_seconds`.
+        """
+        token = uuid.uuid4().hex
+        if await self.cache.set_nx(
+            key=self._lock_key(key=key),
+            value=token,
+            ttl_seconds=self.fill_lock_ttl_seconds,
+        ):
+            return token
+        return None
+
+    async def release_fill_lock(
+        self,
+        *,
+        key: str,
+        token: str,
+    ) -> None:
+        """
+        Release a lock taken with `acquire_fill_lock`.
+
+        A holder that outlived the lock TTL must not delete a lock another
+        instance has taken since, so the delete is conditional on `token`.
+        """
+        await self.cache.delete_if_equals(
+            key=self._lock_key(key=key),
+            value=token,
+        )
+
+    async def wait_for_fill(
+        self,
+        *,
+        key: str,
+        timeout_seconds: float,
+    ) -> UrlEntity | UrlCacheMiss:
+        """Poll the cache until another instance fills `key` or time is up."""
+        deadline = time.monotonic() + timeout_seconds
+
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.fill_poll_interval_seconds)
+
+            result = await self.lookup(key=key)
+            if result is not UrlCacheMiss.UNKNOWN:
+                return result
+
+        return UrlCacheMiss.UNKNOWN
+
+    async def _serve_stale(
+        self,
+        *,
+        key: str,
+    ) -> UrlEntity | UrlResolveDTO | None:
+        if self.local_cache is None:
+            return None
+
+        if not self.cache.is_available():
+            return self.local_cache.get_stale(key)
+
+        if self.serve_stale_seconds <= 0 or self.background is None:
+            return None
+
+        entity = self.local_cache.get_stale(
+            key,
+            max_stale_sec=self.serve_stale_seconds,
+        )
+        if entity is not None and key not in self._revalidating:
+            self._revalidating.add(key)
+            if not await self.background.submit(
+                lambda: self._revalidate(key=key),
+                name="url-cache-revalidate",
+            ):
+                self._revalidating.discard(key)
+        return entity
+
+    async def _revalidate(
+        self,
+        *,
+        key: str,
+    ) -> None:
+        try:
+            value = await self.cache.get(key=self._key(key=key))
+            if not value:
+                return
+            if _is_placeholder(value):
+                if self.local_cache is not None:
+                    self.local_cache.delete(key)
+            else:
+                self._from_cached(key=key, value=value)
+        finally:
+            self._revalidating.discard(key)
+
+    def _from_cached(
+        self,
+        *,
+        key: str,
+        value: dict[str, Any] | None,
+    ) -> UrlEntity | UrlCacheMiss:
+        if value:
+            if _is_placeholder(value):
+                return UrlCacheMiss.KNOWN_MISSING
+
+            dto = self.codec.decode(value)
+            entity = self.mapper.to_entity_from_cache_dto(dto=dto)
+
+            if self.local_cache is not None:
+                self.local_cache.set(key, entity)
+            return entity
+
+        return self._miss(key=key)
+
+    def _miss(
+        self,
+        *,
+        key: str,
+    ) -> UrlCacheMiss:
+        if self.key_filter is not None and not self.key_filter.might_contain(
+            key,
+        ):
+            return UrlCacheMiss.KNOWN_MISSING
+        return UrlCacheMiss.UNKNOWN
+
+    def _read_through_ttl(self) -> int | None:
+        ttl = self.read_through_ttl_seconds
+        if ttl is None or self.read_through_ttl_jitter_seconds <= 0:
+            return ttl
+        return ttl + random.randint(0, self.read_through_ttl_jitter_seconds)
+
     @staticmethod
     def _key(key: str) -> str:
         return f"short:{key}"
+
+    @staticmethod
+    def _guard_key(key: str) -> str:
+        return f"short:guard:{key}"
+
+    @staticmethod
+    def _lock_key(key: str) -> str:
+        return f"short:lock:{key}"
+
+
+def _is_placeholder(value: dict[str, Any]) -> bool:
+    return value == _TOMBSTONE or _RESERVED_FIELD in value
@@ -0,0 +1,71 @@
+__all__ = (
+    "UrlCacheWarmUpReport",
+    "UrlCacheWarmer",
+)
+
+import asyncio
+import time
+from collections.abc import AsyncIterable, Callable, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, final
+
+import structlog
+
+if TYPE_CHECKING:
+    from shortener_app.application.services.urls.url_cache import (
+        UrlCacheService,
+    )
+    from shortener_app.domain.entities.url import UrlEntity
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UrlCacheWarmUpReport:
+    loaded: int
+    redis_filled: int
+    duration_sec: float
+    timed_out: bool
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UrlCacheWarmer:
+    """
+    Pre-populates the cache tiers with the hottest URLs before serving.
+
+    `source` yields pages of URLs, hottest first. Warm-up stops when the
+    source is exhausted or `budget_seconds` runs out, whichever comes
+    first; a failing source or cache ends it early rather than blocking
+    startup.
+    """
+
+    cache_service: "UrlCacheService"
+    source: "Callable[[], AsyncIterable[Sequence[UrlEntity]]]"
+    budget_seconds: float = 10.0
+
+    async def warm(self) -> UrlCacheWarmUpReport:
+        started = time.monotonic()
+        loaded = 0
+        redis_filled = 0
+        timed_out = False
+
+        try:
+            async with asyncio.timeout(self.budget_seconds):
+                async for entities in self.source():
+                    redis_filled += await self.cache_service.warm_many(
+                        entities=entities,
+                    )
+                    loaded += len(entities)
+        except TimeoutError:
+            timed_out = True
+        except Exception:
+            logger.exception("Url cache warm-up failed", loaded=loaded)
+
+        return UrlCacheWarmUpReport(
+            loaded=loaded,
+            redis_filled=redis_filled,
+            duration_sec=time.monotonic() - started,
+            timed_out=timed_out,
+        )
@@ -1,5 +1,6 @@
 __all__ = ("UrlPublishEnqueueService",)
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, final
 
@@ -8,8 +9,10 @@ import structlog
 if TYPE_CHECKING:
     from shortener_app.application.dtos.urls.urls_events import (
         PublishUrlDTO,
+        UrlClickedEventDTO,
     )
     from shortener_app.application.interfaces.publish_queue import (
+        ClickPublishQueueProtocol,
         NewUrlPublishQueueProtocol,
     )
 
@@ -20,6 +23,21 @@ logger = structlog.get_logger(__name__)
 @dataclass(frozen=True, slots=True, kw_only=True)
 class UrlPublishEnqueueService:
     new_urls_queue: "NewUrlPublishQueueProtocol"
+    clicks_queue: "ClickPublishQueueProtocol"
+
+    def admit_new_urls(self, *, count: int = 1) -> None:
+        """Raise PublishOverloadedError while publishing is saturated."""
+        self.new_urls_queue.admit(count=count)
 
     async def enqueue_new_url(self, *, dto: "PublishUrlDTO") -> None:
         await self.new_urls_queue.enqueue(dto=dto)
+
+    async def enqueue_new_urls(
+        self,
+        *,
+        dtos: Sequence["PublishUrlDTO"],
+    ) -> None:
+        await self.new_urls_queue.enqueue_many(dtos=dtos)
+
+    async def enqueue_click(self, *, dto: "UrlClickedEventDTO") -> bool:
+        return await self.clicks_queue.enqueue(dto=dto)
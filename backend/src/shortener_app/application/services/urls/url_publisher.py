@@ -29,6 +29,14 @@ class UrlBrokerPublishService:
     ) -> None:
         await self.message_broker.publish_new_urls_batch(dtos=dtos)
 
+    async def publish_update_urls_batch(
+        self,
+        *,
+        dtos: list["UrlClickedEventDTO"],
+    ) -> None:
+        await self.message_broker.publish_update_urls_batch(dtos=dtos)
+        logger.debug("Published update events batch", size=len(dtos))
+
     async def publish_update_url(self, *, dto: "UrlClickedEventDTO") -> None:
         try:
             await self.message_broker.publish_update_url(dto=dto)
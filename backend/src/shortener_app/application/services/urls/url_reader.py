@@ -1,16 +1,26 @@
 __all__ = ("UrlReaderService",)
 
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, final
 
 import structlog
 
+from shortener_app.application.dtos.urls.urls_cache import UrlResolveDTO
+from shortener_app.application.services.urls.url_cache import UrlCacheMiss
 from shortener_app.domain.entities.url import UrlEntity
 
 if TYPE_CHECKING:
     from shortener_app.application.interfaces.repository import (
         RepositoryProtocol,
     )
+    from shortener_app.application.interfaces.uow import UnitOfWorkProtocol
+    from shortener_app.application.services.background_tasks import (
+        BackgroundTaskSupervisor,
+    )
+    from shortener_app.application.services.single_flight import (
+        SingleFlight,
+    )
     from shortener_app.application.services.urls.url_cache import (
         UrlCacheService,
     )
@@ -22,6 +32,14 @@ logger = structlog.get_logger(__name__)
 @dataclass(frozen=True, slots=True, kw_only=True)
 class UrlReaderService:
     cache_service: "UrlCacheService"
+    read_through: bool = False
+
+    single_flight: "SingleFlight[str, UrlEntity | None] | None" = None
+    # Opens the unit of work a coalesced load runs on
+    uow_factory: "Callable[[], UnitOfWorkProtocol] | None" = None
+    fill_lock_wait_seconds: float | None = None
+
+    background: "BackgroundTaskSupervisor | None" = None
 
     async def get_url_by_key(
         self,
@@ -29,10 +47,84 @@ class UrlReaderService:
         key: str,
         repository: "RepositoryProtocol",
     ) -> UrlEntity | None:
-        if value := await self.cache_service.get_by_key_cached(key=key):
-            return value
+        cached = await self.cache_service.lookup(key=key)
+        if isinstance(cached, UrlEntity):
+            return cached
+        if cached is UrlCacheMiss.KNOWN_MISSING:
+            return None
+
+        return await self._load_coalesced(key=key, repository=repository)
+
+    async def resolve_url_by_key(
+        self,
+        *,
+        key: str,
+        repository: "RepositoryProtocol",
+    ) -> UrlResolveDTO | None:
+        """
+        Redirect fast path: resolve a key to its target without an entity.
+
+        Cache hits are decoded into a UrlResolveDTO directly; only misses
+        take the full `get_url_by_key` path and are projected afterwards.
+        """
+        cached = await self.cache_service.lookup_resolve(key=key)
+        if isinstance(cached, UrlResolveDTO):
+            return cached
+        if cached is UrlCacheMiss.KNOWN_MISSING:
+            return None
 
-        return await self.get_by_key_from_db(key=key, repository=repository)
+        entity = await self._load_coalesced(key=key, repository=repository)
+        if entity is None:
+            return None
+        return self.cache_service.mapper.to_resolve_dto(entity=entity)
+
+    async def get_urls_by_keys(
+        self,
+        *,
+        keys: Sequence[str],
+        repository: "RepositoryProtocol",
+    ) -> dict[str, UrlEntity | None]:
+        """
+        Resolve many keys with one cache round trip and one database query.
+
+        Misses skip single-flight and the fill lock: a batch query already
+        amortises the database cost across its keys.
+        """
+        cached = await self.cache_service.lookup_many(keys=keys)
+
+        result: dict[str, UrlEntity | None] = {}
+        unknown: list[str] = []
+
+        for key, value in cached.items():
+            if isinstance(value, UrlEntity):
+                result[key] = value
+            elif value is UrlCacheMiss.KNOWN_MISSING:
+                result[key] = None
+            else:
+                unknown.append(key)
+
+        if unknown:
+            loaded = {
+                entity.key: entity
+                for entity in await repository.get_by_keys(keys=unknown)
+            }
+            missing = [key for key in unknown if key not in loaded]
+            result.update(dict.fromkeys(missing))
+            result.update(loaded)
+
+            entities = list(loaded.values())
+            if self.background is None:
+                await self._write_back_many(entities=entities, missing=missing)
+            else:
+                await self.background.submit(
+                    lambda: self._write_back_many(
+                        entities=entities,
+                        missing=missing,
+                    ),
+                    name="url-cache-write-back-many",
+                )
+
+        return {key: result[key] for key in keys}
 
     async def get_by_key_from_db(
         self,
@@ -41,3 +133,123 @@ class UrlReaderService:
         repository: "RepositoryProtocol",
     ) -> UrlEntity | None:
         return await repository.get(reference={"key": key})
+
+    async def _load_coalesced(
+        self,
+        *,
+        key: str,
+        repository: "RepositoryProtocol",
+    ) -> UrlEntity | None:
+        """
+        `_load` shared by concurrent callers of the same key.
+
+        The shared load outlives the caller that started it, so with a
+        `uow_factory` it runs on its own unit of work instead of that
+        caller's request-scoped session, which may be closed (or in use by
+        the caller) while other callers still wait for the result.
+        """
+        if self.single_flight is None:
+            return await self._load(key=key, repository=repository)
+
+        return await self.single_flight.do(
+            key,
+            lambda: self._load_detached(key=key, repository=repository),
+        )
+
+    async def _load_detached(
+        self,
+        *,
+        key: str,
+        repository: "RepositoryProtocol",
+    ) -> UrlEntity | None:
+        if self.uow_factory is None:
+            return await self._load(key=key, repository=repository)
+
+        async with self.uow_factory() as uow:
+            return await self._load(key=key, repository=uow.url_repository)
+
+    async def _load(
+        self,
+        *,
+        key: str,
+        repository: "RepositoryProtocol",
+    ) -> UrlEntity | None:
+        """
+        Load a cache miss from the database and write the outcome back.
+
+        With a fill lock configured, only the instance holding the lock
+        queries the database; the others wait for it to populate the cache
+        and fall back to the database if that does not happen in time. The
+        lock lives in Redis, so it is skipped while Redis is unavailable.
+
+        If the database query fails, a stale local entry is served when one
+        is retained; otherwise the error propagates.
+        """
+        lock_token: str | None = None
+
+        if (
+            self.fill_lock_wait_seconds is not None
+            and self.cache_service.available()
+        ):
+            lock_token = await self.cache_service.acquire_fill_lock(key=key)
+
+            if lock_token is None:
+                filled = await self.cache_service.wait_for_fill(
+                    key=key,
+                    timeout_seconds=self.fill_lock_wait_seconds,
+                )
+                if isinstance(filled, UrlEntity):
+                    return filled
+                if filled is UrlCacheMiss.KNOWN_MISSING:
+                    return None
+
+        try:
+            try:
+                entity = await self.get_by_key_from_db(
+                    key=key,
+                    repository=repository,
+                )
+            except Exception:
+                if stale := self.cache_service.fallback(key=key):
+                    logger.warning(
+                        "Database lookup failed, serving stale entry",
+                        key=key,
+                        exc_info=True,
+                    )
+                    return stale
+                raise
+
+            # Waiters on the fill lock poll the cache, so the write-back has
+            # to land before the lock is released.
+            if lock_token is not None or self.background is None:
+                await self._write_back(key=key, entity=entity)
+            else:
+                await self.background.submit(
+                    lambda: self._write_back(key=key, entity=entity),
+                    name="url-cache-write-back",
+                )
+            return entity
+
+        finally:
+            if lock_token is not None:
+                await self.cache_service.release_fill_lock(
+                    key=key,
+                    token=lock_token,
+                )
+
+    async def _write_back(self, *, key: str, entity: UrlEntity | None) -> None:
+        if entity is None:
+            await self.cache_service.remember_missing(key=key)
+        elif self.read_through:
+            await self.cache_service.populate(entity=entity)
+
+    async def _write_back_many(
+        self,
+        *,
+        entities: list[UrlEntity],
+        missing: list[str],
+    ) -> None:
+        if missing:
+            await self.cache_service.remember_missing_many(keys=missing)
+        if entities and self.read_through:
+            await self.cache_service.populate_many(entities=entities)
@@ -0,0 +1,62 @@
+__all__ = ("BatchResolveKeysUseCase",)
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, final
+
+import structlog
+
+from shortener_app.application.dtos.urls.urls_responses import ResolvedKeyDTO
+from shortener_app.application.exceptions.urls import TooManyKeysError
+
+if TYPE_CHECKING:
+    from shortener_app.application.interfaces import (
+        UnitOfWorkProtocol,
+    )
+    from shortener_app.application.services.urls.url_reader import (
+        UrlReaderService,
+    )
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BatchResolveKeysUseCase:
+    """
+    Resolves many keys for read-only consumers (link previews, pre-rendering).
+
+    Unlike redirects, batch resolution does not publish click events.
+    """
+
+    reader_service: "UrlReaderService"
+    uow: "UnitOfWorkProtocol"
+    max_keys: int = 100
+
+    async def execute(self, *, keys: list[str]) -> list[ResolvedKeyDTO]:
+        unique_keys = list(dict.fromkeys(keys))
+
+        if len(unique_keys) > self.max_keys:
+            raise TooManyKeysError(
+                requested=len(unique_keys),
+                limit=self.max_keys,
+            )
+
+        if not unique_keys:
+            return []
+
+        async with self.uow as uow:
+            entities = await self.reader_service.get_urls_by_keys(
+                keys=unique_keys,
+                repository=uow.url_repository,
+            )
+
+        return [
+            ResolvedKeyDTO(key=key)
+            if (entity := entities[key]) is None
+            else ResolvedKeyDTO(
+                key=key,
+                target_url=entity.target_url,
+                is_active=entity.is_active,
+            )
+            for key in unique_keys
+        ]
@@ -7,7 +7,14 @@ import structlog
 
 from shortener_app.application.dtos.urls.urls_cache import UrlCacheSeedDTO
 from shortener_app.application.dtos.urls.urls_requests import CreateUrlDTO
-from shortener_app.application.dtos.urls.urls_responses import CreatedUrlDTO
+from shortener_app.application.dtos.urls.urls_responses import (
+    CreatedUrlDTO,
+    CreateUrlResultDTO,
+)
+from shortener_app.application.exceptions.publish import (
+    PublishOverloadedError,
+)
+from shortener_app.application.exceptions.urls import TooManyUrlsError
 from shortener_app.domain.entities.url import UrlEntity
 
 if TYPE_CHECKING:
@@ -29,12 +36,21 @@ class CreateUrlUseCase:
     key_reservation_service: "UrlKeyReservationService"
     publish_enqueue_service: "UrlPublishEnqueueService"
     mapper: "UrlDtoFacade"
+    max_batch_size: int = 1_000
 
     async def execute(
         self,
         *,
         dto: CreateUrlDTO,
     ) -> CreatedUrlDTO:
+        """
+        Reserve a key and queue the new URL for publishing.
+
+        Raises PublishOverloadedError while publishing is saturated: before
+        reserving a key, or after it, in which case the key is released.
+        """
+        self.publish_enqueue_service.admit_new_urls()
+
         seed = UrlCacheSeedDTO(
             target_url=dto.target_url,
             user_id=dto.user_id,
@@ -49,8 +65,94 @@ class CreateUrlUseCase:
             user_id=dto.user_id,
         )
 
-        await self.publish_enqueue_service.enqueue_new_url(
-            dto=self.mapper.to_publish_dto(entity=entity),
-        )
+        try:
+            await self.publish_enqueue_service.enqueue_new_url(
+                dto=self.mapper.to_publish_dto(entity=entity),
+            )
+        except PublishOverloadedError:
+            await self.key_reservation_service.release(keys=[key])
+            raise
 
         return self.mapper.to_created_dto(entity=entity)
+
+    async def execute_many(
+        self,
+        *,
+        dtos: list[CreateUrlDTO],
+    ) -> list[CreateUrlResultDTO]:
+        """
+        Create many URLs with one reservation pass and one bulk enqueue.
+
+        Results follow request order. An item whose key could not be
+        reserved fails on its own without failing the batch; a saturated
+        publish pipeline fails the whole batch like `execute`.
+        """
+        if len(dtos) > self.max_batch_size:
+            raise TooManyUrlsError(
+                requested=len(dtos),
+                limit=self.max_batch_size,
+            )
+
+        if not dtos:
+            return []
+
+        self.publish_enqueue_service.admit_new_urls(count=len(dtos))
+
+        keys = await self.key_reservation_service.reserve_many(
+            seeds=[
+                UrlCacheSeedDTO(
+                    target_url=dto.target_url,
+                    user_id=dto.user_id,
+                    name=None,
+                    is_active=True,
+                )
+                for dto in dtos
+            ],
+        )
+
+        entities = [
+            None
+            if key is None
+            else UrlEntity.create(
+                key=key,
+                target_url=dto.target_url,
+                user_id=dto.user_id,
+            )
+            for dto, key in zip(dtos, keys, strict=True)
+        ]
+
+        created = [entity for entity in entities if entity is not None]
+        if created:
+            try:
+                await self.publish_enqueue_service.enqueue_new_urls(
+                    dtos=[
+                        self.mapper.to_publish_dto(entity=entity)
+                        for entity in created
+                    ],
+                )
+            except PublishOverloadedError:
+                await self.key_reservation_service.release(
+                    keys=[entity.key for entity in created],
+                )
+                raise
+
+        failed = len(entities) - len(created)
+        if failed:
+            logger.warning(
+                "Batch create could not reserve keys",
+                requested=len(dtos),
+                failed=failed,
+            )
+
+        return [
+            CreateUrlResultDTO(
+                target_url=dto.target_url,
+                created=self.mapper.to_created_dto(entity=entity),
+            )
+            if entity is not None
+            else CreateUrlResultDTO(
+                target_url=dto.target_url,
+                error="Failed to allocate unique key",
+            )
+            for dto, entity in zip(dtos, entities, strict=True)
+        ]
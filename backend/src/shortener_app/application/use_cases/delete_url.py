@@ -8,9 +8,9 @@ import structlog
 from shortener_app.application.dtos.urls.urls_requests import DeleteUrlDTO
 
 if TYPE_CHECKING:
-    from shortener_app.application.interfaces import (
-        CacheProtocol,
-        UnitOfWorkProtocol,
+    from shortener_app.application.interfaces import UnitOfWorkProtocol
+    from shortener_app.application.services.urls.url_cache import (
+        UrlCacheService,
     )
     from shortener_app.application.services.urls.url_reader import (
         UrlReaderService,
@@ -23,7 +23,7 @@ logger = structlog.get_logger(__name__)
 @dataclass(frozen=True, slots=True, kw_only=True)
 class DeleteUrlUseCase:
     reader_service: "UrlReaderService"
-    cache: "CacheProtocol"
+    cache_service: "UrlCacheService"
     uow: "UnitOfWorkProtocol"
 
     async def execute(
@@ -36,11 +36,14 @@ class DeleteUrlUseCase:
                 key=dto.key,
                 repository=uow.url_repository,
             ):
-                await self.cache.delete(key=f"short:{entity.key}")
-
                 await uow.url_repository.delete(entity=entity)
                 await uow.commit()
 
+                await self.cache_service.invalidate(
+                    key=entity.key,
+                    deleted=True,
+                )
+
                 return True
 
             return False
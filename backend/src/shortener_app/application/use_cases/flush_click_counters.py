@@ -0,0 +1,48 @@
+__all__ = ("FlushClickCountersUseCase",)
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, final
+
+import structlog
+
+if TYPE_CHECKING:
+    from shortener_app.application.interfaces import (
+        ClickCounterStoreProtocol,
+        UnitOfWorkProtocol,
+    )
+
+logger = structlog.get_logger(__name__)
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FlushClickCountersUseCase:
+    uow: "UnitOfWorkProtocol"
+    counters: "ClickCounterStoreProtocol"
+
+    async def execute(self) -> int:
+        """Apply every closed counter bucket; returns the clicks applied."""
+        applied = 0
+
+        for bucket in await self.counters.claim_closed():
+            deltas = await self.counters.read(bucket=bucket)
+
+            if deltas:
+                async with self.uow as uow:
+                    await uow.url_repository.increment_clicks(
+                        increments=deltas,
+                    )
+                    await uow.commit()
+
+            await self.counters.release(bucket=bucket)
+
+            clicks = sum(deltas.values())
+            applied += clicks
+            logger.info(
+                "Applied click counter bucket",
+                bucket=bucket,
+                keys=len(deltas),
+                clicks=clicks,
+            )
+
+        return applied
@@ -0,0 +1,21 @@
+__all__ = ("GetHotKeysUseCase",)
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, final
+
+if TYPE_CHECKING:
+    from shortener_app.application.dtos.urls.urls_responses import HotKeyDTO
+    from shortener_app.application.services.hot_keys import HotKeyTracker
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GetHotKeysUseCase:
+    """Reports the most requested keys seen by this instance."""
+
+    hot_keys: "HotKeyTracker | None"
+
+    async def execute(self, *, limit: int | None = None) -> list["HotKeyDTO"]:
+        if self.hot_keys is None:
+            return []
+        return self.hot_keys.top(limit or None)
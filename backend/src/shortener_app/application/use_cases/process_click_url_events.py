@@ -20,7 +20,7 @@ class ProcessClickEventsUseCase:
     async def execute(
         self,
         *,
-        events: list[tuple[UUID, str]],
+        events: list[tuple[UUID, str, int]],
     ) -> None:
         if not events:
             logger.info("No click events to process")
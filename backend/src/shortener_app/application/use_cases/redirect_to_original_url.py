@@ -1,21 +1,18 @@
 __all__ = ("RedirectToOriginalUrlUseCase",)
 
-import asyncio
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, final
 
 import structlog
 
 if TYPE_CHECKING:
-    from shortener_app.application.dtos.urls.urls_events import (
-        UrlClickedEventDTO,
-    )
     from shortener_app.application.interfaces import (
         UnitOfWorkProtocol,
     )
     from shortener_app.application.mappers.url_dto_facade import UrlDtoFacade
-    from shortener_app.application.services.urls.url_publisher import (
-        UrlBrokerPublishService,
+    from shortener_app.application.services.hot_keys import HotKeyTracker
+    from shortener_app.application.services.urls.url_enqueue import (
+        UrlPublishEnqueueService,
     )
     from shortener_app.application.services.urls.url_reader import (
         UrlReaderService,
@@ -28,37 +25,34 @@ logger = structlog.get_logger(__name__)
 @dataclass(frozen=True, slots=True, kw_only=True)
 class RedirectToOriginalUrlUseCase:
     reader_service: "UrlReaderService"
-    broker_publish_service: "UrlBrokerPublishService"
+    publish_enqueue_service: "UrlPublishEnqueueService"
     uow: "UnitOfWorkProtocol"
     mapper: "UrlDtoFacade"
+    hot_keys: "HotKeyTracker | None" = None
 
     async def execute(self, key: str) -> str | None:
+        if self.hot_keys is not None:
+            self.hot_keys.record(key)
+
         async with self.uow as uow:
-            entity = await self.reader_service.get_url_by_key(
+            resolved = await self.reader_service.resolve_url_by_key(
                 key=key,
                 repository=uow.url_repository,
             )
 
-        if entity is None:
+        if resolved is None:
             return None
 
-        if not entity.is_active:
+        if not resolved.is_active:
             # raise UrlNotActiveError(key=key)
             raise Exception("TODO: Custom not active exception")
 
-        publish_redirected_dto = self.mapper.to_publish_redirected_dto(
-            entity=entity,
+        publish_redirected_dto = (
+            self.mapper.to_publish_redirected_dto_from_resolve(dto=resolved)
         )
-        asyncio.create_task(self._publish(dto=publish_redirected_dto))
+        if not await self.publish_enqueue_service.enqueue_click(
+            dto=publish_redirected_dto,
+        ):
+            logger.debug("Click event dropped; queue is full", key=key)
 
-        return entity.target_url
-
-    async def _publish(self, *, dto: "UrlClickedEventDTO") -> None:
-        try:
-            await self.broker_publish_service.publish_update_url(dto=dto)
-        except Exception:
-            logger.exception(
-                "Failed to publish redirected url event",
-                key=dto.key,
-                event_id=str(dto.event_id),
-            )
+        return resolved.target_url
@@ -10,6 +10,9 @@ if TYPE_CHECKING:
     from shortener_app.application.interfaces import (
         UnitOfWorkProtocol,
     )
+    from shortener_app.application.services.urls.url_cache import (
+        UrlCacheService,
+    )
     from shortener_app.application.services.urls.url_reader import (
         UrlReaderService,
     )
@@ -22,6 +25,7 @@ logger = structlog.get_logger(__name__)
 @dataclass(frozen=True, slots=True, kw_only=True)
 class UpdateUrlUseCase:
     reader_service: "UrlReaderService"
+    cache_service: "UrlCacheService"
     uow: "UnitOfWorkProtocol"
 
     async def execute(
@@ -34,7 +38,6 @@ class UpdateUrlUseCase:
                 key=dto.key,
                 repository=uow.url_repository,
             ):
-                # FIXME update cache
                 updated_entity = entity.update(
                     name=dto.name,
                     is_active=dto.is_active,
@@ -43,6 +46,8 @@ class UpdateUrlUseCase:
                 await uow.url_repository.update(entity=updated_entity)
                 await uow.commit()
 
+                await self.cache_service.invalidate(key=entity.key)
+
                 return True
 
             return False
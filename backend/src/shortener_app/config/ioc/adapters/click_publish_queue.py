@@ -0,0 +1,19 @@
+__all__ = ("ClickPublishQueueAdapter",)
+
+from dataclasses import dataclass
+
+from shortener_app.application.dtos.urls.urls_events import UrlClickedEventDTO
+from shortener_app.application.interfaces.publish_queue import (
+    ClickPublishQueueProtocol,
+)
+from shortener_app.infrastructures.broker.click_publish_queue import (
+    ClickPublishQueue,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ClickPublishQueueAdapter(ClickPublishQueueProtocol):
+    _impl: ClickPublishQueue
+
+    async def enqueue(self, dto: UrlClickedEventDTO) -> bool:
+        return await self._impl.enqueue(dto=dto)
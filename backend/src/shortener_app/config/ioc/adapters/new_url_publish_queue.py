@@ -1,5 +1,6 @@
 __all__ = ("NewUrlPublishQueueAdapter",)
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
 from shortener_app.application.dtos.urls.urls_events import PublishUrlDTO
@@ -15,5 +16,11 @@ from shortener_app.infrastructures.broker.new_url_publish_queue import (
 class NewUrlPublishQueueAdapter(NewUrlPublishQueueProtocol):
     _impl: NewUrlPublishQueue
 
+    def admit(self, count: int = 1) -> None:
+        self._impl.admit(count=count)
+
     async def enqueue(self, dto: PublishUrlDTO) -> None:
         await self._impl.enqueue(dto=dto)
+
+    async def enqueue_many(self, dtos: Sequence[PublishUrlDTO]) -> None:
+        await self._impl.enqueue_many(dtos=dtos)
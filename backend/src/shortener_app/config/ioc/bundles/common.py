@@ -23,17 +23,24 @@ from shortener_app.application.mappers.components import (
     UrlCreatedMapper,
     UrlPublishMapper,
     UrlRedirectedMapper,
+    UrlToCacheRecordMapper,
+    UrlToResolveMapper,
     UrlToUserUrlItemMapper,
 )
 from shortener_app.config.settings.base import Settings
 from shortener_app.infrastructures.broker import (
+    KafkaPartitionMap,
     KafkaPublisher,
 )
-from shortener_app.infrastructures.cache import RedisCacheClient
+from shortener_app.infrastructures.cache import (
+    CircuitBreaker,
+    RedisCacheClient,
+)
 from shortener_app.infrastructures.codecs import (
     PublishUrlJsonCodec,
     UrlCacheRedisHashCodec,
     UrlClickedJsonCodec,
+    UrlResolveRedisHashCodec,
 )
 from shortener_app.infrastructures.db import (
     SQLAlchemyRepository,
@@ -139,6 +146,8 @@ class MapperProvider(Provider):
             publish_redirected_url=UrlRedirectedMapper(),
             user_item=UrlToUserUrlItemMapper(),
             url_cache_to_entity=UrlCacheToEntityMapper(),
+            url_to_cache_record=UrlToCacheRecordMapper(),
+            url_to_resolve=UrlToResolveMapper(),
         )
 
     @provide(scope=Scope.APP)
@@ -153,6 +162,12 @@ class CodecProvider(Provider):
     ) -> UrlCacheRedisHashCodec:
         return UrlCacheRedisHashCodec()
 
+    @provide(scope=Scope.APP)
+    def get_resolve_cache_codec(
+        self,
+    ) -> UrlResolveRedisHashCodec:
+        return UrlResolveRedisHashCodec()
+
     @provide(scope=Scope.APP)
     def get_message_broker_codec(
         self,
@@ -170,23 +185,30 @@ class ServiceProvider(Provider):
     @provide(scope=Scope.APP)
     def get_message_broker(
         self,
+        settings: Settings,
         broker: KafkaBroker,
         publish_url_codec: PublishUrlJsonCodec,
         url_clicked_codec: UrlClickedJsonCodec,
     ) -> MessageBrokerPublisherProtocol:
+        partition_map = None
+        if settings.broker.partition_aware_publish:
+            partition_map = KafkaPartitionMap(broker=broker)
+
         return KafkaPublisher(
             broker=broker,
             publish_url_codec=publish_url_codec,
             url_clicked_codec=url_clicked_codec,
+            new_urls_key=settings.broker.new_urls_message_key,
+            partition_map=partition_map,
         )
 
 
 class CacheProvider(Provider):
     @provide(scope=Scope.APP)
-    async def get_cache_service(
+    async def get_redis_client(
         self,
         settings: Settings,
-    ) -> AsyncIterator[CacheProtocol]:
+    ) -> AsyncIterator[redis.Redis]:
         redis_client = redis.from_url(
             url=settings.redis_url,
             encoding="utf-8",
@@ -197,10 +219,6 @@ class CacheProvider(Provider):
             socket_connect_timeout=1.0,
             socket_timeout=1.0,
         )
-        cache_service = RedisCacheClient(
-            client=redis_client,
-            ttl=settings.redis_cache_ttl,
-        )
 
         try:
             await redis_client.ping()
@@ -208,9 +226,33 @@ class CacheProvider(Provider):
             raise
 
         try:
-            yield cache_service
+            yield redis_client
         finally:
-            await cache_service.close()
+            await redis_client.aclose()
+            logger.info("Redis connection closed")
+
+    @provide(scope=Scope.APP)
+    def get_cache_service(
+        self,
+        settings: Settings,
+        redis_client: redis.Redis,
+    ) -> CacheProtocol:
+        redis_settings = settings.redis
+        return RedisCacheClient(
+            client=redis_client,
+            ttl=settings.redis_cache_ttl,
+            breaker=(
+                CircuitBreaker(
+                    name="redis-cache",
+                    failure_threshold=(
+                        redis_settings.redis_breaker_failure_threshold
+                    ),
+                    reset_timeout_sec=redis_settings.redis_breaker_reset_sec,
+                )
+                if redis_settings.redis_breaker_enabled
+                else None
+            ),
+        )
 
 
 COMMON_PROVIDERS: tuple[Provider, ...] = (
@@ -2,16 +2,25 @@ __all__ = ("CONSUMER_ONLY_PROVIDERS",)
 
 import structlog
 from dishka import Provider, Scope, provide
+from redis.asyncio import Redis
 
+from shortener_app.application.interfaces.click_counter import (
+    ClickCounterStoreProtocol,
+)
 from shortener_app.application.interfaces.uow import (
     UnitOfWorkProtocol,
 )
+from shortener_app.application.use_cases.flush_click_counters import (
+    FlushClickCountersUseCase,
+)
 from shortener_app.application.use_cases.process_click_url_events import (
     ProcessClickEventsUseCase,
 )
 from shortener_app.application.use_cases.process_new_url_event import (
     ProcessNewUrlUseCase,
 )
+from shortener_app.config.settings.base import Settings
+from shortener_app.infrastructures.cache import RedisClickCounter
 
 logger = structlog.get_logger(__name__)
 
@@ -31,5 +40,30 @@ class UseCaseProvider(Provider):
     ) -> ProcessClickEventsUseCase:
         return ProcessClickEventsUseCase(uow=uow)
 
+    @provide(scope=Scope.REQUEST)
+    def flush_click_counters_use_case(
+        self,
+        uow: UnitOfWorkProtocol,
+        counters: ClickCounterStoreProtocol,
+    ) -> FlushClickCountersUseCase:
+        return FlushClickCountersUseCase(uow=uow, counters=counters)
+
+
+class ClickCounterProvider(Provider):
+    @provide(scope=Scope.APP)
+    def get_click_counter_store(
+        self,
+        settings: Settings,
+        redis_client: Redis,
+    ) -> ClickCounterStoreProtocol:
+        return RedisClickCounter(
+            client=redis_client,
+            key_prefix=settings.redis.click_counter_prefix,
+            bucket_sec=settings.redis.click_counter_bucket_sec,
+        )
 
-CONSUMER_ONLY_PROVIDERS: tuple[Provider, ...] = (UseCaseProvider(),)
+
+CONSUMER_ONLY_PROVIDERS: tuple[Provider, ...] = (
+    UseCaseProvider(),
+    ClickCounterProvider(),
+)
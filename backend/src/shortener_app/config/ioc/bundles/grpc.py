@@ -7,20 +7,45 @@ from uuid import UUID
 import structlog
 from dishka import Provider, Scope, provide
 from grpc import ServicerContext
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from shortener_app.application.dtos.urls.urls_cache import UrlResolveDTO
 from shortener_app.application.interfaces.broker import (
     MessageBrokerPublisherProtocol,
 )
-from shortener_app.application.interfaces.cache import CacheProtocol
+from shortener_app.application.interfaces.cache import (
+    CacheProtocol,
+    KeyFilterProtocol,
+    LocalCacheProtocol,
+)
+from shortener_app.application.interfaces.key_sequence import (
+    KeySequenceProtocol,
+)
 from shortener_app.application.interfaces.publish_queue import (
+    ClickPublishQueueProtocol,
     NewUrlPublishQueueProtocol,
 )
 from shortener_app.application.interfaces.uow import UnitOfWorkProtocol
 from shortener_app.application.mappers.url_dto_facade import UrlDtoFacade
+from shortener_app.application.services.admission import AdmissionController
+from shortener_app.application.services.background_tasks import (
+    BackgroundTaskSupervisor,
+    OverflowPolicy,
+)
+from shortener_app.application.services.hot_keys import HotKeyTracker
+from shortener_app.application.services.single_flight import SingleFlight
+from shortener_app.application.services.urls.key_pool import ReservedKeyPool
 from shortener_app.application.services.urls.key_reservation import (
     UrlKeyReservationService,
 )
+from shortener_app.application.services.urls.sequence_keys import (
+    SequenceKeyAllocator,
+)
 from shortener_app.application.services.urls.url_cache import UrlCacheService
+from shortener_app.application.services.urls.url_cache_warmer import (
+    UrlCacheWarmer,
+)
 from shortener_app.application.services.urls.url_enqueue import (
     UrlPublishEnqueueService,
 )
@@ -28,10 +53,14 @@ from shortener_app.application.services.urls.url_publisher import (
     UrlBrokerPublishService,
 )
 from shortener_app.application.services.urls.url_reader import UrlReaderService
+from shortener_app.application.use_cases.batch_resolve_keys import (
+    BatchResolveKeysUseCase,
+)
 from shortener_app.application.use_cases.create_short_url import (
     CreateUrlUseCase,
 )
 from shortener_app.application.use_cases.delete_url import DeleteUrlUseCase
+from shortener_app.application.use_cases.get_hot_keys import GetHotKeysUseCase
 from shortener_app.application.use_cases.get_user_urls import (
     GetUserUrlsUseCase,
 )
@@ -39,20 +68,57 @@ from shortener_app.application.use_cases.redirect_to_original_url import (
     RedirectToOriginalUrlUseCase,
 )
 from shortener_app.application.use_cases.update_url import UpdateUrlUseCase
+from shortener_app.config.ioc.adapters.click_publish_queue import (
+    ClickPublishQueueAdapter,
+)
 from shortener_app.config.ioc.adapters.new_url_publish_queue import (
     NewUrlPublishQueueAdapter,
 )
 from shortener_app.config.settings.base import Settings
+from shortener_app.domain.entities.url import UrlEntity
 from shortener_app.domain.services.key_generator import RandomKeyGenerator
-from shortener_app.infrastructures.broker import NewUrlPublishQueue
-from shortener_app.infrastructures.codecs.cache.url_redis_hash_codec import (
+from shortener_app.domain.services.key_permutation import (
+    FeistelKeyPermutation,
+)
+from shortener_app.infrastructures.broker import (
+    AdaptiveBatchController,
+    AdaptiveBatchPolicy,
+    ClickAggregator,
+    ClickPublishQueue,
+    NewUrlPublishQueue,
+    SpillLog,
+)
+from shortener_app.infrastructures.cache import (
+    CircuitBreaker,
+    InMemoryLRUCache,
+    RedisBloomKeyFilter,
+    RedisCacheInvalidationSubscriber,
+    RedisClickCounter,
+    RedisKeySequence,
+)
+from shortener_app.infrastructures.codecs.broker import PublishUrlJsonCodec
+from shortener_app.infrastructures.codecs.cache import (
     UrlCacheRedisHashCodec,
+    UrlResolveRedisHashCodec,
+)
+from shortener_app.infrastructures.db import (
+    PostgresKeySequence,
+    SQLAlchemyRepository,
+    UnitOfWork,
+    iter_hot_urls,
+    iter_url_keys,
 )
+from shortener_app.infrastructures.db.mappers import UrlDBMapper
 from shortener_app.presentation.exceptions.auth import (
     InvalidUserIdMetadata,
     MissingUserIdMetadata,
 )
+from shortener_app.presentation.grpc.batching import (
+    CreateBatchOptions,
+    MicroBatchOptions,
+)
 from shortener_app.presentation.mappers import (
+    AdminPresentationMapper,
     UrlPresentationMapper,
     UserPresentationMapper,
 )
@@ -90,23 +156,303 @@ class RandomKeyGeneratorProvider(Provider):
             random=SystemRandom(),
         )
 
+    @provide(scope=Scope.APP)
+    def get_sequence_key_allocator(
+        self,
+        settings: Settings,
+        redis_client: Redis,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> SequenceKeyAllocator | None:
+        app_settings = settings.app
+        if app_settings.key_strategy != "sequence":
+            return None
+        if not app_settings.key_sequence_secret:
+            raise ValueError(
+                "KEY_SEQUENCE_SECRET is required for sequence keys",
+            )
+
+        sequence: KeySequenceProtocol
+        if app_settings.key_sequence_backend == "redis":
+            sequence = RedisKeySequence(client=redis_client)
+        else:
+            sequence = PostgresKeySequence(session_factory=session_factory)
+
+        return SequenceKeyAllocator(
+            sequence=sequence,
+            permutation=FeistelKeyPermutation(
+                secret=app_settings.key_sequence_secret.encode(),
+                length=app_settings.key_length,
+            ),
+            block_size=app_settings.key_sequence_block_size,
+        )
+
 
 class NewUrlPublishQueueProvider(Provider):
     @provide(scope=Scope.APP)
     async def get_new_url_publish_queue(
         self,
+        settings: Settings,
         broker_publish_service: UrlBrokerPublishService,
+        publish_url_codec: PublishUrlJsonCodec,
     ) -> AsyncIterator[NewUrlPublishQueueProtocol]:
+        broker = settings.broker
+        spill: SpillLog | None = None
+        if broker.new_url_spill_enabled:
+            spill = SpillLog(
+                directory=broker.new_url_spill_dir,
+                segment_bytes=broker.new_url_spill_segment_bytes,
+                fsync_interval_sec=broker.new_url_spill_fsync_interval_ms
+                / 1000,
+                max_bytes=broker.new_url_spill_max_bytes,
+            )
+
+        window_sec = broker.new_url_publish_batch_window_ms / 1000
+        controller: AdaptiveBatchController | None = None
+        if broker.new_url_publish_adaptive:
+            controller = AdaptiveBatchController(
+                policy=AdaptiveBatchPolicy(
+                    max_batch_size=broker.new_url_publish_max_batch_size,
+                    max_window_sec=window_sec,
+                    target_publish_ms=broker.new_url_publish_target_ms,
+                ),
+                batch_size=broker.new_url_publish_batch_size,
+                window_sec=window_sec,
+                max_workers=broker.new_url_publish_workers,
+            )
+
+        admission: AdmissionController | None = None
+        if broker.new_url_admission_enabled:
+            admission = AdmissionController(
+                high_depth=broker.new_url_admission_high_depth,
+                low_depth=broker.new_url_admission_low_depth,
+                high_latency_ms=broker.new_url_admission_high_latency_ms,
+                low_latency_ms=broker.new_url_admission_low_latency_ms,
+                retry_after_sec=broker.new_url_admission_retry_after_ms / 1000,
+            )
+
         impl = NewUrlPublishQueue(
             broker_publish_service=broker_publish_service,
+            admission=admission,
+            spill=spill,
+            spill_codec=publish_url_codec,
             maxsize=10_000,
-            workers=2,
+            workers=broker.new_url_publish_workers,
+            batch_size=broker.new_url_publish_batch_size,
+            batch_window_sec=window_sec,
+            controller=controller,
         )
         await impl.start()
         try:
             yield NewUrlPublishQueueAdapter(impl)
         finally:
             await impl.stop(drain=True, timeout_sec=10.0)
+            logger.info("New URL publish queue totals", **impl.totals())
+
+
+class ClickPublishQueueProvider(Provider):
+    @provide(scope=Scope.APP)
+    async def get_click_publish_queue(
+        self,
+        settings: Settings,
+        broker_publish_service: UrlBrokerPublishService,
+        redis_client: Redis,
+    ) -> AsyncIterator[ClickPublishQueueProtocol]:
+        impl: ClickPublishQueue | None = None
+        sink: ClickPublishQueueProtocol
+
+        if settings.broker.click_tracking_backend == "redis":
+            sink = RedisClickCounter(
+                client=redis_client,
+                key_prefix=settings.redis.click_counter_prefix,
+                bucket_sec=settings.redis.click_counter_bucket_sec,
+                breaker=(
+                    CircuitBreaker(
+                        name="redis-clicks",
+                        failure_threshold=(
+                            settings.redis.redis_breaker_failure_threshold
+                        ),
+                        reset_timeout_sec=(
+                            settings.redis.redis_breaker_reset_sec
+                        ),
+                    )
+                    if settings.redis.redis_breaker_enabled
+                    else None
+                ),
+            )
+        else:
+            impl = ClickPublishQueue(
+                broker_publish_service=broker_publish_service,
+                maxsize=50_000,
+                workers=2,
+                batch_size=500,
+                batch_window_sec=0.05,
+            )
+            await impl.start()
+            sink = ClickPublishQueueAdapter(impl)
+
+        aggregator: ClickAggregator | None = None
+        if settings.broker.click_aggregation_enabled:
+            aggregator = ClickAggregator(
+                queue=sink,
+                window_sec=settings.broker.click_aggregation_window_sec,
+                max_keys=settings.broker.click_aggregation_max_keys,
+            )
+            await aggregator.start()
+
+        try:
+            yield aggregator or sink
+        finally:
+            if aggregator is not None:
+                await aggregator.stop()
+            if impl is not None:
+                await impl.stop(drain=True, timeout_sec=5.0)
+                logger.info("Click publish queue totals", **impl.totals())
+
+
+class LocalCacheProvider(Provider):
+    @provide(scope=Scope.APP)
+    async def get_local_url_cache(
+        self,
+        settings: Settings,
+        redis_client: Redis,
+    ) -> AsyncIterator[LocalCacheProtocol[UrlEntity | UrlResolveDTO]]:
+        local_cache: InMemoryLRUCache[UrlEntity | UrlResolveDTO] = (
+            InMemoryLRUCache(
+                maxsize=settings.redis.local_cache_maxsize,
+                ttl_sec=settings.redis.local_cache_ttl_sec,
+                stale_ttl_sec=settings.redis.local_cache_stale_ttl_sec,
+            )
+        )
+
+        if not settings.redis.local_cache_enabled:
+            yield local_cache
+            return
+
+        subscriber = RedisCacheInvalidationSubscriber(
+            client=redis_client,
+            channel=settings.redis.local_cache_invalidation_channel,
+            local_cache=local_cache,
+        )
+        await subscriber.start()
+        try:
+            yield local_cache
+        finally:
+            await subscriber.stop()
+            logger.info("Local url cache stats", **local_cache.stats())
+
+
+class KeyFilterProvider(Provider):
+    @provide(scope=Scope.APP)
+    async def get_key_filter(
+        self,
+        settings: Settings,
+        redis_client: Redis,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> AsyncIterator[KeyFilterProtocol | None]:
+        if not settings.redis.key_filter_enabled:
+            yield None
+            return
+
+        key_filter = RedisBloomKeyFilter(
+            client=redis_client,
+            capacity=settings.redis.key_filter_capacity,
+            error_rate=settings.redis.key_filter_error_rate,
+            sync_interval_sec=settings.redis.key_filter_sync_interval_sec,
+            keys=lambda: iter_url_keys(session_factory),
+        )
+
+        # Until the bitmap is complete, lookups fall through to the database.
+        if not await key_filter.load():
+            await key_filter.ensure_complete()
+
+        await key_filter.start()
+        try:
+            yield key_filter
+        finally:
+            await key_filter.stop()
+            logger.info("Key filter stats", **key_filter.stats())
+
+
+class SingleFlightProvider(Provider):
+    @provide(scope=Scope.APP)
+    def get_url_single_flight(self) -> SingleFlight[str, UrlEntity | None]:
+        return SingleFlight()
+
+
+class BackgroundTaskProvider(Provider):
+    @provide(scope=Scope.APP)
+    async def get_background_task_supervisor(
+        self,
+        settings: Settings,
+    ) -> AsyncIterator[BackgroundTaskSupervisor | None]:
+        if not settings.app.background_tasks_enabled:
+            yield None
+            return
+
+        supervisor = BackgroundTaskSupervisor(
+            max_concurrency=settings.app.background_tasks_max_concurrency,
+            policy=OverflowPolicy(
+                settings.app.background_tasks_overflow_policy,
+            ),
+        )
+        try:
+            yield supervisor
+        finally:
+            await supervisor.drain(timeout_sec=5.0)
+
+
+class HotKeyProvider(Provider):
+    @provide(scope=Scope.APP)
+    async def get_hot_key_tracker(
+        self,
+        settings: Settings,
+    ) -> AsyncIterator[HotKeyTracker | None]:
+        if not settings.app.hot_keys_enabled:
+            yield None
+            return
+
+        tracker = HotKeyTracker(
+            capacity=settings.app.hot_keys_capacity,
+            top_k=settings.app.hot_keys_top_k,
+            window_sec=settings.app.hot_keys_window_sec,
+            report_interval_sec=settings.app.hot_keys_report_interval_sec,
+        )
+        await tracker.start()
+        try:
+            yield tracker
+        finally:
+            await tracker.stop()
+
+
+class KeyPoolProvider(Provider):
+    @provide(scope=Scope.APP)
+    async def get_reserved_key_pool(
+        self,
+        settings: Settings,
+        key_generator: RandomKeyGenerator,
+        cache_service: UrlCacheService,
+    ) -> AsyncIterator[ReservedKeyPool | None]:
+        # Sequence keys cannot collide, so there is nothing to pre-reserve.
+        if (
+            not settings.app.key_pool_enabled
+            or settings.app.key_strategy == "sequence"
+        ):
+            yield None
+            return
+
+        pool = ReservedKeyPool(
+            cache_service=cache_service,
+            key_generator=key_generator,
+            size=settings.app.key_pool_size,
+            low_water=settings.app.key_pool_low_water,
+            batch_size=settings.app.key_pool_batch_size,
+            reservation_ttl_sec=settings.app.key_pool_reservation_ttl_sec,
+        )
+        await pool.start()
+        try:
+            yield pool
+        finally:
+            await pool.stop()
 
 
 class PresentationMapperProvider(Provider):
@@ -118,38 +464,126 @@ class PresentationMapperProvider(Provider):
     def get_user_presentation_mapper(self) -> UserPresentationMapper:
         return UserPresentationMapper()
 
+    @provide(scope=Scope.APP)
+    def get_admin_presentation_mapper(self) -> AdminPresentationMapper:
+        return AdminPresentationMapper()
+
+    @provide(scope=Scope.APP)
+    def get_create_batch_options(
+        self,
+        settings: Settings,
+    ) -> CreateBatchOptions:
+        # Every chunk of a stream must fit a single CreateShortUrls call.
+        return CreateBatchOptions(
+            max_size=settings.app.create_batch_max_urls,
+            max_stream_items=settings.app.create_stream_max_urls,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_stream_resolve_options(
+        self,
+        settings: Settings,
+    ) -> MicroBatchOptions:
+        return MicroBatchOptions(
+            # Every micro-batch must fit a single BatchResolveKeys call.
+            max_size=min(
+                settings.app.stream_resolve_batch_size,
+                settings.app.batch_resolve_max_keys,
+            ),
+            window_sec=settings.app.stream_resolve_window_ms / 1000,
+            max_pending=settings.app.stream_resolve_max_pending,
+        )
+
 
 class ServiceProvider(Provider):
     @provide(scope=Scope.APP)
     def get_cache_service(
         self,
+        settings: Settings,
         cache: CacheProtocol,
+        local_cache: LocalCacheProtocol[UrlEntity | UrlResolveDTO],
+        key_filter: KeyFilterProtocol | None,
         mapper: UrlDtoFacade,
         codec: UrlCacheRedisHashCodec,
+        resolve_codec: UrlResolveRedisHashCodec,
+        background: BackgroundTaskSupervisor | None,
     ) -> UrlCacheService:
+        redis_settings = settings.redis
+        use_local_cache = redis_settings.local_cache_enabled
+
         return UrlCacheService(
             cache=cache,
             mapper=mapper,
             codec=codec,
+            resolve_codec=resolve_codec,
+            read_through_ttl_seconds=redis_settings.redis_read_through_ttl,
+            read_through_ttl_jitter_seconds=(
+                redis_settings.redis_read_through_ttl_jitter
+            ),
+            invalidation_guard_seconds=(
+                redis_settings.redis_read_through_guard
+            ),
+            negative_ttl_seconds=redis_settings.redis_negative_ttl,
+            key_filter=key_filter,
+            fill_lock_ttl_seconds=redis_settings.fill_lock_ttl,
+            local_cache=local_cache if use_local_cache else None,
+            invalidation_channel=(
+                redis_settings.local_cache_invalidation_channel
+                if use_local_cache
+                else None
+            ),
+            serve_stale_seconds=redis_settings.local_cache_swr_sec,
+            background=background,
+        )
+
+    @provide(scope=Scope.APP)
+    def get_url_cache_warmer(
+        self,
+        settings: Settings,
+        cache_service: UrlCacheService,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> UrlCacheWarmer | None:
+        redis_settings = settings.redis
+        if not redis_settings.cache_warmup_enabled:
+            return None
+
+        return UrlCacheWarmer(
+            cache_service=cache_service,
+            source=lambda: iter_hot_urls(
+                session_factory,
+                limit=redis_settings.cache_warmup_limit,
+                batch_size=redis_settings.cache_warmup_batch_size,
+            ),
+            budget_seconds=redis_settings.cache_warmup_budget_sec,
         )
 
     @provide(scope=Scope.APP)
     def get_key_reservation_service(
         self,
+        settings: Settings,
         key_generator: RandomKeyGenerator,
         cache_service: UrlCacheService,
+        pool: ReservedKeyPool | None,
+        sequence_keys: SequenceKeyAllocator | None,
     ) -> UrlKeyReservationService:
         return UrlKeyReservationService(
             key_generator=key_generator,
             cache_service=cache_service,
+            pool=pool,
+            sequence_keys=sequence_keys,
+            candidates_per_call=settings.app.key_reserve_candidates,
         )
 
     @provide(scope=Scope.APP)
     def get_publish_enqueue_service(
         self,
         new_urls_queue: NewUrlPublishQueueProtocol,
+        clicks_queue: ClickPublishQueueProtocol,
     ) -> UrlPublishEnqueueService:
-        return UrlPublishEnqueueService(new_urls_queue=new_urls_queue)
+        return UrlPublishEnqueueService(
+            new_urls_queue=new_urls_queue,
+            clicks_queue=clicks_queue,
+        )
 
     @provide(scope=Scope.APP)
     def get_url_broker_publish_service(
@@ -161,15 +595,45 @@ class ServiceProvider(Provider):
     @provide(scope=Scope.APP)
     def get_url_reader_service(
         self,
+        settings: Settings,
         cache_service: UrlCacheService,
+        single_flight: SingleFlight[str, UrlEntity | None],
+        background: BackgroundTaskSupervisor | None,
+        session_factory: async_sessionmaker[AsyncSession],
+        db_mapper: UrlDBMapper,
     ) -> UrlReaderService:
-        return UrlReaderService(cache_service=cache_service)
+        def detached_uow() -> UnitOfWorkProtocol:
+            session = session_factory()
+            return UnitOfWork(
+                session=session,
+                url_repository=SQLAlchemyRepository(
+                    session=session,
+                    mapper=db_mapper,
+                ),
+                close_session=True,
+            )
+
+        return UrlReaderService(
+            cache_service=cache_service,
+            read_through=settings.redis.redis_read_through_enabled,
+            single_flight=(
+                single_flight if settings.app.single_flight_enabled else None
+            ),
+            uow_factory=detached_uow,
+            fill_lock_wait_seconds=(
+                settings.redis.fill_lock_wait_sec
+                if settings.redis.fill_lock_enabled
+                else None
+            ),
+            background=background,
+        )
 
 
 class UseCaseProvider(Provider):
     @provide(scope=Scope.REQUEST)
     def get_create_url_use_case(
         self,
+        settings: Settings,
         key_reservation_service: UrlKeyReservationService,
         publish_enqueue_service: UrlPublishEnqueueService,
         mapper: UrlDtoFacade,
@@ -178,21 +642,44 @@ class UseCaseProvider(Provider):
             key_reservation_service=key_reservation_service,
             publish_enqueue_service=publish_enqueue_service,
             mapper=mapper,
+            max_batch_size=settings.app.create_batch_max_urls,
         )
 
     @provide(scope=Scope.REQUEST)
     def redirect_to_target_url_use_case(
         self,
         reader_service: UrlReaderService,
-        broker_publish_service: UrlBrokerPublishService,
+        publish_enqueue_service: UrlPublishEnqueueService,
         mapper: UrlDtoFacade,
         uow: UnitOfWorkProtocol,
+        hot_keys: HotKeyTracker | None,
     ) -> RedirectToOriginalUrlUseCase:
         return RedirectToOriginalUrlUseCase(
             reader_service=reader_service,
-            broker_publish_service=broker_publish_service,
+            publish_enqueue_service=publish_enqueue_service,
             mapper=mapper,
             uow=uow,
+            hot_keys=hot_keys,
+        )
+
+    @provide(scope=Scope.REQUEST)
+    def get_hot_keys_use_case(
+        self,
+        hot_keys: HotKeyTracker | None,
+    ) -> GetHotKeysUseCase:
+        return GetHotKeysUseCase(hot_keys=hot_keys)
+
+    @provide(scope=Scope.REQUEST)
+    def batch_resolve_keys_use_case(
+        self,
+        settings: Settings,
+        reader_service: UrlReaderService,
+        uow: UnitOfWorkProtocol,
+    ) -> BatchResolveKeysUseCase:
+        return BatchResolveKeysUseCase(
+            reader_service=reader_service,
+            uow=uow,
+            max_keys=settings.app.batch_resolve_max_keys,
         )
 
     @provide(scope=Scope.REQUEST)
@@ -210,12 +697,12 @@ class UseCaseProvider(Provider):
     def delete_url_use_case(
         self,
         reader_service: UrlReaderService,
-        cache: CacheProtocol,
+        cache_service: UrlCacheService,
         uow: UnitOfWorkProtocol,
     ) -> DeleteUrlUseCase:
         return DeleteUrlUseCase(
             reader_service=reader_service,
-            cache=cache,
+            cache_service=cache_service,
             uow=uow,
         )
 
@@ -223,10 +710,12 @@ class UseCaseProvider(Provider):
     def update_url_use_case(
         self,
         reader_service: UrlReaderService,
+        cache_service: UrlCacheService,
         uow: UnitOfWorkProtocol,
     ) -> UpdateUrlUseCase:
         return UpdateUrlUseCase(
             reader_service=reader_service,
+            cache_service=cache_service,
             uow=uow,
         )
 
@@ -235,6 +724,13 @@ GRPC_ONLY_PROVIDERS: tuple[Provider, ...] = (
     AuthProvider(),
     RandomKeyGeneratorProvider(),
     NewUrlPublishQueueProvider(),
+    ClickPublishQueueProvider(),
+    LocalCacheProvider(),
+    KeyFilterProvider(),
+    SingleFlightProvider(),
+    BackgroundTaskProvider(),
+    HotKeyProvider(),
+    KeyPoolProvider(),
     PresentationMapperProvider(),
     ServiceProvider(),
     UseCaseProvider(),
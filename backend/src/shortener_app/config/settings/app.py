@@ -12,3 +12,122 @@ class AppSettings(BaseAppSettings):
     debug: bool = Field(False, validation_alias="DEBUG")
 
     key_length: int = Field(5, validation_alias="KEY_LENGTH")
+
+    # Random keys tried per reservation round trip (Lua, first free wins)
+    key_reserve_candidates: int = Field(
+        8,
+        validation_alias="KEY_RESERVE_CANDIDATES",
+    )
+
+    # "sequence": keys are permuted numbers leased in blocks from a shared
+    # counter, unique without retries. The secret fixes the permutation and
+    # must never change once keys have been issued.
+    key_strategy: Literal["random", "sequence"] = Field(
+        "random",
+        validation_alias="KEY_STRATEGY",
+    )
+    key_sequence_backend: Literal["postgres", "redis"] = Field(
+        "postgres",
+        validation_alias="KEY_SEQUENCE_BACKEND",
+    )
+    key_sequence_block_size: int = Field(
+        1_000,
+        validation_alias="KEY_SEQUENCE_BLOCK_SIZE",
+    )
+    key_sequence_secret: str = Field(
+        "",
+        validation_alias="KEY_SEQUENCE_SECRET",
+    )
+
+    single_flight_enabled: bool = Field(
+        True,
+        validation_alias="SINGLE_FLIGHT_ENABLED",
+    )
+
+    # Fire-and-forget side effects (cache write-backs on the redirect path)
+    background_tasks_enabled: bool = Field(
+        True,
+        validation_alias="BACKGROUND_TASKS_ENABLED",
+    )
+    background_tasks_max_concurrency: int = Field(
+        1000,
+        validation_alias="BACKGROUND_TASKS_MAX_CONCURRENCY",
+    )
+    background_tasks_overflow_policy: Literal["drop", "sample", "block"] = (
+        Field(
+            "drop",
+            validation_alias="BACKGROUND_TASKS_OVERFLOW_POLICY",
+        )
+    )
+
+    # Space-Saving top-K of the most redirected keys
+    hot_keys_enabled: bool = Field(
+        True,
+        validation_alias="HOT_KEYS_ENABLED",
+    )
+    hot_keys_capacity: int = Field(
+        1_000,
+        validation_alias="HOT_KEYS_CAPACITY",
+    )
+    hot_keys_top_k: int = Field(
+        20,
+        validation_alias="HOT_KEYS_TOP_K",
+    )
+    hot_keys_window_sec: float = Field(
+        60.0,
+        validation_alias="HOT_KEYS_WINDOW_SEC",
+    )
+    hot_keys_report_interval_sec: float = Field(
+        60.0,
+        validation_alias="HOT_KEYS_REPORT_INTERVAL_SEC",
+    )
+
+    # Keys pre-reserved in Redis for CreateShortUrl
+    key_pool_enabled: bool = Field(
+        True,
+        validation_alias="KEY_POOL_ENABLED",
+    )
+    key_pool_size: int = Field(
+        1_000,
+        validation_alias="KEY_POOL_SIZE",
+    )
+    key_pool_low_water: int = Field(
+        250,
+        validation_alias="KEY_POOL_LOW_WATER",
+    )
+    key_pool_batch_size: int = Field(
+        200,
+        validation_alias="KEY_POOL_BATCH_SIZE",
+    )
+    key_pool_reservation_ttl_sec: int = Field(
+        3600,
+        validation_alias="KEY_POOL_RESERVATION_TTL_SEC",
+    )
+
+    create_batch_max_urls: int = Field(
+        1_000,
+        validation_alias="CREATE_BATCH_MAX_URLS",
+    )
+    # StreamCreateShortUrls answers once, so a stream is capped as a whole
+    create_stream_max_urls: int = Field(
+        10_000,
+        validation_alias="CREATE_STREAM_MAX_URLS",
+    )
+    batch_resolve_max_keys: int = Field(
+        100,
+        validation_alias="BATCH_RESOLVE_MAX_KEYS",
+    )
+
+    # Micro-batching for the streaming ResolveKeys RPC
+    stream_resolve_batch_size: int = Field(
+        100,
+        validation_alias="STREAM_RESOLVE_BATCH_SIZE",
+    )
+    stream_resolve_window_ms: float = Field(
+        2.0,
+        validation_alias="STREAM_RESOLVE_WINDOW_MS",
+    )
+    stream_resolve_max_pending: int = Field(
+        1000,
+        validation_alias="STREAM_RESOLVE_MAX_PENDING",
+    )
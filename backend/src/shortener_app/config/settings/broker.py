@@ -1,4 +1,4 @@
-from typing import final
+from typing import Literal, final
 
 from pydantic import Field
 
@@ -8,3 +8,117 @@ from shortener_app.config.settings._base_settings import BaseAppSettings
 @final
 class BrokerSettings(BaseAppSettings):
     broker_url: str = Field(..., validation_alias="BROKER_URL")
+
+    # Sum clicks per key over a short window before publishing
+    click_aggregation_enabled: bool = Field(
+        False,
+        validation_alias="CLICK_AGGREGATION_ENABLED",
+    )
+    click_aggregation_window_sec: float = Field(
+        1.0,
+        validation_alias="CLICK_AGGREGATION_WINDOW_SEC",
+    )
+    click_aggregation_max_keys: int = Field(
+        100_000,
+        validation_alias="CLICK_AGGREGATION_MAX_KEYS",
+    )
+
+    # "redis" counts clicks in Redis hashes flushed by shortener-click-flusher
+    click_tracking_backend: Literal["kafka", "redis"] = Field(
+        "kafka",
+        validation_alias="CLICK_TRACKING_BACKEND",
+    )
+
+    # Write new URLs to a local disk log when Kafka is slow or down
+    new_url_spill_enabled: bool = Field(
+        False,
+        validation_alias="NEW_URL_SPILL_ENABLED",
+    )
+    new_url_spill_dir: str = Field(
+        "/var/lib/shortener/spill",
+        validation_alias="NEW_URL_SPILL_DIR",
+    )
+    new_url_spill_segment_bytes: int = Field(
+        16 * 1024 * 1024,
+        validation_alias="NEW_URL_SPILL_SEGMENT_BYTES",
+    )
+    new_url_spill_fsync_interval_ms: int = Field(
+        50,
+        validation_alias="NEW_URL_SPILL_FSYNC_INTERVAL_MS",
+    )
+    new_url_spill_max_bytes: int = Field(
+        1024 * 1024 * 1024,
+        validation_alias="NEW_URL_SPILL_MAX_BYTES",
+    )
+
+    # New URL publishing; batch size, window and workers adapt within bounds
+    new_url_publish_workers: int = Field(
+        4,
+        validation_alias="NEW_URL_PUBLISH_WORKERS",
+    )
+    new_url_publish_adaptive: bool = Field(
+        True,
+        validation_alias="NEW_URL_PUBLISH_ADAPTIVE",
+    )
+    new_url_publish_batch_size: int = Field(
+        200,
+        validation_alias="NEW_URL_PUBLISH_BATCH_SIZE",
+    )
+    new_url_publish_max_batch_size: int = Field(
+        2_000,
+        validation_alias="NEW_URL_PUBLISH_MAX_BATCH_SIZE",
+    )
+    new_url_publish_batch_window_ms: int = Field(
+        200,
+        validation_alias="NEW_URL_PUBLISH_BATCH_WINDOW_MS",
+    )
+    new_url_publish_target_ms: float = Field(
+        50.0,
+        validation_alias="NEW_URL_PUBLISH_TARGET_MS",
+    )
+
+    # Kafka message key of new-urls events; "user_id" keeps a user's URLs
+    # on one partition
+    new_urls_message_key: Literal["key", "user_id"] = Field(
+        "key",
+        validation_alias="NEW_URLS_MESSAGE_KEY",
+    )
+    # Publish one produce request per partition instead of one per record;
+    # keys keep their partition either way
+    partition_aware_publish: bool = Field(
+        True,
+        validation_alias="PARTITION_AWARE_PUBLISH",
+    )
+    # Consumers of new-urls in one process; each owns whole partitions
+    new_url_consumer_workers: int = Field(
+        1,
+        validation_alias="NEW_URL_CONSUMER_WORKERS",
+    )
+
+    # Shed CreateShortUrl with RESOURCE_EXHAUSTED while new-url publishing
+    # is saturated; depth counts the queue plus the spill backlog
+    new_url_admission_enabled: bool = Field(
+        True,
+        validation_alias="NEW_URL_ADMISSION_ENABLED",
+    )
+    new_url_admission_high_depth: int = Field(
+        8_000,
+        validation_alias="NEW_URL_ADMISSION_HIGH_DEPTH",
+    )
+    new_url_admission_low_depth: int = Field(
+        2_000,
+        validation_alias="NEW_URL_ADMISSION_LOW_DEPTH",
+    )
+    # Smoothed time for the broker to ack a publish
+    new_url_admission_high_latency_ms: float = Field(
+        500.0,
+        validation_alias="NEW_URL_ADMISSION_HIGH_LATENCY_MS",
+    )
+    new_url_admission_low_latency_ms: float = Field(
+        100.0,
+        validation_alias="NEW_URL_ADMISSION_LOW_LATENCY_MS",
+    )
+    new_url_admission_retry_after_ms: int = Field(
+        1_000,
+        validation_alias="NEW_URL_ADMISSION_RETRY_AFTER_MS",
+    )
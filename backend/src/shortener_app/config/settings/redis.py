@@ -14,3 +14,135 @@ class RedisSettings(BaseAppSettings):
         "short:",
         validation_alias="REDIS_CACHE_PREFIX",
     )
+
+    # Write database hits back into the cache
+    redis_read_through_enabled: bool = Field(
+        True,
+        validation_alias="REDIS_READ_THROUGH_ENABLED",
+    )
+    redis_read_through_ttl: int = Field(
+        3600,
+        validation_alias="REDIS_READ_THROUGH_TTL",
+    )
+    redis_read_through_ttl_jitter: int = Field(
+        300,
+        validation_alias="REDIS_READ_THROUGH_TTL_JITTER",
+    )
+    # Write-backs are skipped for this long after a key is invalidated
+    redis_read_through_guard: int = Field(
+        5,
+        validation_alias="REDIS_READ_THROUGH_GUARD",
+    )
+
+    # In-process L1 tier in front of Redis
+    local_cache_enabled: bool = Field(
+        True,
+        validation_alias="LOCAL_CACHE_ENABLED",
+    )
+    local_cache_maxsize: int = Field(
+        10_000,
+        validation_alias="LOCAL_CACHE_MAXSIZE",
+    )
+    local_cache_ttl_sec: float = Field(
+        30.0,
+        validation_alias="LOCAL_CACHE_TTL_SEC",
+    )
+    local_cache_invalidation_channel: str = Field(
+        "short:invalidate",
+        validation_alias="LOCAL_CACHE_INVALIDATION_CHANNEL",
+    )
+    # How long expired local entries are retained as a fallback for Redis
+    # or database outages, and how far past their TTL they are served while
+    # being refreshed in the background (0 disables)
+    local_cache_stale_ttl_sec: float = Field(
+        0.0,
+        validation_alias="LOCAL_CACHE_STALE_TTL_SEC",
+    )
+    local_cache_swr_sec: float = Field(
+        0.0,
+        validation_alias="LOCAL_CACHE_SWR_SEC",
+    )
+
+    # Stop sending commands to a failing Redis for a cool-down window
+    redis_breaker_enabled: bool = Field(
+        True,
+        validation_alias="REDIS_BREAKER_ENABLED",
+    )
+    redis_breaker_failure_threshold: int = Field(
+        5,
+        validation_alias="REDIS_BREAKER_FAILURE_THRESHOLD",
+    )
+    redis_breaker_reset_sec: float = Field(
+        5.0,
+        validation_alias="REDIS_BREAKER_RESET_SEC",
+    )
+
+    # Load the most clicked URLs into the cache tiers before serving
+    cache_warmup_enabled: bool = Field(
+        True,
+        validation_alias="CACHE_WARMUP_ENABLED",
+    )
+    cache_warmup_limit: int = Field(
+        5_000,
+        validation_alias="CACHE_WARMUP_LIMIT",
+    )
+    cache_warmup_batch_size: int = Field(
+        500,
+        validation_alias="CACHE_WARMUP_BATCH_SIZE",
+    )
+    cache_warmup_budget_sec: float = Field(
+        10.0,
+        validation_alias="CACHE_WARMUP_BUDGET_SEC",
+    )
+
+    # Tombstones for keys that missed the database
+    redis_negative_ttl: int = Field(
+        30,
+        validation_alias="REDIS_NEGATIVE_TTL",
+    )
+
+    # Bloom filter of allocated keys, shared through a Redis bitmap
+    key_filter_enabled: bool = Field(
+        False,
+        validation_alias="KEY_FILTER_ENABLED",
+    )
+    key_filter_capacity: int = Field(
+        1_000_000,
+        validation_alias="KEY_FILTER_CAPACITY",
+    )
+    key_filter_error_rate: float = Field(
+        0.01,
+        validation_alias="KEY_FILTER_ERROR_RATE",
+    )
+    key_filter_sync_interval_sec: float = Field(
+        5.0,
+        validation_alias="KEY_FILTER_SYNC_INTERVAL_SEC",
+    )
+
+    # Fleet-wide lock so one instance fills a missing key from the database
+    fill_lock_enabled: bool = Field(
+        False,
+        validation_alias="FILL_LOCK_ENABLED",
+    )
+    fill_lock_ttl: int = Field(
+        2,
+        validation_alias="FILL_LOCK_TTL",
+    )
+    fill_lock_wait_sec: float = Field(
+        0.5,
+        validation_alias="FILL_LOCK_WAIT_SEC",
+    )
+
+    # Per-time-bucket click counters (CLICK_TRACKING_BACKEND=redis)
+    click_counter_prefix: str = Field(
+        "short:clicks",
+        validation_alias="CLICK_COUNTER_PREFIX",
+    )
+    click_counter_bucket_sec: int = Field(
+        10,
+        validation_alias="CLICK_COUNTER_BUCKET_SEC",
+    )
+    click_counter_flush_interval_sec: float = Field(
+        5.0,
+        validation_alias="CLICK_COUNTER_FLUSH_INTERVAL_SEC",
+    )
@@ -12,6 +12,10 @@ from dishka import make_async_container
 from dishka.integrations.grpcio import DishkaAioInterceptor, GrpcioProvider
 from grpc_reflection.v1alpha import reflection
 
+from shortener_app.application.services.urls.url_cache_warmer import (
+    UrlCacheWarmer,
+)
+
 if TYPE_CHECKING:
     from dishka import AsyncContainer, Provider
 
@@ -32,14 +36,20 @@ async def server(
 ) -> None:
     address = _get_address()
 
-    server_ = await _create_grpc_server(
+    container = make_async_container(
+        *ioc_providers,
+        GrpcioProvider(),
+    )
+    server_ = _setup_server(
         is_reflection_enable=is_reflection_enable,
-        ioc_providers=ioc_providers,
         grpc_interceptors=grpc_interceptors,
         grpc_services=grpc_services,
+        ioc_container=container,
     )
     server_.add_insecure_port(address)
 
+    await _warm_up(container)
+
     await server_.start()
     logger.info("grpc_server_started", address=address)
 
@@ -62,6 +72,27 @@ async def server(
     await server_.stop(grace=5)
     logger.info("grpc_server_stopped")
 
+    # Closing the container runs APP-scope finalizers: background tasks and
+    # publish queues are drained before broker/Redis/DB clients shut down.
+    await container.close()
+    logger.info("ioc_container_closed")
+
+
+async def _warm_up(container: "AsyncContainer") -> None:
+    """Fill the cache tiers with hot URLs before the port starts serving."""
+    warmer = await container.get(UrlCacheWarmer | None)
+    if warmer is None:
+        return
+
+    report = await warmer.warm()
+    logger.info(
+        "cache_warmup_finished",
+        entries_loaded=report.loaded,
+        redis_filled=report.redis_filled,
+        duration_ms=round(report.duration_sec * 1000, 1),
+        timed_out=report.timed_out,
+    )
+
 
 def _get_address() -> str:
     host = os.getenv("GRPC_HOST", "0.0.0.0")
@@ -69,26 +100,6 @@ def _get_address() -> str:
     return f"{host}:{port}"
 
 
-async def _create_grpc_server(
-    *,
-    is_reflection_enable: bool,
-    ioc_providers: tuple["Provider", ...],
-    grpc_interceptors: Sequence["GrpcInterceptorDefinition"],
-    grpc_services: Sequence["GrpcServiceDefinition"],
-) -> grpc.aio.Server:
-    container = make_async_container(
-        *ioc_providers,
-        GrpcioProvider(),
-    )
-
-    return _setup_server(
-        is_reflection_enable=is_reflection_enable,
-        grpc_interceptors=grpc_interceptors,
-        grpc_services=grpc_services,
-        ioc_container=container,
-    )
-
-
 def _setup_server(
     *,
     is_reflection_enable: bool,
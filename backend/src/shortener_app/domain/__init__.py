@@ -1,7 +1,11 @@
 __all__ = (
+    "FeistelKeyPermutation",
     "RandomKeyGenerator",
     "UrlEntity",
 )
 
 from shortener_app.domain.entities import UrlEntity
-from shortener_app.domain.services import RandomKeyGenerator
+from shortener_app.domain.services import (
+    FeistelKeyPermutation,
+    RandomKeyGenerator,
+)
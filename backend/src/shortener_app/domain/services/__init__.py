@@ -1,3 +1,9 @@
-__all__ = ("RandomKeyGenerator",)
+__all__ = (
+    "FeistelKeyPermutation",
+    "RandomKeyGenerator",
+)
 
 from shortener_app.domain.services.key_generator import RandomKeyGenerator
+from shortener_app.domain.services.key_permutation import (
+    FeistelKeyPermutation,
+)
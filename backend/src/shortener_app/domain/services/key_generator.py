@@ -17,13 +17,58 @@ class RandomKeyGenerator:
     chars: str = f"{ascii_letters}{digits}"
     random: SystemRandom = field(default_factory=SystemRandom)
 
+    # byte -> char table for `generate_many`, None if chars is not ASCII
+    _table: bytes | None = field(init=False, repr=False)
+    _reject: bytes = field(init=False, repr=False)
+
     def __post_init__(self) -> None:
         if self.length < 0:
             raise ValueError("length must be >= 0")
         if not self.chars and self.length > 0:
             raise ValueError("chars must be non-empty when length > 0")
 
+        table: bytes | None = None
+        reject = b""
+        if self.chars and self.chars.isascii() and len(self.chars) <= 256:
+            # Bytes past the last whole multiple of the alphabet size are
+            # rejected, so every char stays equally likely (no modulo bias).
+            limit = 256 - 256 % len(self.chars)
+            alphabet = self.chars.encode("ascii")
+            table = bytes(alphabet[i % len(alphabet)] for i in range(256))
+            reject = bytes(range(limit, 256))
+        object.__setattr__(self, "_table", table)
+        object.__setattr__(self, "_reject", reject)
+
     def __call__(self) -> str:
         return "".join(
             self.random.choices(population=self.chars, k=self.length),
         )
+
+    def generate_many(self, n: int) -> list[str]:
+        """
+        Generate `n` keys from one large random buffer.
+
+        Random bytes are mapped to chars with a single `bytes.translate`
+        that also drops rejected bytes; a short draw is topped up.
+        """
+        if n <= 0 or self.length == 0:
+            return [""] * max(n, 0)
+        if self._table is None:
+            return [self() for _ in range(n)]
+
+        needed = n * self.length
+        # Rejection rate is below 256 % len(chars) / 256; ask for a bit more.
+        accept = 256 - len(self._reject)
+        draw = needed * 256 // accept + 16
+
+        buffer = b""
+        while len(buffer) < needed:
+            buffer += self.random.randbytes(draw).translate(
+                self._table,
+                self._reject,
+            )
+
+        text = buffer[:needed].decode("ascii")
+        return [
+            text[i : i + self.length] for i in range(0, needed, self.length)
+        ]
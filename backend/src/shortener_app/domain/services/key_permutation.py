@@ -0,0 +1,84 @@
+__all__ = ("FeistelKeyPermutation",)
+
+import hashlib
+from dataclasses import dataclass, field
+from string import ascii_letters, digits
+from typing import final
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class FeistelKeyPermutation:
+    """
+    Keyed bijection from sequence numbers to fixed-length keys.
+
+    A balanced Feistel network over the smallest even bit width covering
+    `len(chars) ** length` permutes the integers of that range; values that
+    land outside the keyspace are re-encrypted (cycle walking), so every
+    number below `capacity` maps to a distinct key. Consecutive numbers give
+    unrelated-looking keys, and without `secret` the order cannot be
+    recovered.
+
+    The mapping is fixed by `secret`, `length`, `chars` and `rounds`:
+    changing any of them after keys were issued reissues existing keys.
+    """
+
+    secret: bytes
+    length: int = 5
+    chars: str = f"{ascii_letters}{digits}"
+    rounds: int = 4
+
+    _half_bits: int = field(init=False, repr=False)
+    _half_mask: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if not 0 < len(self.secret) <= 64:
+            raise ValueError("secret must be 1..64 bytes")
+        if self.length <= 0:
+            raise ValueError("length must be > 0")
+        if len(self.chars) < 2:
+            raise ValueError("chars must have at least two symbols")
+        if self.rounds < 3:
+            raise ValueError("rounds must be >= 3")
+
+        half_bits = ((self.capacity - 1).bit_length() + 1) // 2
+        object.__setattr__(self, "_half_bits", half_bits)
+        object.__setattr__(self, "_half_mask", (1 << half_bits) - 1)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.chars) ** self.length
+
+    def __call__(self, index: int) -> str:
+        if not 0 <= index < self.capacity:
+            raise ValueError("index is outside the keyspace")
+
+        value = self._encrypt(index)
+        while value >= self.capacity:
+            value = self._encrypt(value)
+        return self._encode(value)
+
+    def _encrypt(self, value: int) -> int:
+        left = value >> self._half_bits
+        right = value & self._half_mask
+
+        for round_ in range(self.rounds):
+            left, right = right, left ^ self._round(round_, right)
+
+        return (left << self._half_bits) | right
+
+    def _round(self, round_: int, value: int) -> int:
+        digest = hashlib.blake2b(
+            value.to_bytes(8, "big") + round_.to_bytes(1, "big"),
+            key=self.secret,
+            digest_size=8,
+        ).digest()
+        return int.from_bytes(digest, "big") & self._half_mask
+
+    def _encode(self, value: int) -> str:
+        base = len(self.chars)
+        symbols = []
+        for _ in range(self.length):
+            value, rem = divmod(value, base)
+            symbols.append(self.chars[rem])
+        return "".join(reversed(symbols))
@@ -0,0 +1,33 @@
+import asyncio
+
+from shortener_app.config.ioc.consumer_providers import get_consumer_providers
+from shortener_app.config.settings.base import Settings
+from shortener_app.config.settings.logging import LoggingConfig, setup_logging
+from shortener_app.infrastructures.broker.consumers.common import (
+    init_container,
+)
+from shortener_app.infrastructures.cache.click_counter_flusher import (
+    run_flusher,
+)
+
+
+async def main():
+    providers = get_consumer_providers()
+    container = await init_container(providers=providers)
+    settings = await container.get(Settings)
+    await run_flusher(
+        container=container,
+        interval_sec=settings.redis.click_counter_flush_interval_sec,
+    )
+
+
+if __name__ == "__main__":
+    setup_logging(
+        config=LoggingConfig(
+            level="INFO",
+            renderer="console",
+            enable_diagnostics=False,
+            use_utc_timestamps=True,
+        ),
+    )
+    asyncio.run(main())
@@ -1,6 +1,7 @@
 import asyncio
 
 from shortener_app.config.ioc.consumer_providers import get_consumer_providers
+from shortener_app.config.settings.loader import get_settings
 from shortener_app.config.settings.logging import LoggingConfig, setup_logging
 from shortener_app.infrastructures.broker.consumers.common import (
     init_container,
@@ -13,7 +14,10 @@ from shortener_app.infrastructures.broker.consumers.consumer_new_url import (
 async def main():
     providers = get_consumer_providers()
     container = await init_container(providers=providers)
-    await run_subscriber(container=container)
+    await run_subscriber(
+        container=container,
+        workers=get_settings().broker.new_url_consumer_workers,
+    )
 
 
 if __name__ == "__main__":
@@ -1,6 +1,35 @@
-__all__ = ("KafkaPublisher", "NewUrlPublishQueue")
+__all__ = (
+    "AdaptiveBatchController",
+    "AdaptiveBatchPolicy",
+    "BatchPublishQueue",
+    "BatchQueue",
+    "ClickAggregator",
+    "ClickPublishQueue",
+    "KafkaPartitionMap",
+    "KafkaPublisher",
+    "NewUrlPublishQueue",
+    "SpillLog",
+)
 
+from shortener_app.infrastructures.broker.adaptive_batching import (
+    AdaptiveBatchController,
+    AdaptiveBatchPolicy,
+)
+from shortener_app.infrastructures.broker.batch_publish_queue import (
+    BatchPublishQueue,
+)
+from shortener_app.infrastructures.broker.batch_queue import BatchQueue
+from shortener_app.infrastructures.broker.click_aggregator import (
+    ClickAggregator,
+)
+from shortener_app.infrastructures.broker.click_publish_queue import (
+    ClickPublishQueue,
+)
 from shortener_app.infrastructures.broker.new_url_publish_queue import (
     NewUrlPublishQueue,
 )
+from shortener_app.infrastructures.broker.partitioning import (
+    KafkaPartitionMap,
+)
 from shortener_app.infrastructures.broker.publisher import KafkaPublisher
+from shortener_app.infrastructures.broker.spill_log import SpillLog
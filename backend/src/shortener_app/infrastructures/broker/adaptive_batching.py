@@ -0,0 +1,153 @@
+__all__ = (
+    "AdaptiveBatchController",
+    "AdaptiveBatchPolicy",
+    "BatchOperatingPoint",
+)
+
+from dataclasses import dataclass, replace
+from typing import final
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AdaptiveBatchPolicy:
+    """Bounds and steps for `AdaptiveBatchController`."""
+
+    min_batch_size: int = 10
+    max_batch_size: int = 2_000
+    batch_size_step: int = 20
+
+    min_window_sec: float = 0.001
+    max_window_sec: float = 0.2
+    window_step_sec: float = 0.005
+
+    # Publish calls slower than this shrink the batch
+    target_publish_ms: float = 50.0
+    decrease_factor: float = 0.5
+
+    # Consecutive signals needed before the worker count changes
+    worker_patience: int = 8
+
+    def __post_init__(self) -> None:
+        if not 0 < self.min_batch_size <= self.max_batch_size:
+            raise ValueError("0 < min_batch_size <= max_batch_size required")
+        if not 0 < self.min_window_sec <= self.max_window_sec:
+            raise ValueError("0 < min_window_sec <= max_window_sec required")
+        if not 0 < self.decrease_factor < 1:
+            raise ValueError("decrease_factor must be in (0, 1)")
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class BatchOperatingPoint:
+    batch_size: int
+    window_sec: float
+    workers: int
+
+
+class AdaptiveBatchController:
+    """
+    Tunes batch size, batch window and active workers of a publish queue.
+
+    Batch size follows AIMD: it grows by `batch_size_step` while batches
+    fill up within the target publish latency, and is cut by
+    `decrease_factor` when a publish is slower than the target or the
+    producer buffer overflows. The window grows by `window_step_sec` while
+    batches fill before it closes and halves when it closes on a batch
+    that is less than half full, so a lightly loaded queue stops holding
+    events back. Workers are added while the backlog exceeds a batch per
+    active worker and removed while batches find the queue empty.
+    """
+
+    def __init__(
+        self,
+        *,
+        policy: AdaptiveBatchPolicy,
+        batch_size: int,
+        window_sec: float,
+        max_workers: int,
+    ) -> None:
+        if max_workers <= 0:
+            raise ValueError("max_workers must be > 0")
+
+        self._policy = policy
+        self._max_workers = max_workers
+        self._point = BatchOperatingPoint(
+            batch_size=self._clamp_size(batch_size),
+            window_sec=self._clamp_window(window_sec),
+            workers=max_workers,
+        )
+
+        self._backlog_streak = 0
+        self._idle_streak = 0
+
+    @property
+    def point(self) -> BatchOperatingPoint:
+        return self._point
+
+    def on_batch(
+        self,
+        *,
+        size: int,
+        latency_ms: float,
+        qsize: int,
+    ) -> BatchOperatingPoint:
+        """Account one published batch; returns the new operating point."""
+        policy = self._policy
+        point = self._point
+        filled = size >= point.batch_size
+
+        batch_size = point.batch_size
+        if latency_ms > policy.target_publish_ms:
+            batch_size = int(batch_size * policy.decrease_factor)
+        elif filled:
+            batch_size += policy.batch_size_step
+
+        window_sec = point.window_sec
+        if filled:
+            window_sec += policy.window_step_sec
+        elif size * 2 < point.batch_size:
+            window_sec /= 2
+
+        self._point = replace(
+            point,
+            batch_size=self._clamp_size(batch_size),
+            window_sec=self._clamp_window(window_sec),
+            workers=self._next_workers(
+                qsize=qsize,
+                backlog=qsize > point.batch_size * point.workers
+                and latency_ms <= policy.target_publish_ms,
+            ),
+        )
+        return self._point
+
+    def on_split(self) -> BatchOperatingPoint:
+        """Account a batch split because the producer buffer was full."""
+        self._point = replace(
+            self._point,
+            batch_size=self._clamp_size(
+                int(self._point.batch_size * self._policy.decrease_factor),
+            ),
+        )
+        return self._point
+
+    def _next_workers(self, *, qsize: int, backlog: bool) -> int:
+        workers = self._point.workers
+        self._backlog_streak = self._backlog_streak + 1 if backlog else 0
+        self._idle_streak = self._idle_streak + 1 if qsize == 0 else 0
+
+        if self._backlog_streak >= self._policy.worker_patience:
+            self._backlog_streak = 0
+            return min(workers + 1, self._max_workers)
+        if self._idle_streak >= self._policy.worker_patience:
+            self._idle_streak = 0
+            return max(workers - 1, 1)
+        return workers
+
+    def _clamp_size(self, value: int) -> int:
+        policy = self._policy
+        return max(policy.min_batch_size, min(value, policy.max_batch_size))
+
+    def _clamp_window(self, value: float) -> float:
+        policy = self._policy
+        return max(policy.min_window_sec, min(value, policy.max_window_sec))
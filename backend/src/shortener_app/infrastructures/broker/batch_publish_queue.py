@@ -0,0 +1,458 @@
+__all__ = ("BatchPublishQueue",)
+
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
+
+import structlog
+
+from shortener_app.infrastructures.broker.adaptive_batching import (
+    AdaptiveBatchController,
+    BatchOperatingPoint,
+)
+from shortener_app.infrastructures.broker.batch_queue import BatchQueue
+
+logger = structlog.get_logger(__name__)
+
+
+class BatchPublishQueue[T](ABC):
+    """
+    Bounded in-process queue drained by workers that publish in batches.
+
+    Workers collect up to `batch_size` items or whatever arrives within
+    `batch_window_sec` from a `BatchQueue`, publish them with
+    exponential-backoff retries and split batches that overflow the
+    producer buffer. When the queue is full, `put` waits
+    `enqueue_timeout_sec` and then either blocks until there is room
+    (backpressure) or drops the item, depending on `drop_on_overflow`,
+    unless a subclass keeps it elsewhere (`_overflow`).
+
+    With a `controller`, batch size, window and the number of active
+    workers (up to `workers`) are retuned after every published batch;
+    idle workers park until the controller wants them back.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        maxsize: int = 10_000,
+        workers: int = 4,
+        enqueue_timeout_sec: float = 0.01,
+        drop_on_overflow: bool = False,
+        max_retries: int = 5,
+        base_backoff_sec: float = 0.05,
+        report_interval_sec: float = 1.0,
+        batch_size: int = 200,
+        batch_window_sec: float = 0.2,
+        controller: AdaptiveBatchController | None = None,
+    ) -> None:
+        self._name = name
+        self._q: BatchQueue[T] = BatchQueue(maxsize=maxsize)
+
+        self._workers = workers
+        self._enqueue_timeout_sec = enqueue_timeout_sec
+        self._drop_on_overflow = drop_on_overflow
+
+        self._max_retries = max_retries
+        self._base_backoff_sec = base_backoff_sec
+
+        self._report_interval_sec = report_interval_sec
+        self._batch_size = batch_size
+        self._batch_window_sec = batch_window_sec
+
+        self._controller = controller
+        self._active_workers = workers
+        self._resume = asyncio.Event()
+        self._stopping = False
+        self._last_point: BatchOperatingPoint | None = None
+        if controller is not None:
+            self._apply(controller.point)
+
+        self._tasks: list[asyncio.Task] = []
+        self._report_task: asyncio.Task | None = None
+        self._started = False
+
+        self._enqueued = 0
+        self._enqueue_timeouts = 0
+        self._dropped = 0
+
+        self._publish_calls = 0
+        self._published_msgs = 0
+        self._retries = 0
+        self._failures = 0
+        self._splits = 0
+
+        self._publish_call_ms_sum = 0.0
+        self._publish_call_ms_max = 0.0
+
+        self._last_qsize = 0
+        self._totals: dict[str, int] = {}
+
+    @abstractmethod
+    async def _publish_batch(self, items: list[T]) -> None:
+        """Publish one batch; raising triggers a retry."""
+
+    def _log_context(self, item: T) -> dict[str, Any]:  # noqa: ARG002
+        """Extra fields identifying an item in overload warnings."""
+        return {}
+
+    async def _overflow(self, item: T) -> bool:  # noqa: ARG002
+        """Keep an item the queue had no room for; False if not kept."""
+        return False
+
+    async def _publish_failed(self, items: list[T]) -> None:
+        """Handle a batch that failed every retry; by default it is lost."""
+
+    def _counters(self) -> dict[str, int]:
+        """Per-interval counters that `totals` accumulates."""
+        return {
+            "enqueued": self._enqueued,
+            "enqueue_timeouts": self._enqueue_timeouts,
+            "dropped": self._dropped,
+            "published_msgs": self._published_msgs,
+            "publish_calls": self._publish_calls,
+            "retries": self._retries,
+            "failures": self._failures,
+            "buffer_full_splits": self._splits,
+        }
+
+    def _reset_interval(self) -> None:
+        """Reset per-interval counters after each stats report."""
+        for name, value in self._counters().items():
+            self._totals[name] = self._totals.get(name, 0) + value
+
+        self._enqueued = 0
+        self._enqueue_timeouts = 0
+        self._dropped = 0
+        self._publish_calls = 0
+        self._published_msgs = 0
+        self._retries = 0
+        self._failures = 0
+        self._splits = 0
+        self._publish_call_ms_sum = 0.0
+        self._publish_call_ms_max = 0.0
+
+    async def start(self) -> None:
+        if self._started:
+            return
+
+        self._started = True
+        self._stopping = False
+        self._q.reopen()
+
+        for i in range(self._workers):
+            self._tasks.append(
+                asyncio.create_task(
+                    self._worker(i),
+                    name=f"{self._name}-{i}",
+                ),
+            )
+
+        self._report_task = asyncio.create_task(
+            self._reporter(),
+            name=f"{self._name}-reporter",
+        )
+
+        logger.info(
+            "Publish queue started",
+            queue=self._name,
+            workers=self._workers,
+            maxsize=self._q.maxsize,
+            enqueue_timeout_sec=self._enqueue_timeout_sec,
+            drop_on_overflow=self._drop_on_overflow,
+            batch_size=self._batch_size,
+            batch_window_sec=self._batch_window_sec,
+            adaptive=self._controller is not None,
+            max_retries=self._max_retries,
+            base_backoff_sec=self._base_backoff_sec,
+        )
+        return
+
+    async def stop(
+        self,
+        *,
+        drain: bool = True,
+        timeout_sec: float = 10.0,
+    ) -> None:
+        if not self._started:
+            return
+
+        logger.info(
+            "Publish queue stopping",
+            queue=self._name,
+            drain=drain,
+            timeout_sec=timeout_sec,
+            qsize=self._q.qsize(),
+        )
+
+        if drain:
+            try:
+                await asyncio.wait_for(self._q.join(), timeout=timeout_sec)
+            except TimeoutError:
+                logger.warning(
+                    "Publish queue drain timeout",
+                    queue=self._name,
+                    timeout_sec=timeout_sec,
+                    qsize=self._q.qsize(),
+                )
+
+        if self._report_task is not None:
+            self._report_task.cancel()
+            try:
+                await self._report_task
+            except asyncio.CancelledError:
+                pass
+            self._report_task = None
+
+        # Workers publish what is left, then exit; parked ones wake first.
+        self._stopping = True
+        self._resume.set()
+        self._q.close()
+
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._started = False
+
+        logger.info("Publish queue stopped", queue=self._name)
+        return
+
+    async def put(self, item: T) -> bool:
+        """Queue an item; returns False if it was dropped on overflow."""
+        try:
+            self._q.put_nowait(item)
+            self._enqueued += 1
+            return True
+        except asyncio.QueueFull:
+            pass
+
+        try:
+            await asyncio.wait_for(
+                self._q.put(item),
+                timeout=self._enqueue_timeout_sec,
+            )
+            self._enqueued += 1
+            return True
+        except TimeoutError:
+            self._enqueue_timeouts += 1
+            qsize = self._q.qsize()
+
+            if await self._overflow(item):
+                self._enqueued += 1
+                return True
+
+            if self._drop_on_overflow:
+                self._dropped += 1
+                return False
+
+            if qsize >= int(self._q.maxsize * 0.8):
+                logger.warning(
+                    "Publish queue overloaded; applying backpressure",
+                    queue=self._name,
+                    qsize=qsize,
+                    maxsize=self._q.maxsize,
+                    **self._log_context(item),
+                )
+
+            await self._q.put(item)
+            self._enqueued += 1
+            return True
+
+    async def put_many(self, items: Sequence[T]) -> int:
+        """Queue several items; returns how many were queued (not dropped)."""
+        queued = self._q.put_many_nowait(items)
+        self._enqueued += queued
+
+        # Slow path for the rest, with the usual overflow policy.
+        for rest in items[queued:]:
+            queued += await self.put(rest)
+        return queued
+
+    def stats(self) -> dict[str, int | float | bool]:
+        """Queue depth and per-interval publish counters."""
+        qsize = self._q.qsize()
+        calls = self._publish_calls
+        msgs = self._published_msgs
+
+        avg_call_ms = self._publish_call_ms_sum / calls if calls else 0.0
+        avg_msg_ms = self._publish_call_ms_sum / msgs if msgs else 0.0
+        avg_batch = msgs / calls if calls else 0.0
+
+        return {
+            "qsize": qsize,
+            "maxsize": self._q.maxsize,
+            "backlog_growing": qsize > self._last_qsize,
+            "enqueued_per_interval": self._enqueued,
+            "enqueue_timeouts_per_interval": self._enqueue_timeouts,
+            "dropped_per_interval": self._dropped,
+            "published_msgs_per_interval": msgs,
+            "publish_calls_per_interval": calls,
+            "avg_batch_size": round(avg_batch, 2),
+            "publish_call_avg_ms": round(avg_call_ms, 2),
+            "publish_call_max_ms": round(self._publish_call_ms_max, 2),
+            "publish_per_msg_avg_ms": round(avg_msg_ms, 6),
+            "retries_per_interval": self._retries,
+            "failures_per_interval": self._failures,
+            "buffer_full_splits_per_interval": self._splits,
+            "batch_size": self._batch_size,
+            "batch_window_sec": round(self._batch_window_sec, 4),
+            "active_workers": self._active_workers,
+        }
+
+    def totals(self) -> dict[str, int]:
+        """Counters since the queue was created, e.g. for a shutdown log."""
+        return {
+            name: self._totals.get(name, 0) + value
+            for name, value in self._counters().items()
+        }
+
+    def _apply(self, point: BatchOperatingPoint) -> None:
+        self._batch_size = point.batch_size
+        self._batch_window_sec = point.window_sec
+
+        workers = min(point.workers, self._workers)
+        if workers > self._active_workers:
+            self._resume.set()
+            self._resume = asyncio.Event()
+        self._active_workers = workers
+
+    async def _park(self, idx: int) -> None:
+        while idx >= self._active_workers and not self._stopping:
+            await self._resume.wait()
+
+    async def _worker(self, idx: int) -> None:
+        while True:
+            await self._park(idx)
+            items = await self._q.get_batch(
+                self._batch_size,
+                self._batch_window_sec,
+            )
+            if not items:
+                return
+
+            try:
+                t0 = time.perf_counter()
+                await self._publish_with_retries(items, worker=idx)
+
+                if self._controller is not None:
+                    self._apply(
+                        self._controller.on_batch(
+                            size=len(items),
+                            latency_ms=(time.perf_counter() - t0) * 1000.0,
+                            qsize=self._q.qsize(),
+                        ),
+                    )
+
+            finally:
+                self._q.task_done(len(items))
+
+    @staticmethod
+    def _is_batch_buffer_full_error(err: Exception) -> bool:
+        msg = str(err).lower()
+        return "batch buffer is full" in msg or "buffer is full" in msg
+
+    async def _publish_with_retries(
+        self,
+        items: list[T],
+        *,
+        worker: int,
+    ) -> None:
+        if not items:
+            return
+
+        last_err: Exception | None = None
+
+        for attempt in range(1, self._max_retries + 1):
+            t0 = time.perf_counter()
+            try:
+                await self._publish_batch(items)
+
+                dt_ms = (time.perf_counter() - t0) * 1000.0
+                self._publish_calls += 1
+                self._published_msgs += len(items)
+                self._publish_call_ms_sum += dt_ms
+                self._publish_call_ms_max = max(
+                    self._publish_call_ms_max,
+                    dt_ms,
+                )
+                return
+
+            except Exception as e:
+                last_err = e
+
+                if self._is_batch_buffer_full_error(e) and len(items) > 1:
+                    self._splits += 1
+                    if self._controller is not None:
+                        self._apply(self._controller.on_split())
+
+                    mid = len(items) // 2
+                    left = items[:mid]
+                    right = items[mid:]
+
+                    logger.warning(
+                        "Publish batch overflow; splitting",
+                        queue=self._name,
+                        worker=worker,
+                        original_batch_size=len(items),
+                        left_size=len(left),
+                        right_size=len(right),
+                        error=str(e),
+                    )
+
+                    await self._publish_with_retries(left, worker=worker)
+                    await self._publish_with_retries(right, worker=worker)
+                    return
+
+                self._retries += 1
+                dt_ms = (time.perf_counter() - t0) * 1000.0
+                sleep_for = self._base_backoff_sec * (2 ** (attempt - 1))
+
+                logger.warning(
+                    "Publish batch failed; retrying",
+                    queue=self._name,
+                    worker=worker,
+                    attempt=attempt,
+                    batch_size=len(items),
+                    publish_ms=round(dt_ms, 2),
+                    sleep_for=sleep_for,
+                    error=str(e),
+                )
+                await asyncio.sleep(sleep_for)
+
+        self._failures += 1
+        logger.error(
+            "Publish batch failed permanently",
+            queue=self._name,
+            worker=worker,
+            batch_size=len(items),
+            error=str(last_err),
+        )
+        await self._publish_failed(items)
+        return
+
+    async def _reporter(self) -> None:
+        try:
+            while True:
+                await asyncio.sleep(self._report_interval_sec)
+
+                stats = self.stats()
+                self._last_qsize = self._q.qsize()
+
+                logger.debug("Publish queue stats", queue=self._name, **stats)
+                self._reset_interval()
+
+                point = self._controller.point if self._controller else None
+                if point is not None and point != self._last_point:
+                    self._last_point = point
+                    logger.info(
+                        "Publish batching adjusted",
+                        queue=self._name,
+                        batch_size=point.batch_size,
+                        batch_window_sec=round(point.window_sec, 4),
+                        active_workers=self._active_workers,
+                    )
+
+        except asyncio.CancelledError:
+            return
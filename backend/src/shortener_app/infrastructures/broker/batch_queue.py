@@ -0,0 +1,134 @@
+__all__ = ("BatchQueue",)
+
+import asyncio
+from collections import deque
+from collections.abc import Iterable
+
+
+class BatchQueue[T]:
+    """
+    Bounded FIFO queue whose consumers take items in batches.
+
+    `get_batch` waits for the first item, then drains everything already
+    queued and keeps collecting until the batch is full or one deadline per
+    batch passes. Items sit in a deque and waiters sleep on events, so an
+    item costs a deque append and pop instead of a future, a timeout
+    handle and a task per `get`.
+
+    `task_done`/`join` track unfinished items like `asyncio.Queue`.
+    `close` wakes every consumer; `get_batch` then returns what is left and
+    an empty list once the queue is empty.
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        self._maxsize = maxsize
+        self._items: deque[T] = deque()
+
+        self._not_empty = asyncio.Event()
+        self._not_full = asyncio.Event()
+        self._not_full.set()
+        self._all_done = asyncio.Event()
+        self._all_done.set()
+
+        self._unfinished = 0
+        self._closed = False
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def full(self) -> bool:
+        return 0 < self._maxsize <= len(self._items)
+
+    def put_nowait(self, item: T) -> None:
+        if self.full():
+            raise asyncio.QueueFull
+        self._append(item)
+
+    async def put(self, item: T) -> None:
+        while self.full():
+            self._not_full.clear()
+            await self._not_full.wait()
+        self._append(item)
+
+    def put_many_nowait(self, items: Iterable[T]) -> int:
+        """Queue items until the queue is full; returns how many fit."""
+        count = 0
+        for item in items:
+            if self.full():
+                break
+            self._items.append(item)
+            count += 1
+
+        if count:
+            self._unfinished += count
+            self._all_done.clear()
+            self._not_empty.set()
+        return count
+
+    async def get_batch(self, max_items: int, window_sec: float) -> list[T]:
+        """
+        Up to `max_items` items, collected for at most `window_sec` after
+        the first one; an empty list means the queue is closed and empty.
+        """
+        while not self._items:
+            if self._closed:
+                return []
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+        batch: list[T] = []
+        self._drain_into(batch, max_items)
+        if len(batch) >= max_items or window_sec <= 0 or self._closed:
+            return batch
+
+        loop = asyncio.get_running_loop()
+        try:
+            async with asyncio.timeout_at(loop.time() + window_sec):
+                while len(batch) < max_items and not self._closed:
+                    if not self._items:
+                        self._not_empty.clear()
+                        await self._not_empty.wait()
+                    self._drain_into(batch, max_items)
+        except TimeoutError:
+            pass
+        return batch
+
+    def task_done(self, count: int = 1) -> None:
+        if count > self._unfinished:
+            raise ValueError("task_done() called too many times")
+
+        self._unfinished -= count
+        if self._unfinished == 0:
+            self._all_done.set()
+
+    async def join(self) -> None:
+        await self._all_done.wait()
+
+    def close(self) -> None:
+        self._closed = True
+        self._not_empty.set()
+
+    def reopen(self) -> None:
+        self._closed = False
+
+    def _append(self, item: T) -> None:
+        self._items.append(item)
+        self._unfinished += 1
+        self._all_done.clear()
+        self._not_empty.set()
+
+    def _drain_into(self, batch: list[T], max_items: int) -> None:
+        items = self._items
+        while items and len(batch) < max_items:
+            batch.append(items.popleft())
+
+        if self._maxsize and len(items) < self._maxsize:
+            self._not_full.set()
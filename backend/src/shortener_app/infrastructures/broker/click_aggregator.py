@@ -0,0 +1,125 @@
+__all__ = ("ClickAggregator",)
+
+import asyncio
+from collections import Counter
+from uuid import UUID, uuid4, uuid5
+
+import structlog
+
+from shortener_app.application.dtos.urls.urls_events import UrlClickedEventDTO
+from shortener_app.application.interfaces.publish_queue import (
+    ClickPublishQueueProtocol,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+class ClickAggregator(ClickPublishQueueProtocol):
+    """
+    Pre-aggregates click events per key before they reach the publish queue.
+
+    Clicks are counted per key over `window_sec` and each (key, window) pair
+    is emitted as a single event carrying the total `count`. Event ids are
+    derived with uuid5 from a per-process namespace, the window sequence and
+    the key, so a flushed event keeps the same id across publish retries
+    while events from other instances or windows never collide.
+
+    Once `max_keys` distinct keys are pending in a window, further new keys
+    bypass aggregation and are forwarded as individual events.
+    """
+
+    def __init__(
+        self,
+        *,
+        queue: ClickPublishQueueProtocol,
+        window_sec: float = 1.0,
+        max_keys: int = 100_000,
+        namespace: UUID | None = None,
+    ) -> None:
+        self._queue = queue
+        self._window_sec = window_sec
+        self._max_keys = max_keys
+        self._namespace = namespace or uuid4()
+
+        self._counts: Counter[str] = Counter()
+        self._window_seq = 0
+        self._task: asyncio.Task | None = None
+
+        self._clicks = 0
+        self._emitted = 0
+        self._bypassed = 0
+        self._dropped = 0
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+
+        self._task = asyncio.create_task(
+            self._flush_loop(),
+            name="click-aggregator",
+        )
+        logger.info(
+            "Click aggregator started",
+            window_sec=self._window_sec,
+            max_keys=self._max_keys,
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        await self.flush()
+        logger.info("Click aggregator stopped", **self.stats())
+
+    async def enqueue(self, *, dto: UrlClickedEventDTO) -> bool:
+        self._clicks += dto.count
+
+        if dto.key in self._counts or len(self._counts) < self._max_keys:
+            self._counts[dto.key] += dto.count
+            return True
+
+        self._bypassed += 1
+        return await self._queue.enqueue(dto=dto)
+
+    async def flush(self) -> None:
+        if not self._counts:
+            return
+
+        counts, self._counts = self._counts, Counter()
+        window = self._window_seq
+        self._window_seq += 1
+
+        for key, count in counts.items():
+            dto = UrlClickedEventDTO(
+                key=key,
+                count=count,
+                event_id=uuid5(self._namespace, f"{window}:{key}"),
+            )
+            if await self._queue.enqueue(dto=dto):
+                self._emitted += 1
+            else:
+                self._dropped += 1
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "pending_keys": len(self._counts),
+            "clicks": self._clicks,
+            "emitted": self._emitted,
+            "bypassed": self._bypassed,
+            "dropped": self._dropped,
+        }
+
+    async def _flush_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._window_sec)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Click aggregator flush failed")
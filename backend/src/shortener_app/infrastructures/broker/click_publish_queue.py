@@ -0,0 +1,46 @@
+__all__ = ("ClickPublishQueue",)
+
+from typing import Any
+
+from shortener_app.application.dtos.urls.urls_events import UrlClickedEventDTO
+from shortener_app.application.services.urls.url_publisher import (
+    UrlBrokerPublishService,
+)
+from shortener_app.infrastructures.broker.batch_publish_queue import (
+    BatchPublishQueue,
+)
+
+
+class ClickPublishQueue(BatchPublishQueue[UrlClickedEventDTO]):
+    """
+    Publishes redirect click events in keyed batches.
+
+    Click counting is best effort and must never slow redirects down, so by
+    default a full queue drops events (counted in stats) instead of blocking
+    the caller.
+    """
+
+    def __init__(
+        self,
+        *,
+        broker_publish_service: UrlBrokerPublishService,
+        drop_on_overflow: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(
+            name="click-pub",
+            drop_on_overflow=drop_on_overflow,
+            **kwargs,
+        )
+        self._broker_publish_service = broker_publish_service
+
+    async def enqueue(self, *, dto: UrlClickedEventDTO) -> bool:
+        return await self.put(dto)
+
+    async def _publish_batch(self, items: list[UrlClickedEventDTO]) -> None:
+        await self._broker_publish_service.publish_update_urls_batch(
+            dtos=items,
+        )
+
+    def _log_context(self, item: UrlClickedEventDTO) -> dict[str, Any]:
+        return {"key": item.key}
@@ -24,7 +24,18 @@ class NewUrlEvent(BaseModel):
     key: str
 
 
-async def run_subscriber(container: AsyncContainer) -> None:
+async def run_subscriber(
+    container: AsyncContainer,
+    *,
+    workers: int = 1,
+) -> None:
+    """
+    Consume new-urls with `workers` members of the consumer group.
+
+    Each member is a separate Kafka consumer that owns whole partitions and
+    handles its batches one at a time, so events of one message key are
+    processed in order while partitions are processed concurrently.
+    """
     async with container() as app_container:
         broker, process_uc = await init_dependencies(
             container=app_container,
@@ -33,16 +44,6 @@ async def run_subscriber(container: AsyncContainer) -> None:
 
         app = FastStream(broker)
 
-        subscriber = broker.subscriber(
-            "new-urls",
-            group_id="new-urls-consumers",
-            auto_commit=False,
-            batch=True,
-            max_records=1_000,
-            batch_timeout_ms=5_000,
-        )
-
-        @subscriber
         async def consumer(batch: list[NewUrlEvent]) -> None:
             entities = [
                 UrlEntity.create(
@@ -56,4 +57,15 @@ async def run_subscriber(container: AsyncContainer) -> None:
             logger.info("Processing batch", size=len(entities))
             await process_uc.execute(entities=entities)
 
+        for _ in range(workers):
+            subscriber = broker.subscriber(
+                "new-urls",
+                group_id="new-urls-consumers",
+                auto_commit=False,
+                batch=True,
+                max_records=1_000,
+                batch_timeout_ms=5_000,
+            )
+            subscriber(consumer)
+
         await app.run()
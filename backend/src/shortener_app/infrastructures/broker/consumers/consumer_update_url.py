@@ -5,7 +5,7 @@ from uuid import UUID
 import structlog
 from dishka import AsyncContainer
 from faststream import FastStream
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from shortener_app.application.use_cases.process_click_url_events import (
     ProcessClickEventsUseCase,
@@ -20,6 +20,7 @@ logger = structlog.get_logger(__name__)
 class ClickEvent(BaseModel):
     key: str
     event_id: UUID
+    count: int = Field(1, ge=1)
 
 
 async def run_subscriber(container: AsyncContainer) -> None:
@@ -41,7 +42,7 @@ async def run_subscriber(container: AsyncContainer) -> None:
 
         @subscriber
         async def _update_url(batch: list[ClickEvent]) -> None:
-            events = [(msg.event_id, msg.key) for msg in batch]
+            events = [(msg.event_id, msg.key, msg.count) for msg in batch]
             logger.info("Processing batch", size=len(events))
             await update_uc.execute(events=events)
 
@@ -1,347 +1,261 @@
+__all__ = ("NewUrlPublishQueue",)
+
 import asyncio
 import time
-from dataclasses import dataclass
-from typing import Final
+from collections.abc import Sequence
+from typing import Any
 
 import structlog
 
 from shortener_app.application.dtos.urls.urls_events import PublishUrlDTO
+from shortener_app.application.exceptions.publish import (
+    PublishOverloadedError,
+)
+from shortener_app.application.interfaces.dto_codec import DtoCodecProtocol
+from shortener_app.application.services.admission import AdmissionController
 from shortener_app.application.services.urls.url_publisher import (
     UrlBrokerPublishService,
 )
+from shortener_app.infrastructures.broker.batch_publish_queue import (
+    BatchPublishQueue,
+)
+from shortener_app.infrastructures.broker.spill_log import SpillLog
 
 logger = structlog.get_logger(__name__)
 
-_STOP: Final[object] = object()
 
+class NewUrlPublishQueue(BatchPublishQueue[PublishUrlDTO]):
+    """
+    Publishes newly reserved URLs in batches.
 
-@dataclass(slots=True)
-class NewUrlItem:
-    entity: PublishUrlDTO
+    New URLs must not be lost, so a full queue applies backpressure to the
+    caller instead of dropping. With a `spill` log, URLs that do not fit
+    the queue or fail every publish retry are written to disk instead, and
+    replayed in order once the queue has room again (and on the next start
+    after a crash). Replay is at-least-once; the consumer's insert ignores
+    duplicate keys.
 
+    With `admission`, enqueues fail fast with `PublishOverloadedError`
+    while the backlog (queue plus spill) or the broker's publish latency
+    is past its high watermark, instead of waiting for room.
+    """
 
-class NewUrlPublishQueue:
     def __init__(
         self,
         *,
         broker_publish_service: UrlBrokerPublishService,
-        maxsize: int = 10_000,
-        workers: int = 4,
-        enqueue_timeout_sec: float = 0.01,
-        max_retries: int = 5,
-        base_backoff_sec: float = 0.05,
-        report_interval_sec: float = 1.0,
-        batch_size: int = 200,
-        batch_window_sec: float = 0.2,
+        spill: SpillLog | None = None,
+        spill_codec: DtoCodecProtocol[PublishUrlDTO, bytes] | None = None,
+        replay_interval_sec: float = 0.5,
+        max_replay_backoff_sec: float = 30.0,
+        admission: AdmissionController | None = None,
+        **kwargs: Any,
     ) -> None:
-        self._broker_publish_service = broker_publish_service
-        self._q: asyncio.Queue[object] = asyncio.Queue(maxsize=maxsize)
-
-        self._workers = workers
-        self._enqueue_timeout_sec = enqueue_timeout_sec
-
-        self._max_retries = max_retries
-        self._base_backoff_sec = base_backoff_sec
-
-        self._report_interval_sec = report_interval_sec
-        self._batch_size = batch_size
-        self._batch_window_sec = batch_window_sec
-
-        self._tasks: list[asyncio.Task] = []
-        self._report_task: asyncio.Task | None = None
-        self._started = False
+        super().__init__(name="new-url-pub", **kwargs)
+        if spill is not None and spill_codec is None:
+            raise ValueError("spill_codec is required with spill")
 
-        self._enqueued = 0
-        self._enqueue_timeouts = 0
-
-        self._publish_calls = 0
-        self._published_msgs = 0
-        self._retries = 0
-        self._failures = 0
-
-        self._publish_call_ms_sum = 0.0
-        self._publish_call_ms_max = 0.0
+        self._broker_publish_service = broker_publish_service
+        self._spill = spill
+        self._spill_codec = spill_codec
+        self._replay_interval_sec = replay_interval_sec
+        self._max_replay_backoff_sec = max_replay_backoff_sec
+        self._admission = admission
 
-        self._last_qsize = 0
+        self._replay_task: asyncio.Task | None = None
+        self._spilled = 0
+        self._replayed = 0
+        self._shed = 0
 
     async def start(self) -> None:
         if self._started:
             return
 
-        self._started = True
+        if self._spill is not None:
+            await self._spill.start()
+        await super().start()
 
-        for i in range(self._workers):
-            self._tasks.append(
-                asyncio.create_task(
-                    self._worker(i),
-                    name=f"new-url-pub-{i}",
-                ),
+        if self._spill is not None:
+            self._replay_task = asyncio.create_task(
+                self._replayer(),
+                name="new-url-pub-replay",
             )
 
-        self._report_task = asyncio.create_task(
-            self._reporter(),
-            name="new-url-pub-reporter",
-        )
-
-        logger.info(
-            "NewUrlPublishQueue started",
-            workers=self._workers,
-            maxsize=self._q.maxsize,
-            enqueue_timeout_sec=self._enqueue_timeout_sec,
-            batch_size=self._batch_size,
-            batch_window_sec=self._batch_window_sec,
-            max_retries=self._max_retries,
-            base_backoff_sec=self._base_backoff_sec,
-        )
-        return
-
     async def stop(
         self,
         *,
         drain: bool = True,
         timeout_sec: float = 10.0,
     ) -> None:
-        if not self._started:
-            return
-
-        logger.info(
-            "NewUrlPublishQueue stopping",
-            drain=drain,
-            timeout_sec=timeout_sec,
-            qsize=self._q.qsize(),
-        )
-
-        if drain:
+        if self._replay_task is not None:
+            self._replay_task.cancel()
             try:
-                await asyncio.wait_for(self._q.join(), timeout=timeout_sec)
-            except TimeoutError:
-                logger.warning(
-                    "NewUrlPublishQueue drain timeout",
-                    timeout_sec=timeout_sec,
-                    qsize=self._q.qsize(),
-                )
-
-        if self._report_task is not None:
-            self._report_task.cancel()
-            try:
-                await self._report_task
+                await self._replay_task
             except asyncio.CancelledError:
                 pass
-            self._report_task = None
-
-        for _ in range(self._workers):
-            await self._q.put(_STOP)
+            self._replay_task = None
 
-        await asyncio.gather(*self._tasks, return_exceptions=True)
-        self._tasks.clear()
-        self._started = False
+        await super().stop(drain=drain, timeout_sec=timeout_sec)
 
-        logger.info("NewUrlPublishQueue stopped")
-        return
+        if self._spill is not None:
+            await self._spill.close()
 
-    async def enqueue(self, *, dto: PublishUrlDTO) -> None:
-        item = NewUrlItem(entity=dto)
+    def admit(self, *, count: int = 1, claim_probe: bool = False) -> None:
+        """
+        Raise `PublishOverloadedError` if `count` URLs would be shed.
 
-        try:
-            self._q.put_nowait(item)
-            self._enqueued += 1
+        Only the enqueue that follows a passing check takes the probe slot
+        while shedding; the check itself leaves it for that enqueue.
+        """
+        if self._admission is None:
             return
-        except asyncio.QueueFull:
-            pass
 
-        try:
-            await asyncio.wait_for(
-                self._q.put(item),
-                timeout=self._enqueue_timeout_sec,
+        depth = self._q.qsize()
+        if self._spill is not None:
+            depth += self._spill.pending_records
+
+        if not self._admission.admit(depth=depth, claim_probe=claim_probe):
+            self._shed += count
+            raise PublishOverloadedError(
+                retry_after_sec=self._admission.retry_after_sec,
             )
-            self._enqueued += 1
-            return
-        except TimeoutError:
-            self._enqueue_timeouts += 1
-            qsize = self._q.qsize()
 
-            if qsize >= int(self._q.maxsize * 0.8):
-                logger.warning(
-                    "Publish queue overloaded; applying backpressure",
-                    key=dto.key,
-                    qsize=qsize,
-                    maxsize=self._q.maxsize,
+    async def enqueue(self, *, dto: PublishUrlDTO) -> None:
+        self.admit(claim_probe=True)
+        await self.put(dto)
+
+    async def enqueue_many(self, *, dtos: Sequence[PublishUrlDTO]) -> None:
+        self.admit(count=len(dtos), claim_probe=True)
+        await self.put_many(dtos)
+
+    def stats(self) -> dict[str, int | float | bool]:
+        stats = super().stats()
+        if self._admission is not None:
+            stats = {
+                **stats,
+                **self._admission.stats(),
+                "shed_per_interval": self._shed,
+            }
+        if self._spill is None:
+            return stats
+
+        spill = self._spill.stats()
+        return {
+            **stats,
+            "spill_pending_records": spill["pending_records"],
+            "spill_pending_bytes": spill["pending_bytes"],
+            "spill_segments": spill["segments"],
+            "spill_syncs": spill["syncs"],
+            "spilled_per_interval": self._spilled,
+            "replayed_per_interval": self._replayed,
+            "replay_rate_per_sec": round(
+                self._replayed / self._report_interval_sec,
+                2,
+            ),
+        }
+
+    async def _publish_batch(self, items: list[PublishUrlDTO]) -> None:
+        t0 = time.perf_counter()
+        try:
+            await self._broker_publish_service.publish_new_urls_batch(
+                dtos=items,
+            )
+        finally:
+            # Until the broker acks or fails: a timeout counts as slow.
+            if self._admission is not None:
+                self._admission.observe(
+                    latency_ms=(time.perf_counter() - t0) * 1000.0,
                 )
 
-            await self._q.put(item)
-            self._enqueued += 1
-
-    async def _worker(self, idx: int) -> None:
-        while True:
-            first = await self._q.get()
-            consumed = 1
-            stop_after = False
+    def _log_context(self, item: PublishUrlDTO) -> dict[str, Any]:
+        return {"key": item.key}
 
-            entities: list[PublishUrlDTO] = []
+    async def _overflow(self, item: PublishUrlDTO) -> bool:
+        return self._spill_items([item])
 
-            try:
-                if first is _STOP:
-                    return
-
-                assert isinstance(first, NewUrlItem)
-                entities.append(first.entity)
-
-                deadline = time.perf_counter() + self._batch_window_sec
-
-                while len(entities) < self._batch_size:
-                    remaining = deadline - time.perf_counter()
-                    if remaining <= 0:
-                        break
-
-                    try:
-                        nxt = await asyncio.wait_for(
-                            self._q.get(),
-                            timeout=remaining,
-                        )
-                    except TimeoutError:
-                        break
-
-                    consumed += 1
+    async def _publish_failed(self, items: list[PublishUrlDTO]) -> None:
+        if not self._spill_items(items):
+            logger.error(
+                "New URLs lost after failed publish",
+                keys=[item.key for item in items],
+            )
 
-                    if nxt is _STOP:
-                        stop_after = True
-                        break
+    def _counters(self) -> dict[str, int]:
+        return {
+            **super()._counters(),
+            "spilled": self._spilled,
+            "replayed": self._replayed,
+            "shed": self._shed,
+        }
 
-                    assert isinstance(nxt, NewUrlItem)
-                    entities.append(nxt.entity)
+    def _reset_interval(self) -> None:
+        super()._reset_interval()
+        self._spilled = 0
+        self._replayed = 0
+        self._shed = 0
 
-                await self._publish_with_retries(entities, worker=idx)
+    def _spill_items(self, items: Sequence[PublishUrlDTO]) -> bool:
+        if self._spill is None or self._spill_codec is None:
+            return False
 
-            finally:
-                for _ in range(consumed):
-                    self._q.task_done()
+        try:
+            self._spill.append([self._spill_codec.encode(i) for i in items])
+        except (OSError, ValueError) as e:
+            logger.error("Spill append failed", size=len(items), error=str(e))
+            return False
 
-            if stop_after:
-                return
+        self._spilled += len(items)
+        return True
 
-    @staticmethod
-    def _is_batch_buffer_full_error(err: Exception) -> bool:
-        msg = str(err).lower()
-        return "batch buffer is full" in msg or "buffer is full" in msg
+    async def _replayer(self) -> None:
+        assert self._spill is not None
 
-    async def _publish_with_retries(
-        self,
-        entities: list[PublishUrlDTO],
-        *,
-        worker: int,
-    ) -> None:
-        if not entities:
-            return
+        backoff = self._replay_interval_sec
+        while True:
+            await asyncio.sleep(backoff)
 
-        last_err: Exception | None = None
+            # Spilled URLs wait until live traffic leaves room in the queue.
+            if (
+                self._spill.pending_records == 0
+                or self._q.qsize() > self._q.maxsize // 2
+            ):
+                backoff = self._replay_interval_sec
+                continue
 
-        for attempt in range(1, self._max_retries + 1):
-            t0 = time.perf_counter()
+            records, position = self._spill.read(self._batch_size)
             try:
-                await self._broker_publish_service.publish_new_urls_batch(
-                    dtos=entities,
-                )
-
-                dt_ms = (time.perf_counter() - t0) * 1000.0
-                self._publish_calls += 1
-                self._published_msgs += len(entities)
-                self._publish_call_ms_sum += dt_ms
-                self._publish_call_ms_max = max(
-                    self._publish_call_ms_max,
-                    dt_ms,
+                if items := self._decode(records):
+                    await self._publish_batch(items)
+            except Exception as e:  # noqa: BLE001
+                backoff = min(
+                    max(backoff, self._replay_interval_sec) * 2,
+                    self._max_replay_backoff_sec,
                 )
-                return
-
-            except Exception as e:
-                last_err = e
-
-                if self._is_batch_buffer_full_error(e) and len(entities) > 1:
-                    mid = len(entities) // 2
-                    left = entities[:mid]
-                    right = entities[mid:]
-
-                    logger.warning(
-                        "Publish batch overflow; splitting",
-                        worker=worker,
-                        original_batch_size=len(entities),
-                        left_size=len(left),
-                        right_size=len(right),
-                        error=str(e),
-                    )
-
-                    await self._publish_with_retries(left, worker=worker)
-                    await self._publish_with_retries(right, worker=worker)
-                    return
-
-                self._retries += 1
-                dt_ms = (time.perf_counter() - t0) * 1000.0
-                sleep_for = self._base_backoff_sec * (2 ** (attempt - 1))
-
                 logger.warning(
-                    "Publish batch failed; retrying",
-                    worker=worker,
-                    attempt=attempt,
-                    batch_size=len(entities),
-                    publish_ms=round(dt_ms, 2),
-                    sleep_for=sleep_for,
+                    "Spill replay failed; backing off",
+                    batch_size=len(records),
+                    sleep_for=backoff,
                     error=str(e),
                 )
-                await asyncio.sleep(sleep_for)
-
-        self._failures += 1
-        logger.error(
-            "Publish batch failed permanently",
-            worker=worker,
-            batch_size=len(entities),
-            error=str(last_err),
-        )
-        return
-
-    async def _reporter(self) -> None:
-        try:
-            while True:
-                await asyncio.sleep(self._report_interval_sec)
-
-                qsize = self._q.qsize()
-                growing = qsize > self._last_qsize
-                self._last_qsize = qsize
-
-                calls = self._publish_calls
-                msgs = self._published_msgs
-
-                avg_call_ms = (
-                    self._publish_call_ms_sum / calls if calls else 0.0
-                )
-                avg_msg_ms = self._publish_call_ms_sum / msgs if msgs else 0.0
-                avg_batch = msgs / calls if calls else 0.0
-
-                logger.debug(
-                    "NewUrlPublishQueue stats",
-                    qsize=qsize,
-                    maxsize=self._q.maxsize,
-                    backlog_growing=growing,
-                    enqueued_per_interval=self._enqueued,
-                    enqueue_timeouts_per_interval=self._enqueue_timeouts,
-                    published_msgs_per_interval=msgs,
-                    publish_calls_per_interval=calls,
-                    avg_batch_size=round(avg_batch, 2),
-                    publish_call_avg_ms=round(avg_call_ms, 2),
-                    publish_call_max_ms=round(self._publish_call_ms_max, 2),
-                    publish_per_msg_avg_ms=round(avg_msg_ms, 6),
-                    retries_per_interval=self._retries,
-                    failures_per_interval=self._failures,
-                    batch_size=self._batch_size,
-                    batch_window_sec=self._batch_window_sec,
-                )
+                continue
+
+            self._spill.commit(position)
+            self._replayed += len(records)
+            # No pause while a backlog is left to drain.
+            backoff = (
+                0.0
+                if self._spill.pending_records
+                else self._replay_interval_sec
+            )
 
-                self._enqueued = 0
-                self._enqueue_timeouts = 0
-                self._publish_calls = 0
-                self._published_msgs = 0
-                self._retries = 0
-                self._failures = 0
-                self._publish_call_ms_sum = 0.0
-                self._publish_call_ms_max = 0.0
+    def _decode(self, records: list[bytes]) -> list[PublishUrlDTO]:
+        assert self._spill_codec is not None
 
-        except asyncio.CancelledError:
-            return
+        items = []
+        for record in records:
+            try:
+                items.append(self._spill_codec.decode(record))
+            except (ValueError, KeyError) as e:
+                # Skipped rather than retried forever; it cannot decode later.
+                logger.error("Spilled record is unreadable", error=str(e))
+        return items
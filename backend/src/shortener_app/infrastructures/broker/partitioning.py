@@ -0,0 +1,83 @@
+__all__ = (
+    "KafkaPartitionMap",
+    "PartitionMapProtocol",
+    "group_by_partition",
+    "partition_for",
+)
+
+import time
+from collections import defaultdict
+from collections.abc import Callable, Sequence
+from typing import Protocol
+
+import structlog
+from aiokafka.partitioner import murmur2
+from faststream.kafka import KafkaBroker
+
+logger = structlog.get_logger(__name__)
+
+
+def partition_for(key: bytes, partitions: int) -> int:
+    """Partition of a keyed record, as Kafka's default partitioner picks it."""
+    return (murmur2(key) & 0x7FFFFFFF) % partitions
+
+
+def group_by_partition[T](
+    items: Sequence[T],
+    *,
+    key: Callable[[T], bytes],
+    partitions: int,
+) -> dict[int, list[T]]:
+    """Split items into per-partition groups, keeping their order."""
+    groups: dict[int, list[T]] = defaultdict(list)
+    for item in items:
+        groups[partition_for(key(item), partitions)].append(item)
+    return groups
+
+
+class PartitionMapProtocol(Protocol):
+    async def partitions(self, topic: str) -> int:
+        """Partition count of `topic`, or 0 when it is not known."""
+        ...
+
+
+class KafkaPartitionMap(PartitionMapProtocol):
+    """
+    Partition counts of topics, read from cluster metadata.
+
+    Counts are cached for `ttl_sec` so a topic that gains partitions is
+    picked up without a restart. A failed lookup keeps serving the last
+    known count for another TTL; with none known, `partitions` returns 0
+    and the caller lets the producer pick the partition.
+    """
+
+    def __init__(self, *, broker: KafkaBroker, ttl_sec: float = 60.0) -> None:
+        self._broker = broker
+        self._ttl_sec = ttl_sec
+        self._counts: dict[str, tuple[int, float]] = {}
+
+    async def partitions(self, topic: str) -> int:
+        cached = self._counts.get(topic)
+        now = time.monotonic()
+        if cached is not None and now - cached[1] < self._ttl_sec:
+            return cached[0]
+
+        try:
+            topics = await self._broker.config.admin_client.describe_topics(
+                [topic],
+            )
+            count = len(topics[0]["partitions"]) if topics else 0
+        except Exception as e:  # noqa: BLE001
+            logger.warning(
+                "Topic metadata lookup failed",
+                topic=topic,
+                error=str(e),
+            )
+            # Served until the next lookup, one TTL later.
+            count = cached[0] if cached is not None else 0
+        else:
+            if cached is None or cached[0] != count:
+                logger.info("Topic partitions", topic=topic, partitions=count)
+
+        self._counts[topic] = (count, now)
+        return count
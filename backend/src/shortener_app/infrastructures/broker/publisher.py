@@ -1,10 +1,12 @@
 __all__ = ("KafkaPublisher",)
 
+import asyncio
 from dataclasses import dataclass, field
-from typing import final
+from operator import itemgetter
+from typing import Literal, final
 
 import structlog
-from faststream.kafka import KafkaBroker
+from faststream.kafka import KafkaBroker, KafkaPublishMessage
 
 from shortener_app.application.dtos.urls.urls_events import (
     PublishUrlDTO,
@@ -12,6 +14,10 @@ from shortener_app.application.dtos.urls.urls_events import (
 )
 from shortener_app.application.interfaces import MessageBrokerPublisherProtocol
 from shortener_app.application.interfaces.dto_codec import DtoCodecProtocol
+from shortener_app.infrastructures.broker.partitioning import (
+    PartitionMapProtocol,
+    group_by_partition,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -23,6 +29,13 @@ class KafkaPublisher(MessageBrokerPublisherProtocol):
     Kafka publisher adapter.
 
     Uses dedicated codecs per message type to keep schemas explicit and type-safe.
+
+    Batches are keyed (new URLs by `new_urls_key`, clicks by URL key) and
+    every record of a key lands on the same partition in publish order. A
+    produce request goes to a single partition, so with a `partition_map`
+    each batch is split into per-partition sub-batches, hashed like Kafka's
+    default partitioner. Without one, records are sent individually and the
+    producer partitions them by key.
     """
 
     broker: KafkaBroker
@@ -33,9 +46,39 @@ class KafkaPublisher(MessageBrokerPublisherProtocol):
     new_urls_topic: str = field(default="new-urls")
     update_urls_update_topic: str = field(default="update-urls")
 
+    new_urls_key: Literal["key", "user_id"] = field(default="key")
+    partition_map: PartitionMapProtocol | None = field(default=None)
+
     async def publish_new_urls_batch(self, dtos: list[PublishUrlDTO]) -> None:
-        messages = [self.publish_url_codec.encode(dto) for dto in dtos]
-        await self.broker.publish_batch(*messages, topic=self.new_urls_topic)
+        records = [
+            (self._new_url_key(dto), self.publish_url_codec.encode(dto))
+            for dto in dtos
+        ]
+        await self._publish_keyed(records, topic=self.new_urls_topic)
+
+    async def publish_update_urls_batch(
+        self,
+        dtos: list[UrlClickedEventDTO],
+    ) -> None:
+        """
+        Publish click events, one produce request per partition.
+
+        Each message keeps the URL key as its Kafka key, so a URL's clicks
+        stay on one partition; headers are shared by the batch, the event id
+        travels in the payload.
+        """
+        records = [
+            (dto.key.encode("utf-8"), self.url_clicked_codec.encode(dto))
+            for dto in dtos
+        ]
+        await self._publish_keyed(
+            records,
+            topic=self.update_urls_update_topic,
+            headers={
+                "content-type": "application/json",
+                "event_type": "UrlClicked",
+            },
+        )
 
     async def publish_update_url(self, dto: UrlClickedEventDTO) -> None:
         try:
@@ -54,3 +97,60 @@ class KafkaPublisher(MessageBrokerPublisherProtocol):
         except Exception as e:
             logger.error("Failed to publish update_url event", error=str(e))
             raise
+
+    def _new_url_key(self, dto: PublishUrlDTO) -> bytes:
+        if self.new_urls_key == "user_id":
+            return str(dto.user_id).encode("utf-8")
+        return dto.key.encode("utf-8")
+
+    async def _publish_keyed(
+        self,
+        records: list[tuple[bytes, bytes]],
+        *,
+        topic: str,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """
+        Publish (key, payload) records so each lands on its key's partition.
+
+        With a known partition count, records go out as one produce call
+        per partition. Otherwise they are sent one by one with their key,
+        which the producer partitions and batches per partition itself.
+        """
+        partitions = 0
+        if self.partition_map is not None:
+            partitions = await self.partition_map.partitions(topic)
+
+        if partitions <= 0:
+            await asyncio.gather(
+                *(
+                    self.broker.publish(
+                        payload,
+                        topic=topic,
+                        key=key,
+                        headers=headers,
+                    )
+                    for key, payload in records
+                ),
+            )
+            return
+
+        groups = group_by_partition(
+            records,
+            key=itemgetter(0),
+            partitions=partitions,
+        )
+        await asyncio.gather(
+            *(
+                self.broker.publish_batch(
+                    *(
+                        KafkaPublishMessage(payload, key=key)
+                        for key, payload in group
+                    ),
+                    topic=topic,
+                    partition=partition,
+                    headers=headers,
+                )
+                for partition, group in groups.items()
+            ),
+        )
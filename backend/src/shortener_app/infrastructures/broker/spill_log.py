@@ -0,0 +1,414 @@
+__all__ = (
+    "SpillLog",
+    "SpillPosition",
+)
+
+import asyncio
+import errno
+import mmap
+import os
+import struct
+import zlib
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Final
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# payload length, crc32 of the payload; a zero length marks the end of data
+_HEADER: Final[struct.Struct] = struct.Struct("<II")
+_SUFFIX: Final[str] = ".spill"
+_CURSOR: Final[str] = "cursor"
+
+
+@dataclass(frozen=True, slots=True, order=True)
+class SpillPosition:
+    segment: int
+    offset: int
+
+
+class SpillLog:
+    """
+    Append-only, crash-safe log of byte records on local disk.
+
+    Records go into preallocated, memory-mapped segment files of
+    `segment_bytes`, each framed by its length and CRC32. An append is a
+    memory copy: it survives a crash of the process as soon as it returns,
+    and dirty pages are flushed to disk every `fsync_interval_sec` to also
+    survive a crash of the host. Segments hold their disk blocks up front,
+    so a full disk fails the `append` that opens a segment with `OSError`
+    instead of faulting on a write to the map; `max_bytes` caps the disk
+    taken by segments the same way.
+
+    Records are read back in append order. `commit` moves the position
+    past the records that were handled; the next flush persists it and
+    deletes fully read segments off the event loop. Records read but not
+    committed and persisted are read again after a restart, so delivery is
+    at-least-once. On open, a torn record at the tail (failed CRC) ends the
+    log and is overwritten by the next append.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: str | Path,
+        segment_bytes: int = 16 * 1024 * 1024,
+        fsync_interval_sec: float = 0.05,
+        max_bytes: int | None = None,
+    ) -> None:
+        if segment_bytes <= _HEADER.size:
+            raise ValueError("segment_bytes is too small")
+        if max_bytes is not None and max_bytes < segment_bytes:
+            raise ValueError("max_bytes must fit at least one segment")
+
+        self._dir = Path(directory)
+        self._segment_bytes = segment_bytes
+        self._fsync_interval_sec = fsync_interval_sec
+        self._max_bytes = max_bytes
+
+        self._segments: list[int] = []
+        self._mms: dict[int, mmap.mmap] = {}
+        self._write_offset = 0
+        self._cursor = SpillPosition(segment=0, offset=0)
+
+        self._dirty: set[int] = set()
+        self._unsaved_cursor: SpillPosition | None = None
+        self._retired: list[tuple[mmap.mmap, Path]] = []
+        self._flushing: asyncio.Future[None] | None = None
+        self._sync_task: asyncio.Task | None = None
+        self._opened = False
+
+        self._pending_records = 0
+        self._pending_bytes = 0
+        self._appended = 0
+        self._committed = 0
+        self._syncs = 0
+
+    @property
+    def pending_records(self) -> int:
+        return self._pending_records
+
+    @property
+    def pending_bytes(self) -> int:
+        return self._pending_bytes
+
+    async def start(self) -> None:
+        if self._opened:
+            return
+
+        self._open()
+        self._sync_task = asyncio.create_task(
+            self._sync_loop(),
+            name="spill-log-sync",
+        )
+        logger.info(
+            "Spill log opened",
+            directory=str(self._dir),
+            **self.stats(),
+        )
+
+    async def close(self) -> None:
+        if not self._opened:
+            return
+
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+            self._sync_task = None
+
+        await self._sync()
+        for mm in self._mms.values():
+            mm.close()
+        self._mms.clear()
+        self._opened = False
+        logger.info("Spill log closed", **self.stats())
+
+    def append(self, payloads: Sequence[bytes]) -> None:
+        """Append records in order; each must be non-empty."""
+        self._check_room(payloads)
+
+        for payload in payloads:
+            size = _HEADER.size + len(payload)
+            if self._write_offset + size > self._segment_bytes:
+                self._rotate()
+
+            segment = self._segments[-1]
+            mm = self._mms[segment]
+            start = self._write_offset
+            # Payload first, header last: a crash in between leaves a zero
+            # length, which reads as the end of the log.
+            mm[start + _HEADER.size : start + size] = payload
+            mm[start : start + _HEADER.size] = _HEADER.pack(
+                len(payload),
+                zlib.crc32(payload),
+            )
+            self._write_offset += size
+            self._dirty.add(segment)
+
+            self._pending_records += 1
+            self._pending_bytes += size
+            self._appended += 1
+
+    def read(self, max_records: int) -> tuple[list[bytes], SpillPosition]:
+        """Up to `max_records` from the committed position, and the end."""
+        records: list[bytes] = []
+        position = self._cursor
+
+        for record, after in self._iter(self._cursor):
+            if len(records) >= max_records:
+                break
+            records.append(record)
+            position = after
+
+        return records, position
+
+    def commit(self, position: SpillPosition) -> None:
+        """Mark every record before `position` as handled."""
+        if position <= self._cursor:
+            return
+
+        for record, after in self._iter(self._cursor):
+            if after > position:
+                break
+            self._pending_records -= 1
+            self._pending_bytes -= _HEADER.size + len(record)
+            self._committed += 1
+        self._cursor = position
+        self._unsaved_cursor = position
+
+        for segment in [s for s in self._segments if s < position.segment]:
+            self._segments.remove(segment)
+            self._dirty.discard(segment)
+            self._retired.append((self._mms.pop(segment), self._path(segment)))
+
+    async def flush(self) -> None:
+        await self._sync()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "segments": len(self._segments),
+            "pending_records": self._pending_records,
+            "pending_bytes": self._pending_bytes,
+            "appended": self._appended,
+            "committed": self._committed,
+            "syncs": self._syncs,
+        }
+
+    def _open(self) -> None:
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+        self._segments = sorted(
+            int(path.stem) for path in self._dir.glob(f"*{_SUFFIX}")
+        )
+        cursor_path = self._dir / _CURSOR
+        if cursor_path.exists():
+            segment, offset = cursor_path.read_text().split()
+            self._cursor = SpillPosition(
+                segment=int(segment),
+                offset=int(offset),
+            )
+        elif self._segments:
+            self._cursor = SpillPosition(segment=self._segments[0], offset=0)
+
+        for segment in [s for s in self._segments if s < self._cursor.segment]:
+            self._path(segment).unlink(missing_ok=True)
+            self._segments.remove(segment)
+
+        if not self._segments:
+            self._segments.append(self._cursor.segment)
+            self._create(self._cursor.segment)
+        if self._cursor.segment != self._segments[0]:
+            # The cursor's segment is gone: nothing before the next one is
+            # left to read.
+            self._cursor = SpillPosition(segment=self._segments[0], offset=0)
+
+        # Logs written before segments were preallocated may be sparse.
+        with self._path(self._segments[-1]).open("r+b") as f:
+            _allocate(f.fileno(), self._segment_bytes)
+        for segment in self._segments:
+            self._mms[segment] = self._map(segment)
+
+        self._write_offset = self._truncate_torn_tail(
+            self._mms[self._segments[-1]],
+        )
+        self._opened = True
+
+        for record, _ in self._iter(self._cursor):
+            self._pending_records += 1
+            self._pending_bytes += _HEADER.size + len(record)
+
+    def _check_room(self, payloads: Sequence[bytes]) -> None:
+        """Reject the whole batch before writing any of it."""
+        segments, offset = len(self._segments), self._write_offset
+        for payload in payloads:
+            size = _HEADER.size + len(payload)
+            if not payload or size > self._segment_bytes:
+                raise ValueError("record must be non-empty and fit a segment")
+            if offset + size > self._segment_bytes:
+                segments, offset = segments + 1, 0
+            offset += size
+
+        if (
+            self._max_bytes is not None
+            and segments * self._segment_bytes > self._max_bytes
+        ):
+            raise OSError(errno.ENOSPC, "spill log is full")
+
+    def _rotate(self) -> None:
+        # Once per segment, on the loop: with fallocate support the
+        # preallocation is a metadata update, not a write of the segment.
+        segment = self._segments[-1] + 1
+        self._create(segment)
+        self._segments.append(segment)
+        self._mms[segment] = self._map(segment)
+        self._write_offset = 0
+
+    def _create(self, segment: int) -> None:
+        path = self._path(segment)
+        try:
+            with path.open("wb") as f:
+                _allocate(f.fileno(), self._segment_bytes)
+        except OSError:
+            path.unlink(missing_ok=True)
+            raise
+
+    def _map(self, segment: int) -> mmap.mmap:
+        with self._path(segment).open("r+b") as f:
+            return mmap.mmap(f.fileno(), 0)
+
+    def _path(self, segment: int) -> Path:
+        return self._dir / f"{segment:020d}{_SUFFIX}"
+
+    def _iter(
+        self,
+        position: SpillPosition,
+    ) -> Iterator[tuple[bytes, SpillPosition]]:
+        """Records from `position` on, each with the position after it."""
+        segment, offset = position.segment, position.offset
+
+        while (mm := self._mms.get(segment)) is not None:
+            record = _read_record(mm, offset)
+            if record is None:
+                # The end of data; only the last segment is still written.
+                later = [s for s in self._segments if s > segment]
+                if not later:
+                    return
+                segment, offset = later[0], 0
+                continue
+
+            offset += _HEADER.size + len(record)
+            yield record, SpillPosition(segment=segment, offset=offset)
+
+    @staticmethod
+    def _truncate_torn_tail(mm: mmap.mmap) -> int:
+        offset = 0
+        while (record := _read_record(mm, offset)) is not None:
+            offset += _HEADER.size + len(record)
+
+        tail = mm[offset:]
+        if tail.count(0) != len(tail):
+            mm[offset:] = bytes(len(tail))
+        return offset
+
+    async def _sync(self) -> None:
+        """
+        Flush dirty segments, the cursor and retired segments in a thread.
+
+        The work is picked on the event loop, so `append` and `commit`
+        never race the thread over the segment bookkeeping; every commit
+        since the last sync costs one cursor write. One flush runs at a
+        time: if its caller is cancelled, the thread keeps what it was
+        handed and the next sync (e.g. from `close`) waits for it.
+        """
+        while self._flushing is not None:
+            await asyncio.wait({self._flushing})
+
+        dirty = [self._mms[segment] for segment in sorted(self._dirty)]
+        cursor, self._unsaved_cursor = self._unsaved_cursor, None
+        retired, self._retired = self._retired, []
+        self._dirty.clear()
+        if not dirty and cursor is None and not retired:
+            return
+
+        flushing = asyncio.ensure_future(
+            asyncio.to_thread(_flush, self._dir, dirty, cursor, retired),
+        )
+        self._flushing = flushing
+        flushing.add_done_callback(self._flush_done)
+        if dirty:
+            self._syncs += 1
+        await asyncio.shield(flushing)
+
+    def _flush_done(self, _: asyncio.Future[None]) -> None:
+        self._flushing = None
+
+    async def _sync_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._fsync_interval_sec)
+            if (
+                self._dirty
+                or self._unsaved_cursor is not None
+                or self._retired
+            ):
+                await self._sync()
+
+
+def _flush(
+    directory: Path,
+    dirty: Sequence[mmap.mmap],
+    cursor: SpillPosition | None,
+    retired: Sequence[tuple[mmap.mmap, Path]],
+) -> None:
+    for mm in dirty:
+        mm.flush()
+    # Segments are deleted only once the cursor past them is on disk.
+    if cursor is not None:
+        _write_cursor(directory, cursor)
+    for mm, path in retired:
+        mm.close()
+        path.unlink(missing_ok=True)
+
+
+def _write_cursor(directory: Path, position: SpillPosition) -> None:
+    # fsync the file before the rename and the directory after it, so a
+    # host crash leaves either the old cursor or the new one.
+    tmp = directory / f"{_CURSOR}.tmp"
+    with tmp.open("w") as f:
+        f.write(f"{position.segment} {position.offset}")
+        f.flush()
+        os.fsync(f.fileno())
+    tmp.replace(directory / _CURSOR)
+
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _allocate(fd: int, size: int) -> None:
+    if hasattr(os, "posix_fallocate"):
+        os.posix_fallocate(fd, 0, size)
+    else:
+        os.ftruncate(fd, size)
+
+
+def _read_record(mm: mmap.mmap, offset: int) -> bytes | None:
+    if offset + _HEADER.size > len(mm):
+        return None
+
+    length, crc = _HEADER.unpack_from(mm, offset)
+    start = offset + _HEADER.size
+    if length == 0 or start + length > len(mm):
+        return None
+
+    payload = mm[start : start + length]
+    if zlib.crc32(payload) != crc:
+        return None
+    return payload
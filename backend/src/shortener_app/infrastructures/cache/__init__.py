@@ -1,3 +1,29 @@
-__all__ = ("RedisCacheClient",)
+__all__ = (
+    "BloomFilter",
+    "CircuitBreaker",
+    "InMemoryLRUCache",
+    "RedisBloomKeyFilter",
+    "RedisCacheClient",
+    "RedisCacheInvalidationSubscriber",
+    "RedisClickCounter",
+    "RedisKeySequence",
+)
 
+from shortener_app.infrastructures.cache.bloom import (
+    BloomFilter,
+    RedisBloomKeyFilter,
+)
+from shortener_app.infrastructures.cache.circuit_breaker import (
+    CircuitBreaker,
+)
+from shortener_app.infrastructures.cache.click_counter import (
+    RedisClickCounter,
+)
+from shortener_app.infrastructures.cache.invalidation import (
+    RedisCacheInvalidationSubscriber,
+)
+from shortener_app.infrastructures.cache.key_sequence import (
+    RedisKeySequence,
+)
+from shortener_app.infrastructures.cache.local_cache import InMemoryLRUCache
 from shortener_app.infrastructures.cache.redis_client import RedisCacheClient
@@ -0,0 +1,433 @@
+__all__ = (
+    "BloomFilter",
+    "RedisBloomKeyFilter",
+)
+
+import asyncio
+import hashlib
+import math
+import uuid
+from collections.abc import AsyncIterable, Callable
+
+import redis.exceptions
+import structlog
+from redis.asyncio import Redis
+
+from shortener_app.application.interfaces.cache import KeyFilterProtocol
+
+logger = structlog.get_logger(__name__)
+
+_MASK_64 = (1 << 64) - 1
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter sized from an expected capacity and error rate.
+
+    Bits are laid out like a Redis bitmap (bit 0 is the most significant bit
+    of byte 0), so the raw buffer can be exchanged with SETBIT/GET as is.
+    """
+
+    def __init__(self, *, capacity: int, error_rate: float) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be > 0")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self._bits = (bits + 7) // 8 * 8
+        self._hashes = max(1, round(self._bits / capacity * math.log(2)))
+        self._buf = bytearray(self._bits // 8)
+        self._added = 0
+
+    @property
+    def bits(self) -> int:
+        return self._bits
+
+    @property
+    def hashes(self) -> int:
+        return self._hashes
+
+    def offsets(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [
+            ((h1 + i * h2) & _MASK_64) % self._bits
+            for i in range(self._hashes)
+        ]
+
+    def add(self, key: str) -> list[int]:
+        offsets = self.offsets(key)
+        for offset in offsets:
+            self._buf[offset >> 3] |= 0x80 >> (offset & 7)
+        self._added += 1
+        return offsets
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._buf[offset >> 3] & (0x80 >> (offset & 7))
+            for offset in self.offsets(key)
+        )
+
+    def merge(self, raw: bytes) -> None:
+        """
+        OR another bitmap of the same geometry into this one.
+
+        A shorter bitmap is zero-padded: Redis only grows a bitmap up to its
+        highest set bit.
+        """
+        if len(raw) > len(self._buf):
+            raise ValueError("bitmap size mismatch")
+
+        raw = raw.ljust(len(self._buf), b"\x00")
+        merged = int.from_bytes(self._buf, "big") | int.from_bytes(raw, "big")
+        self._buf[:] = merged.to_bytes(len(self._buf), "big")
+
+    def to_bytes(self) -> bytes:
+        return bytes(self._buf)
+
+    def stats(self) -> dict[str, int | float]:
+        set_bits = int.from_bytes(self._buf, "big").bit_count()
+        fill_ratio = set_bits / self._bits
+        return {
+            "bits": self._bits,
+            "hashes": self._hashes,
+            "memory_bytes": len(self._buf),
+            "added": self._added,
+            "fill_ratio": round(fill_ratio, 6),
+            "estimated_fpr": round(fill_ratio**self._hashes, 6),
+        }
+
+
+class RedisBloomKeyFilter(KeyFilterProtocol):
+    """
+    Bloom filter of allocated short keys shared between instances via Redis.
+
+    Lookups are served from the in-process copy. Keys added locally are
+    pushed to a Redis bitmap with SETBIT and the bitmap is periodically
+    OR-merged back, so every instance converges on the union of all adds.
+    The Redis key embeds the filter geometry, so changing the sizing starts a
+    fresh bitmap instead of mixing incompatible layouts.
+
+    A bitmap is trusted only while it is known to be complete: a full
+    rebuild from the database stamps it with the Redis server's run id, and
+    every instance holds a heartbeat lease while it may have unflushed bits.
+    A restarted or flushed Redis (new run id or no stamp) or a writer whose
+    lease expired without a clean stop leaves the bitmap incomplete. Until
+    one instance has rebuilt it, `might_contain` answers True for every key
+    so lookups fall through to the database instead of being rejected.
+
+    Filters cannot forget keys: deletions are only counted, and the filter
+    should be rebuilt when stale entries start to dominate.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Redis,
+        capacity: int,
+        error_rate: float,
+        key_prefix: str = "short:bloom",
+        sync_interval_sec: float = 5.0,
+        keys: Callable[[], AsyncIterable[str]] | None = None,
+        rebuild_lock_sec: float = 300.0,
+    ) -> None:
+        self._client = client
+        self._bloom = BloomFilter(capacity=capacity, error_rate=error_rate)
+        self._redis_key = (
+            f"{key_prefix}:{self._bloom.bits}:{self._bloom.hashes}"
+        )
+        self._sync_interval_sec = sync_interval_sec
+        self._keys = keys
+        self._rebuild_lock_ms = int(rebuild_lock_sec * 1000)
+
+        self._writer_id = uuid.uuid4().hex
+        # A lease outlives a few missed syncs before the writer counts as
+        # crashed.
+        self._lease_ms = int(max(sync_interval_sec * 3, 1.0) * 1000)
+
+        self._complete = False
+        self._pending: list[int] = []
+        self._task: asyncio.Task | None = None
+        self._lease_task: asyncio.Task | None = None
+
+        self._checks = 0
+        self._rejected = 0
+        self._false_positives = 0
+        self._stale = 0
+        self._sync_failures = 0
+        self._rebuilds = 0
+
+    @property
+    def redis_key(self) -> str:
+        return self._redis_key
+
+    @property
+    def complete(self) -> bool:
+        return self._complete
+
+    def might_contain(self, key: str) -> bool:
+        self._checks += 1
+        if not self._complete or key in self._bloom:
+            return True
+        self._rejected += 1
+        return False
+
+    def add(self, key: str) -> None:
+        self._pending.extend(self._bloom.add(key))
+
+    def discard(self, key: str) -> None:  # noqa: ARG002
+        self._stale += 1
+
+    def record_false_positive(self, key: str) -> None:  # noqa: ARG002
+        self._false_positives += 1
+
+    def stats(self) -> dict[str, int | float]:
+        passed = self._checks - self._rejected
+        return {
+            **self._bloom.stats(),
+            "complete": int(self._complete),
+            "checks": self._checks,
+            "rejected": self._rejected,
+            "false_positives": self._false_positives,
+            "observed_fpr": (
+                round(self._false_positives / passed, 6) if passed else 0.0
+            ),
+            "stale": self._stale,
+            "pending_bits": len(self._pending),
+            "sync_failures": self._sync_failures,
+            "rebuilds": self._rebuilds,
+        }
+
+    async def load(self) -> bool:
+        """
+        Merge the shared bitmap; returns whether it is known to be complete.
+
+        A writer found with an expired lease drops the completeness stamp,
+        so every instance stops trusting the bitmap until it is rebuilt.
+        """
+        run_id = await self._run_id()
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.get(self._marker_key)
+            pipe.get(self._redis_key)
+            pipe.smembers(self._writers_key)
+            marker, raw, writers = await pipe.execute()
+
+        if raw is not None:
+            self._bloom.merge(raw)
+
+        crashed = await self._crashed_writers(writers)
+        if crashed:
+            logger.warning(
+                "Key filter writers stopped without a flush",
+                redis_key=self._redis_key,
+                writers=len(crashed),
+            )
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.delete(self._marker_key)
+                pipe.srem(self._writers_key, *crashed)
+                await pipe.execute()
+
+        complete = (
+            raw is not None
+            and not crashed
+            and marker is not None
+            and marker.decode() == run_id
+        )
+        if self._complete and not complete:
+            logger.warning(
+                "Key filter bitmap is incomplete; lookups fall through",
+                redis_key=self._redis_key,
+            )
+        self._complete = complete
+        return complete
+
+    async def rebuild(self, keys: AsyncIterable[str]) -> int:
+        """
+        Populate the filter from a full scan of existing keys.
+
+        The result is OR-merged into the shared bitmap through a temporary
+        key, so bits set concurrently by other instances are not lost. The
+        bitmap is stamped complete unless Redis restarted during the scan.
+        """
+        run_id = await self._run_id()
+        count = 0
+        async for key in keys:
+            self._bloom.add(key)
+            count += 1
+
+        # Pending bits are part of the local copy and land with the merge.
+        self._pending.clear()
+        restarted = await self._run_id() != run_id
+
+        tmp_key = f"{self._redis_key}:rebuild"
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.set(tmp_key, self._bloom.to_bytes())
+            pipe.bitop("OR", self._redis_key, self._redis_key, tmp_key)
+            pipe.delete(tmp_key)
+            if not restarted:
+                pipe.set(self._marker_key, run_id)
+            await pipe.execute()
+
+        self._complete = not restarted
+        self._rebuilds += 1
+        return count
+
+    async def ensure_complete(self) -> bool:
+        """
+        Rebuild an incomplete filter unless another instance is already
+        rebuilding it; returns whether the filter is complete afterwards.
+        """
+        if self._complete:
+            return True
+        if self._keys is None:
+            return False
+
+        lock_key = f"{self._redis_key}:rebuild-lock"
+        if not await self._client.set(
+            lock_key,
+            self._writer_id,
+            nx=True,
+            px=self._rebuild_lock_ms,
+        ):
+            return False
+
+        try:
+            rebuilt = await self.rebuild(self._keys())
+        finally:
+            await self._client.delete(lock_key)
+
+        logger.info(
+            "Key filter rebuilt from database",
+            redis_key=self._redis_key,
+            keys=rebuilt,
+            complete=self._complete,
+        )
+        return self._complete
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+
+        await self._renew_lease()
+        self._task = asyncio.create_task(
+            self._sync_loop(),
+            name="key-filter-sync",
+        )
+        self._lease_task = asyncio.create_task(
+            self._lease_loop(),
+            name="key-filter-lease",
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        for task in (self._task, self._lease_task):
+            if task is None:
+                continue
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._task = self._lease_task = None
+
+        try:
+            await self._flush()
+        except redis.exceptions.RedisError as e:
+            # The lease is left to expire so other instances rebuild.
+            logger.warning("Key filter final flush failed", error=str(e))
+            return
+
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.srem(self._writers_key, self._writer_id)
+            pipe.delete(self._lease_key)
+            await pipe.execute()
+
+    async def sync(self) -> None:
+        await self._flush()
+        if not await self.load():
+            await self.ensure_complete()
+
+    @property
+    def _marker_key(self) -> str:
+        return f"{self._redis_key}:complete"
+
+    @property
+    def _writers_key(self) -> str:
+        return f"{self._redis_key}:writers"
+
+    @property
+    def _lease_key(self) -> str:
+        return self._writer_lease_key(self._writer_id)
+
+    def _writer_lease_key(self, writer_id: str) -> str:
+        return f"{self._redis_key}:writer:{writer_id}"
+
+    async def _run_id(self) -> str:
+        info = await self._client.info("server")
+        return str(info["run_id"])
+
+    async def _renew_lease(self) -> None:
+        # The lease is set first: a listed writer always has one until it
+        # stops renewing it.
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.set(self._lease_key, 1, px=self._lease_ms)
+            pipe.sadd(self._writers_key, self._writer_id)
+            await pipe.execute()
+
+    async def _crashed_writers(self, writers: set[bytes]) -> list[bytes]:
+        others = [w for w in writers if w.decode() != self._writer_id]
+        if not others:
+            return []
+
+        leases = await self._client.mget(
+            [self._writer_lease_key(w.decode()) for w in others],
+        )
+        return [
+            writer
+            for writer, lease in zip(others, leases, strict=True)
+            if lease is None
+        ]
+
+    async def _flush(self) -> None:
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, []
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                for offset in pending:
+                    pipe.setbit(self._redis_key, offset, 1)
+                await pipe.execute()
+        except redis.exceptions.RedisError:
+            self._pending = pending + self._pending
+            raise
+
+    async def _sync_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._sync_interval_sec)
+            try:
+                await self.sync()
+            except (redis.exceptions.RedisError, ValueError) as e:
+                self._sync_failures += 1
+                logger.warning(
+                    "Key filter sync failed",
+                    redis_key=self._redis_key,
+                    error=str(e),
+                )
+
+    async def _lease_loop(self) -> None:
+        # Renewed apart from syncs so a long rebuild does not let it lapse.
+        while True:
+            await asyncio.sleep(self._lease_ms / 3000)
+            try:
+                await self._renew_lease()
+            except redis.exceptions.RedisError as e:
+                logger.warning(
+                    "Key filter lease renewal failed",
+                    redis_key=self._redis_key,
+                    error=str(e),
+                )
@@ -0,0 +1,124 @@
+__all__ = (
+    "BreakerState",
+    "CircuitBreaker",
+)
+
+import time
+from collections.abc import Callable
+from enum import StrEnum
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class BreakerState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for a remote dependency.
+
+    After `failure_threshold` failures in a row the breaker opens and
+    `allow` rejects calls for `reset_timeout_sec`, so callers fail fast
+    instead of paying a socket timeout each. Then a single probe call is
+    let through (half-open): success closes the breaker, failure reopens it
+    for another cool-down window.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout_sec: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be > 0")
+
+        self._name = name
+        self._failure_threshold = failure_threshold
+        self._reset_timeout_sec = reset_timeout_sec
+        self._clock = clock
+
+        self._state = BreakerState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+        self._opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> BreakerState:
+        return self._state
+
+    def is_open(self) -> bool:
+        """True while calls are being rejected, without claiming the probe."""
+        if self._state is BreakerState.CLOSED:
+            return False
+        if self._state is BreakerState.HALF_OPEN:
+            return self._probing
+        return self._clock() - self._opened_at < self._reset_timeout_sec
+
+    def allow(self) -> bool:
+        if self._state is BreakerState.CLOSED:
+            return True
+
+        if (
+            self._state is BreakerState.OPEN
+            and self._clock() - self._opened_at >= self._reset_timeout_sec
+        ):
+            self._state = BreakerState.HALF_OPEN
+            self._probing = False
+
+        if self._state is BreakerState.HALF_OPEN and not self._probing:
+            self._probing = True
+            return True
+
+        self._rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        if self._state is not BreakerState.CLOSED:
+            logger.info("Circuit breaker closed", breaker=self._name)
+
+        self._state = BreakerState.CLOSED
+        self._failures = 0
+        self._probing = False
+
+    def release_probe(self) -> None:
+        """Give back a claimed probe whose call ended without a verdict."""
+        if self._state is BreakerState.HALF_OPEN:
+            self._probing = False
+
+    def record_failure(self) -> None:
+        self._failures += 1
+
+        if (
+            self._state is BreakerState.HALF_OPEN
+            or self._failures >= self._failure_threshold
+        ):
+            if self._state is not BreakerState.OPEN:
+                self._opened += 1
+                logger.warning(
+                    "Circuit breaker opened",
+                    breaker=self._name,
+                    failures=self._failures,
+                    reset_timeout_sec=self._reset_timeout_sec,
+                )
+            self._state = BreakerState.OPEN
+            self._opened_at = self._clock()
+            self._probing = False
+
+    def stats(self) -> dict[str, int | str]:
+        return {
+            "state": self._state.value,
+            "consecutive_failures": self._failures,
+            "opened": self._opened,
+            "rejected": self._rejected,
+        }
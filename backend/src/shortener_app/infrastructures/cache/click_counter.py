@@ -0,0 +1,144 @@
+__all__ = ("RedisClickCounter",)
+
+import time
+from collections.abc import Awaitable, Callable
+from typing import cast
+from uuid import uuid4
+
+import redis.exceptions
+import structlog
+from redis.asyncio import Redis
+
+from shortener_app.application.dtos.urls.urls_events import UrlClickedEventDTO
+from shortener_app.application.interfaces.click_counter import (
+    ClickCounterStoreProtocol,
+)
+from shortener_app.application.interfaces.publish_queue import (
+    ClickPublishQueueProtocol,
+)
+from shortener_app.infrastructures.cache.circuit_breaker import (
+    CircuitBreaker,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+class RedisClickCounter(ClickPublishQueueProtocol, ClickCounterStoreProtocol):
+    """
+    Click counters kept in per-time-bucket Redis hashes.
+
+    Redirects add to `{prefix}:{bucket}` with a pipelined HINCRBY and record
+    the bucket in a sorted-set index, so no broker is involved on the hot
+    path. A bucket is closed once `grace_sec` has passed after its end.
+
+    The flusher claims closed buckets by atomically renaming them to a
+    unique `{prefix}:claimed:...` key: a late write to the same bucket lands
+    in a fresh hash and is picked up by a later pass instead of being lost.
+    Claimed keys are tracked in a set until released, so a flusher that
+    crashes mid-way re-applies them on restart (at-least-once delivery).
+
+    With a circuit breaker, redirects stop writing while Redis is failing
+    and drop the click at once instead of waiting out a socket timeout.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Redis,
+        key_prefix: str = "short:clicks",
+        bucket_sec: int = 10,
+        grace_sec: float = 2.0,
+        clock: Callable[[], float] = time.time,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self._client = client
+        self._prefix = key_prefix
+        self._bucket_sec = bucket_sec
+        self._grace_sec = grace_sec
+        self._clock = clock
+        self._breaker = breaker
+
+        self._index_key = f"{key_prefix}:buckets"
+        self._claimed_key = f"{key_prefix}:claimed"
+
+        self._clicks = 0
+        self._failures = 0
+        self._skipped = 0
+
+    async def enqueue(self, *, dto: UrlClickedEventDTO) -> bool:
+        if self._breaker is not None and not self._breaker.allow():
+            self._skipped += 1
+            return False
+
+        bucket = int(self._clock() // self._bucket_sec)
+
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                pipe.hincrby(self._bucket_key(bucket), dto.key, dto.count)
+                pipe.zadd(self._index_key, {str(bucket): bucket})
+                await pipe.execute()
+        except redis.exceptions.RedisError as e:
+            self._failures += 1
+            if self._breaker is not None:
+                self._breaker.record_failure()
+            logger.debug("Click counter write failed", error=str(e))
+            return False
+        except BaseException:
+            if self._breaker is not None:
+                self._breaker.release_probe()
+            raise
+
+        if self._breaker is not None:
+            self._breaker.record_success()
+        self._clicks += dto.count
+        return True
+
+    async def claim_closed(self) -> list[str]:
+        cutoff = int((self._clock() - self._grace_sec) // self._bucket_sec)
+        closed = await self._client.zrangebyscore(
+            self._index_key,
+            "-inf",
+            f"({cutoff}",
+        )
+
+        for raw in closed:
+            bucket = raw.decode()
+            claimed = f"{self._prefix}:claimed:{bucket}:{uuid4().hex}"
+
+            async with self._client.pipeline(transaction=True) as pipe:
+                pipe.zrem(self._index_key, bucket)
+                pipe.sadd(self._claimed_key, claimed)
+                pipe.rename(self._bucket_key(int(bucket)), claimed)
+                # RENAME fails if the bucket was never written; the claim
+                # then reads as empty and is released.
+                await pipe.execute(raise_on_error=False)
+
+        # redis-py types these as `Awaitable[T] | T`; the client is async.
+        members = await cast(
+            Awaitable[set[bytes]],
+            self._client.smembers(self._claimed_key),
+        )
+        return sorted(member.decode() for member in members)
+
+    async def read(self, *, bucket: str) -> dict[str, int]:
+        raw = await cast(
+            Awaitable[dict[bytes, bytes]],
+            self._client.hgetall(bucket),
+        )
+        return {key.decode(): int(value) for key, value in raw.items()}
+
+    async def release(self, *, bucket: str) -> None:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.delete(bucket)
+            pipe.srem(self._claimed_key, bucket)
+            await pipe.execute()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "clicks": self._clicks,
+            "failures": self._failures,
+            "skipped": self._skipped,
+        }
+
+    def _bucket_key(self, bucket: int) -> str:
+        return f"{self._prefix}:{bucket}"
@@ -0,0 +1,65 @@
+__all__ = ("run_flusher",)
+
+import asyncio
+import signal
+
+import structlog
+from dishka import AsyncContainer
+
+from shortener_app.application.use_cases.flush_click_counters import (
+    FlushClickCountersUseCase,
+)
+
+logger = structlog.get_logger(__name__)
+
+
+async def run_flusher(
+    container: AsyncContainer,
+    *,
+    interval_sec: float,
+) -> None:
+    """
+    Periodically apply closed Redis click counter buckets to the database.
+
+    Runs one flush per interval until SIGINT/SIGTERM, then performs a last
+    pass and closes the container. A single flusher per deployment is
+    expected; claims are atomic, so a second one only adds idle passes.
+    """
+    stop_event = asyncio.Event()
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop_event.set)
+        except NotImplementedError:
+            # Windows
+            pass
+
+    logger.info("Click counter flusher started", interval_sec=interval_sec)
+
+    try:
+        while True:
+            await _flush_once(container)
+
+            if stop_event.is_set():
+                break
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=interval_sec)
+            except TimeoutError:
+                pass
+    finally:
+        await container.close()
+        logger.info("Click counter flusher stopped")
+
+
+async def _flush_once(container: AsyncContainer) -> None:
+    try:
+        async with container() as request_container:
+            use_case = await request_container.get(FlushClickCountersUseCase)
+            applied = await use_case.execute()
+    except Exception:
+        logger.exception("Click counter flush failed")
+        return
+
+    if applied:
+        logger.info("Click counters flushed", clicks=applied)
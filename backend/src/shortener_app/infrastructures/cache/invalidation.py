@@ -0,0 +1,100 @@
+__all__ = ("RedisCacheInvalidationSubscriber",)
+
+import asyncio
+from typing import Any
+
+import redis.exceptions
+import structlog
+from redis.asyncio import Redis
+
+from shortener_app.application.interfaces.cache import LocalCacheProtocol
+
+logger = structlog.get_logger(__name__)
+
+
+class RedisCacheInvalidationSubscriber:
+    """
+    Keeps a per-process cache coherent across instances.
+
+    Listens on a Redis pub/sub channel where every instance publishes the keys
+    it invalidates, and drops those keys from the local cache. Pub/sub has no
+    delivery guarantees, so the local cache is cleared whenever the
+    subscription is (re)established.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Redis,
+        channel: str,
+        local_cache: LocalCacheProtocol[Any],
+        reconnect_backoff_sec: float = 1.0,
+    ) -> None:
+        self._client = client
+        self._channel = channel
+        self._local_cache = local_cache
+        self._reconnect_backoff_sec = reconnect_backoff_sec
+
+        self._task: asyncio.Task | None = None
+        self._received = 0
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+
+        self._task = asyncio.create_task(
+            self._listen(),
+            name="cache-invalidation-listener",
+        )
+        logger.info(
+            "Cache invalidation subscriber started",
+            channel=self._channel,
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        logger.info(
+            "Cache invalidation subscriber stopped",
+            channel=self._channel,
+            received=self._received,
+        )
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self._client.pubsub(
+                    ignore_subscribe_messages=True,
+                ) as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    self._local_cache.clear()
+
+                    async for message in pubsub.listen():
+                        self._handle(message)
+
+            except redis.exceptions.RedisError as e:
+                logger.warning(
+                    "Cache invalidation subscription lost; reconnecting",
+                    channel=self._channel,
+                    sleep_for=self._reconnect_backoff_sec,
+                    error=str(e),
+                )
+                await asyncio.sleep(self._reconnect_backoff_sec)
+
+    def _handle(self, message: dict[str, Any]) -> None:
+        if message.get("type") != "message":
+            return
+
+        data = message["data"]
+        key = data.decode("utf-8") if isinstance(data, bytes) else str(data)
+
+        self._received += 1
+        self._local_cache.delete(key)
@@ -0,0 +1,33 @@
+__all__ = ("RedisKeySequence",)
+
+from redis.asyncio import Redis
+
+from shortener_app.application.interfaces.key_sequence import (
+    KeySequenceProtocol,
+)
+
+
+class RedisKeySequence(KeySequenceProtocol):
+    """
+    Key sequence backed by a Redis counter advanced with INCRBY.
+
+    Only safe with a Redis that persists the counter (AOF or replication
+    with failover): a counter that restarts from zero reissues keys that
+    were already handed out.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: Redis,
+        key: str = "short:key_seq",
+    ) -> None:
+        self._client = client
+        self._key = key
+
+    async def lease(self, *, count: int) -> range:
+        if count <= 0:
+            raise ValueError("count must be > 0")
+
+        end = await self._client.incrby(self._key, count)
+        return range(end - count, end)
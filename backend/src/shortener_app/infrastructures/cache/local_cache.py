@@ -0,0 +1,118 @@
+__all__ = ("InMemoryLRUCache",)
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from shortener_app.application.interfaces.cache import LocalCacheProtocol
+
+
+class InMemoryLRUCache[V](LocalCacheProtocol[V]):
+    """
+    Bounded per-process LRU cache with a fixed TTL per entry.
+
+    Used as an L1 tier in front of Redis. Entries are evicted in LRU order
+    once `maxsize` is reached and lazily expired on read.
+
+    With `stale_ttl_sec` > 0, expired entries are retained for that long
+    past their TTL: `get` no longer returns them, but `get_stale` does, so
+    callers can serve a stale value while refreshing it or while the
+    backing stores are unavailable.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 10_000,
+        ttl_sec: float = 30.0,
+        stale_ttl_sec: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be > 0")
+        if ttl_sec <= 0:
+            raise ValueError("ttl_sec must be > 0")
+        if stale_ttl_sec < 0:
+            raise ValueError("stale_ttl_sec must be >= 0")
+
+        self._maxsize = maxsize
+        self._ttl_sec = ttl_sec
+        self._stale_ttl_sec = stale_ttl_sec
+        self._clock = clock
+
+        self._data: OrderedDict[str, tuple[float, V]] = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._invalidations = 0
+        self._stale_hits = 0
+
+    def get(self, key: str) -> V | None:
+        item = self._data.get(key)
+        if item is None:
+            self._misses += 1
+            return None
+
+        expires_at, value = item
+        now = self._clock()
+        if expires_at <= now:
+            if expires_at + self._stale_ttl_sec <= now:
+                del self._data[key]
+                self._expirations += 1
+            self._misses += 1
+            return None
+
+        self._data.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def get_stale(
+        self,
+        key: str,
+        max_stale_sec: float | None = None,
+    ) -> V | None:
+        item = self._data.get(key)
+        if item is None:
+            return None
+
+        expires_at, value = item
+        allowed = self._stale_ttl_sec
+        if max_stale_sec is not None:
+            allowed = min(allowed, max_stale_sec)
+
+        if expires_at + allowed <= self._clock():
+            return None
+
+        self._stale_hits += 1
+        return value
+
+    def set(self, key: str, value: V) -> None:
+        self._data[key] = (self._clock() + self._ttl_sec, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+            self._evictions += 1
+
+    def delete(self, key: str) -> bool:
+        if self._data.pop(key, None) is None:
+            return False
+        self._invalidations += 1
+        return True
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._data),
+            "maxsize": self._maxsize,
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "expirations": self._expirations,
+            "invalidations": self._invalidations,
+            "stale_hits": self._stale_hits,
+        }
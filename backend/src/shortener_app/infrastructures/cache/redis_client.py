@@ -1,28 +1,141 @@
 __all__ = ("RedisCacheClient",)
 
 import json
-from dataclasses import dataclass
-from typing import Any, final
+from collections.abc import Awaitable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Final, final
 
 import redis.exceptions
 import structlog
 from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
 
 from shortener_app.application.interfaces import CacheProtocol
+from shortener_app.infrastructures.cache.circuit_breaker import CircuitBreaker
 
 logger = structlog.get_logger(__name__)
 
+# KEYS: candidate keys; ARGV[1]: TTL in seconds (0 = none), ARGV[i + 1]:
+# value for KEYS[i]. Returns the 1-based index of the key set, or 0.
+_RESERVE_FIRST_FREE_LUA: Final[str] = """
+local ttl = tonumber(ARGV[1])
+for i, key in ipairs(KEYS) do
+    local ok
+    if ttl > 0 then
+        ok = redis.call('SET', key, ARGV[i + 1], 'NX', 'EX', ttl)
+    else
+        ok = redis.call('SET', key, ARGV[i + 1], 'NX')
+    end
+    if ok then
+        return i
+    end
+end
+return 0
+"""
+
+# KEYS: record and guard key pairs; ARGV[1]: TTL in seconds (0 = none),
+# ARGV[i + 1]: value of the i-th record. Returns 1/0 per record.
+_SET_GUARDED_LUA: Final[str] = """
+local ttl = tonumber(ARGV[1])
+local result = {}
+for i = 1, #KEYS / 2 do
+    local key = KEYS[2 * i - 1]
+    if redis.call('EXISTS', KEYS[2 * i]) == 1 then
+        result[i] = 0
+    else
+        if ttl > 0 then
+            redis.call('SET', key, ARGV[i + 1], 'EX', ttl)
+        else
+            redis.call('SET', key, ARGV[i + 1])
+        end
+        result[i] = 1
+    end
+end
+return result
+"""
+
+# KEYS: keys to replace; ARGV[1]: TTL in seconds (0 = none), ARGV[2]:
+# expected current value, ARGV[i + 2]: new value for KEYS[i]. Returns 1/0
+# per key.
+_SET_IF_EQUALS_LUA: Final[str] = """
+local ttl = tonumber(ARGV[1])
+local result = {}
+for i, key in ipairs(KEYS) do
+    if redis.call('GET', key) == ARGV[2] then
+        if ttl > 0 then
+            redis.call('SET', key, ARGV[i + 2], 'EX', ttl)
+        else
+            redis.call('SET', key, ARGV[i + 2])
+        end
+        result[i] = 1
+    else
+        result[i] = 0
+    end
+end
+return result
+"""
+
+# KEYS: keys; ARGV[1]: expected value. Returns how many keys were deleted.
+_DELETE_IF_EQUALS_LUA: Final[str] = """
+local deleted = 0
+for _, key in ipairs(KEYS) do
+    if redis.call('GET', key) == ARGV[1] then
+        deleted = deleted + redis.call('DEL', key)
+    end
+end
+return deleted
+"""
+
 
 @final
 @dataclass(frozen=True, slots=True, kw_only=True)
 class RedisCacheClient(CacheProtocol):
+    """
+    JSON cache over Redis that degrades to misses instead of raising.
+
+    With a circuit breaker, commands are not sent while Redis is known to
+    be failing; they fail fast as misses until a probe succeeds.
+    """
+
     client: Redis
     ttl: int | None = None
+    breaker: CircuitBreaker | None = None
+
+    _reserve_script: AsyncScript = field(init=False, repr=False)
+    _set_guarded_script: AsyncScript = field(init=False, repr=False)
+    _set_if_equals_script: AsyncScript = field(init=False, repr=False)
+    _delete_if_equals_script: AsyncScript = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Runs with EVALSHA; redis-py loads the script on the first NOSCRIPT.
+        object.__setattr__(
+            self,
+            "_reserve_script",
+            self.client.register_script(_RESERVE_FIRST_FREE_LUA),
+        )
+        object.__setattr__(
+            self,
+            "_set_guarded_script",
+            self.client.register_script(_SET_GUARDED_LUA),
+        )
+        object.__setattr__(
+            self,
+            "_set_if_equals_script",
+            self.client.register_script(_SET_IF_EQUALS_LUA),
+        )
+        object.__setattr__(
+            self,
+            "_delete_if_equals_script",
+            self.client.register_script(_DELETE_IF_EQUALS_LUA),
+        )
+
+    def is_available(self) -> bool:
+        return self.breaker is None or not self.breaker.is_open()
 
     async def get(self, key: str) -> dict[str, Any] | None:
         """Get a value by key and deserialize JSON."""
         try:
-            value = await self.client.get(key)
+            value = await self._run(self.client.get(key))
             if value is None:
                 return None
             return json.loads(value)
@@ -30,6 +143,126 @@ class RedisCacheClient(CacheProtocol):
             logger.error("Redis get operation failed", key=key, error=str(e))
             return None
 
+    async def get_many(
+        self,
+        keys: Sequence[str],
+    ) -> list[dict[str, Any] | None]:
+        """Get several values with one MGET; failures read as misses."""
+        if not keys:
+            return []
+
+        try:
+            values = await self._run(self.client.mget(keys))
+        except redis.exceptions.RedisError as e:
+            logger.error(
+                "Redis mget operation failed",
+                keys=len(keys),
+                error=str(e),
+            )
+            return [None] * len(keys)
+
+        result: list[dict[str, Any] | None] = []
+        for key, value in zip(keys, values, strict=True):
+            try:
+                result.append(json.loads(value) if value is not None else None)
+            except json.JSONDecodeError as e:
+                logger.error(
+                    "Redis mget value is invalid",
+                    key=key,
+                    error=str(e),
+                )
+                result.append(None)
+        return result
+
+    async def set_many(
+        self,
+        items: Mapping[str, dict[str, Any]],
+        ttl: int | None = None,
+    ) -> bool:
+        """Set several values in one pipelined round trip."""
+        if not items:
+            return True
+
+        expire = ttl or self.ttl
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    serialized = json.dumps(value)
+                    if expire:
+                        pipe.setex(key, expire, serialized)
+                    else:
+                        pipe.set(key, serialized)
+                await self._run(pipe.execute())
+            return True
+        except (redis.exceptions.RedisError, TypeError, ValueError) as e:
+            logger.error(
+                "Redis set_many operation failed",
+                keys=len(items),
+                error=str(e),
+            )
+            return False
+
+    async def set_many_guarded(
+        self,
+        items: Mapping[str, dict[str, Any]],
+        guards: Sequence[str],
+        ttl: int | None = None,
+    ) -> list[bool]:
+        """Set keys whose guard key is absent, with one EVALSHA."""
+        if not items:
+            return []
+
+        expire = ttl or self.ttl
+        try:
+            keys = [
+                key for pair in zip(items, guards, strict=True) for key in pair
+            ]
+            values = [json.dumps(value) for value in items.values()]
+            results = await self._run(
+                self._set_guarded_script(
+                    keys=keys,
+                    args=[expire or 0, *values],
+                ),
+            )
+            return [bool(ok) for ok in results]
+        except (redis.exceptions.RedisError, TypeError, ValueError) as e:
+            logger.error(
+                "Redis set_many_guarded operation failed",
+                keys=len(items),
+                error=str(e),
+            )
+            return [False] * len(items)
+
+    async def set_many_if_equals(
+        self,
+        items: Mapping[str, dict[str, Any]],
+        expected: dict[str, Any],
+        ttl: int | None = None,
+    ) -> list[bool]:
+        """Compare-and-set several keys with one EVALSHA."""
+        if not items:
+            return []
+
+        expire = ttl or self.ttl
+        try:
+            # Serialized like `set_nx_many` writes it, so equal JSON matches.
+            current = json.dumps(expected, ensure_ascii=False)
+            values = [json.dumps(value) for value in items.values()]
+            results = await self._run(
+                self._set_if_equals_script(
+                    keys=list(items),
+                    args=[expire or 0, current, *values],
+                ),
+            )
+            return [bool(ok) for ok in results]
+        except (redis.exceptions.RedisError, TypeError, ValueError) as e:
+            logger.error(
+                "Redis set_many_if_equals operation failed",
+                keys=len(items),
+                error=str(e),
+            )
+            return [False] * len(items)
+
     async def set(
         self,
         key: str,
@@ -46,9 +279,9 @@ class RedisCacheClient(CacheProtocol):
             )
             expire = ttl or self.ttl
             if expire:
-                await self.client.setex(key, expire, serialized)
+                await self._run(self.client.setex(key, expire, serialized))
             else:
-                await self.client.set(key, serialized)
+                await self._run(self.client.set(key, serialized))
             return True
         except (redis.exceptions.RedisError, TypeError, ValueError) as e:
             logger.error(
@@ -62,7 +295,7 @@ class RedisCacheClient(CacheProtocol):
     async def exists(self, key: str) -> bool:
         """Check if key exists in Redis."""
         try:
-            return bool(await self.client.exists(key))
+            return bool(await self._run(self.client.exists(key)))
         except redis.exceptions.RedisError as e:
             logger.error(
                 "Redis exists operation failed",
@@ -74,7 +307,7 @@ class RedisCacheClient(CacheProtocol):
     async def delete(self, key: str) -> bool:
         """Delete a key from Redis."""
         try:
-            return bool(await self.client.delete(key))
+            return bool(await self._run(self.client.delete(key)))
         except redis.exceptions.RedisError as e:
             logger.error(
                 "Redis delete operation failed",
@@ -83,12 +316,73 @@ class RedisCacheClient(CacheProtocol):
             )
             return False
 
+    async def delete_if_equals(self, key: str, value: str) -> bool:
+        """Compare-and-delete with one EVALSHA."""
+        try:
+            return bool(
+                await self._run(
+                    self._delete_if_equals_script(keys=[key], args=[value]),
+                ),
+            )
+        except redis.exceptions.RedisError as e:
+            logger.error(
+                "Redis delete_if_equals operation failed",
+                key=key,
+                error=str(e),
+            )
+            return False
+
+    async def delete_many_if_equals(
+        self,
+        keys: Sequence[str],
+        value: dict[str, Any] | str,
+    ) -> int:
+        """Compare-and-delete several keys with one EVALSHA."""
+        if not keys:
+            return 0
+
+        try:
+            # Serialized like `set_nx_many` writes it, so equal JSON matches.
+            expected = (
+                json.dumps(value, ensure_ascii=False)
+                if isinstance(value, dict)
+                else value
+            )
+            return await self._run(
+                self._delete_if_equals_script(
+                    keys=list(keys),
+                    args=[expected],
+                ),
+            )
+        except (redis.exceptions.RedisError, TypeError, ValueError) as e:
+            logger.error(
+                "Redis delete_many_if_equals operation failed",
+                keys=len(keys),
+                error=str(e),
+            )
+            return 0
+
+    async def delete_many(self, keys: Sequence[str]) -> int:
+        """Delete several keys in one round trip."""
+        if not keys:
+            return 0
+
+        try:
+            return await self._run(self.client.delete(*keys))
+        except redis.exceptions.RedisError as e:
+            logger.error(
+                "Redis delete_many operation failed",
+                keys=len(keys),
+                error=str(e),
+            )
+            return 0
+
     async def clear(self, pattern: str) -> int:
         """Delete all keys matching a pattern."""
         try:
-            keys = [key async for key in self.client.scan_iter(match=pattern)]
+            keys = await self._run(self._scan(pattern))
             if keys:
-                deleted_count = await self.client.delete(*keys)
+                deleted_count = await self._run(self.client.delete(*keys))
                 logger.info(
                     "Cleared keys matching pattern",
                     pattern=pattern,
@@ -104,6 +398,9 @@ class RedisCacheClient(CacheProtocol):
             )
             return 0
 
+    async def _scan(self, pattern: str) -> list[bytes]:
+        return [key async for key in self.client.scan_iter(match=pattern)]
+
     async def close(self) -> None:
         """Close the Redis connection."""
         try:
@@ -126,11 +423,13 @@ class RedisCacheClient(CacheProtocol):
             )
             expire = ttl_seconds if ttl_seconds is not None else self.ttl
 
-            ok = await self.client.set(
-                key,
-                serialized,
-                nx=True,
-                ex=expire,
+            ok = await self._run(
+                self.client.set(
+                    key,
+                    serialized,
+                    nx=True,
+                    ex=expire,
+                ),
             )
             return bool(ok)
         except (redis.exceptions.RedisError, TypeError, ValueError) as e:
@@ -140,3 +439,104 @@ class RedisCacheClient(CacheProtocol):
                 error=str(e),
             )
             return False
+
+    async def set_nx_many(
+        self,
+        items: Mapping[str, dict[str, Any] | str],
+        ttl_seconds: int | None = None,
+    ) -> list[bool]:
+        """SETNX several keys in one pipelined round trip."""
+        if not items:
+            return []
+
+        expire = ttl_seconds if ttl_seconds is not None else self.ttl
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    serialized = (
+                        json.dumps(value, ensure_ascii=False)
+                        if isinstance(value, dict)
+                        else str(value)
+                    )
+                    pipe.set(key, serialized, nx=True, ex=expire)
+                results = await self._run(pipe.execute())
+            return [bool(ok) for ok in results]
+        except (redis.exceptions.RedisError, TypeError, ValueError) as e:
+            logger.error(
+                "Redis set_nx_many operation failed",
+                keys=len(items),
+                error=str(e),
+            )
+            return [False] * len(items)
+
+    async def reserve_first_free(
+        self,
+        items: Mapping[str, dict[str, Any] | str],
+        ttl_seconds: int | None = None,
+    ) -> str | None:
+        """Claim the first free key of `items` with one EVALSHA."""
+        if not items:
+            return None
+
+        keys = list(items)
+        expire = ttl_seconds if ttl_seconds is not None else self.ttl
+        try:
+            values = [
+                json.dumps(value, ensure_ascii=False)
+                if isinstance(value, dict)
+                else str(value)
+                for value in items.values()
+            ]
+            index = await self._run(
+                self._reserve_script(keys=keys, args=[expire or 0, *values]),
+            )
+        except (redis.exceptions.RedisError, TypeError, ValueError) as e:
+            logger.error(
+                "Redis reserve_first_free operation failed",
+                keys=len(keys),
+                error=str(e),
+            )
+            return None
+
+        return keys[index - 1] if index else None
+
+    async def publish(self, channel: str, message: str) -> int:
+        """Publish a message to a pub/sub channel."""
+        try:
+            return await self._run(self.client.publish(channel, message))
+        except redis.exceptions.RedisError as e:
+            logger.error(
+                "Redis publish operation failed",
+                channel=channel,
+                error=str(e),
+            )
+            return 0
+
+    async def _run[T](self, command: Awaitable[T]) -> T:
+        """Await a Redis command through the circuit breaker."""
+        if self.breaker is None:
+            return await command
+
+        if not self.breaker.allow():
+            # Close the unawaited coroutine so it is not reported as such.
+            if callable(close := getattr(command, "close", None)):
+                close()
+            raise CircuitOpenError("Redis circuit breaker is open")
+
+        try:
+            result = await command
+        except redis.exceptions.RedisError:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            # Cancelled or broken locally: say nothing about Redis, but do
+            # not keep a half-open probe claimed forever.
+            self.breaker.release_probe()
+            raise
+
+        self.breaker.record_success()
+        return result
+
+
+class CircuitOpenError(redis.exceptions.ConnectionError):
+    """Raised instead of sending a command while the breaker is open."""
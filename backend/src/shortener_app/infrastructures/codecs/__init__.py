@@ -2,10 +2,14 @@ __all__ = (
     "PublishUrlJsonCodec",
     "UrlCacheRedisHashCodec",
     "UrlClickedJsonCodec",
+    "UrlResolveRedisHashCodec",
 )
 
 from shortener_app.infrastructures.codecs.broker import (
     PublishUrlJsonCodec,
     UrlClickedJsonCodec,
 )
-from shortener_app.infrastructures.codecs.cache import UrlCacheRedisHashCodec
+from shortener_app.infrastructures.codecs.cache import (
+    UrlCacheRedisHashCodec,
+    UrlResolveRedisHashCodec,
+)
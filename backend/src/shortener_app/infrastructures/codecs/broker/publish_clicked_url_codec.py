@@ -17,6 +17,7 @@ class UrlClickedJsonCodec(DtoCodecProtocol[UrlClickedEventDTO, bytes]):
         payload = {
             "key": dto.key,
             "event_id": str(dto.event_id),
+            "count": dto.count,
         }
         return json.dumps(
             payload,
@@ -29,4 +30,5 @@ class UrlClickedJsonCodec(DtoCodecProtocol[UrlClickedEventDTO, bytes]):
         return UrlClickedEventDTO(
             key=data["key"],
             event_id=UUID(data["event_id"]),
+            count=int(data.get("count", 1)),
         )
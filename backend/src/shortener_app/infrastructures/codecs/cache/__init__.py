@@ -1,5 +1,11 @@
-__all__ = ("UrlCacheRedisHashCodec",)
+__all__ = (
+    "UrlCacheRedisHashCodec",
+    "UrlResolveRedisHashCodec",
+)
 
 from shortener_app.infrastructures.codecs.cache.url_redis_hash_codec import (
     UrlCacheRedisHashCodec,
 )
+from shortener_app.infrastructures.codecs.cache.url_resolve_codec import (
+    UrlResolveRedisHashCodec,
+)
@@ -0,0 +1,34 @@
+__all__ = ("UrlResolveRedisHashCodec",)
+
+from dataclasses import dataclass
+
+from shortener_app.application.dtos.urls.urls_cache import UrlResolveDTO
+from shortener_app.application.interfaces.dto_codec import DtoCodecProtocol
+
+
+@dataclass(frozen=True, slots=True)
+class UrlResolveRedisHashCodec(
+    DtoCodecProtocol[UrlResolveDTO, dict[str, str]],
+):
+    """
+    Infrastructure codec: UrlResolveDTO <-> Redis HASH representation.
+
+    Reads records written by UrlCacheRedisHashCodec, picking only the
+    fields a redirect needs; `user_id` and `name` are left unparsed.
+    Encoded records lack the owner and must not be stored as cache
+    records.
+    """
+
+    def encode(self, dto: UrlResolveDTO) -> dict[str, str]:
+        return {
+            "key": dto.key,
+            "target_url": dto.target_url,
+            "is_active": "1" if dto.is_active else "0",
+        }
+
+    def decode(self, raw: dict[str, str]) -> UrlResolveDTO:
+        return UrlResolveDTO(
+            key=raw["key"],
+            target_url=raw["target_url"],
+            is_active=raw.get("is_active", "0") == "1",
+        )
@@ -2,9 +2,19 @@ __all__ = (
     "SQLAlchemyRepository",
     "engine_factory",
     "get_session_factory",
+    "iter_hot_urls",
+    "iter_url_keys",
+    "PostgresKeySequence",
     "UnitOfWork",
 )
 
+from shortener_app.infrastructures.db.key_scan import (
+    iter_hot_urls,
+    iter_url_keys,
+)
+from shortener_app.infrastructures.db.key_sequence import (
+    PostgresKeySequence,
+)
 from shortener_app.infrastructures.db.repository import SQLAlchemyRepository
 from shortener_app.infrastructures.db.session import (
     engine_factory,
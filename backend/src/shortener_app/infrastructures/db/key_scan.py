@@ -0,0 +1,86 @@
+__all__ = (
+    "iter_hot_urls",
+    "iter_url_keys",
+)
+
+from collections.abc import AsyncIterator
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from shortener_app.domain.entities.url import UrlEntity
+from shortener_app.infrastructures.db.mappers.url_db_mapper import UrlDBMapper
+from shortener_app.infrastructures.db.models import Urls
+
+
+async def iter_url_keys(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    batch_size: int = 10_000,
+) -> AsyncIterator[str]:
+    """
+    Yield every stored short key using keyset pagination over `urls.id`.
+
+    Each page runs in its own short session so a full scan never holds a
+    long-lived transaction open.
+    """
+    last_id = 0
+
+    while True:
+        stmt = (
+            select(Urls.id, Urls.key)
+            .where(Urls.id > last_id)
+            .order_by(Urls.id)
+            .limit(batch_size)
+        )
+
+        async with session_factory() as session:
+            rows = (await session.execute(stmt)).all()
+
+        if not rows:
+            return
+
+        for _, key in rows:
+            yield key
+
+        last_id = rows[-1][0]
+
+
+async def iter_hot_urls(
+    session_factory: async_sessionmaker[AsyncSession],
+    *,
+    limit: int,
+    batch_size: int = 1_000,
+) -> AsyncIterator[list[UrlEntity]]:
+    """
+    Yield up to `limit` active URLs, most clicked first, in pages.
+
+    Pages continue from the last (clicks_count, id) seen rather than using
+    OFFSET, so every page is an index range scan on `ix_urls_clicks_count_id`
+    however deep the scan goes. Ties on clicks_count are broken by the most
+    recently created row.
+    """
+    mapper = UrlDBMapper()
+    cursor: tuple[int, int] | None = None
+    remaining = limit
+
+    while remaining > 0:
+        stmt = (
+            select(Urls)
+            .where(Urls.is_active.is_(True))
+            .order_by(Urls.clicks_count.desc(), Urls.id.desc())
+            .limit(min(batch_size, remaining))
+        )
+        if cursor is not None:
+            stmt = stmt.where(tuple_(Urls.clicks_count, Urls.id) < cursor)
+
+        async with session_factory() as session:
+            models = (await session.scalars(stmt)).all()
+
+        if not models:
+            return
+
+        yield [mapper.to_entity(model) for model in models]
+
+        remaining -= len(models)
+        cursor = (models[-1].clicks_count, models[-1].id)
@@ -0,0 +1,48 @@
+__all__ = ("PostgresKeySequence",)
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from shortener_app.application.interfaces.key_sequence import (
+    KeySequenceProtocol,
+)
+from shortener_app.infrastructures.db.models import url_key_sequence
+
+
+class PostgresKeySequence(KeySequenceProtocol):
+    """
+    Key sequence backed by the `url_key_seq` Postgres sequence.
+
+    A lease draws `count` values with one `setval(nextval + count - 1)`
+    round trip. The statement runs under a transaction-scoped advisory
+    lock, so concurrent leases never interleave and every block is
+    contiguous. Sequences are non-transactional: a lease is never handed
+    out twice, even if the caller fails before using it.
+    """
+
+    # Arbitrary application-wide id for pg_advisory_xact_lock
+    _LOCK_ID = 0x75726C6B
+
+    def __init__(
+        self,
+        *,
+        session_factory: async_sessionmaker[AsyncSession],
+    ) -> None:
+        self._session_factory = session_factory
+
+    async def lease(self, *, count: int) -> range:
+        if count <= 0:
+            raise ValueError("count must be > 0")
+
+        async with self._session_factory() as session, session.begin():
+            await session.execute(
+                select(func.pg_advisory_xact_lock(self._LOCK_ID)),
+            )
+            first = await session.scalar(select(url_key_sequence.next_value()))
+            await session.execute(
+                select(
+                    func.setval(url_key_sequence.name, first + count - 1),
+                ),
+            )
+
+        return range(first, first + count)
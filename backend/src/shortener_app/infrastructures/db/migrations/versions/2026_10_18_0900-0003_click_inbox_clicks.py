@@ -0,0 +1,27 @@
+"""click_inbox_clicks
+
+Revision ID: 0003_click_inbox_clicks
+Revises: 0002_click_inbox
+Create Date: 2026-10-18 09:00:00.000000+00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003_click_inbox_clicks"
+down_revision = "0002_click_inbox"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "click_inbox",
+        sa.Column("clicks", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("click_inbox", "clicks")
@@ -0,0 +1,27 @@
+"""urls_clicks_count_index
+
+Revision ID: 0004_urls_clicks_count_index
+Revises: 0003_click_inbox_clicks
+Create Date: 2026-10-18 10:00:00.000000+00:00
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004_urls_clicks_count_index"
+down_revision = "0003_click_inbox_clicks"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_urls_clicks_count_id",
+        "urls",
+        ["clicks_count", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_urls_clicks_count_id", table_name="urls")
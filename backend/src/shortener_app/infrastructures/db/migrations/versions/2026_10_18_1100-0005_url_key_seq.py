@@ -0,0 +1,28 @@
+"""url_key_seq
+
+Revision ID: 0005_url_key_seq
+Revises: 0004_urls_clicks_count_index
+Create Date: 2026-10-18 11:00:00.000000+00:00
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0005_url_key_seq"
+down_revision = "0004_urls_clicks_count_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        sa.schema.CreateSequence(
+            sa.Sequence("url_key_seq", start=0, minvalue=0),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.execute(sa.schema.DropSequence(sa.Sequence("url_key_seq")))
@@ -2,8 +2,9 @@ __all__ = (
     "Base",
     "ClickInbox",
     "Urls",
+    "url_key_sequence",
 )
 
 from shortener_app.infrastructures.db.models.base import Base
 from shortener_app.infrastructures.db.models.click_inbox import ClickInbox
-from shortener_app.infrastructures.db.models.urls import Urls
+from shortener_app.infrastructures.db.models.urls import Urls, url_key_sequence
@@ -3,7 +3,7 @@ __all__ = ("ClickInbox",)
 from datetime import datetime
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, Integer, String, func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -24,6 +24,12 @@ class ClickInbox(Base):
         doc="The URL key.",
         nullable=False,
     )
+    clicks: Mapped[int] = mapped_column(
+        Integer,
+        doc="Clicks carried by the event (pre-aggregated per key).",
+        nullable=False,
+        server_default="1",
+    )
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -1,10 +1,13 @@
-__all__ = ("Urls",)
+__all__ = (
+    "Urls",
+    "url_key_sequence",
+)
 
 from datetime import datetime
 from typing import Annotated
 from uuid import UUID, uuid4
 
-from sqlalchemy import DateTime, String
+from sqlalchemy import DateTime, Index, Sequence, String
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -13,11 +16,23 @@ from shortener_app.infrastructures.db.models.base import Base
 
 int_pk = Annotated[int, mapped_column(primary_key=True, autoincrement=True)]
 
+# Source of sequence-allocated short keys (see PostgresKeySequence)
+url_key_sequence = Sequence(
+    "url_key_seq",
+    start=0,
+    minvalue=0,
+    metadata=Base.metadata,
+)
+
 
 class Urls(Base):
     """A model class for storing shortened URLs."""
 
     __tablename__ = "urls"
+    __table_args__ = (
+        # Keyset scan of the hottest URLs for cache warm-up
+        Index("ix_urls_clicks_count_id", "clicks_count", "id"),
+    )
     repr_cols_num = 5
 
     id: Mapped[int_pk] = mapped_column(doc="The primary key of the model.")
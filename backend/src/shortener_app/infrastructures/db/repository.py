@@ -1,15 +1,18 @@
 __all__ = ("SQLAlchemyRepository",)
 
 from collections import Counter
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
 from datetime import datetime
-from typing import TypeVar, final
+from typing import final
 from uuid import UUID
 
 import structlog
 from sqlalchemy import (
     Integer,
     String,
+    any_,
+    bindparam,
     column,
     delete,
     func,
@@ -18,7 +21,7 @@ from sqlalchemy import (
     update,
     values,
 )
-from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from shortener_app.application.interfaces import RepositoryProtocol
@@ -27,22 +30,20 @@ from shortener_app.infrastructures.db.mappers.url_db_mapper import UrlDBMapper
 from shortener_app.infrastructures.db.models import Urls
 from shortener_app.infrastructures.db.models.click_inbox import ClickInbox
 
-ModelType = TypeVar("ModelType", bound=Urls)
-
 logger = structlog.get_logger(__name__)
 
 
 @final
 @dataclass(frozen=True, slots=True, kw_only=True)
 class SQLAlchemyRepository(RepositoryProtocol):
-    model: ModelType = Urls
+    model: type[Urls] = Urls
     mapper: UrlDBMapper
     session: AsyncSession
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__} for model: {self.model}"
 
-    async def get(  # type: ignore
+    async def get(
         self,
         *,
         reference: dict[str, str | int | UUID],
@@ -55,7 +56,28 @@ class SQLAlchemyRepository(RepositoryProtocol):
 
         return None
 
-    async def get_all(  # type: ignore
+    async def get_by_keys(
+        self,
+        *,
+        keys: Sequence[str],
+    ) -> list[UrlEntity]:
+        if not keys:
+            return []
+
+        # One array parameter keeps a single prepared statement for any
+        # number of keys, unlike an expanded IN (...) list.
+        _statement = select(self.model).where(
+            self.model.key
+            == any_(bindparam("keys", list(keys), type_=ARRAY(String))),
+        )
+        statement_result = await self.session.execute(statement=_statement)
+
+        return [
+            self.mapper.to_entity(model=db_model)
+            for db_model in statement_result.scalars()
+        ]
+
+    async def get_all(
         self,
         *,
         reference: dict[str, str | int | UUID],
@@ -85,7 +107,7 @@ class SQLAlchemyRepository(RepositoryProtocol):
         _statement = insert(self.model).values(**data)
         await self.session.execute(statement=_statement)
 
-    async def add_bulk(  # type: ignore
+    async def add_bulk(
         self,
         *,
         entities: list[UrlEntity],
@@ -103,7 +125,7 @@ class SQLAlchemyRepository(RepositoryProtocol):
 
         await self.session.execute(stmt)
 
-    async def update(  # type: ignore
+    async def update(
         self,
         *,
         entity: UrlEntity,
@@ -119,7 +141,7 @@ class SQLAlchemyRepository(RepositoryProtocol):
         )
         await self.session.execute(_statement)
 
-    async def delete(  # type: ignore
+    async def delete(
         self,
         *,
         entity: UrlEntity,
@@ -127,36 +149,46 @@ class SQLAlchemyRepository(RepositoryProtocol):
         _statement = delete(self.model).where(self.model.key == entity.key)
         await self.session.execute(_statement)
 
-    async def apply_click_events(  # type: ignore
+    async def apply_click_events(
         self,
         *,
-        events: list[tuple[UUID, str]],
+        events: list[tuple[UUID, str, int]],
     ) -> int:
         if not events:
             return 0
 
         rows = [
-            {"event_id": event_id, "url_key": key} for event_id, key in events
+            {"event_id": event_id, "url_key": key, "clicks": clicks}
+            for event_id, key, clicks in events
         ]
 
         stmt_ins = (
             pg_insert(ClickInbox)
             .values(rows)
             .on_conflict_do_nothing(index_elements=[ClickInbox.event_id])
-            .returning(ClickInbox.url_key)
+            .returning(ClickInbox.url_key, ClickInbox.clicks)
         )
         stmt_result = await self.session.execute(stmt_ins)
-        inserted_keys = list(stmt_result.scalars().all())
+        inserted = stmt_result.all()
 
-        if not inserted_keys:
+        if not inserted:
             return 0
 
-        increments = Counter(inserted_keys)
+        increments: Counter[str] = Counter()
+        for key, clicks in inserted:
+            increments[key] += clicks
 
         await self._increment_clicks_batch(increments=increments)
-        return len(inserted_keys)
+        return len(inserted)
+
+    async def increment_clicks(
+        self,
+        *,
+        increments: Mapping[str, int],
+    ) -> None:
+        await self._increment_clicks_batch(increments=Counter(increments))
 
-    async def _increment_clicks_batch(  # type: ignore
+    async def _increment_clicks_batch(
         self,
         *,
         increments: Counter[str],
@@ -5,7 +5,7 @@ from types import TracebackType
 from typing import Self, final
 
 import structlog
-from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from shortener_app.application.interfaces import (
     RepositoryProtocol,
@@ -18,14 +18,22 @@ logger = structlog.get_logger(__name__)
 @final
 @dataclass(slots=True, kw_only=True)
 class UnitOfWork(UnitOfWorkProtocol):
+    """
+    Transaction boundary over a request-scoped session.
+
+    The transaction is opened lazily by the session's autobegin on the first
+    statement, so a unit of work that never touches the repository (e.g. a
+    redirect served from cache) never checks a connection out of the pool.
+
+    With `close_session`, the unit of work owns its session and closes it
+    on exit, returning the connection to the pool.
+    """
+
     session: AsyncSession
     url_repository: RepositoryProtocol
-
-    tx: AsyncSessionTransaction | None = None
+    close_session: bool = False
 
     async def __aenter__(self) -> Self:
-        logger.debug("Starting database transaction")
-        self.tx = await self.session.begin()
         return self
 
     async def __aexit__(
@@ -34,24 +42,26 @@ class UnitOfWork(UnitOfWorkProtocol):
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        if exc_type is not None:
-            logger.warning("Rollback transaction due to error")
-            await self.rollback()
-
-        self.tx = None
+        try:
+            if exc_type is not None:
+                logger.warning("Rollback transaction due to error")
+                await self.rollback()
+        finally:
+            if self.close_session:
+                await self.session.close()
 
     async def commit(self) -> None:
-        if self.tx is None:
-            raise RuntimeError("Transaction is not started")
+        if not self.session.in_transaction():
+            return
 
         logger.debug("Committing transaction")
-        await self.tx.commit()
+        await self.session.commit()
         logger.debug("Transaction committed successfully")
 
     async def rollback(self) -> None:
-        if self.tx is None:
+        if not self.session.in_transaction():
             return
 
         logger.debug("Rolling back transaction")
-        await self.tx.rollback()
+        await self.session.rollback()
         logger.debug("Transaction rolled back successfully")
@@ -0,0 +1,118 @@
+__all__ = (
+    "CreateBatchOptions",
+    "MicroBatchOptions",
+    "chunked",
+    "micro_batches",
+)
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator
+from dataclasses import dataclass
+from typing import Final, final
+
+_END: Final[object] = object()
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class MicroBatchOptions:
+    max_size: int = 100
+    window_sec: float = 0.002
+    max_pending: int = 1000
+
+
+@final
+@dataclass(frozen=True, slots=True, kw_only=True)
+class CreateBatchOptions:
+    max_size: int = 1000
+    max_stream_items: int = 10_000
+
+
+async def chunked[T](
+    source: AsyncIterable[T],
+    *,
+    size: int,
+) -> AsyncIterator[list[T]]:
+    """Group items of a stream into lists of `size`; the last may be less."""
+    chunk: list[T] = []
+    async for item in source:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def micro_batches[T](
+    source: AsyncIterable[T],
+    *,
+    max_size: int,
+    window_sec: float,
+    max_pending: int,
+) -> AsyncGenerator[list[T]]:
+    """
+    Group items of a stream into small batches.
+
+    A batch is emitted once it holds `max_size` items or `window_sec` has
+    passed since its first item. Items are read ahead into a buffer of at
+    most `max_pending`; while the consumer is busy (e.g. writing to a slow
+    client) and the buffer is full, the source is not read, so transport
+    flow control pushes back on the sender instead of memory growing.
+    Errors raised by the source are re-raised after the last batch.
+    """
+    loop = asyncio.get_running_loop()
+    buffer: asyncio.Queue[object] = asyncio.Queue(maxsize=max_pending)
+
+    async def pump() -> None:
+        # Not in `finally`: once cancelled, nobody drains a full buffer.
+        try:
+            async for item in source:
+                await buffer.put(item)
+        except Exception:
+            await buffer.put(_END)
+            raise
+        await buffer.put(_END)
+
+    reader = asyncio.create_task(pump())
+
+    try:
+        finished = False
+        while not finished:
+            first = await buffer.get()
+            if first is _END:
+                break
+
+            batch: list[T] = [first]  # type: ignore[list-item]
+            deadline = loop.time() + window_sec
+
+            while len(batch) < max_size:
+                try:
+                    item = buffer.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(
+                            buffer.get(),
+                            timeout=remaining,
+                        )
+                    except TimeoutError:
+                        break
+
+                if item is _END:
+                    finished = True
+                    break
+                batch.append(item)  # type: ignore[arg-type]
+
+            yield batch
+
+        await reader
+    finally:
+        if not reader.done():
+            reader.cancel()
+            try:
+                await reader
+            except asyncio.CancelledError:
+                pass
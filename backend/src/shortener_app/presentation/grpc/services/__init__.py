@@ -8,8 +8,10 @@ from dataclasses import dataclass
 
 import grpc
 
+from shortener_app.generated.admin.v1 import admin_pb2_grpc
 from shortener_app.generated.shortener.v1 import shortener_pb2_grpc
 from shortener_app.generated.user_urls.v1 import user_urls_pb2_grpc
+from shortener_app.presentation.grpc.services.admin import AdminGrpcService
 from shortener_app.presentation.grpc.services.shortener import (
     ShortenerGrpcService,
 )
@@ -36,4 +38,9 @@ GRPC_SERVICES: Sequence[GrpcServiceDefinition] = (
         servicer_cls=UserUrlsGrpcService,
         service_name="user_urls.v1.UserUrlsService",
     ),
+    GrpcServiceDefinition(
+        register=admin_pb2_grpc.add_AdminServiceServicer_to_server,
+        servicer_cls=AdminGrpcService,
+        service_name="admin.v1.AdminService",
+    ),
 )
@@ -0,0 +1,32 @@
+__all__ = ("AdminGrpcService",)
+
+from dataclasses import dataclass
+
+import grpc
+from dishka.integrations.grpcio import FromDishka, inject
+
+from shortener_app.application.use_cases.get_hot_keys import GetHotKeysUseCase
+from shortener_app.generated.admin.v1 import admin_pb2, admin_pb2_grpc
+from shortener_app.presentation.mappers.admin_mapper import (
+    AdminPresentationMapper,
+)
+
+
+@dataclass
+class AdminGrpcService(admin_pb2_grpc.AdminServiceServicer):
+    @inject
+    async def GetHotKeys(
+        self,
+        request: admin_pb2.GetHotKeysRequest,
+        context: grpc.aio.ServicerContext,
+        use_case: FromDishka[GetHotKeysUseCase],
+        mapper: FromDishka[AdminPresentationMapper],
+    ) -> admin_pb2.GetHotKeysResponse:
+        if request.limit < 0:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "limit must be >= 0",
+            )
+
+        hot_keys = await use_case.execute(limit=request.limit)
+        return mapper.to_get_hot_keys_response(hot_keys)
@@ -1,11 +1,28 @@
 __all__ = ("ShortenerGrpcService",)
 
+from collections.abc import AsyncIterator, Sequence
 from dataclasses import dataclass
 from uuid import UUID
 
 import grpc
+import structlog
+from dishka import AsyncContainer
 from dishka.integrations.grpcio import FromDishka, inject
 
+from shortener_app.application.dtos.urls.urls_requests import CreateUrlDTO
+from shortener_app.application.dtos.urls.urls_responses import (
+    CreateUrlResultDTO,
+)
+from shortener_app.application.exceptions.publish import (
+    PublishOverloadedError,
+)
+from shortener_app.application.exceptions.urls import (
+    TooManyKeysError,
+    TooManyUrlsError,
+)
+from shortener_app.application.use_cases.batch_resolve_keys import (
+    BatchResolveKeysUseCase,
+)
 from shortener_app.application.use_cases.create_short_url import (
     CreateUrlUseCase,
 )
@@ -18,8 +35,45 @@ from shortener_app.generated.shortener.v1 import (
     shortener_pb2,
     shortener_pb2_grpc,
 )
+from shortener_app.presentation.grpc.batching import (
+    CreateBatchOptions,
+    MicroBatchOptions,
+    chunked,
+    micro_batches,
+)
 from shortener_app.presentation.mappers.url_mapper import UrlPresentationMapper
 
+logger = structlog.get_logger(__name__)
+
+# gRPC retry pushback (gRFC A6): clients wait this long before retrying
+_RETRY_PUSHBACK_KEY = "grpc-retry-pushback-ms"
+
+
+def _retry_pushback(error: PublishOverloadedError) -> tuple[tuple[str, str]]:
+    return ((_RETRY_PUSHBACK_KEY, str(int(error.retry_after_sec * 1000))),)
+
+
+def _failed(
+    dtos: Sequence[CreateUrlDTO],
+    *,
+    error: str,
+) -> list[CreateUrlResultDTO]:
+    return [
+        CreateUrlResultDTO(target_url=dto.target_url, error=error)
+        for dto in dtos
+    ]
+
+
+async def _abort_overloaded(
+    context: grpc.aio.ServicerContext,
+    error: PublishOverloadedError,
+) -> None:
+    await context.abort(
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+        str(error),
+        trailing_metadata=_retry_pushback(error),
+    )
+
 
 @dataclass
 class ShortenerGrpcService(shortener_pb2_grpc.ShortenerServiceServicer):
@@ -32,14 +86,91 @@ class ShortenerGrpcService(shortener_pb2_grpc.ShortenerServiceServicer):
         mapper: FromDishka[UrlPresentationMapper],
         use_case: FromDishka[CreateUrlUseCase],
     ) -> shortener_pb2.CreateShortUrlResponse:
-        result = await use_case.execute(
-            dto=mapper.to_create_url_dto(
-                request,
-                user_id=x_user_id,
-            ),
-        )
+        try:
+            result = await use_case.execute(
+                dto=mapper.to_create_url_dto(
+                    request,
+                    user_id=x_user_id,
+                ),
+            )
+        except PublishOverloadedError as e:
+            await _abort_overloaded(context, e)
+
         return mapper.to_create_short_url_response(result)
 
+    @inject
+    async def CreateShortUrls(
+        self,
+        request: shortener_pb2.CreateShortUrlsRequest,
+        context: grpc.aio.ServicerContext,
+        x_user_id: FromDishka[UUID],
+        mapper: FromDishka[UrlPresentationMapper],
+        use_case: FromDishka[CreateUrlUseCase],
+    ) -> shortener_pb2.CreateShortUrlsResponse:
+        try:
+            results = await use_case.execute_many(
+                dtos=mapper.to_create_url_dtos(
+                    request.items,
+                    user_id=x_user_id,
+                ),
+            )
+        except TooManyUrlsError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        except PublishOverloadedError as e:
+            await _abort_overloaded(context, e)
+
+        return mapper.to_create_short_urls_response(results)
+
+    @inject
+    async def StreamCreateShortUrls(
+        self,
+        request_iterator: AsyncIterator[shortener_pb2.CreateShortUrlRequest],
+        context: grpc.aio.ServicerContext,
+        container: FromDishka[AsyncContainer],
+        options: FromDishka[CreateBatchOptions],
+        mapper: FromDishka[UrlPresentationMapper],
+    ) -> shortener_pb2.CreateShortUrlsResponse:
+        # Like ResolveKeys, each chunk gets its own REQUEST scope. Earlier
+        # chunks are already created when a later one fails, so a failure
+        # fails its own chunk per item and the response is still sent; the
+        # client resends what is missing from it.
+        results: list[CreateUrlResultDTO] = []
+
+        async for chunk in chunked(request_iterator, size=options.max_size):
+            async with container() as request_container:
+                user_id = await request_container.get(UUID)
+                dtos = mapper.to_create_url_dtos(chunk, user_id=user_id)
+                # One response holds every result, so the stream is capped;
+                # nothing past the chunk that reaches the cap is read.
+                room = max(options.max_stream_items - len(results), 0)
+                accepted, rejected = dtos[:room], dtos[room:]
+                try:
+                    if accepted:
+                        use_case = await request_container.get(
+                            CreateUrlUseCase,
+                        )
+                        results.extend(
+                            await use_case.execute_many(dtos=accepted),
+                        )
+                except PublishOverloadedError as e:
+                    results.extend(_failed(accepted, error=str(e)))
+                    context.set_trailing_metadata(_retry_pushback(e))
+                except Exception:
+                    logger.exception(
+                        "Stream chunk failed",
+                        items=len(accepted),
+                    )
+                    results.extend(_failed(accepted, error="internal error"))
+                    break
+
+            if rejected:
+                results.extend(
+                    _failed(rejected, error="stream item limit reached"),
+                )
+                break
+
+        return mapper.to_create_short_urls_response(results)
+
     @inject
     async def ResolveKey(
         self,
@@ -52,6 +183,48 @@ class ShortenerGrpcService(shortener_pb2_grpc.ShortenerServiceServicer):
             await use_case.execute(key=request.key),
         )
 
+    @inject
+    async def BatchResolveKeys(
+        self,
+        request: shortener_pb2.BatchResolveKeysRequest,
+        context: grpc.aio.ServicerContext,
+        use_case: FromDishka[BatchResolveKeysUseCase],
+        mapper: FromDishka[UrlPresentationMapper],
+    ) -> shortener_pb2.BatchResolveKeysResponse:
+        try:
+            results = await use_case.execute(keys=list(request.keys))
+        except TooManyKeysError as e:
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+
+        return mapper.to_batch_resolve_keys_response(results)
+
+    @inject
+    async def ResolveKeys(
+        self,
+        request_iterator: AsyncIterator[shortener_pb2.ResolveKeysRequest],
+        context: grpc.aio.ServicerContext,
+        container: FromDishka[AsyncContainer],
+        options: FromDishka[MicroBatchOptions],
+        mapper: FromDishka[UrlPresentationMapper],
+    ) -> AsyncIterator[shortener_pb2.ResolvedKey]:
+        # Streams run in Dishka's SESSION scope; each micro-batch gets its own
+        # REQUEST scope so a DB session is held only while a batch resolves.
+        keys = (request.key async for request in request_iterator)
+
+        async for batch in micro_batches(
+            keys,
+            max_size=options.max_size,
+            window_sec=options.window_sec,
+            max_pending=options.max_pending,
+        ):
+            async with container() as request_container:
+                use_case = await request_container.get(BatchResolveKeysUseCase)
+                results = await use_case.execute(keys=batch)
+
+            by_key = {result.key: result for result in results}
+            for key in batch:
+                yield mapper.to_resolved_key(by_key[key])
+
     @inject
     async def UpdateUrl(
         self,
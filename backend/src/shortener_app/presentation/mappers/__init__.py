@@ -1,8 +1,12 @@
 __all__ = (
+    "AdminPresentationMapper",
     "UrlPresentationMapper",
     "UserPresentationMapper",
 )
 
+from shortener_app.presentation.mappers.admin_mapper import (
+    AdminPresentationMapper,
+)
 from shortener_app.presentation.mappers.url_mapper import UrlPresentationMapper
 from shortener_app.presentation.mappers.user_mapper import (
     UserPresentationMapper,
@@ -0,0 +1,33 @@
+__all__ = ("AdminPresentationMapper",)
+
+from dataclasses import dataclass
+from typing import final
+
+from shortener_app.application.dtos.urls.urls_responses import HotKeyDTO
+from shortener_app.generated.admin.v1 import admin_pb2
+
+
+@final
+@dataclass(frozen=True, slots=True)
+class AdminPresentationMapper:
+    """
+    Presentation-layer mapper for the Admin gRPC API.
+
+    Converts Application output DTOs into protobuf responses.
+    """
+
+    def to_get_hot_keys_response(
+        self,
+        hot_keys: list[HotKeyDTO],
+    ) -> admin_pb2.GetHotKeysResponse:
+        return admin_pb2.GetHotKeysResponse(
+            keys=[
+                admin_pb2.HotKey(
+                    key=item.key,
+                    count=item.count,
+                    error=item.error,
+                    rate_per_sec=item.rate_per_sec,
+                )
+                for item in hot_keys
+            ],
+        )
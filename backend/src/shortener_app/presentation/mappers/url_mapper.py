@@ -1,5 +1,6 @@
 __all__ = ("UrlPresentationMapper",)
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import final
 from uuid import UUID
@@ -9,7 +10,11 @@ from shortener_app.application.dtos.urls.urls_requests import (
     DeleteUrlDTO,
     UpdateUrlDTO,
 )
-from shortener_app.application.dtos.urls.urls_responses import CreatedUrlDTO
+from shortener_app.application.dtos.urls.urls_responses import (
+    CreatedUrlDTO,
+    CreateUrlResultDTO,
+    ResolvedKeyDTO,
+)
 from shortener_app.generated.shortener.v1 import shortener_pb2
 
 
@@ -42,6 +47,18 @@ class UrlPresentationMapper:
             user_id=user_id,
         )
 
+    def to_create_url_dtos(
+        self,
+        requests: Iterable[shortener_pb2.CreateShortUrlRequest],
+        *,
+        user_id: UUID,
+    ) -> list[CreateUrlDTO]:
+        """Convert CreateShortUrlRequest items into CreateUrlDTOs."""
+        return [
+            self.to_create_url_dto(request, user_id=user_id)
+            for request in requests
+        ]
+
     def to_update_url_dto(
         self,
         request: shortener_pb2.UpdateUrlRequest,
@@ -72,6 +89,15 @@ class UrlPresentationMapper:
             target_url=result.target_url,
         )
 
+    def to_create_short_urls_response(
+        self,
+        results: list[CreateUrlResultDTO],
+    ) -> shortener_pb2.CreateShortUrlsResponse:
+        """Convert per-item creation results into CreateShortUrlsResponse."""
+        return shortener_pb2.CreateShortUrlsResponse(
+            results=[self.to_created_short_url(result) for result in results],
+        )
+
     def to_resolve_key_response(
         self,
         target_url: str,
@@ -79,6 +105,15 @@ class UrlPresentationMapper:
         """Convert a resolved target URL into ResolveKeyResponse."""
         return shortener_pb2.ResolveKeyResponse(target_url=target_url)
 
+    def to_batch_resolve_keys_response(
+        self,
+        results: list[ResolvedKeyDTO],
+    ) -> shortener_pb2.BatchResolveKeysResponse:
+        """Convert per-key resolutions into BatchResolveKeysResponse."""
+        return shortener_pb2.BatchResolveKeysResponse(
+            results=[self.to_resolved_key(result) for result in results],
+        )
+
     def to_update_url_response(
         self,
         ok: bool,
@@ -94,3 +129,41 @@ class UrlPresentationMapper:
         return shortener_pb2.DeleteUrlResponse(
             ok="Ok" if ok else "Error",
         )
+
+    def to_resolved_key(
+        self,
+        result: ResolvedKeyDTO,
+    ) -> shortener_pb2.ResolvedKey:
+        """Convert one key resolution into ResolvedKey."""
+        if result.target_url is None:
+            return shortener_pb2.ResolvedKey(
+                key=result.key,
+                status=shortener_pb2.RESOLVE_STATUS_NOT_FOUND,
+            )
+        if not result.is_active:
+            return shortener_pb2.ResolvedKey(
+                key=result.key,
+                status=shortener_pb2.RESOLVE_STATUS_INACTIVE,
+            )
+        return shortener_pb2.ResolvedKey(
+            key=result.key,
+            status=shortener_pb2.RESOLVE_STATUS_FOUND,
+            target_url=result.target_url,
+        )
+
+    def to_created_short_url(
+        self,
+        result: CreateUrlResultDTO,
+    ) -> shortener_pb2.CreatedShortUrl:
+        """Convert one creation result into CreatedShortUrl."""
+        if result.created is None:
+            return shortener_pb2.CreatedShortUrl(
+                target_url=result.target_url,
+                status=shortener_pb2.CREATE_STATUS_FAILED,
+                error=result.error or "",
+            )
+        return shortener_pb2.CreatedShortUrl(
+            key=result.created.key,
+            target_url=result.created.target_url,
+            status=shortener_pb2.CREATE_STATUS_CREATED,
+        )
@@ -107,7 +107,9 @@ async def test_apply_click_events_increments_clicks_count(session) -> None:
     e2 = uuid4()
 
     async with uow:
-        inserted = await repo.apply_click_events(events=[(e1, key), (e2, key)])
+        inserted = await repo.apply_click_events(
+            events=[(e1, key, 1), (e2, key, 1)],
+        )
         assert inserted == 2
 
     found = await repo.get(reference={"key": key})
@@ -134,10 +136,88 @@ async def test_apply_click_events_ignores_duplicate_event_id(session) -> None:
 
     async with uow:
         inserted = await repo.apply_click_events(
-            events=[(event_id, key), (event_id, key)],
+            events=[(event_id, key, 1), (event_id, key, 1)],
         )
         assert inserted == 1
 
     found = await repo.get(reference={"key": key})
     assert found is not None
     assert found.clicks_count == 1
+
+
+@pytest.mark.asyncio
+async def test_apply_click_events_adds_weighted_counts_once(session) -> None:
+    repo, uow = _make_repo_and_uow(session)
+
+    key = "Ab12Z"
+    entity = UrlEntity.create(
+        user_id=uuid4(),
+        target_url="https://example.com",
+        key=key,
+        name=None,
+    )
+
+    async with uow:
+        await repo.add_bulk(entities=[entity])
+
+    event_id = uuid4()
+
+    async with uow:
+        assert await repo.apply_click_events(events=[(event_id, key, 40)]) == 1
+        assert await repo.apply_click_events(events=[(event_id, key, 40)]) == 0
+
+    found = await repo.get(reference={"key": key})
+    assert found is not None
+    assert found.clicks_count == 40
+
+
+@pytest.mark.asyncio
+async def test_increment_clicks_adds_deltas_per_key(session) -> None:
+    repo, uow = _make_repo_and_uow(session)
+
+    entities = [
+        UrlEntity.create(
+            user_id=uuid4(),
+            target_url="https://example.com",
+            key=key,
+            name=None,
+        )
+        for key in ("Ab12Z", "Cd34Y")
+    ]
+
+    async with uow:
+        await repo.add_bulk(entities=entities)
+
+    async with uow:
+        await repo.increment_clicks(increments={"Ab12Z": 3, "Cd34Y": 5})
+        await repo.increment_clicks(increments={"Ab12Z": 2})
+
+    first = await repo.get(reference={"key": "Ab12Z"})
+    second = await repo.get(reference={"key": "Cd34Y"})
+    assert first is not None
+    assert second is not None
+    assert first.clicks_count == 5
+    assert second.clicks_count == 5
+
+
+@pytest.mark.asyncio
+async def test_get_by_keys_returns_only_existing_keys(session) -> None:
+    repo, uow = _make_repo_and_uow(session)
+
+    entities = [
+        UrlEntity.create(
+            user_id=uuid4(),
+            target_url=f"https://example.com/{key}",
+            key=key,
+            name=None,
+        )
+        for key in ("Ab12Z", "Cd34Y")
+    ]
+
+    async with uow:
+        await repo.add_bulk(entities=entities)
+
+    found = await repo.get_by_keys(keys=["Ab12Z", "Cd34Y", "Miss1"])
+
+    assert sorted(entity.key for entity in found) == ["Ab12Z", "Cd34Y"]
+    assert await repo.get_by_keys(keys=[]) == []
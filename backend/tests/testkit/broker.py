@@ -17,9 +17,13 @@ class FakeMessageBrokerPublisher(MessageBrokerPublisherProtocol):
     publish_update_url_calls: list[UrlClickedEventDTO] = field(
         default_factory=list,
     )
+    publish_update_urls_batch_calls: list[list[UrlClickedEventDTO]] = field(
+        default_factory=list,
+    )
 
     raise_on_publish_new_urls_batch: Exception | None = None
     raise_on_publish_update_url: Exception | None = None
+    raise_on_publish_update_urls_batch: Exception | None = None
 
     async def publish_new_urls_batch(self, dtos: list[PublishUrlDTO]) -> None:
         self.publish_new_urls_batch_calls.append(dtos)
@@ -30,3 +34,11 @@ class FakeMessageBrokerPublisher(MessageBrokerPublisherProtocol):
         self.publish_update_url_calls.append(dto)
         if self.raise_on_publish_update_url is not None:
             raise self.raise_on_publish_update_url
+
+    async def publish_update_urls_batch(
+        self,
+        dtos: list[UrlClickedEventDTO],
+    ) -> None:
+        self.publish_update_urls_batch_calls.append(dtos)
+        if self.raise_on_publish_update_urls_batch is not None:
+            raise self.raise_on_publish_update_urls_batch
@@ -1,3 +1,4 @@
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -11,6 +12,7 @@ class FakeCache:
     store: dict[str, Any] = field(default_factory=dict)
 
     get_calls: list[str] = field(default_factory=list)
+    get_many_calls: list[list[str]] = field(default_factory=list)
     set_calls: list[tuple[str, dict[str, Any], int | None]] = field(
         default_factory=list,
     )
@@ -21,9 +23,12 @@ class FakeCache:
         default_factory=list,
     )
     set_nx_results: list[bool] = field(default_factory=list)
+    reserve_first_free_calls: list[list[str]] = field(default_factory=list)
+    publish_calls: list[tuple[str, str]] = field(default_factory=list)
 
     set_result: bool = True
     raise_on_set: Exception | None = None
+    available: bool = True
 
     async def get(self, key: str) -> dict[str, Any] | None:
         self.get_calls.append(key)
@@ -46,10 +51,71 @@ class FakeCache:
 
         return self.set_result
 
+    async def get_many(
+        self,
+        keys: Sequence[str],
+    ) -> list[dict[str, Any] | None]:
+        self.get_many_calls.append(list(keys))
+        return [
+            val if isinstance(val := self.store.get(key), dict) else None
+            for key in keys
+        ]
+
+    async def set_many(
+        self,
+        items: Mapping[str, dict[str, Any]],
+        ttl: int | None = None,
+    ) -> bool:
+        for key, value in items.items():
+            await self.set(key, value, ttl)
+        return self.set_result
+
+    async def set_many_guarded(
+        self,
+        items: Mapping[str, dict[str, Any]],
+        guards: Sequence[str],
+        ttl: int | None = None,
+    ) -> list[bool]:
+        return [
+            guard not in self.store and await self.set(key, value, ttl)
+            for (key, value), guard in zip(items.items(), guards, strict=True)
+        ]
+
+    async def set_many_if_equals(
+        self,
+        items: Mapping[str, dict[str, Any]],
+        expected: dict[str, Any],
+        ttl: int | None = None,
+    ) -> list[bool]:
+        return [
+            self.store.get(key) == expected and await self.set(key, value, ttl)
+            for key, value in items.items()
+        ]
+
     async def delete(self, key: str) -> bool:
         self.delete_calls.append(key)
         return self.store.pop(key, None) is not None
 
+    async def delete_if_equals(self, key: str, value: str) -> bool:
+        if self.store.get(key) != value:
+            return False
+        return await self.delete(key)
+
+    async def delete_many_if_equals(
+        self,
+        keys: Sequence[str],
+        value: dict[str, Any] | str,
+    ) -> int:
+        return sum(
+            [
+                self.store.get(key) == value and await self.delete(key)
+                for key in keys
+            ],
+        )
+
+    async def delete_many(self, keys: Sequence[str]) -> int:
+        return sum([await self.delete(key) for key in keys])
+
     async def exists(self, key: str) -> bool:
         self.exists_calls.append(key)
         return key in self.store
@@ -85,3 +151,32 @@ class FakeCache:
 
         self.store[key] = value
         return True
+
+    async def set_nx_many(
+        self,
+        items: Mapping[str, dict[str, Any] | str],
+        ttl_seconds: int | None = None,
+    ) -> list[bool]:
+        return [
+            await self.set_nx(key, value, ttl_seconds)
+            for key, value in items.items()
+        ]
+
+    async def reserve_first_free(
+        self,
+        items: Mapping[str, dict[str, Any] | str],
+        ttl_seconds: int | None = None,  # noqa: ARG002
+    ) -> str | None:
+        self.reserve_first_free_calls.append(list(items))
+        for key, value in items.items():
+            if key not in self.store:
+                self.store[key] = value
+                return key
+        return None
+
+    async def publish(self, channel: str, message: str) -> int:
+        self.publish_calls.append((channel, message))
+        return 1
+
+    def is_available(self) -> bool:
+        return self.available
@@ -18,3 +18,6 @@ class SequenceKeyGenerator:
         key = self.keys[self._idx]
         self._idx += 1
         return key
+
+    def generate_many(self, n: int) -> list[str]:
+        return [self() for _ in range(n)]
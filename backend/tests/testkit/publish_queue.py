@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 from shortener_app.application.dtos.urls.urls_events import PublishUrlDTO
@@ -10,8 +11,19 @@ from shortener_app.application.interfaces.publish_queue import (
 class SpyNewUrlPublishQueue(NewUrlPublishQueueProtocol):
     calls: list[PublishUrlDTO] = field(default_factory=list)
     exc: Exception | None = None
+    admit_calls: list[int] = field(default_factory=list)
+    admit_exc: Exception | None = None
+
+    def admit(self, *, count: int = 1) -> None:
+        self.admit_calls.append(count)
+        if self.admit_exc is not None:
+            raise self.admit_exc
 
     async def enqueue(self, *, dto: PublishUrlDTO) -> None:
         self.calls.append(dto)
         if self.exc is not None:
             raise self.exc
+
+    async def enqueue_many(self, *, dtos: Sequence[PublishUrlDTO]) -> None:
+        for dto in dtos:
+            await self.enqueue(dto=dto)
@@ -1,3 +1,4 @@
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from uuid import UUID
 
@@ -9,6 +10,9 @@ from shortener_app.domain.entities.url import UrlEntity
 class FakeRepository(RepositoryProtocol):
     get_result: UrlEntity | None = None
     get_calls: list[dict[str, str | int | UUID]] = field(default_factory=list)
+    increment_calls: list[dict[str, int]] = field(default_factory=list)
+    entities: list[UrlEntity] = field(default_factory=list)
+    get_by_keys_calls: list[list[str]] = field(default_factory=list)
 
     async def get(
         self,
@@ -18,6 +22,14 @@ class FakeRepository(RepositoryProtocol):
         self.get_calls.append(reference)
         return self.get_result
 
+    async def get_by_keys(
+        self,
+        *,
+        keys: Sequence[str],
+    ) -> list[UrlEntity]:
+        self.get_by_keys_calls.append(list(keys))
+        return [entity for entity in self.entities if entity.key in keys]
+
     async def get_all(
         self,
         *,
@@ -42,6 +54,13 @@ class FakeRepository(RepositoryProtocol):
     async def apply_click_events(
         self,
         *,
-        events: list[tuple[UUID, str]],
+        events: list[tuple[UUID, str, int]],
     ) -> int:
         raise NotImplementedError
+
+    async def increment_clicks(
+        self,
+        *,
+        increments: Mapping[str, int],
+    ) -> None:
+        self.increment_calls.append(dict(increments))
@@ -1,6 +1,9 @@
 from dataclasses import dataclass, field
 
-from shortener_app.application.dtos.urls.urls_cache import UrlCacheRecordDTO
+from shortener_app.application.dtos.urls.urls_cache import (
+    UrlCacheRecordDTO,
+    UrlResolveDTO,
+)
 from shortener_app.application.dtos.urls.urls_events import PublishUrlDTO
 from shortener_app.application.dtos.urls.urls_responses import CreatedUrlDTO
 from shortener_app.domain.entities.url import UrlEntity
@@ -17,6 +20,7 @@ class SpyUrlDtoFacade:
     return_created_dto: CreatedUrlDTO | None = None
     to_publish_calls: list[UrlEntity] = field(default_factory=list)
     to_created_calls: list[UrlEntity] = field(default_factory=list)
+    to_cache_record_calls: list[UrlEntity] = field(default_factory=list)
 
     def to_entity_from_cache_dto(self, *, dto: UrlCacheRecordDTO) -> UrlEntity:
         self.to_entity_from_cache_calls.append(dto)
@@ -35,3 +39,20 @@ class SpyUrlDtoFacade:
         if self.return_created_dto is None:
             raise RuntimeError("SpyUrlDtoFacade.return_created_dto is not set")
         return self.return_created_dto
+
+    def to_cache_record_dto(self, *, entity: UrlEntity) -> UrlCacheRecordDTO:
+        self.to_cache_record_calls.append(entity)
+        return UrlCacheRecordDTO(
+            key=entity.key,
+            target_url=entity.target_url,
+            user_id=entity.user_id,
+            name=entity.name,
+            is_active=entity.is_active,
+        )
+
+    def to_resolve_dto(self, *, entity: UrlEntity) -> UrlResolveDTO:
+        return UrlResolveDTO(
+            key=entity.key,
+            target_url=entity.target_url,
+            is_active=entity.is_active,
+        )
@@ -0,0 +1,59 @@
+import pytest
+
+from shortener_app.application.services.admission import AdmissionController
+
+pytestmark = pytest.mark.unit
+
+
+def make_controller() -> AdmissionController:
+    return AdmissionController(
+        high_depth=100,
+        low_depth=20,
+        high_latency_ms=50.0,
+        low_latency_ms=5.0,
+        smoothing=1.0,
+    )
+
+
+def test_depth_watermarks_have_hysteresis() -> None:
+    controller = make_controller()
+
+    assert controller.admit(depth=99)
+    assert not controller.admit(depth=100)
+    assert not controller.admit(depth=50)
+    assert controller.shedding
+
+    assert controller.admit(depth=20)
+    assert not controller.shedding
+
+
+def test_slow_publishes_shed_until_a_probe_is_fast() -> None:
+    controller = make_controller()
+    controller.observe(latency_ms=80.0)
+
+    assert not controller.admit(depth=50)
+
+    # Below the low watermark, but latency still says the broker is slow.
+    assert not controller.admit(depth=10)
+    # Drained: a single probe refreshes the latency.
+    assert controller.admit(depth=0, claim_probe=False)
+    assert controller.admit(depth=0)
+    assert not controller.admit(depth=0)
+    assert not controller.admit(depth=0, claim_probe=False)
+    assert controller.shedding
+
+    controller.observe(latency_ms=1.0)
+    assert controller.admit(depth=1)
+    assert not controller.shedding
+
+
+def test_a_slow_probe_frees_the_slot_for_the_next_one() -> None:
+    controller = make_controller()
+    controller.observe(latency_ms=80.0)
+
+    assert controller.admit(depth=0)
+    assert not controller.admit(depth=0)
+
+    controller.observe(latency_ms=80.0)
+    assert controller.shedding
+    assert controller.admit(depth=0)
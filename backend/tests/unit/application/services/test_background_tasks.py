@@ -0,0 +1,113 @@
+import asyncio
+import random
+
+import pytest
+
+from shortener_app.application.services.background_tasks import (
+    BackgroundTaskSupervisor,
+    OverflowPolicy,
+)
+
+pytestmark = pytest.mark.unit
+
+
+async def test_drop_policy_sheds_work_past_the_limit() -> None:
+    release = asyncio.Event()
+    supervisor = BackgroundTaskSupervisor(max_concurrency=2)
+
+    results = [
+        await supervisor.submit(release.wait, name="wait") for _ in range(3)
+    ]
+
+    assert results == [True, True, False]
+    assert supervisor.stats()["inflight"] == 2
+    assert supervisor.stats()["dropped"] == 1
+
+    release.set()
+    await supervisor.drain(timeout_sec=1.0)
+
+    assert supervisor.stats()["completed"] == 2
+
+
+async def test_block_policy_waits_for_a_free_slot() -> None:
+    release = asyncio.Event()
+    supervisor = BackgroundTaskSupervisor(
+        max_concurrency=1,
+        policy=OverflowPolicy.BLOCK,
+    )
+    await supervisor.submit(release.wait, name="wait")
+
+    blocked = asyncio.create_task(
+        supervisor.submit(release.wait, name="wait"),
+    )
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    release.set()
+    assert await blocked
+    await supervisor.drain(timeout_sec=1.0)
+
+    assert supervisor.stats()["completed"] == 2
+
+
+async def test_sample_policy_sheds_before_reaching_the_limit() -> None:
+    release = asyncio.Event()
+    supervisor = BackgroundTaskSupervisor(
+        max_concurrency=100,
+        policy=OverflowPolicy.SAMPLE,
+        rng=random.Random(0),
+    )
+
+    for _ in range(200):
+        await supervisor.submit(release.wait, name="wait")
+
+    inflight = supervisor.stats()["inflight"]
+    assert isinstance(inflight, int)
+    assert 50 < inflight < 100
+
+    release.set()
+    await supervisor.drain(timeout_sec=1.0)
+
+
+async def test_failures_are_counted_not_raised() -> None:
+    async def boom() -> None:
+        raise RuntimeError("boom")
+
+    supervisor = BackgroundTaskSupervisor()
+    assert await supervisor.submit(boom, name="boom")
+
+    await supervisor.drain(timeout_sec=1.0)
+
+    assert supervisor.stats()["failed"] == 1
+
+
+async def test_drain_cancels_stragglers_and_rejects_new_work() -> None:
+    supervisor = BackgroundTaskSupervisor()
+    await supervisor.submit(asyncio.Event().wait, name="stuck")
+
+    await supervisor.drain(timeout_sec=0.01)
+
+    assert supervisor.stats()["inflight"] == 0
+    assert not await supervisor.submit(asyncio.Event().wait, name="late")
+
+
+async def test_a_task_cancelled_before_it_starts_frees_its_slot() -> None:
+    release = asyncio.Event()
+    supervisor = BackgroundTaskSupervisor(
+        max_concurrency=1,
+        policy=OverflowPolicy.BLOCK,
+    )
+    await supervisor.submit(release.wait, name="unstarted")
+    for task in asyncio.all_tasks():
+        if task.get_name() == "unstarted":
+            task.cancel()
+    await asyncio.sleep(0)
+
+    release.set()
+    assert await asyncio.wait_for(
+        supervisor.submit(release.wait, name="wait"),
+        timeout=1.0,
+    )
+    await supervisor.drain(timeout_sec=1.0)
+
+    assert supervisor.stats()["completed"] == 1
@@ -0,0 +1,71 @@
+import random
+from collections import Counter
+
+import pytest
+
+from shortener_app.application.services.hot_keys import (
+    HotKeyTracker,
+    SpaceSaving,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_space_saving_counts_exactly_below_capacity() -> None:
+    sketch = SpaceSaving(capacity=3)
+    for key in ["a", "b", "a", "c", "a", "b"]:
+        sketch.add(key)
+
+    assert sketch.top(3) == [("a", 3, 0), ("b", 2, 0), ("c", 1, 0)]
+    assert sketch.total == 6
+
+
+def test_space_saving_keeps_heavy_hitters_with_bounded_error() -> None:
+    rng = random.Random(7)
+    stream = ["hot1"] * 2_000 + ["hot2"] * 1_000
+    stream += [f"cold{rng.randrange(5_000)}" for _ in range(7_000)]
+    rng.shuffle(stream)
+
+    sketch = SpaceSaving(capacity=50)
+    for key in stream:
+        sketch.add(key)
+
+    truth = Counter(stream)
+    top = sketch.top(2)
+    assert [key for key, _, _ in top] == ["hot1", "hot2"]
+    for key, count, error in top:
+        assert count - error <= truth[key] <= count
+    assert len(sketch) == 50
+
+
+def test_tracker_reports_rates_and_hot_keys_per_window() -> None:
+    clock = FakeClock()
+    tracker = HotKeyTracker(capacity=10, top_k=1, window_sec=10.0, clock=clock)
+
+    for _ in range(30):
+        tracker.record("Ab12Z")
+    tracker.record("Zz999")
+
+    [top] = tracker.top()
+    assert top.key == "Ab12Z"
+    assert top.count == 30
+    assert top.rate_per_sec == pytest.approx(3.0)
+    assert tracker.is_hot("Ab12Z") is False  # no completed window yet
+
+    clock.now = 15.0
+    assert tracker.is_hot("Ab12Z") is True
+    assert tracker.is_hot("Zz999") is False
+    # Half of the previous window still counts towards the rate.
+    assert tracker.top()[0].rate_per_sec == pytest.approx(1.5)
+
+    clock.now = 40.0
+    assert tracker.is_hot("Ab12Z") is False
+    assert tracker.top() == []
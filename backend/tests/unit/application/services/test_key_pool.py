@@ -0,0 +1,238 @@
+from typing import cast
+from uuid import uuid4
+
+import pytest
+
+from shortener_app.application.dtos.urls.urls_cache import UrlCacheSeedDTO
+from shortener_app.application.mappers.url_dto_facade import UrlDtoFacade
+from shortener_app.application.services.urls.key_pool import ReservedKeyPool
+from shortener_app.application.services.urls.key_reservation import (
+    UrlKeyReservationService,
+)
+from shortener_app.application.services.urls.url_cache import (
+    UrlCacheMiss,
+    UrlCacheService,
+)
+from shortener_app.infrastructures.codecs import UrlCacheRedisHashCodec
+from tests.testkit.cache import FakeCache
+from tests.testkit.keygen import SequenceKeyGenerator
+from tests.testkit.url_facade import SpyUrlDtoFacade
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_cache_service(cache: FakeCache) -> UrlCacheService:
+    return UrlCacheService(
+        cache=cache,
+        codec=UrlCacheRedisHashCodec(),
+        mapper=cast(UrlDtoFacade, SpyUrlDtoFacade()),
+    )
+
+
+def make_pool(
+    *,
+    cache: FakeCache,
+    keys: list[str],
+    size: int = 4,
+    low_water: int = 1,
+    clock: FakeClock | None = None,
+) -> ReservedKeyPool:
+    return ReservedKeyPool(
+        cache_service=make_cache_service(cache),
+        key_generator=SequenceKeyGenerator(keys=keys),
+        size=size,
+        low_water=low_water,
+        batch_size=size,
+        reservation_ttl_sec=100,
+        clock=clock or FakeClock(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_refill_reserves_keys_and_counts_collisions() -> None:
+    cache = FakeCache(store={"short:bbbbb": {"target_url": "x"}})
+    pool = make_pool(
+        cache=cache,
+        keys=["aaaaa", "bbbbb", "ccccc", "ddddd", "eeeee"],
+    )
+
+    assert await pool.refill() == 4
+    assert pool.depth == 4
+    assert cache.store["short:aaaaa"] == {"reserved": pool._token}
+    assert cache.set_nx_calls[0][2] == 100
+
+    stats = pool.stats()
+    assert stats["refills"] == 2
+    assert stats["collisions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pop_hands_out_keys_without_cache_calls() -> None:
+    cache = FakeCache()
+    pool = make_pool(cache=cache, keys=["aaaaa", "bbbbb", "ccccc", "ddddd"])
+    await pool.refill()
+    calls = len(cache.set_nx_calls)
+
+    assert [pool.pop() for _ in range(4)] == [
+        "aaaaa",
+        "bbbbb",
+        "ccccc",
+        "ddddd",
+    ]
+    assert pool.pop() is None
+    assert len(cache.set_nx_calls) == calls
+    assert pool.stats()["empty"] == 1
+
+
+@pytest.mark.asyncio
+async def test_pop_discards_keys_past_half_the_reservation_ttl() -> None:
+    clock = FakeClock()
+    pool = make_pool(
+        cache=FakeCache(),
+        keys=["aaaaa", "bbbbb", "ccccc", "ddddd"],
+        clock=clock,
+    )
+    await pool.refill()
+
+    clock.now = 51.0
+
+    assert pool.pop() is None
+    assert pool.stats()["expired"] == 4
+
+
+@pytest.mark.asyncio
+async def test_stop_releases_unused_reservations() -> None:
+    cache = FakeCache()
+    pool = make_pool(cache=cache, keys=["aaaaa", "bbbbb", "ccccc", "ddddd"])
+    await pool.start()
+    pool.pop()
+
+    await pool.stop()
+
+    assert cache.delete_calls == ["short:bbbbb", "short:ccccc", "short:ddddd"]
+    assert pool.stats()["reclaimed"] == 3
+    assert list(cache.store) == ["short:aaaaa"]
+
+
+@pytest.mark.asyncio
+async def test_reserved_placeholder_reads_as_known_missing() -> None:
+    cache = FakeCache()
+    service = make_cache_service(cache)
+    await service.reserve_keys(keys=["aaaaa"], token="t", ttl_seconds=100)
+
+    assert await service.lookup(key="aaaaa") is UrlCacheMiss.KNOWN_MISSING
+
+
+@pytest.mark.asyncio
+async def test_reservation_uses_pooled_key_with_a_single_set() -> None:
+    cache = FakeCache()
+    pool = make_pool(cache=cache, keys=["aaaaa", "bbbbb", "ccccc", "ddddd"])
+    await pool.refill()
+    nx_calls = len(cache.set_nx_calls)
+
+    reservation = UrlKeyReservationService(
+        key_generator=SequenceKeyGenerator(keys=[]),
+        cache_service=make_cache_service(cache),
+        pool=pool,
+    )
+    key = await reservation.reserve(
+        seed=UrlCacheSeedDTO(
+            target_url="https://example.com",
+            user_id=uuid4(),
+        ),
+    )
+
+    assert key == "aaaaa"
+    assert len(cache.set_calls) == 1
+    assert len(cache.set_nx_calls) == nx_calls
+    assert cache.store["short:aaaaa"]["target_url"] == "https://example.com"
+
+
+@pytest.mark.asyncio
+async def test_reservation_skips_a_pooled_key_taken_by_another_writer() -> (
+    None
+):
+    cache = FakeCache()
+    pool = make_pool(cache=cache, keys=["aaaaa", "bbbbb", "ccccc", "ddddd"])
+    await pool.refill()
+    # The placeholder expired and another instance reserved the key.
+    taken = {"reserved": "other"}
+    cache.store["short:aaaaa"] = taken
+    reservation = UrlKeyReservationService(
+        key_generator=SequenceKeyGenerator(keys=["eeeee"]),
+        cache_service=make_cache_service(cache),
+        pool=pool,
+    )
+
+    keys = await reservation.reserve_many(
+        seeds=[
+            UrlCacheSeedDTO(target_url=f"https://e.com/{i}", user_id=uuid4())
+            for i in range(2)
+        ],
+    )
+
+    assert keys == ["eeeee", "bbbbb"]
+    assert cache.store["short:aaaaa"] is taken
+
+
+@pytest.mark.asyncio
+async def test_failed_assignment_gives_pooled_keys_back() -> None:
+    cache = FakeCache(raise_on_set=RuntimeError("encode failed"))
+    pool = make_pool(cache=cache, keys=["aaaaa", "bbbbb", "ccccc", "ddddd"])
+    await pool.refill()
+    reservation = UrlKeyReservationService(
+        key_generator=SequenceKeyGenerator(keys=[]),
+        cache_service=make_cache_service(cache),
+        pool=pool,
+    )
+
+    with pytest.raises(RuntimeError, match="encode failed"):
+        await reservation.reserve_many(
+            seeds=[
+                UrlCacheSeedDTO(target_url="https://e.com", user_id=uuid4()),
+            ]
+            * 2,
+        )
+
+    assert pool.depth == 4
+    assert pool.pop() == "aaaaa"
+
+
+@pytest.mark.asyncio
+async def test_stop_leaves_keys_that_are_no_longer_ours() -> None:
+    cache = FakeCache()
+    pool = make_pool(cache=cache, keys=["aaaaa", "bbbbb", "ccccc", "ddddd"])
+    await pool.start()
+    # The placeholder expired and another instance stored a real URL.
+    cache.store["short:aaaaa"] = {"target_url": "https://other.com"}
+
+    await pool.stop()
+
+    assert cache.delete_calls == ["short:bbbbb", "short:ccccc", "short:ddddd"]
+    assert cache.store == {"short:aaaaa": {"target_url": "https://other.com"}}
+
+
+@pytest.mark.asyncio
+async def test_stop_drops_aged_keys_without_touching_redis() -> None:
+    clock = FakeClock()
+    cache = FakeCache()
+    pool = make_pool(
+        cache=cache,
+        keys=["aaaaa", "bbbbb", "ccccc", "ddddd"],
+        clock=clock,
+    )
+    await pool.start()
+    clock.now = 51.0
+
+    await pool.stop()
+
+    assert cache.delete_calls == []
+    assert pool.stats()["expired"] == 4
@@ -0,0 +1,93 @@
+from typing import cast
+from uuid import uuid4
+
+import pytest
+
+from shortener_app.application.dtos.urls.urls_cache import UrlCacheSeedDTO
+from shortener_app.application.mappers.url_dto_facade import UrlDtoFacade
+from shortener_app.application.services.urls.key_reservation import (
+    UrlKeyReservationService,
+)
+from shortener_app.application.services.urls.url_cache import UrlCacheService
+from shortener_app.infrastructures.codecs import UrlCacheRedisHashCodec
+from tests.testkit.cache import FakeCache
+from tests.testkit.keygen import SequenceKeyGenerator
+from tests.testkit.url_facade import SpyUrlDtoFacade
+
+pytestmark = pytest.mark.unit
+
+
+def make_service(
+    *,
+    cache: FakeCache,
+    keys: list[str],
+    candidates_per_call: int,
+    max_attempts: int = 50,
+) -> UrlKeyReservationService:
+    return UrlKeyReservationService(
+        key_generator=SequenceKeyGenerator(keys=keys),
+        cache_service=UrlCacheService(
+            cache=cache,
+            codec=UrlCacheRedisHashCodec(),
+            mapper=cast(UrlDtoFacade, SpyUrlDtoFacade()),
+        ),
+        max_attempts=max_attempts,
+        candidates_per_call=candidates_per_call,
+    )
+
+
+def make_seed() -> UrlCacheSeedDTO:
+    return UrlCacheSeedDTO(target_url="https://example.com", user_id=uuid4())
+
+
+async def test_first_free_candidate_is_claimed_in_one_call() -> None:
+    cache = FakeCache(
+        store={
+            "short:aaaaa": {"key": "aaaaa"},
+            "short:bbbbb": {"key": "bbbbb"},
+        },
+    )
+    service = make_service(
+        cache=cache,
+        keys=["aaaaa", "bbbbb", "ccccc", "ddddd"],
+        candidates_per_call=4,
+    )
+
+    key = await service.reserve(seed=make_seed())
+
+    assert key == "ccccc"
+    assert cache.reserve_first_free_calls == [
+        ["short:aaaaa", "short:bbbbb", "short:ccccc", "short:ddddd"],
+    ]
+    assert "short:ddddd" not in cache.store
+    assert cache.set_nx_calls == []
+
+
+async def test_attempts_are_capped_across_calls() -> None:
+    cache = FakeCache(store={"short:aaaaa": {"key": "aaaaa"}})
+    service = make_service(
+        cache=cache,
+        keys=["aaaaa"],
+        candidates_per_call=4,
+        max_attempts=10,
+    )
+
+    with pytest.raises(RuntimeError):
+        await service.reserve(seed=make_seed())
+
+    # 4 + 4 + 2 candidates; the generator keeps repeating "aaaaa", which
+    # is sent once per call.
+    assert [len(call) for call in cache.reserve_first_free_calls] == [1, 1, 1]
+
+
+async def test_single_candidate_keeps_plain_setnx() -> None:
+    cache = FakeCache()
+    service = make_service(
+        cache=cache,
+        keys=["aaaaa"],
+        candidates_per_call=1,
+    )
+
+    assert await service.reserve(seed=make_seed()) == "aaaaa"
+    assert len(cache.set_nx_calls) == 1
+    assert cache.reserve_first_free_calls == []
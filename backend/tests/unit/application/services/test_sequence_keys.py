@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from shortener_app.application.services.urls.sequence_keys import (
+    SequenceKeyAllocator,
+)
+from shortener_app.domain.services.key_permutation import (
+    FeistelKeyPermutation,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FakeSequence:
+    def __init__(self) -> None:
+        self.value = 0
+        self.leases: list[int] = []
+
+    async def lease(self, *, count: int) -> range:
+        self.leases.append(count)
+        await asyncio.sleep(0)
+        start, self.value = self.value, self.value + count
+        return range(start, self.value)
+
+
+def make_allocator(
+    sequence: FakeSequence,
+    *,
+    length: int = 5,
+    block_size: int = 10,
+) -> SequenceKeyAllocator:
+    return SequenceKeyAllocator(
+        sequence=sequence,
+        permutation=FeistelKeyPermutation(secret=b"secret", length=length),
+        block_size=block_size,
+    )
+
+
+async def test_leases_one_block_per_block_size_keys() -> None:
+    sequence = FakeSequence()
+    allocator = make_allocator(sequence)
+
+    keys = [await allocator.next_key() for _ in range(25)]
+
+    assert len(set(keys)) == 25
+    assert sequence.leases == [10, 10, 10]
+    assert allocator.stats()["block_remaining"] == 5
+
+
+async def test_concurrent_callers_share_a_single_lease() -> None:
+    sequence = FakeSequence()
+    allocator = make_allocator(sequence)
+
+    keys = await asyncio.gather(*(allocator.next_key() for _ in range(10)))
+
+    assert len(set(keys)) == 10
+    assert sequence.leases == [10]
+
+
+async def test_stops_at_the_end_of_the_keyspace() -> None:
+    sequence = FakeSequence()
+    allocator = make_allocator(sequence, length=1, block_size=50)
+
+    keys = [await allocator.next_key() for _ in range(62)]
+
+    assert len(set(keys)) == 62
+    with pytest.raises(RuntimeError):
+        await allocator.next_key()
@@ -0,0 +1,67 @@
+import asyncio
+
+import pytest
+
+from shortener_app.application.services.single_flight import SingleFlight
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_execution() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def load() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 42
+
+    waiters = [
+        asyncio.create_task(flight.do("Ab12Z", load)) for _ in range(10)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == [42] * 10
+    assert calls == 1
+    assert flight.stats() == {"inflight": 0, "calls": 1, "shared": 9}
+
+
+@pytest.mark.asyncio
+async def test_exception_is_shared_and_key_is_released() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+
+    async def boom() -> int:
+        await asyncio.sleep(0)
+        raise RuntimeError("db down")
+
+    results = await asyncio.gather(
+        flight.do("Ab12Z", boom),
+        flight.do("Ab12Z", boom),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert flight.stats()["inflight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_shared_call() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+
+    async def load() -> int:
+        await release.wait()
+        return 7
+
+    leader = asyncio.create_task(flight.do("Ab12Z", load))
+    follower = asyncio.create_task(flight.do("Ab12Z", load))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    release.set()
+
+    assert await follower == 7
@@ -0,0 +1,220 @@
+from dataclasses import replace
+from typing import cast
+from uuid import uuid4
+
+import pytest
+
+from shortener_app.application.dtos.urls.urls_cache import (
+    UrlCacheRecordDTO,
+    UrlResolveDTO,
+)
+from shortener_app.application.mappers.url_dto_facade import UrlDtoFacade
+from shortener_app.application.services.background_tasks import (
+    BackgroundTaskSupervisor,
+)
+from shortener_app.application.services.urls.url_cache import UrlCacheService
+from shortener_app.domain.entities.url import UrlEntity
+from shortener_app.infrastructures.cache.local_cache import InMemoryLRUCache
+from shortener_app.infrastructures.codecs import (
+    UrlCacheRedisHashCodec,
+    UrlResolveRedisHashCodec,
+)
+from tests.testkit.cache import FakeCache
+from tests.testkit.codec import SpyDtoCodec
+from tests.testkit.url_facade import SpyUrlDtoFacade
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_service(
+    *,
+    cache: FakeCache,
+    local_cache: InMemoryLRUCache[UrlEntity | UrlResolveDTO],
+) -> tuple[UrlCacheService, UrlEntity]:
+    entity = UrlEntity.create(
+        user_id=uuid4(),
+        target_url="https://example.com",
+        key="Ab12Z",
+    )
+    codec = SpyDtoCodec(
+        decode_value=UrlCacheRecordDTO(
+            key=entity.key,
+            target_url=entity.target_url,
+            user_id=entity.user_id,
+        ),
+    )
+    mapper = SpyUrlDtoFacade(return_entity=entity)
+
+    service = UrlCacheService(
+        cache=cache,
+        codec=codec,
+        mapper=cast(UrlDtoFacade, mapper),
+        local_cache=local_cache,
+        invalidation_channel="short:invalidate",
+    )
+    return service, entity
+
+
+@pytest.mark.asyncio
+async def test_second_lookup_is_served_from_local_cache() -> None:
+    cache = FakeCache(store={"short:Ab12Z": {"key": "Ab12Z"}})
+    local_cache: InMemoryLRUCache[UrlEntity | UrlResolveDTO] = (
+        InMemoryLRUCache()
+    )
+    service, entity = make_service(cache=cache, local_cache=local_cache)
+
+    first = await service.get_by_key_cached(key="Ab12Z")
+    second = await service.get_by_key_cached(key="Ab12Z")
+
+    assert first is entity
+    assert second is entity
+    assert cache.get_calls == ["short:Ab12Z"]
+    assert local_cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidate_clears_all_tiers_and_broadcasts() -> None:
+    cache = FakeCache(store={"short:Ab12Z": {"key": "Ab12Z"}})
+    local_cache: InMemoryLRUCache[UrlEntity | UrlResolveDTO] = (
+        InMemoryLRUCache()
+    )
+    service, _ = make_service(cache=cache, local_cache=local_cache)
+
+    await service.get_by_key_cached(key="Ab12Z")
+    await service.invalidate(key="Ab12Z")
+
+    assert cache.delete_calls == ["short:Ab12Z"]
+    assert cache.publish_calls == [("short:invalidate", "Ab12Z")]
+    assert local_cache.get("Ab12Z") is None
+    assert await service.get_by_key_cached(key="Ab12Z") is None
+
+
+@pytest.mark.asyncio
+async def test_populate_writes_record_with_jittered_ttl() -> None:
+    cache = FakeCache()
+    local_cache: InMemoryLRUCache[UrlEntity | UrlResolveDTO] = (
+        InMemoryLRUCache()
+    )
+    service, entity = make_service(cache=cache, local_cache=local_cache)
+    service = replace(
+        service,
+        read_through_ttl_seconds=3600,
+        read_through_ttl_jitter_seconds=300,
+    )
+
+    assert await service.populate(entity=entity) is True
+
+    [(key, _, ttl)] = cache.set_calls
+    assert key == "short:Ab12Z"
+    assert ttl is not None
+    assert 3600 <= ttl <= 3900
+    assert local_cache.get("Ab12Z") is entity
+
+
+@pytest.mark.asyncio
+async def test_populate_after_invalidate_does_not_write_back() -> None:
+    cache = FakeCache()
+    local_cache: InMemoryLRUCache[UrlEntity | UrlResolveDTO] = (
+        InMemoryLRUCache()
+    )
+    service, entity = make_service(cache=cache, local_cache=local_cache)
+
+    # The entity was read from the database before the key was invalidated.
+    await service.invalidate(key="Ab12Z", deleted=True)
+
+    assert await service.populate(entity=entity) is False
+    assert "short:Ab12Z" not in cache.store
+    assert local_cache.get("Ab12Z") is None
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_it_is_revalidated() -> None:
+    cache = FakeCache(store={"short:Ab12Z": {"key": "Ab12Z"}})
+    clock = FakeClock()
+    local_cache: InMemoryLRUCache[UrlEntity | UrlResolveDTO] = (
+        InMemoryLRUCache(ttl_sec=30.0, stale_ttl_sec=60.0, clock=clock)
+    )
+    background = BackgroundTaskSupervisor()
+    service, entity = make_service(cache=cache, local_cache=local_cache)
+    service = replace(service, serve_stale_seconds=10.0, background=background)
+    local_cache.set("Ab12Z", entity)
+
+    clock.now = 35.0
+    assert await service.get_by_key_cached(key="Ab12Z") is entity
+    assert await service.get_by_key_cached(key="Ab12Z") is entity
+    await background.drain(timeout_sec=1.0)
+
+    assert cache.get_calls == ["short:Ab12Z"]
+    assert background.stats()["completed"] == 1
+    assert local_cache.get("Ab12Z") is entity
+
+
+@pytest.mark.asyncio
+async def test_unavailable_redis_falls_back_to_retained_entry() -> None:
+    cache = FakeCache(available=False)
+    clock = FakeClock()
+    local_cache: InMemoryLRUCache[UrlEntity | UrlResolveDTO] = (
+        InMemoryLRUCache(ttl_sec=30.0, stale_ttl_sec=300.0, clock=clock)
+    )
+    service, entity = make_service(cache=cache, local_cache=local_cache)
+    local_cache.set("Ab12Z", entity)
+
+    clock.now = 120.0
+
+    assert await service.get_by_key_cached(key="Ab12Z") is entity
+    assert cache.get_calls == []
+
+
+@pytest.mark.asyncio
+async def test_resolve_lookup_decodes_projection_without_entity() -> None:
+    record = UrlCacheRecordDTO(
+        key="Ab12Z",
+        target_url="https://example.com",
+        user_id=uuid4(),
+        is_active=False,
+    )
+    cache = FakeCache(
+        store={"short:Ab12Z": UrlCacheRedisHashCodec().encode(record)},
+    )
+    local_cache: InMemoryLRUCache[UrlEntity | UrlResolveDTO] = (
+        InMemoryLRUCache()
+    )
+    service, _ = make_service(cache=cache, local_cache=local_cache)
+    service = replace(service, resolve_codec=UrlResolveRedisHashCodec())
+    mapper = cast(SpyUrlDtoFacade, service.mapper)
+
+    first = await service.lookup_resolve(key="Ab12Z")
+    second = await service.lookup_resolve(key="Ab12Z")
+
+    assert first == UrlResolveDTO(
+        key="Ab12Z",
+        target_url="https://example.com",
+        is_active=False,
+    )
+    assert second is first
+    assert cache.get_calls == ["short:Ab12Z"]
+    assert mapper.to_entity_from_cache_calls == []
+
+
+@pytest.mark.asyncio
+async def test_entity_lookup_skips_a_cached_projection() -> None:
+    cache = FakeCache(store={"short:Ab12Z": {"key": "Ab12Z"}})
+    local_cache: InMemoryLRUCache[UrlEntity | UrlResolveDTO] = (
+        InMemoryLRUCache()
+    )
+    service, entity = make_service(cache=cache, local_cache=local_cache)
+    local_cache.set(
+        "Ab12Z",
+        UrlResolveDTO(key="Ab12Z", target_url="https://example.com"),
+    )
+
+    assert await service.get_by_key_cached(key="Ab12Z") is entity
+    assert cache.get_calls == ["short:Ab12Z"]
@@ -0,0 +1,104 @@
+import asyncio
+from collections.abc import AsyncIterator
+from typing import cast
+from uuid import uuid4
+
+import pytest
+
+from shortener_app.application.dtos.urls.urls_cache import UrlResolveDTO
+from shortener_app.application.mappers.url_dto_facade import UrlDtoFacade
+from shortener_app.application.services.urls.url_cache import UrlCacheService
+from shortener_app.application.services.urls.url_cache_warmer import (
+    UrlCacheWarmer,
+)
+from shortener_app.domain.entities.url import UrlEntity
+from shortener_app.infrastructures.cache.local_cache import InMemoryLRUCache
+from tests.testkit.cache import FakeCache
+from tests.testkit.codec import SpyDtoCodec
+from tests.testkit.url_facade import SpyUrlDtoFacade
+
+pytestmark = pytest.mark.unit
+
+
+def make_entity(key: str) -> UrlEntity:
+    return UrlEntity.create(
+        user_id=uuid4(),
+        target_url=f"https://example.com/{key}",
+        key=key,
+    )
+
+
+def make_cache_service(
+    *,
+    cache: FakeCache,
+    local_cache: InMemoryLRUCache[UrlEntity | UrlResolveDTO],
+) -> UrlCacheService:
+    return UrlCacheService(
+        cache=cache,
+        codec=SpyDtoCodec(),
+        mapper=cast(
+            UrlDtoFacade,
+            SpyUrlDtoFacade(return_entity=make_entity("aaaaa")),
+        ),
+        local_cache=local_cache,
+        read_through_ttl_seconds=3600,
+    )
+
+
+@pytest.mark.asyncio
+async def test_warm_up_fills_local_cache_and_only_missing_redis_records() -> (
+    None
+):
+    cache = FakeCache(store={"short:aaaaa": {"key": "aaaaa"}})
+    local_cache: InMemoryLRUCache[UrlEntity | UrlResolveDTO] = (
+        InMemoryLRUCache()
+    )
+    pages = [
+        [make_entity("aaaaa"), make_entity("bbbbb")],
+        [make_entity("ccccc")],
+    ]
+
+    async def source() -> AsyncIterator[list[UrlEntity]]:
+        for page in pages:
+            yield page
+
+    warmer = UrlCacheWarmer(
+        cache_service=make_cache_service(cache=cache, local_cache=local_cache),
+        source=source,
+    )
+
+    report = await warmer.warm()
+
+    assert report.loaded == 3
+    assert report.redis_filled == 2
+    assert report.timed_out is False
+    assert [key for key, _, _ in cache.set_calls] == [
+        "short:bbbbb",
+        "short:ccccc",
+    ]
+    assert local_cache.stats()["size"] == 3
+
+
+@pytest.mark.asyncio
+async def test_warm_up_stops_when_the_budget_runs_out() -> None:
+    cache = FakeCache()
+    local_cache: InMemoryLRUCache[UrlEntity | UrlResolveDTO] = (
+        InMemoryLRUCache()
+    )
+
+    async def source() -> AsyncIterator[list[UrlEntity]]:
+        yield [make_entity("aaaaa")]
+        await asyncio.sleep(10)
+        yield [make_entity("bbbbb")]
+
+    warmer = UrlCacheWarmer(
+        cache_service=make_cache_service(cache=cache, local_cache=local_cache),
+        source=source,
+        budget_seconds=0.05,
+    )
+
+    report = await warmer.warm()
+
+    assert report.loaded == 1
+    assert report.timed_out is True
+    assert local_cache.get("aaaaa") is not None
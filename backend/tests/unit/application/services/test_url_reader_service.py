@@ -0,0 +1,464 @@
+import asyncio
+from dataclasses import dataclass, field, replace
+from typing import cast
+from uuid import UUID, uuid4
+
+import pytest
+
+from shortener_app.application.mappers.components import (
+    UrlCacheToEntityMapper,
+    UrlToCacheRecordMapper,
+)
+from shortener_app.application.mappers.url_dto_facade import UrlDtoFacade
+from shortener_app.application.services.background_tasks import (
+    BackgroundTaskSupervisor,
+)
+from shortener_app.application.services.single_flight import SingleFlight
+from shortener_app.application.services.urls.url_cache import UrlCacheService
+from shortener_app.application.services.urls.url_reader import UrlReaderService
+from shortener_app.domain.entities.url import UrlEntity
+from shortener_app.infrastructures.cache.local_cache import InMemoryLRUCache
+from tests.testkit.cache import FakeCache
+from tests.testkit.codec import SpyDtoCodec
+from tests.testkit.repository import FakeRepository
+from tests.testkit.uow import FakeUnitOfWork
+from tests.testkit.url_facade import SpyUrlDtoFacade
+
+pytestmark = pytest.mark.unit
+
+
+@dataclass
+class FakeKeyFilter:
+    keys: set[str] = field(default_factory=set)
+    false_positives: list[str] = field(default_factory=list)
+
+    def might_contain(self, key: str) -> bool:
+        return key in self.keys
+
+    def add(self, key: str) -> None:
+        self.keys.add(key)
+
+    def discard(self, key: str) -> None:
+        pass
+
+    def record_false_positive(self, key: str) -> None:
+        self.false_positives.append(key)
+
+    def stats(self) -> dict[str, int | float]:
+        return {}
+
+
+@dataclass
+class SlowRepository(FakeRepository):
+    release: asyncio.Event = field(default_factory=asyncio.Event)
+
+    async def get(
+        self,
+        *,
+        reference: dict[str, str | int | UUID],
+    ) -> UrlEntity | None:
+        self.get_calls.append(reference)
+        await self.release.wait()
+        return self.get_result
+
+
+@dataclass
+class FailingRepository(FakeRepository):
+    async def get(
+        self,
+        *,
+        reference: dict[str, str | int | UUID],
+    ) -> UrlEntity | None:
+        self.get_calls.append(reference)
+        raise ConnectionError("database is down")
+
+
+def make_reader(
+    *,
+    cache: FakeCache,
+    read_through: bool,
+    key_filter: FakeKeyFilter | None = None,
+    single_flight: SingleFlight[str, UrlEntity | None] | None = None,
+    fill_lock_wait_seconds: float | None = None,
+    background: BackgroundTaskSupervisor | None = None,
+) -> UrlReaderService:
+    cache_service = UrlCacheService(
+        cache=cache,
+        codec=SpyDtoCodec(),
+        mapper=cast(UrlDtoFacade, SpyUrlDtoFacade()),
+        read_through_ttl_seconds=60,
+        negative_ttl_seconds=30,
+        key_filter=key_filter,
+    )
+    return UrlReaderService(
+        cache_service=cache_service,
+        read_through=read_through,
+        single_flight=single_flight,
+        fill_lock_wait_seconds=fill_lock_wait_seconds,
+        background=background,
+    )
+
+
+@pytest.fixture
+def entity() -> UrlEntity:
+    return UrlEntity.create(
+        user_id=uuid4(),
+        target_url="https://example.com",
+        key="Ab12Z",
+    )
+
+
+@pytest.mark.asyncio
+async def test_db_hit_is_written_back_when_read_through_enabled(
+    entity: UrlEntity,
+) -> None:
+    cache = FakeCache()
+    reader = make_reader(cache=cache, read_through=True)
+
+    result = await reader.get_url_by_key(
+        key="Ab12Z",
+        repository=FakeRepository(get_result=entity),
+    )
+
+    assert result is entity
+    assert [(key, ttl) for key, _, ttl in cache.set_calls] == [
+        ("short:Ab12Z", 60),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_write_back_runs_in_background_when_supervised(
+    entity: UrlEntity,
+) -> None:
+    cache = FakeCache()
+    background = BackgroundTaskSupervisor()
+    reader = make_reader(cache=cache, read_through=True, background=background)
+
+    result = await reader.get_url_by_key(
+        key="Ab12Z",
+        repository=FakeRepository(get_result=entity),
+    )
+
+    assert result is entity
+    assert cache.set_calls == []
+
+    await background.drain(timeout_sec=1.0)
+
+    assert [key for key, _, _ in cache.set_calls] == ["short:Ab12Z"]
+
+
+@pytest.mark.asyncio
+async def test_db_hit_is_not_cached_when_read_through_disabled(
+    entity: UrlEntity,
+) -> None:
+    cache = FakeCache()
+    reader = make_reader(cache=cache, read_through=False)
+
+    await reader.get_url_by_key(
+        key="Ab12Z",
+        repository=FakeRepository(get_result=entity),
+    )
+
+    assert cache.set_calls == []
+
+
+@pytest.mark.asyncio
+async def test_db_miss_is_not_cached() -> None:
+    cache = FakeCache()
+    reader = make_reader(cache=cache, read_through=True)
+
+    result = await reader.get_url_by_key(
+        key="Ab12Z",
+        repository=FakeRepository(get_result=None),
+    )
+
+    assert result is None
+    assert cache.set_calls == []
+    assert cache.set_nx_calls == [("short:Ab12Z", {"tombstone": "1"}, 30)]
+
+
+@pytest.mark.asyncio
+async def test_tombstone_skips_the_database() -> None:
+    cache = FakeCache(store={"short:Ab12Z": {"tombstone": "1"}})
+    reader = make_reader(cache=cache, read_through=True)
+    repository = FakeRepository(get_result=None)
+
+    result = await reader.get_url_by_key(key="Ab12Z", repository=repository)
+
+    assert result is None
+    assert repository.get_calls == []
+
+
+@pytest.mark.asyncio
+async def test_key_filter_rejects_unknown_keys_without_database() -> None:
+    cache = FakeCache()
+    key_filter = FakeKeyFilter(keys={"Zz999"})
+    reader = make_reader(cache=cache, read_through=True, key_filter=key_filter)
+    repository = FakeRepository(get_result=None)
+
+    result = await reader.get_url_by_key(key="Ab12Z", repository=repository)
+
+    assert result is None
+    assert repository.get_calls == []
+    assert cache.get_calls == ["short:Ab12Z"]
+
+
+@pytest.mark.asyncio
+async def test_key_filter_false_positive_is_recorded() -> None:
+    cache = FakeCache()
+    key_filter = FakeKeyFilter(keys={"Ab12Z"})
+    reader = make_reader(cache=cache, read_through=True, key_filter=key_filter)
+
+    await reader.get_url_by_key(
+        key="Ab12Z",
+        repository=FakeRepository(get_result=None),
+    )
+
+    assert key_filter.false_positives == ["Ab12Z"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_issue_one_database_query(
+    entity: UrlEntity,
+) -> None:
+    reader = make_reader(
+        cache=FakeCache(),
+        read_through=True,
+        single_flight=SingleFlight(),
+    )
+    repository = SlowRepository()
+    repository.get_result = entity
+
+    lookups = [
+        asyncio.create_task(
+            reader.get_url_by_key(key="Ab12Z", repository=repository),
+        )
+        for _ in range(20)
+    ]
+    await asyncio.sleep(0)
+    repository.release.set()
+
+    assert await asyncio.gather(*lookups) == [entity] * 20
+    assert len(repository.get_calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_fill_lock_holder_elsewhere_serves_filled_cache() -> None:
+    cache = FakeCache(store={"short:lock:Ab12Z": "1"})
+    reader = make_reader(
+        cache=cache,
+        read_through=True,
+        fill_lock_wait_seconds=1.0,
+    )
+    repository = FakeRepository(get_result=None)
+
+    async def fill_from_other_instance() -> None:
+        await asyncio.sleep(0.01)
+        cache.store["short:Ab12Z"] = {"tombstone": "1"}
+
+    filler = asyncio.create_task(fill_from_other_instance())
+    result = await reader.get_url_by_key(key="Ab12Z", repository=repository)
+    await filler
+
+    assert result is None
+    assert repository.get_calls == []
+
+
+@pytest.mark.asyncio
+async def test_fill_lock_is_released_after_loading(entity: UrlEntity) -> None:
+    cache = FakeCache()
+    reader = make_reader(
+        cache=cache,
+        read_through=True,
+        fill_lock_wait_seconds=1.0,
+    )
+
+    await reader.get_url_by_key(
+        key="Ab12Z",
+        repository=FakeRepository(get_result=entity),
+    )
+
+    assert "short:lock:Ab12Z" in cache.delete_calls
+    assert "short:lock:Ab12Z" not in cache.store
+
+
+@pytest.mark.asyncio
+async def test_expired_fill_lock_taken_elsewhere_is_not_released(
+    entity: UrlEntity,
+) -> None:
+    cache = FakeCache()
+    reader = make_reader(
+        cache=cache,
+        read_through=True,
+        fill_lock_wait_seconds=1.0,
+    )
+
+    class LockStealingRepository(FakeRepository):
+        async def get(
+            self,
+            *,
+            reference: dict[str, str | int | UUID],
+        ) -> UrlEntity | None:
+            # Our lock expired mid-query and another instance took it.
+            cache.store["short:lock:Ab12Z"] = "other-owner"
+            return await super().get(reference=reference)
+
+    await reader.get_url_by_key(
+        key="Ab12Z",
+        repository=LockStealingRepository(get_result=entity),
+    )
+
+    assert cache.store["short:lock:Ab12Z"] == "other-owner"
+
+
+@pytest.mark.asyncio
+async def test_coalesced_load_runs_on_its_own_unit_of_work(
+    entity: UrlEntity,
+) -> None:
+    shared_repository = SlowRepository()
+    shared_repository.get_result = entity
+    shared = FakeUnitOfWork(url_repository=shared_repository)
+    reader = replace(
+        make_reader(
+            cache=FakeCache(),
+            read_through=True,
+            single_flight=SingleFlight(),
+        ),
+        uow_factory=lambda: shared,
+    )
+    request_repository = FakeRepository(get_result=entity)
+
+    first = asyncio.create_task(
+        reader.get_url_by_key(key="Ab12Z", repository=request_repository),
+    )
+    await asyncio.sleep(0)
+    # The first caller goes away; the shared load must not depend on it.
+    first.cancel()
+    second = asyncio.create_task(
+        reader.get_url_by_key(key="Ab12Z", repository=request_repository),
+    )
+    await asyncio.sleep(0)
+    shared_repository.release.set()
+
+    assert await second is entity
+    assert request_repository.get_calls == []
+    assert len(shared_repository.get_calls) == 1
+
+
+def test_cache_record_round_trip_keeps_active_flag(entity: UrlEntity) -> None:
+    inactive = entity.update(is_active=False)
+
+    dto = UrlToCacheRecordMapper().to_dto(inactive)
+    restored = UrlCacheToEntityMapper().to_entity(dto)
+
+    assert restored.key == inactive.key
+    assert restored.target_url == inactive.target_url
+    assert restored.is_active is False
+
+
+@pytest.mark.asyncio
+async def test_batch_uses_one_cache_round_trip_and_one_query(
+    entity: UrlEntity,
+) -> None:
+    cache = FakeCache(store={"short:Gone1": {"tombstone": "1"}})
+    reader = make_reader(cache=cache, read_through=True)
+    repository = FakeRepository(entities=[entity])
+
+    result = await reader.get_urls_by_keys(
+        keys=["Ab12Z", "Gone1", "Miss1"],
+        repository=repository,
+    )
+
+    assert result == {"Ab12Z": entity, "Gone1": None, "Miss1": None}
+    assert cache.get_many_calls == [
+        ["short:Ab12Z", "short:Gone1", "short:Miss1"],
+    ]
+    assert cache.get_calls == []
+    assert repository.get_by_keys_calls == [["Ab12Z", "Miss1"]]
+    assert [key for key, _, _ in cache.set_calls] == ["short:Ab12Z"]
+    assert [key for key, _, _ in cache.set_nx_calls] == ["short:Miss1"]
+
+
+@pytest.mark.asyncio
+async def test_batch_skips_the_database_when_everything_is_cached() -> None:
+    cache = FakeCache(store={"short:Gone1": {"tombstone": "1"}})
+    reader = make_reader(cache=cache, read_through=True)
+    repository = FakeRepository()
+
+    result = await reader.get_urls_by_keys(
+        keys=["Gone1"],
+        repository=repository,
+    )
+
+    assert result == {"Gone1": None}
+    assert repository.get_by_keys_calls == []
+
+
+@pytest.mark.asyncio
+async def test_database_outage_serves_retained_local_entry(
+    entity: UrlEntity,
+) -> None:
+    cache = FakeCache(available=False)
+    now = 0.0
+    local_cache: InMemoryLRUCache[UrlEntity] = InMemoryLRUCache(
+        ttl_sec=30.0,
+        stale_ttl_sec=300.0,
+        clock=lambda: now,
+    )
+    local_cache.set(entity.key, entity)
+    reader = make_reader(
+        cache=cache,
+        read_through=True,
+        fill_lock_wait_seconds=0.5,
+    )
+    reader = replace(
+        reader,
+        cache_service=replace(reader.cache_service, local_cache=local_cache),
+    )
+
+    now = 120.0
+    # Redis is down, so the lookup is answered from the retained entry.
+    assert (
+        await reader.get_url_by_key(
+            key="Ab12Z",
+            repository=FailingRepository(),
+        )
+        is entity
+    )
+
+    # The database is down as well: the fallback still answers, and no
+    # fill lock is taken while Redis is unavailable.
+    assert (
+        await reader._load(key="Ab12Z", repository=FailingRepository())
+        is entity
+    )
+    assert cache.set_nx_calls == []
+
+
+@pytest.mark.asyncio
+async def test_database_outage_without_fallback_propagates() -> None:
+    reader = make_reader(cache=FakeCache(), read_through=True)
+
+    with pytest.raises(ConnectionError):
+        await reader.get_url_by_key(
+            key="Ab12Z",
+            repository=FailingRepository(),
+        )
+
+
+@pytest.mark.asyncio
+async def test_resolve_miss_loads_entity_and_returns_projection(
+    entity: UrlEntity,
+) -> None:
+    cache = FakeCache()
+    reader = make_reader(cache=cache, read_through=True)
+
+    resolved = await reader.resolve_url_by_key(
+        key="Ab12Z",
+        repository=FakeRepository(get_result=entity),
+    )
+
+    assert resolved is not None
+    assert resolved.target_url == entity.target_url
+    assert resolved.is_active is True
+    assert [key for key, _, _ in cache.set_calls] == ["short:Ab12Z"]
@@ -0,0 +1,84 @@
+from typing import cast
+from uuid import uuid4
+
+import pytest
+
+from shortener_app.application.dtos.urls.urls_responses import ResolvedKeyDTO
+from shortener_app.application.exceptions.urls import TooManyKeysError
+from shortener_app.application.mappers.url_dto_facade import UrlDtoFacade
+from shortener_app.application.services.urls.url_cache import UrlCacheService
+from shortener_app.application.services.urls.url_reader import UrlReaderService
+from shortener_app.application.use_cases.batch_resolve_keys import (
+    BatchResolveKeysUseCase,
+)
+from shortener_app.domain.entities.url import UrlEntity
+from tests.testkit.cache import FakeCache
+from tests.testkit.codec import SpyDtoCodec
+from tests.testkit.repository import FakeRepository
+from tests.testkit.uow import FakeUnitOfWork
+from tests.testkit.url_facade import SpyUrlDtoFacade
+
+pytestmark = pytest.mark.unit
+
+
+def make_use_case(
+    *,
+    entities: list[UrlEntity],
+    max_keys: int = 100,
+) -> tuple[BatchResolveKeysUseCase, FakeRepository]:
+    repository = FakeRepository(entities=entities)
+    reader = UrlReaderService(
+        cache_service=UrlCacheService(
+            cache=FakeCache(),
+            codec=SpyDtoCodec(),
+            mapper=cast(UrlDtoFacade, SpyUrlDtoFacade()),
+        ),
+    )
+    use_case = BatchResolveKeysUseCase(
+        reader_service=reader,
+        uow=FakeUnitOfWork(url_repository=repository),
+        max_keys=max_keys,
+    )
+    return use_case, repository
+
+
+async def test_results_follow_request_order_without_duplicates() -> None:
+    active = UrlEntity.create(
+        user_id=uuid4(),
+        target_url="https://example.com/a",
+        key="Ab12Z",
+    )
+    inactive = UrlEntity.create(
+        user_id=uuid4(),
+        target_url="https://example.com/b",
+        key="Cd34Y",
+    ).update(is_active=False)
+    use_case, repository = make_use_case(entities=[active, inactive])
+
+    results = await use_case.execute(
+        keys=["Miss1", "Ab12Z", "Cd34Y", "Ab12Z"],
+    )
+
+    assert results == [
+        ResolvedKeyDTO(key="Miss1"),
+        ResolvedKeyDTO(
+            key="Ab12Z",
+            target_url="https://example.com/a",
+            is_active=True,
+        ),
+        ResolvedKeyDTO(
+            key="Cd34Y",
+            target_url="https://example.com/b",
+            is_active=False,
+        ),
+    ]
+    assert repository.get_by_keys_calls == [["Miss1", "Ab12Z", "Cd34Y"]]
+
+
+async def test_too_many_distinct_keys_are_rejected() -> None:
+    use_case, repository = make_use_case(entities=[], max_keys=2)
+
+    with pytest.raises(TooManyKeysError):
+        await use_case.execute(keys=["a", "b", "c"])
+
+    assert repository.get_by_keys_calls == []
@@ -0,0 +1,185 @@
+from uuid import uuid4
+
+import pytest
+
+from shortener_app.application.dtos.urls.urls_requests import CreateUrlDTO
+from shortener_app.application.exceptions.publish import (
+    PublishOverloadedError,
+)
+from shortener_app.application.exceptions.urls import TooManyUrlsError
+from shortener_app.application.mappers import UrlDtoFacade
+from shortener_app.application.mappers.components import (
+    UrlCacheToEntityMapper,
+    UrlCreatedMapper,
+    UrlPublishMapper,
+    UrlRedirectedMapper,
+    UrlToCacheRecordMapper,
+    UrlToResolveMapper,
+    UrlToUserUrlItemMapper,
+)
+from shortener_app.application.services.urls.key_reservation import (
+    UrlKeyReservationService,
+)
+from shortener_app.application.services.urls.url_cache import UrlCacheService
+from shortener_app.application.services.urls.url_enqueue import (
+    UrlPublishEnqueueService,
+)
+from shortener_app.application.use_cases.create_short_url import (
+    CreateUrlUseCase,
+)
+from shortener_app.infrastructures.codecs import UrlCacheRedisHashCodec
+from tests.testkit.cache import FakeCache
+from tests.testkit.keygen import SequenceKeyGenerator
+from tests.testkit.publish_queue import SpyNewUrlPublishQueue
+
+pytestmark = pytest.mark.unit
+
+
+def make_use_case(
+    *,
+    cache: FakeCache,
+    keys: list[str],
+    queue: SpyNewUrlPublishQueue,
+    max_attempts: int = 50,
+    max_batch_size: int = 1_000,
+) -> CreateUrlUseCase:
+    mapper = UrlDtoFacade(
+        publish_new_url=UrlPublishMapper(),
+        created=UrlCreatedMapper(),
+        publish_redirected_url=UrlRedirectedMapper(),
+        user_item=UrlToUserUrlItemMapper(),
+        url_cache_to_entity=UrlCacheToEntityMapper(),
+        url_to_cache_record=UrlToCacheRecordMapper(),
+        url_to_resolve=UrlToResolveMapper(),
+    )
+    return CreateUrlUseCase(
+        key_reservation_service=UrlKeyReservationService(
+            key_generator=SequenceKeyGenerator(keys=keys),
+            cache_service=UrlCacheService(
+                cache=cache,
+                codec=UrlCacheRedisHashCodec(),
+                mapper=mapper,
+            ),
+            max_attempts=max_attempts,
+        ),
+        publish_enqueue_service=UrlPublishEnqueueService(
+            new_urls_queue=queue,
+            clicks_queue=None,  # type: ignore[arg-type]
+        ),
+        mapper=mapper,
+        max_batch_size=max_batch_size,
+    )
+
+
+def make_dtos(count: int) -> list[CreateUrlDTO]:
+    user_id = uuid4()
+    return [
+        CreateUrlDTO(target_url=f"https://example.com/{i}", user_id=user_id)
+        for i in range(count)
+    ]
+
+
+async def test_reserves_with_one_round_trip_and_enqueues_in_order() -> None:
+    cache = FakeCache()
+    queue = SpyNewUrlPublishQueue()
+    use_case = make_use_case(
+        cache=cache,
+        keys=["aaaaa", "bbbbb", "ccccc"],
+        queue=queue,
+    )
+
+    results = await use_case.execute_many(dtos=make_dtos(3))
+
+    assert [r.created.key for r in results if r.created] == [
+        "aaaaa",
+        "bbbbb",
+        "ccccc",
+    ]
+    assert [dto.key for dto in queue.calls] == ["aaaaa", "bbbbb", "ccccc"]
+    assert cache.store["short:bbbbb"]["target_url"] == "https://example.com/1"
+
+
+async def test_only_colliding_items_are_retried() -> None:
+    cache = FakeCache(store={"short:bbbbb": {"target_url": "taken"}})
+    queue = SpyNewUrlPublishQueue()
+    use_case = make_use_case(
+        cache=cache,
+        keys=["aaaaa", "bbbbb", "aaaaa", "ccccc", "ddddd"],
+        queue=queue,
+    )
+
+    results = await use_case.execute_many(dtos=make_dtos(3))
+
+    # Round 1 draws aaaaa, bbbbb (taken) and aaaaa again (duplicate);
+    # round 2 draws ccccc and ddddd for the two leftovers.
+    assert [r.created.key for r in results if r.created] == [
+        "aaaaa",
+        "ccccc",
+        "ddddd",
+    ]
+    assert len(cache.set_nx_calls) == 4
+
+
+async def test_items_without_a_key_fail_on_their_own() -> None:
+    cache = FakeCache(store={"short:bbbbb": {"target_url": "taken"}})
+    queue = SpyNewUrlPublishQueue()
+    use_case = make_use_case(
+        cache=cache,
+        keys=["aaaaa", "bbbbb"],
+        queue=queue,
+        max_attempts=3,
+    )
+
+    results = await use_case.execute_many(dtos=make_dtos(2))
+
+    assert results[0].created is not None
+    assert results[1].created is None
+    assert results[1].error
+    assert results[1].target_url == "https://example.com/1"
+    assert [dto.key for dto in queue.calls] == ["aaaaa"]
+
+
+async def test_rejects_batches_over_the_limit() -> None:
+    use_case = make_use_case(
+        cache=FakeCache(),
+        keys=["aaaaa"],
+        queue=SpyNewUrlPublishQueue(),
+        max_batch_size=2,
+    )
+
+    with pytest.raises(TooManyUrlsError):
+        await use_case.execute_many(dtos=make_dtos(3))
+
+
+async def test_saturated_pipeline_fails_before_reserving_keys() -> None:
+    cache = FakeCache()
+    queue = SpyNewUrlPublishQueue(
+        admit_exc=PublishOverloadedError(retry_after_sec=1.0),
+    )
+    use_case = make_use_case(cache=cache, keys=["aaaaa"], queue=queue)
+
+    with pytest.raises(PublishOverloadedError):
+        await use_case.execute(dto=make_dtos(1)[0])
+
+    assert cache.store == {}
+    assert queue.calls == []
+
+
+async def test_shed_enqueue_releases_the_reserved_keys() -> None:
+    cache = FakeCache()
+    queue = SpyNewUrlPublishQueue(
+        exc=PublishOverloadedError(retry_after_sec=1.0),
+    )
+    use_case = make_use_case(
+        cache=cache,
+        keys=["aaaaa", "bbbbb", "ccccc"],
+        queue=queue,
+    )
+
+    with pytest.raises(PublishOverloadedError):
+        await use_case.execute(dto=make_dtos(1)[0])
+    with pytest.raises(PublishOverloadedError):
+        await use_case.execute_many(dtos=make_dtos(2))
+
+    assert queue.admit_calls == [1, 2]
+    assert cache.store == {}
@@ -0,0 +1,87 @@
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+
+import pytest
+
+from shortener_app.application.use_cases.flush_click_counters import (
+    FlushClickCountersUseCase,
+)
+from tests.testkit.repository import FakeRepository
+from tests.testkit.uow import FakeUnitOfWork
+
+pytestmark = pytest.mark.unit
+
+
+@dataclass
+class FakeClickCounterStore:
+    buckets: dict[str, dict[str, int]] = field(default_factory=dict)
+    released: list[str] = field(default_factory=list)
+
+    async def claim_closed(self) -> list[str]:
+        return sorted(self.buckets)
+
+    async def read(self, *, bucket: str) -> dict[str, int]:
+        return self.buckets[bucket]
+
+    async def release(self, *, bucket: str) -> None:
+        self.released.append(bucket)
+        del self.buckets[bucket]
+
+
+async def test_closed_buckets_are_applied_then_released() -> None:
+    repository = FakeRepository()
+    uow = FakeUnitOfWork(url_repository=repository)
+    store = FakeClickCounterStore(
+        buckets={"b1": {"aaaaa": 3}, "b2": {"aaaaa": 1, "bbbbb": 2}},
+    )
+
+    applied = await FlushClickCountersUseCase(
+        uow=uow,
+        counters=store,
+    ).execute()
+
+    assert applied == 6
+    assert repository.increment_calls == [
+        {"aaaaa": 3},
+        {"aaaaa": 1, "bbbbb": 2},
+    ]
+    assert uow.commit_calls == 2
+    assert store.released == ["b1", "b2"]
+
+
+async def test_empty_bucket_is_released_without_a_transaction() -> None:
+    repository = FakeRepository()
+    uow = FakeUnitOfWork(url_repository=repository)
+    store = FakeClickCounterStore(buckets={"b1": {}})
+
+    applied = await FlushClickCountersUseCase(
+        uow=uow,
+        counters=store,
+    ).execute()
+
+    assert applied == 0
+    assert repository.increment_calls == []
+    assert uow.commit_calls == 0
+    assert store.released == ["b1"]
+
+
+async def test_bucket_is_kept_when_the_database_write_fails() -> None:
+    class FailingRepository(FakeRepository):
+        async def increment_clicks(
+            self,
+            *,
+            increments: Mapping[str, int],  # noqa: ARG002
+        ) -> None:
+            raise RuntimeError("db down")
+
+    store = FakeClickCounterStore(buckets={"b1": {"aaaaa": 1}})
+    use_case = FlushClickCountersUseCase(
+        uow=FakeUnitOfWork(url_repository=FailingRepository()),
+        counters=store,
+    )
+
+    with pytest.raises(RuntimeError):
+        await use_case.execute()
+
+    assert store.released == []
+    assert "b1" in store.buckets
@@ -36,3 +36,38 @@ def test_reasonable_uniqueness() -> None:
     gen = RandomKeyGenerator()
     keys = [gen() for _ in range(500)]
     assert len(set(keys)) == len(keys)
+
+
+def test_generate_many_returns_keys_of_declared_chars() -> None:
+    gen = RandomKeyGenerator(length=7)
+
+    keys = gen.generate_many(1_000)
+
+    allowed = re.escape(gen.chars)
+    assert len(keys) == 1_000
+    assert all(re.fullmatch(rf"[{allowed}]{{7}}", key) for key in keys)
+    assert len(set(keys)) == len(keys)
+
+
+def test_generate_many_covers_the_alphabet_evenly() -> None:
+    gen = RandomKeyGenerator(length=10, chars="abc")
+
+    text = "".join(gen.generate_many(3_000))
+
+    # 256 % 3 == 1: byte 255 is rejected instead of favouring "a".
+    for char in "abc":
+        assert 9_000 < text.count(char) < 11_000
+
+
+def test_generate_many_falls_back_for_non_ascii_chars() -> None:
+    gen = RandomKeyGenerator(length=3, chars="äöü")
+
+    keys = gen.generate_many(10)
+
+    assert len(keys) == 10
+    assert all(set(key) <= set("äöü") for key in keys)
+
+
+def test_generate_many_handles_empty_requests() -> None:
+    assert RandomKeyGenerator().generate_many(0) == []
+    assert RandomKeyGenerator(length=0).generate_many(2) == ["", ""]
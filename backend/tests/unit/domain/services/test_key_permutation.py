@@ -0,0 +1,44 @@
+import re
+
+import pytest
+
+from shortener_app.domain.services.key_permutation import (
+    FeistelKeyPermutation,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_is_a_bijection_over_the_keyspace() -> None:
+    perm = FeistelKeyPermutation(secret=b"secret", length=2)
+
+    keys = {perm(index) for index in range(perm.capacity)}
+
+    assert len(keys) == perm.capacity == 62**2
+
+
+def test_keys_have_fixed_length_and_declared_chars() -> None:
+    perm = FeistelKeyPermutation(secret=b"secret")
+
+    allowed = re.escape(perm.chars)
+    for index in (0, 1, perm.capacity - 1):
+        assert re.fullmatch(rf"[{allowed}]{{5}}", perm(index))
+
+
+def test_mapping_is_stable_and_depends_on_secret() -> None:
+    first = FeistelKeyPermutation(secret=b"one")
+    again = FeistelKeyPermutation(secret=b"one")
+    other = FeistelKeyPermutation(secret=b"two")
+
+    keys = [first(index) for index in range(20)]
+
+    assert keys == [again(index) for index in range(20)]
+    assert keys != [other(index) for index in range(20)]
+    assert keys != sorted(keys)
+
+
+def test_rejects_index_outside_keyspace() -> None:
+    perm = FeistelKeyPermutation(secret=b"secret", length=2)
+
+    with pytest.raises(ValueError, match="outside the keyspace"):
+        perm(perm.capacity)
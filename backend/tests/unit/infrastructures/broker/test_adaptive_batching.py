@@ -0,0 +1,89 @@
+import asyncio
+
+import pytest
+
+from shortener_app.application.dtos.urls.urls_events import UrlClickedEventDTO
+from shortener_app.application.services.urls.url_publisher import (
+    UrlBrokerPublishService,
+)
+from shortener_app.infrastructures.broker.adaptive_batching import (
+    AdaptiveBatchController,
+    AdaptiveBatchPolicy,
+)
+from shortener_app.infrastructures.broker.click_publish_queue import (
+    ClickPublishQueue,
+)
+from tests.testkit.broker import FakeMessageBrokerPublisher
+
+pytestmark = pytest.mark.unit
+
+
+def make_controller(**policy: object) -> AdaptiveBatchController:
+    return AdaptiveBatchController(
+        policy=AdaptiveBatchPolicy(worker_patience=2, **policy),  # type: ignore[arg-type]
+        batch_size=100,
+        window_sec=0.1,
+        max_workers=4,
+    )
+
+
+def test_full_fast_batches_grow_additively() -> None:
+    controller = make_controller(batch_size_step=10, window_step_sec=0.01)
+
+    point = controller.on_batch(size=100, latency_ms=5.0, qsize=0)
+
+    assert point.batch_size == 110
+    assert point.window_sec == pytest.approx(0.11)
+
+
+def test_slow_publish_and_split_shrink_multiplicatively() -> None:
+    controller = make_controller(target_publish_ms=10.0)
+
+    assert (
+        controller.on_batch(size=100, latency_ms=20.0, qsize=0).batch_size
+        == 50
+    )
+    assert controller.on_split().batch_size == 25
+
+
+def test_sparse_batches_shrink_the_window() -> None:
+    controller = make_controller()
+
+    point = controller.on_batch(size=1, latency_ms=1.0, qsize=0)
+
+    assert point.window_sec == pytest.approx(0.05)
+    assert point.batch_size == 100
+
+
+def test_workers_follow_the_backlog() -> None:
+    controller = make_controller()
+    for _ in range(4):
+        controller.on_batch(size=1, latency_ms=1.0, qsize=0)
+    assert controller.point.workers == 2
+
+    for _ in range(2):
+        controller.on_batch(size=100, latency_ms=1.0, qsize=10_000)
+    assert controller.point.workers == 3
+
+
+async def test_queue_stops_waiting_for_full_batches_under_light_load() -> None:
+    broker = FakeMessageBrokerPublisher()
+    queue = ClickPublishQueue(
+        broker_publish_service=UrlBrokerPublishService(message_broker=broker),
+        workers=2,
+        batch_size=100,
+        batch_window_sec=0.05,
+        controller=make_controller(max_window_sec=0.05),
+    )
+    await queue.start()
+
+    for i in range(6):
+        await queue.enqueue(dto=UrlClickedEventDTO(key=f"k{i:04d}"))
+        await asyncio.sleep(0.06)
+
+    stats = queue.stats()
+    await queue.stop(drain=True, timeout_sec=1.0)
+
+    assert stats["batch_window_sec"] < 0.01
+    assert stats["active_workers"] == 1
+    assert sum(map(len, broker.publish_update_urls_batch_calls)) == 6
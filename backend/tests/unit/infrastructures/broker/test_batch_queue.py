@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from shortener_app.infrastructures.broker.batch_queue import BatchQueue
+
+pytestmark = pytest.mark.unit
+
+
+async def test_get_batch_drains_available_items_up_to_the_limit() -> None:
+    queue: BatchQueue[int] = BatchQueue()
+    assert queue.put_many_nowait(range(5)) == 5
+
+    assert await queue.get_batch(3, window_sec=1.0) == [0, 1, 2]
+    assert await queue.get_batch(3, window_sec=0) == [3, 4]
+
+
+async def test_get_batch_collects_until_the_window_closes() -> None:
+    queue: BatchQueue[int] = BatchQueue()
+
+    async def produce() -> None:
+        for i in range(3):
+            await queue.put(i)
+            await asyncio.sleep(0.01)
+
+    producer = asyncio.create_task(produce())
+    batch = await queue.get_batch(100, window_sec=0.1)
+    await producer
+
+    assert batch == [0, 1, 2]
+
+
+async def test_full_queue_rejects_and_put_waits_for_room() -> None:
+    queue: BatchQueue[int] = BatchQueue(maxsize=2)
+    assert queue.put_many_nowait([1, 2, 3]) == 2
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait(3)
+
+    waiting = asyncio.create_task(queue.put(3))
+    await asyncio.sleep(0)
+    assert not waiting.done()
+
+    assert await queue.get_batch(1, window_sec=0) == [1]
+    await asyncio.wait_for(waiting, timeout=1.0)
+    assert queue.qsize() == 2
+
+
+async def test_close_wakes_consumers_and_join_waits_for_task_done() -> None:
+    queue: BatchQueue[int] = BatchQueue()
+    consumer = asyncio.create_task(queue.get_batch(10, window_sec=10.0))
+    await queue.put(1)
+    await asyncio.sleep(0)
+
+    queue.close()
+
+    assert await asyncio.wait_for(consumer, timeout=1.0) == [1]
+    assert await queue.get_batch(10, window_sec=10.0) == []
+
+    joined = asyncio.create_task(queue.join())
+    await asyncio.sleep(0)
+    assert not joined.done()
+    queue.task_done()
+    await asyncio.wait_for(joined, timeout=1.0)
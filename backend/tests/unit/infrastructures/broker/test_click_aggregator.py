@@ -0,0 +1,84 @@
+from uuid import uuid4
+
+import pytest
+
+from shortener_app.application.dtos.urls.urls_events import UrlClickedEventDTO
+from shortener_app.infrastructures.broker.click_aggregator import (
+    ClickAggregator,
+)
+from shortener_app.infrastructures.codecs import UrlClickedJsonCodec
+
+pytestmark = pytest.mark.unit
+
+
+class RecordingQueue:
+    def __init__(self, *, accept: bool = True) -> None:
+        self.accept = accept
+        self.events: list[UrlClickedEventDTO] = []
+
+    async def enqueue(self, *, dto: UrlClickedEventDTO) -> bool:
+        self.events.append(dto)
+        return self.accept
+
+
+async def test_clicks_are_summed_per_key_within_a_window() -> None:
+    queue = RecordingQueue()
+    aggregator = ClickAggregator(queue=queue)
+
+    for key in ("aaaaa", "bbbbb", "aaaaa", "aaaaa"):
+        assert await aggregator.enqueue(dto=UrlClickedEventDTO(key=key))
+
+    assert queue.events == []
+
+    await aggregator.flush()
+
+    counts = {e.key: e.count for e in queue.events}
+    assert counts == {"aaaaa": 3, "bbbbb": 1}
+    assert aggregator.stats()["emitted"] == 2
+
+
+async def test_event_ids_are_deterministic_per_window_and_key() -> None:
+    namespace = uuid4()
+    first, second = RecordingQueue(), RecordingQueue()
+
+    for queue in (first, second):
+        aggregator = ClickAggregator(queue=queue, namespace=namespace)
+        await aggregator.enqueue(dto=UrlClickedEventDTO(key="aaaaa"))
+        await aggregator.flush()
+        await aggregator.enqueue(dto=UrlClickedEventDTO(key="aaaaa"))
+        await aggregator.flush()
+
+    assert [e.event_id for e in first.events] == [
+        e.event_id for e in second.events
+    ]
+    assert first.events[0].event_id != first.events[1].event_id
+
+
+async def test_new_keys_bypass_aggregation_past_max_keys() -> None:
+    queue = RecordingQueue()
+    aggregator = ClickAggregator(queue=queue, max_keys=1)
+
+    await aggregator.enqueue(dto=UrlClickedEventDTO(key="aaaaa"))
+    await aggregator.enqueue(dto=UrlClickedEventDTO(key="aaaaa"))
+    await aggregator.enqueue(dto=UrlClickedEventDTO(key="bbbbb"))
+
+    assert [(e.key, e.count) for e in queue.events] == [("bbbbb", 1)]
+    assert aggregator.stats()["bypassed"] == 1
+
+
+async def test_stop_flushes_pending_clicks() -> None:
+    queue = RecordingQueue()
+    aggregator = ClickAggregator(queue=queue, window_sec=60.0)
+    await aggregator.start()
+
+    await aggregator.enqueue(dto=UrlClickedEventDTO(key="aaaaa"))
+    await aggregator.stop()
+
+    assert [(e.key, e.count) for e in queue.events] == [("aaaaa", 1)]
+
+
+def test_codec_round_trips_click_count() -> None:
+    codec = UrlClickedJsonCodec()
+    dto = UrlClickedEventDTO(key="aaaaa", count=7)
+
+    assert codec.decode(codec.encode(dto)) == dto
@@ -0,0 +1,104 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from shortener_app.application.dtos.urls.urls_events import UrlClickedEventDTO
+from shortener_app.application.services.urls.url_publisher import (
+    UrlBrokerPublishService,
+)
+from shortener_app.infrastructures.broker.click_publish_queue import (
+    ClickPublishQueue,
+)
+from tests.testkit.broker import FakeMessageBrokerPublisher
+
+pytestmark = pytest.mark.unit
+
+
+def make_queue(
+    broker: FakeMessageBrokerPublisher,
+    **kwargs: Any,
+) -> ClickPublishQueue:
+    return ClickPublishQueue(
+        broker_publish_service=UrlBrokerPublishService(message_broker=broker),
+        **kwargs,
+    )
+
+
+async def test_clicks_are_published_in_batches() -> None:
+    broker = FakeMessageBrokerPublisher()
+    queue = make_queue(
+        broker,
+        workers=1,
+        batch_size=10,
+        batch_window_sec=0.05,
+    )
+    await queue.start()
+
+    for i in range(25):
+        assert await queue.enqueue(dto=UrlClickedEventDTO(key=f"k{i:04d}"))
+
+    await queue.stop(drain=True, timeout_sec=1.0)
+
+    sizes = [len(batch) for batch in broker.publish_update_urls_batch_calls]
+    assert sizes == [10, 10, 5]
+    assert broker.publish_update_url_calls == []
+
+
+async def test_totals_span_every_report_interval() -> None:
+    broker = FakeMessageBrokerPublisher()
+    queue = make_queue(
+        broker,
+        workers=1,
+        batch_size=5,
+        batch_window_sec=0.001,
+        report_interval_sec=0.005,
+    )
+    await queue.start()
+
+    for i in range(20):
+        await queue.enqueue(dto=UrlClickedEventDTO(key=f"k{i:04d}"))
+        await asyncio.sleep(0.002)
+
+    await queue.stop(drain=True, timeout_sec=1.0)
+
+    assert queue.stats()["published_msgs_per_interval"] < 20
+    assert queue.totals()["published_msgs"] == 20
+    assert queue.totals()["enqueued"] == 20
+
+
+async def test_full_queue_drops_instead_of_blocking() -> None:
+    broker = FakeMessageBrokerPublisher()
+    queue = make_queue(broker, maxsize=2, enqueue_timeout_sec=0.001)
+
+    results = [
+        await queue.enqueue(dto=UrlClickedEventDTO(key="Ab12Z"))
+        for _ in range(3)
+    ]
+
+    assert results == [True, True, False]
+    assert queue.stats()["dropped_per_interval"] == 1
+    assert queue.stats()["qsize"] == 2
+
+
+async def test_failed_batch_is_retried() -> None:
+    broker = FakeMessageBrokerPublisher(
+        raise_on_publish_update_urls_batch=RuntimeError("broker down"),
+    )
+    queue = make_queue(
+        broker,
+        workers=1,
+        max_retries=3,
+        base_backoff_sec=0.001,
+        batch_window_sec=0.01,
+    )
+    await queue.start()
+
+    await queue.enqueue(dto=UrlClickedEventDTO(key="Ab12Z"))
+    await asyncio.sleep(0.05)
+    stats = queue.stats()
+    await queue.stop(drain=False)
+
+    assert len(broker.publish_update_urls_batch_calls) == 3
+    assert stats["retries_per_interval"] == 3
+    assert stats["failures_per_interval"] == 1
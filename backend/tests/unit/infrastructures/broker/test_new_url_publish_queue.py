@@ -0,0 +1,161 @@
+import asyncio
+from pathlib import Path
+from uuid import uuid4
+
+import pytest
+
+from shortener_app.application.dtos.urls.urls_events import PublishUrlDTO
+from shortener_app.application.exceptions.publish import (
+    PublishOverloadedError,
+)
+from shortener_app.application.services.admission import AdmissionController
+from shortener_app.application.services.urls.url_publisher import (
+    UrlBrokerPublishService,
+)
+from shortener_app.infrastructures.broker.new_url_publish_queue import (
+    NewUrlPublishQueue,
+)
+from shortener_app.infrastructures.broker.spill_log import SpillLog
+from shortener_app.infrastructures.codecs import PublishUrlJsonCodec
+from tests.testkit.broker import FakeMessageBrokerPublisher
+
+pytestmark = pytest.mark.unit
+
+
+def make_dto(key: str) -> PublishUrlDTO:
+    return PublishUrlDTO(
+        key=key,
+        target_url="https://example.com",
+        user_id=uuid4(),
+    )
+
+
+def make_queue(
+    broker: FakeMessageBrokerPublisher,
+    spill: SpillLog,
+    **kwargs: object,
+) -> NewUrlPublishQueue:
+    return NewUrlPublishQueue(
+        broker_publish_service=UrlBrokerPublishService(message_broker=broker),
+        spill=spill,
+        spill_codec=PublishUrlJsonCodec(),
+        replay_interval_sec=0.01,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+async def test_full_queue_spills_instead_of_blocking(tmp_path: Path) -> None:
+    broker = FakeMessageBrokerPublisher()
+    spill = SpillLog(directory=tmp_path)
+    await spill.start()
+    queue = make_queue(broker, spill, maxsize=1, enqueue_timeout_sec=0.001)
+
+    await queue.enqueue(dto=make_dto("aaaaa"))
+    await asyncio.wait_for(queue.enqueue(dto=make_dto("bbbbb")), timeout=1.0)
+
+    stats = queue.stats()
+    assert stats["qsize"] == 1
+    assert stats["spill_pending_records"] == 1
+    assert stats["spilled_per_interval"] == 1
+    await spill.close()
+
+
+async def test_failed_batch_is_spilled_and_replayed(tmp_path: Path) -> None:
+    broker = FakeMessageBrokerPublisher(
+        raise_on_publish_new_urls_batch=RuntimeError("broker down"),
+    )
+    queue = make_queue(
+        broker,
+        SpillLog(directory=tmp_path),
+        workers=1,
+        max_retries=1,
+        base_backoff_sec=0.001,
+        batch_window_sec=0.01,
+    )
+    await queue.start()
+
+    await queue.enqueue_many(dtos=[make_dto("aaaaa"), make_dto("bbbbb")])
+    await asyncio.sleep(0.05)
+    assert queue.stats()["spill_pending_records"] == 2
+
+    broker.raise_on_publish_new_urls_batch = None
+    await asyncio.sleep(0.2)
+    stats = queue.stats()
+    await queue.stop(drain=True, timeout_sec=1.0)
+
+    assert [dto.key for dto in broker.publish_new_urls_batch_calls[-1]] == [
+        "aaaaa",
+        "bbbbb",
+    ]
+    assert stats["spill_pending_records"] == 0
+    assert stats["replayed_per_interval"] == 2
+
+
+async def test_spilled_urls_are_replayed_after_restart(tmp_path: Path) -> None:
+    log = SpillLog(directory=tmp_path)
+    await log.start()
+    log.append([PublishUrlJsonCodec().encode(make_dto("aaaaa"))])
+    await log.close()
+
+    broker = FakeMessageBrokerPublisher()
+    queue = make_queue(broker, SpillLog(directory=tmp_path))
+    await queue.start()
+    await asyncio.sleep(0.05)
+    await queue.stop(drain=True, timeout_sec=1.0)
+
+    assert [
+        [dto.key for dto in batch]
+        for batch in broker.publish_new_urls_batch_calls
+    ] == [["aaaaa"]]
+
+
+async def test_saturated_queue_sheds_with_a_retry_hint() -> None:
+    queue = NewUrlPublishQueue(
+        broker_publish_service=UrlBrokerPublishService(
+            message_broker=FakeMessageBrokerPublisher(),
+        ),
+        admission=AdmissionController(
+            high_depth=2,
+            low_depth=1,
+            retry_after_sec=0.5,
+        ),
+    )
+    await queue.enqueue_many(dtos=[make_dto("aaaaa"), make_dto("bbbbb")])
+
+    with pytest.raises(PublishOverloadedError) as exc:
+        await queue.enqueue(dto=make_dto("ccccc"))
+
+    assert exc.value.retry_after_sec == 0.5
+    stats = queue.stats()
+    assert stats["shedding"] is True
+    assert stats["shed_per_interval"] == 1
+    assert stats["qsize"] == 2
+
+
+class SlowBroker(FakeMessageBrokerPublisher):
+    async def publish_new_urls_batch(self, dtos: list[PublishUrlDTO]) -> None:
+        await asyncio.sleep(0.05)
+        await super().publish_new_urls_batch(dtos)
+
+
+async def test_slow_broker_acks_start_shedding() -> None:
+    admission = AdmissionController(
+        high_depth=100,
+        low_depth=10,
+        high_latency_ms=20.0,
+        low_latency_ms=5.0,
+        smoothing=1.0,
+    )
+    queue = NewUrlPublishQueue(
+        broker_publish_service=UrlBrokerPublishService(
+            message_broker=SlowBroker(),
+        ),
+        admission=admission,
+        batch_window_sec=0.0,
+    )
+    await queue.start()
+    await queue.enqueue(dto=make_dto("aaaaa"))
+    await queue.stop(drain=True, timeout_sec=1.0)
+
+    assert queue.stats()["publish_latency_ms"] >= 40.0
+    assert not admission.admit(depth=1)
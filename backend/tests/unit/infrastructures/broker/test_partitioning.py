@@ -0,0 +1,135 @@
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from aiokafka.partitioner import DefaultPartitioner
+
+from shortener_app.application.dtos.urls.urls_events import (
+    PublishUrlDTO,
+    UrlClickedEventDTO,
+)
+from shortener_app.infrastructures.broker.partitioning import (
+    group_by_partition,
+    partition_for,
+)
+from shortener_app.infrastructures.broker.publisher import KafkaPublisher
+from shortener_app.infrastructures.codecs import (
+    PublishUrlJsonCodec,
+    UrlClickedJsonCodec,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class RecordingBroker:
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    async def publish_batch(self, *messages: Any, **kwargs: Any) -> None:
+        self.calls.append(
+            {"keys": [m.key for m in messages], **kwargs},
+        )
+
+    async def publish(self, *_: Any, key: bytes, **kwargs: Any) -> None:
+        self.calls.append({"keys": [key], **kwargs})
+
+
+class FixedPartitionMap:
+    def __init__(self, count: int) -> None:
+        self.count = count
+
+    async def partitions(self, topic: str) -> int:  # noqa: ARG002
+        return self.count
+
+
+def make_publisher(
+    broker: RecordingBroker,
+    partitions: int | None,
+    **kwargs: Any,
+) -> KafkaPublisher:
+    return KafkaPublisher(
+        broker=broker,  # type: ignore[arg-type]
+        publish_url_codec=PublishUrlJsonCodec(),
+        url_clicked_codec=UrlClickedJsonCodec(),
+        partition_map=(
+            FixedPartitionMap(partitions) if partitions is not None else None
+        ),
+        **kwargs,
+    )
+
+
+def make_dto(key: str) -> PublishUrlDTO:
+    return PublishUrlDTO(key=key, target_url="https://e.com", user_id=uuid4())
+
+
+def test_partition_matches_the_kafka_default_partitioner() -> None:
+    partitions = list(range(12))
+    for key in (b"Ab12Z", b"x", str(uuid4()).encode()):
+        assert partition_for(key, 12) == DefaultPartitioner()(
+            key,
+            partitions,
+            partitions,
+        )
+
+
+def test_group_by_partition_keeps_order_within_a_partition() -> None:
+    keys = [f"k{i}".encode() for i in range(50)]
+
+    groups = group_by_partition(keys, key=lambda k: k, partitions=4)
+
+    assert sorted(k for group in groups.values() for k in group) == sorted(
+        keys,
+    )
+    for partition, group in groups.items():
+        assert all(partition_for(k, 4) == partition for k in group)
+        assert group == [k for k in keys if k in group]
+
+
+async def test_new_urls_are_published_once_per_partition() -> None:
+    broker = RecordingBroker()
+    publisher = make_publisher(broker, partitions=4)
+    dtos = [make_dto(f"key{i:02d}") for i in range(40)]
+
+    await publisher.publish_new_urls_batch(dtos)
+
+    assert len(broker.calls) == len({c["partition"] for c in broker.calls})
+    for call in broker.calls:
+        assert call["topic"] == "new-urls"
+        assert {partition_for(k, 4) for k in call["keys"]} == {
+            call["partition"],
+        }
+
+
+async def test_new_urls_can_be_keyed_by_user() -> None:
+    broker = RecordingBroker()
+    publisher = make_publisher(broker, partitions=None, new_urls_key="user_id")
+    dto = make_dto("Ab12Z")
+
+    await publisher.publish_new_urls_batch([dto])
+
+    assert broker.calls == [
+        {
+            "keys": [str(dto.user_id).encode()],
+            "topic": "new-urls",
+            "headers": None,
+        },
+    ]
+
+
+async def test_clicks_keep_their_key_without_partition_metadata() -> None:
+    broker = RecordingBroker()
+    publisher = make_publisher(broker, partitions=0)
+    dtos = [
+        UrlClickedEventDTO(key=key, event_id=uuid4())
+        for key in ("Ab12Z", "Cd34Y", "Ab12Z")
+    ]
+
+    await publisher.publish_update_urls_batch(dtos)
+
+    # No partition count: one keyed send per click, partitioned by key.
+    assert [call["keys"] for call in broker.calls] == [
+        [b"Ab12Z"],
+        [b"Cd34Y"],
+        [b"Ab12Z"],
+    ]
+    assert all("partition" not in call for call in broker.calls)
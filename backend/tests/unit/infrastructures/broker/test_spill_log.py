@@ -0,0 +1,110 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from shortener_app.infrastructures.broker.spill_log import SpillLog
+
+pytestmark = pytest.mark.unit
+
+
+async def open_log(directory: Path, **kwargs: object) -> SpillLog:
+    log = SpillLog(directory=directory, **kwargs)  # type: ignore[arg-type]
+    await log.start()
+    return log
+
+
+async def test_records_are_read_back_in_order(tmp_path: Path) -> None:
+    log = await open_log(tmp_path)
+    log.append([b"one", b"two", b"three"])
+
+    records, position = log.read(2)
+    log.commit(position)
+
+    assert records == [b"one", b"two"]
+    assert log.read(10)[0] == [b"three"]
+    assert log.stats()["pending_records"] == 1
+    await log.close()
+
+
+async def test_uncommitted_records_survive_a_restart(tmp_path: Path) -> None:
+    log = await open_log(tmp_path)
+    log.append([b"one", b"two", b"three"])
+    log.commit(log.read(1)[1])
+    await log.close()
+
+    log = await open_log(tmp_path)
+
+    assert log.read(10)[0] == [b"two", b"three"]
+    assert log.pending_records == 2
+    await log.close()
+
+
+async def test_fully_read_segments_are_deleted(tmp_path: Path) -> None:
+    log = await open_log(tmp_path, segment_bytes=32)
+    log.append([b"a" * 20, b"b" * 20, b"c" * 20])
+    assert len(list(tmp_path.glob("*.spill"))) == 3
+
+    log.commit(log.read(2)[1])
+    await log.flush()
+
+    assert log.read(10)[0] == [b"c" * 20]
+    assert len(list(tmp_path.glob("*.spill"))) == 2
+    await log.close()
+
+
+async def test_torn_tail_ends_the_log(tmp_path: Path) -> None:
+    log = await open_log(tmp_path, segment_bytes=64)
+    log.append([b"one", b"two"])
+    await log.close()
+
+    # Corrupt the second record's payload, as a crash mid-write would.
+    segment = next(tmp_path.glob("*.spill"))
+    data = bytearray(segment.read_bytes())
+    data[8 + 3 + 8] ^= 0xFF
+    segment.write_bytes(bytes(data))
+
+    log = await open_log(tmp_path, segment_bytes=64)
+    log.append([b"new"])
+
+    assert log.read(10)[0] == [b"one", b"new"]
+    await log.close()
+
+
+async def test_close_waits_for_a_cancelled_flush(tmp_path: Path) -> None:
+    log = await open_log(tmp_path, segment_bytes=32)
+    log.append([b"a" * 20, b"b" * 20])
+    log.commit(log.read(1)[1])
+
+    flush = asyncio.create_task(log.flush())
+    await asyncio.sleep(0)
+    flush.cancel()
+    # The flush thread still holds the retired map; close must not race it.
+    await log.close()
+
+    assert flush.cancelled()
+    log = await open_log(tmp_path, segment_bytes=32)
+    assert log.read(10)[0] == [b"b" * 20]
+    await log.close()
+
+
+async def test_commits_are_persisted_by_the_next_flush(tmp_path: Path) -> None:
+    log = await open_log(tmp_path, fsync_interval_sec=60)
+    log.append([b"one", b"two"])
+    log.commit(log.read(1)[1])
+
+    assert not (tmp_path / "cursor").exists()
+    await log.flush()
+    assert (tmp_path / "cursor").exists()
+    await log.close()
+
+
+async def test_append_past_max_bytes_fails_whole(tmp_path: Path) -> None:
+    log = await open_log(tmp_path, segment_bytes=32, max_bytes=64)
+    log.append([b"a" * 20])
+
+    with pytest.raises(OSError, match="spill log is full"):
+        log.append([b"b" * 20, b"c" * 20])
+
+    assert log.read(10)[0] == [b"a" * 20]
+    await log.close()
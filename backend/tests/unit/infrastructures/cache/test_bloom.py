@@ -0,0 +1,208 @@
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+import pytest
+from redis.asyncio import Redis
+
+from shortener_app.infrastructures.cache.bloom import (
+    BloomFilter,
+    RedisBloomKeyFilter,
+)
+
+pytestmark = pytest.mark.unit
+
+
+def test_added_keys_are_always_found() -> None:
+    bloom = BloomFilter(capacity=1_000, error_rate=0.01)
+    keys = [f"k{i:04d}" for i in range(1_000)]
+
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+
+
+def test_false_positive_rate_stays_near_target() -> None:
+    bloom = BloomFilter(capacity=5_000, error_rate=0.01)
+    for i in range(5_000):
+        bloom.add(f"present-{i}")
+
+    false_positives = sum(f"absent-{i}" in bloom for i in range(20_000))
+
+    assert false_positives / 20_000 < 0.02
+    assert bloom.stats()["estimated_fpr"] < 0.02
+
+
+def test_bit_layout_matches_redis_bitmaps() -> None:
+    bloom = BloomFilter(capacity=10, error_rate=0.1)
+    [offset, *_] = bloom.add("Ab12Z")
+
+    raw = bloom.to_bytes()
+
+    assert raw[offset >> 3] & (0x80 >> (offset & 7))
+
+
+def test_merge_is_a_union() -> None:
+    left = BloomFilter(capacity=100, error_rate=0.01)
+    right = BloomFilter(capacity=100, error_rate=0.01)
+    left.add("aaaaa")
+    right.add("bbbbb")
+
+    left.merge(right.to_bytes())
+
+    assert "aaaaa" in left
+    assert "bbbbb" in left
+
+
+def test_merge_rejects_foreign_geometry() -> None:
+    bloom = BloomFilter(capacity=100, error_rate=0.01)
+
+    with pytest.raises(ValueError, match="size mismatch"):
+        bloom.merge(bytes(len(bloom.to_bytes()) + 1))
+
+
+class FakeRedis:
+    """Just enough of redis.asyncio.Redis for RedisBloomKeyFilter."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.run_id = "run-1"
+
+    def restart(self) -> None:
+        self.data.clear()
+        self.run_id = "run-2"
+
+    def pipeline(self, *, transaction: bool = True) -> "FakePipeline":  # noqa: ARG002
+        return FakePipeline(self)
+
+    async def info(self, section: str) -> dict[str, str]:  # noqa: ARG002
+        return {"run_id": self.run_id}
+
+    async def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def mget(self, keys: list[str]) -> list[Any]:
+        return [self.data.get(key) for key in keys]
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def smembers(self, key: str) -> set[bytes]:
+        return set(self.data.get(key, set()))
+
+    async def sadd(self, key: str, *members: str) -> int:
+        self.data.setdefault(key, set()).update(m.encode() for m in members)
+        return len(members)
+
+    async def srem(self, key: str, *members: bytes) -> int:
+        self.data.get(key, set()).difference_update(members)
+        return len(members)
+
+    async def setbit(self, key: str, offset: int, value: int) -> int:
+        buf = bytearray(self.data.get(key, b""))
+        buf.extend(bytes(max(0, (offset >> 3) + 1 - len(buf))))
+        if value:
+            buf[offset >> 3] |= 0x80 >> (offset & 7)
+        self.data[key] = bytes(buf)
+        return 0
+
+    async def bitop(self, op: str, dest: str, *keys: str) -> int:  # noqa: ARG002
+        values = [self.data.get(key, b"") for key in keys]
+        size = max(map(len, values))
+        merged = 0
+        for value in values:
+            merged |= int.from_bytes(value.ljust(size, b"\x00"), "big")
+        self.data[dest] = merged.to_bytes(size, "big")
+        return size
+
+    # Last, so `set` in the annotations above is still the builtin.
+    async def set(self, key: str, value: Any, **kwargs: Any) -> bool:
+        if kwargs.get("nx") and key in self.data:
+            return False
+        self.data[key] = (
+            value if isinstance(value, bytes) else str(value).encode()
+        )
+        return True
+
+
+class FakePipeline:
+    def __init__(self, client: FakeRedis) -> None:
+        self._client = client
+        self._calls: list[Any] = []
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        return None
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self._client, name)
+        return lambda *args, **kwargs: self._calls.append(
+            method(*args, **kwargs),
+        )
+
+    async def execute(self) -> list[Any]:
+        calls, self._calls = self._calls, []
+        return [await call for call in calls]
+
+
+async def scan(keys: list[str]) -> AsyncIterator[str]:
+    for key in keys:
+        yield key
+
+
+def make_filter(client: FakeRedis, keys: list[str]) -> RedisBloomKeyFilter:
+    return RedisBloomKeyFilter(
+        client=cast(Redis, client),
+        capacity=1_000,
+        error_rate=0.01,
+        keys=lambda: scan(keys),
+    )
+
+
+@pytest.mark.asyncio
+async def test_unproven_bitmap_falls_through_until_rebuilt() -> None:
+    client = FakeRedis()
+    key_filter = make_filter(client, ["Ab12Z"])
+
+    assert await key_filter.load() is False
+    assert key_filter.might_contain("unknown") is True
+
+    assert await key_filter.ensure_complete() is True
+    assert key_filter.might_contain("Ab12Z") is True
+    assert key_filter.might_contain("unknown") is False
+
+    # Another instance trusts the stamped bitmap without rebuilding.
+    assert await make_filter(client, []).load() is True
+
+
+@pytest.mark.asyncio
+async def test_restarted_redis_invalidates_the_bitmap() -> None:
+    client = FakeRedis()
+    key_filter = make_filter(client, ["Ab12Z"])
+    await key_filter.ensure_complete()
+
+    client.restart()
+    key_filter.add("Cd34Y")
+    await key_filter.sync()
+
+    # Rebuilt from the database; the restart lost the stamp, not the keys.
+    assert key_filter.stats()["rebuilds"] == 2
+    assert await make_filter(client, []).load() is True
+
+
+@pytest.mark.asyncio
+async def test_writer_without_lease_invalidates_the_bitmap() -> None:
+    client = FakeRedis()
+    crashed = make_filter(client, [])
+    await crashed.ensure_complete()
+    await crashed._renew_lease()
+    # The process died: its lease expired with bits never flushed.
+    del client.data[crashed._lease_key]
+
+    key_filter = make_filter(client, [])
+
+    assert await key_filter.load() is False
+    assert key_filter.might_contain("anything") is True
+    assert await make_filter(client, []).load() is False
@@ -0,0 +1,82 @@
+import pytest
+
+from shortener_app.infrastructures.cache.circuit_breaker import (
+    BreakerState,
+    CircuitBreaker,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_opens_after_consecutive_failures() -> None:
+    breaker = CircuitBreaker(
+        name="test",
+        failure_threshold=2,
+        reset_timeout_sec=5.0,
+        clock=FakeClock(),
+    )
+
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state is BreakerState.CLOSED
+
+    breaker.record_failure()
+    assert breaker.state is BreakerState.OPEN
+    assert breaker.is_open() is True
+    assert breaker.allow() is False
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_half_open_lets_one_probe_through() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        name="test",
+        failure_threshold=1,
+        reset_timeout_sec=5.0,
+        clock=clock,
+    )
+    breaker.record_failure()
+
+    clock.now = 5.0
+    assert breaker.is_open() is False
+    assert breaker.allow() is True
+    assert breaker.state is BreakerState.HALF_OPEN
+    assert breaker.allow() is False
+
+    breaker.record_failure()
+    assert breaker.state is BreakerState.OPEN
+
+    clock.now = 10.0
+    assert breaker.allow() is True
+    breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.stats()["opened"] == 2
+
+
+def test_released_probe_can_be_claimed_again() -> None:
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        name="test",
+        failure_threshold=1,
+        reset_timeout_sec=5.0,
+        clock=clock,
+    )
+    breaker.record_failure()
+    clock.now = 5.0
+    assert breaker.allow() is True
+
+    # The probe call was cancelled before Redis answered.
+    breaker.release_probe()
+
+    assert breaker.state is BreakerState.HALF_OPEN
+    assert breaker.allow() is True
+    assert breaker.allow() is False
@@ -0,0 +1,68 @@
+from types import TracebackType
+from typing import Self, cast
+
+import pytest
+import redis.exceptions
+from redis.asyncio import Redis
+
+from shortener_app.application.dtos.urls.urls_events import UrlClickedEventDTO
+from shortener_app.infrastructures.cache.circuit_breaker import (
+    BreakerState,
+    CircuitBreaker,
+)
+from shortener_app.infrastructures.cache.click_counter import (
+    RedisClickCounter,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FailingPipeline:
+    def __init__(self, client: "FailingRedis") -> None:
+        self._client = client
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        return None
+
+    def hincrby(self, *args: object) -> None:
+        return None
+
+    def zadd(self, *args: object) -> None:
+        return None
+
+    async def execute(self) -> list[object]:
+        self._client.calls += 1
+        raise redis.exceptions.ConnectionError("down")
+
+
+class FailingRedis:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def pipeline(self, *, transaction: bool) -> FailingPipeline:
+        return FailingPipeline(self)
+
+
+async def test_open_breaker_drops_clicks_without_calling_redis() -> None:
+    client = FailingRedis()
+    breaker = CircuitBreaker(name="test", failure_threshold=2)
+    counter = RedisClickCounter(
+        client=cast(Redis, client),
+        breaker=breaker,
+    )
+    dto = UrlClickedEventDTO(key="abc", count=1)
+
+    for _ in range(4):
+        assert await counter.enqueue(dto=dto) is False
+
+    assert client.calls == 2
+    assert breaker.state is BreakerState.OPEN
+    assert counter.stats() == {"clicks": 0, "failures": 2, "skipped": 2}
@@ -0,0 +1,86 @@
+import pytest
+
+from shortener_app.infrastructures.cache.local_cache import InMemoryLRUCache
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_value_until_ttl_expires() -> None:
+    clock = FakeClock()
+    cache: InMemoryLRUCache[str] = InMemoryLRUCache(
+        maxsize=10,
+        ttl_sec=5.0,
+        clock=clock,
+    )
+
+    cache.set("Ab12Z", "https://example.com")
+    assert cache.get("Ab12Z") == "https://example.com"
+
+    clock.now = 5.0
+    assert cache.get("Ab12Z") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["expirations"] == 1
+    assert stats["size"] == 0
+
+
+def test_evicts_least_recently_used_when_full() -> None:
+    cache: InMemoryLRUCache[int] = InMemoryLRUCache(maxsize=2, ttl_sec=60.0)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" becomes the LRU entry
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_delete_counts_only_existing_keys() -> None:
+    cache: InMemoryLRUCache[int] = InMemoryLRUCache(maxsize=2, ttl_sec=60.0)
+    cache.set("a", 1)
+
+    assert cache.delete("a") is True
+    assert cache.delete("a") is False
+    assert cache.stats()["invalidations"] == 1
+
+
+@pytest.mark.parametrize(("maxsize", "ttl_sec"), [(0, 1.0), (1, 0.0)])
+def test_rejects_invalid_bounds(maxsize: int, ttl_sec: float) -> None:
+    with pytest.raises(ValueError, match="must be > 0"):
+        InMemoryLRUCache(maxsize=maxsize, ttl_sec=ttl_sec)
+
+
+def test_expired_entry_is_retained_for_stale_reads() -> None:
+    clock = FakeClock()
+    cache: InMemoryLRUCache[str] = InMemoryLRUCache(
+        maxsize=10,
+        ttl_sec=5.0,
+        stale_ttl_sec=10.0,
+        clock=clock,
+    )
+    cache.set("Ab12Z", "https://example.com")
+
+    clock.now = 7.0
+    assert cache.get("Ab12Z") is None
+    assert cache.get_stale("Ab12Z") == "https://example.com"
+    assert cache.get_stale("Ab12Z", max_stale_sec=1.0) is None
+
+    clock.now = 15.0
+    assert cache.get_stale("Ab12Z") is None
+    assert cache.get("Ab12Z") is None
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["stale_hits"] == 1
@@ -0,0 +1,61 @@
+from collections.abc import AsyncIterator
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from shortener_app.infrastructures.db import (
+    UnitOfWork,
+    engine_factory,
+    get_session_factory,
+)
+from tests.testkit.repository import FakeRepository
+
+pytestmark = pytest.mark.unit
+
+UNREACHABLE_DSN = "postgresql+asyncpg://u:p@127.0.0.1:1/db"
+
+
+@pytest.fixture
+async def engine() -> AsyncIterator[AsyncEngine]:
+    eng = engine_factory(dsn=UNREACHABLE_DSN, is_echo=False)
+    try:
+        yield eng
+    finally:
+        await eng.dispose()
+
+
+async def test_unused_unit_of_work_never_checks_out_a_connection(
+    engine: AsyncEngine,
+) -> None:
+    checkouts: list[object] = []
+    event.listen(
+        engine.sync_engine,
+        "checkout",
+        lambda *args: checkouts.append(args),
+    )
+
+    async with get_session_factory(engine)() as session:
+        async with UnitOfWork(
+            session=session,
+            url_repository=FakeRepository(),
+        ) as uow:
+            await uow.commit()
+
+        assert not session.in_transaction()
+
+    assert checkouts == []
+
+
+async def test_rollback_on_error_without_statements_is_a_noop(
+    engine: AsyncEngine,
+) -> None:
+    async with get_session_factory(engine)() as session:
+        with pytest.raises(LookupError):
+            async with UnitOfWork(
+                session=session,
+                url_repository=FakeRepository(),
+            ):
+                raise LookupError
+
+        assert not session.in_transaction()
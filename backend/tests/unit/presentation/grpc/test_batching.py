@@ -0,0 +1,101 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+from shortener_app.presentation.grpc.batching import chunked, micro_batches
+
+pytestmark = pytest.mark.unit
+
+
+async def from_list(items: list[str]) -> AsyncIterator[str]:
+    for item in items:
+        yield item
+
+
+async def test_batches_are_capped_by_size() -> None:
+    batches = [
+        batch
+        async for batch in micro_batches(
+            from_list([f"k{i}" for i in range(7)]),
+            max_size=3,
+            window_sec=1.0,
+            max_pending=10,
+        )
+    ]
+
+    assert batches == [["k0", "k1", "k2"], ["k3", "k4", "k5"], ["k6"]]
+
+
+async def test_window_flushes_a_partial_batch() -> None:
+    release = asyncio.Event()
+
+    async def slow_source() -> AsyncIterator[str]:
+        yield "k0"
+        await release.wait()
+        yield "k1"
+
+    batches = micro_batches(
+        slow_source(),
+        max_size=10,
+        window_sec=0.01,
+        max_pending=10,
+    )
+
+    assert await anext(batches) == ["k0"]
+    release.set()
+    assert await anext(batches) == ["k1"]
+    with pytest.raises(StopAsyncIteration):
+        await anext(batches)
+
+
+async def test_source_is_not_read_past_the_pending_limit() -> None:
+    pulled: list[int] = []
+
+    async def counting_source() -> AsyncIterator[int]:
+        for i in range(100):
+            pulled.append(i)
+            yield i
+
+    batches = micro_batches(
+        counting_source(),
+        max_size=2,
+        window_sec=0.0,
+        max_pending=3,
+    )
+    assert await anext(batches) == [0, 1]
+
+    # The consumer is stalled: only the bounded buffer may fill up.
+    await asyncio.sleep(0.01)
+    assert len(pulled) <= 2 + 3 + 1
+
+    await batches.aclose()
+
+
+async def test_source_errors_are_propagated() -> None:
+    async def failing_source() -> AsyncIterator[str]:
+        yield "k0"
+        raise RuntimeError("stream reset")
+
+    batches = micro_batches(
+        failing_source(),
+        max_size=10,
+        window_sec=0.01,
+        max_pending=10,
+    )
+
+    assert await anext(batches) == ["k0"]
+    with pytest.raises(RuntimeError):
+        await anext(batches)
+
+
+async def test_chunked_splits_a_stream_by_size() -> None:
+    chunks = [
+        chunk
+        async for chunk in chunked(
+            from_list([f"k{i}" for i in range(5)]),
+            size=2,
+        )
+    ]
+
+    assert chunks == [["k0", "k1"], ["k2", "k3"], ["k4"]]